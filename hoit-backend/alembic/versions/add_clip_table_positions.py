@@ -0,0 +1,38 @@
+"""Add ordering columns to clips/words and clip_rows_version to projects
+
+Revision ID: add_clip_table_positions
+Revises: add_project_list_summary
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "add_clip_table_positions"
+down_revision = "add_project_list_summary"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add columns needed to mirror projects.clips into clips/words"""
+    op.add_column(
+        "clips",
+        sa.Column("position", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "words",
+        sa.Column("position", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "projects", sa.Column("clip_rows_version", sa.Integer(), nullable=True)
+    )
+
+
+def downgrade():
+    """Remove clip table ordering columns"""
+    op.drop_column("projects", "clip_rows_version")
+    op.drop_column("words", "position")
+    op.drop_column("clips", "position")
@@ -0,0 +1,30 @@
+"""Add segmented editor clips to jobs
+
+Revision ID: add_job_segmentation
+Revises: add_project_versions
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "add_job_segmentation"
+down_revision = "add_project_versions"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Store subtitle clips segmented from the ML result at job completion"""
+    op.add_column(
+        "jobs",
+        sa.Column("segmentation", postgresql.JSONB(), nullable=True),
+    )
+
+
+def downgrade():
+    """Drop segmented clips column"""
+    op.drop_column("jobs", "segmentation")
@@ -0,0 +1,54 @@
+"""Add project_changes table for since-version delta fetch
+
+Revision ID: add_project_changes
+Revises: add_phase2_metrics
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "add_project_changes"
+down_revision = "add_phase2_metrics"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create bounded per-project clip change log"""
+    op.create_table(
+        "project_changes",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column(
+            "project_id",
+            sa.String(255),
+            sa.ForeignKey("projects.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("added", sa.JSON(), nullable=True),
+        sa.Column("modified", sa.JSON(), nullable=True),
+        sa.Column("deleted", sa.JSON(), nullable=True),
+        sa.Column("reordered", sa.Boolean(), nullable=True),
+        sa.Column("meta_changed", sa.Boolean(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "idx_project_changes_project_version",
+        "project_changes",
+        ["project_id", "version"],
+        unique=True,
+    )
+
+
+def downgrade():
+    """Drop project change log"""
+    op.drop_index("idx_project_changes_project_version", "project_changes")
+    op.drop_table("project_changes")
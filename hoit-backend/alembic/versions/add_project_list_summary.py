@@ -0,0 +1,56 @@
+"""Add clip_count/size_bytes summary columns and listing indexes to projects
+
+Revision ID: add_project_list_summary
+Revises: add_project_changes
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "add_project_list_summary"
+down_revision = "add_project_changes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add listing summary columns and backfill them from clips"""
+    op.add_column(
+        "projects",
+        sa.Column("clip_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "projects",
+        sa.Column("size_bytes", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    # 기존 프로젝트 요약 정보 채우기 (크기는 JSON 텍스트 길이 기준 근사값)
+    op.execute(
+        """
+        UPDATE projects
+        SET clip_count = COALESCE(json_array_length(clips::json), 0),
+            size_bytes = CASE
+                WHEN COALESCE(json_array_length(clips::json), 0) = 0 THEN 0
+                ELSE length(clips::text)
+            END
+        WHERE clips IS NOT NULL
+        """
+    )
+
+    op.create_index(
+        "idx_projects_user_updated", "projects", ["user_id", "updated_at", "id"]
+    )
+    op.create_index(
+        "idx_projects_user_created", "projects", ["user_id", "created_at", "id"]
+    )
+
+
+def downgrade():
+    """Remove listing summary columns and indexes"""
+    op.drop_index("idx_projects_user_created", "projects")
+    op.drop_index("idx_projects_user_updated", "projects")
+    op.drop_column("projects", "size_bytes")
+    op.drop_column("projects", "clip_count")
@@ -0,0 +1,70 @@
+"""Add project version history tables
+
+Revision ID: add_project_versions
+Revises: add_transcript_search_indexes
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "add_project_versions"
+down_revision = "add_transcript_search_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create content-addressed blob store and per-project version history"""
+    op.create_table(
+        "project_blobs",
+        sa.Column("hash", sa.String(64), primary_key=True),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.Column("raw_size", sa.Integer(), nullable=False),
+        sa.Column("stored_size", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+    )
+    op.create_table(
+        "project_versions",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column(
+            "project_id",
+            sa.String(255),
+            sa.ForeignKey("projects.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("kind", sa.String(20), nullable=False),
+        sa.Column("base_version", sa.Integer(), nullable=False),
+        sa.Column("manifest_hash", sa.String(64), nullable=True),
+        sa.Column("delta", sa.JSON(), nullable=True),
+        sa.Column("name", sa.String(255), nullable=True),
+        sa.Column("clip_count", sa.Integer(), nullable=False),
+        sa.Column("size_bytes", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "idx_project_versions_project_version",
+        "project_versions",
+        ["project_id", "version"],
+        unique=True,
+    )
+
+
+def downgrade():
+    """Drop project version history"""
+    op.drop_index("idx_project_versions_project_version", "project_versions")
+    op.drop_table("project_versions")
+    op.drop_table("project_blobs")
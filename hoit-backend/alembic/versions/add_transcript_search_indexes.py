@@ -0,0 +1,34 @@
+"""Add transcript search indexes on clips/words
+
+Revision ID: add_transcript_search_indexes
+Revises: add_clip_table_positions
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "add_transcript_search_indexes"
+down_revision = "add_clip_table_positions"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Trigram index on clip text and prefix index on word text"""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_clips_full_text_trgm "
+        "ON clips USING gin (full_text gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_words_text_prefix "
+        "ON words (lower(text) text_pattern_ops)"
+    )
+
+
+def downgrade():
+    """Drop transcript search indexes (pg_trgm extension is left installed)"""
+    op.execute("DROP INDEX IF EXISTS idx_words_text_prefix")
+    op.execute("DROP INDEX IF EXISTS idx_clips_full_text_trgm")
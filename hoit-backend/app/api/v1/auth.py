@@ -1,3 +1,5 @@
+import logging
+
 from fastapi import APIRouter, HTTPException, Depends, status, Request
 from fastapi.responses import RedirectResponse, JSONResponse
 from sqlalchemy.orm import Session
@@ -6,12 +8,26 @@ from authlib.integrations.base_client.errors import OAuthError
 from app.db.database import get_db
 from app.schemas.user import UserCreate, UserLogin, UserResponse
 from app.services.auth_service import auth_service, oauth
+from app.services.google_id_token import GoogleIdTokenError, google_id_token_verifier
+from app.services.password_hasher import PasswordHasherBusy
+from app.services.user_cache import user_cache
 from app.models.user import User, AuthProvider
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 
 
+def _password_hasher_busy() -> HTTPException:
+    """비밀번호 해시 대기열 포화 시 응답 (잠시 후 재시도)"""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="로그인 요청이 많습니다. 잠시 후 다시 시도해주세요.",
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post("/signup", status_code=status.HTTP_201_CREATED)
 async def signup(user_data: UserCreate, db: Session = Depends(get_db)):
     """
@@ -25,9 +41,15 @@ async def signup(user_data: UserCreate, db: Session = Depends(get_db)):
             status_code=status.HTTP_400_BAD_REQUEST, detail="이미 사용 중인 이메일입니다."
         )
 
+    # 비밀번호 해시화 (해시 풀이 가득 차면 503)
+    try:
+        hashed_password = await auth_service.hash_password(user_data.password)
+    except PasswordHasherBusy:
+        raise _password_hasher_busy()
+
     # 사용자 생성
     try:
-        user = auth_service.create_user(db, user_data)
+        user = auth_service.create_user(db, user_data, hashed_password)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -92,7 +114,12 @@ async def login(user_data: UserLogin, db: Session = Depends(get_db)):
     - 성공 시 JWT 토큰 발급
     """
     # 사용자 인증
-    user = auth_service.authenticate_user(db, user_data.email, user_data.password)
+    try:
+        user = await auth_service.authenticate_user(
+            db, user_data.email, user_data.password
+        )
+    except PasswordHasherBusy:
+        raise _password_hasher_busy()
 
     if not user:
         raise HTTPException(
@@ -152,6 +179,11 @@ async def login(user_data: UserLogin, db: Session = Depends(get_db)):
     return response
 
 
+def _token_id(payload: dict) -> str:
+    """캐시/폐기 키로 쓰는 토큰 식별자 (jti 도입 전 발급된 토큰은 만료 시각으로 대체)"""
+    return payload.get("jti") or f"exp-{payload.get('exp')}"
+
+
 async def get_current_user_dependency(
     request: Request,
     db: Session = Depends(get_db),
@@ -181,10 +213,6 @@ async def get_current_user_dependency(
 
     # 2. HttpOnly 쿠키에서 access_token 확인 (Origin 검증 필요)
     if not token:
-        # 디버깅: 요청 정보 로그
-        print(f"🔍 Cookie auth attempt - Origin: {origin}, Referer: {referer}")
-        print(f"🔍 Available cookies: {list(request.cookies.keys())}")
-
         # CSRF 보호: 쿠키 기반 인증 시 Origin 검증 (개발 환경에서는 완화)
         is_development = not bool(settings.domain)
 
@@ -192,17 +220,14 @@ async def get_current_user_dependency(
             if origin not in allowed_origins and not any(
                 referer and referer.startswith(ao) for ao in allowed_origins
             ):
-                print(
-                    f"❌ Origin validation failed - Origin: {origin}, Allowed: {allowed_origins}"
+                logger.warning(
+                    f"Origin validation failed - Origin: {origin}, Referer: {referer}"
                 )
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail="요청 출처가 허용되지 않습니다.",
                 )
-        else:
-            print("🔧 Development mode - Origin validation bypassed")
         token = request.cookies.get("access_token")
-        print(f"🔍 Cookie token found: {bool(token)}")
 
     if not token:
         raise HTTPException(
@@ -220,9 +245,16 @@ async def get_current_user_dependency(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # 사용자 조회
-    user_id = payload.get("user_id")
-    user = db.query(User).filter(User.id == user_id).first()
+    # 사용자 조회 (캐시 히트 시 DB 조회 없음)
+    revoked, user = await user_cache.resolve(
+        db, payload.get("user_id"), _token_id(payload)
+    )
+    if revoked:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="로그아웃된 토큰입니다.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
     if not user:
         raise HTTPException(
@@ -256,12 +288,6 @@ async def get_current_user(
     현재 로그인한 사용자 정보 조회
     - JWT 토큰 (Bearer 또는 HttpOnly 쿠키)으로 사용자 확인
     """
-    # 디버깅: 요청에 포함된 모든 쿠키 출력
-    print(f"🔍 /me endpoint - Cookies received: {list(request.cookies.keys())}")
-    print(f"🔍 /me endpoint - Has access_token: {'access_token' in request.cookies}")
-    print(
-        f"✅ Successfully authenticated user: {current_user.email} (ID: {current_user.id})"
-    )
     return UserResponse.model_validate(current_user)
 
 
@@ -331,22 +357,30 @@ async def refresh_token(request: Request, db: Session = Depends(get_db)):
 @router.post("/logout")
 async def logout(request: Request):
     """
-    로그아웃 - refresh token 쿠키 삭제
+    로그아웃 - 토큰 쿠키 삭제 및 access token 폐기
+
+    폐기는 이 워커에서는 즉시 적용됩니다. 다른 워커가 같은 토큰을 이미 로컬 캐시에
+    갖고 있으면 최대 USER_CACHE_TTL(기본 30초) 동안 더 인증될 수 있습니다.
     """
+    # 쿠키를 지워도 남아 있는 토큰으로 다시 인증되지 않도록 만료 시각까지 폐기
+    auth_header = request.headers.get("Authorization")
+    token = (
+        auth_header[7:]
+        if auth_header and auth_header.startswith("Bearer ")
+        else request.cookies.get("access_token")
+    )
+    payload = auth_service.verify_token(token) if token else None
+    if payload:
+        await user_cache.revoke_token(
+            payload.get("user_id"), _token_id(payload), payload.get("exp", 0)
+        )
+
     response = JSONResponse(content={"message": "로그아웃 되었습니다."})
 
     # 쿠키 삭제 시 도메인 설정 통일화
     is_production = bool(settings.domain)
     cookie_domain = settings.domain if is_production else None
 
-    print(
-        "🚪 Logout - Incoming cookies:",
-        {key: bool(value) for key, value in request.cookies.items()},
-    )
-    print(
-        f"🚪 Logout - Clearing cookies with domain: {cookie_domain}, secure: {is_production}"
-    )
-
     # Access / Refresh 토큰은 HttpOnly 속성이 있으므로 동일 속성으로 무효화
     for cookie_name in ("access_token", "refresh_token"):
         response.set_cookie(
@@ -430,53 +464,29 @@ async def google_callback(request: Request, db: Session = Depends(get_db)):
 
         token = await google.authorize_access_token(request)
 
-        print(f"Token received: {bool(token)}")
-
-        # Google 사용자 정보 가져오기
-        user_info = await auth_service.get_google_user_info(token["access_token"])
-
-        # 디버깅: 구글에서 받은 사용자 정보 확인
-        print(f"Google user_info received: {user_info}")
-
-        google_id = user_info["id"]
-        email = user_info["email"]
-        username = user_info.get("name", email.split("@")[0])
-
-        # 디버깅: 추출된 사용자 정보 확인
-        print(
-            f"Extracted - google_id: {google_id}, email: {email}, username: {username}"
+        # ID 토큰을 캐시된 Google 공개키로 로컬 검증 (userinfo API 호출 없음)
+        claims = await google_id_token_verifier.verify(
+            token["id_token"], access_token=token.get("access_token")
         )
 
-        # 기존 OAuth 사용자 확인
-        user = auth_service.get_user_by_oauth_id(db, google_id, AuthProvider.GOOGLE)
-
-        if user:
-            # 디버깅: 기존 사용자 로그인
-            print(
-                f"Existing OAuth user found - id: {user.id}, username: {user.username}, email: {user.email}"
-            )
+        google_id = claims["sub"]
+        email = claims["email"]
+        username = claims.get("name") or email.split("@")[0]
+
+        # 기존 OAuth 사용자 조회 또는 생성 (단일 upsert)
+        user = auth_service.upsert_oauth_user(
+            db=db,
+            email=email,
+            username=username,
+            oauth_id=google_id,
+            provider=AuthProvider.GOOGLE,
+        )
 
         if not user:
-            # 이메일로 기존 사용자 확인 (로컬 계정이 있는 경우)
-            existing_user = auth_service.get_user_by_email(db, email)
-            if existing_user and existing_user.auth_provider == AuthProvider.LOCAL:
-                # 에러 상황에서도 프론트엔드로 리디렉션
-                error_message = f"이미 '{email}' 계정으로 가입된 사용자가 있습니다. 일반 로그인을 사용해주세요."
-                return RedirectResponse(
-                    url=f"{settings.frontend_url}/auth/callback?error={error_message}"
-                )
-
-            # 새 OAuth 사용자 생성
-            user = auth_service.create_oauth_user(
-                db=db,
-                email=email,
-                username=username,
-                oauth_id=google_id,
-                provider=AuthProvider.GOOGLE,
-            )
-            # 디버깅: 생성된 사용자 정보 확인
-            print(
-                f"Created OAuth user - id: {user.id}, username: {user.username}, email: {user.email}"
+            # 같은 이메일의 로컬 계정이 있는 경우에도 프론트엔드로 리디렉션
+            error_message = f"이미 '{email}' 계정으로 가입된 사용자가 있습니다. 일반 로그인을 사용해주세요."
+            return RedirectResponse(
+                url=f"{settings.frontend_url}/auth/callback?error={error_message}"
             )
 
         # JWT 토큰 쌍 생성
@@ -519,7 +529,7 @@ async def google_callback(request: Request, db: Session = Depends(get_db)):
 
         return response
 
-    except OAuthError as e:
+    except (OAuthError, GoogleIdTokenError) as e:
         # OAuth 에러 시에도 프론트엔드로 리디렉션
         print(f"OAuth Error: {str(e)}")
         error_message = f"Google OAuth 인증 실패: {str(e)}"
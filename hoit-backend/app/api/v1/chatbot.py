@@ -1,14 +1,27 @@
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+import asyncio
+import json
 import time
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from app.schemas.chatbot import (
     ChatBotRequest,
     ChatBotResponse,
     ChatBotErrorResponse,
 )
+from app.db.database import get_db
+from app.services.bedrock_executor import (
+    BedrockBusy,
+    ClientDisconnected,
+    bedrock_executor,
+)
 from app.services.bedrock_service import bedrock_service
+from app.services.intent_classifier import intent_classifier
+from app.services.scenario_builder import get_job_scenario
+from app.services.scenario_context import ScenarioContext, select_scenario_context
 from app.services.langchain_bedrock_service import langchain_bedrock_service
 
 # 로거 설정
@@ -73,18 +86,55 @@ def extract_summary_from_xml(xml_response: str) -> str:
         return "요청이 처리되었습니다."
 
 
-def build_xml_request(request: ChatBotRequest) -> str:
+async def resolve_job_scenario(request: ChatBotRequest, db: Session) -> None:
+    """scenario_data 없이 job_id만 온 경우 서버에서 만든 작업 시나리오로 채움"""
+    if request.scenario_data is None and request.job_id:
+        content = await asyncio.to_thread(
+            get_job_scenario, db, request.job_id, request.style_preset
+        )
+        request.scenario_data = json.loads(content)
+
+
+def chatbot_busy() -> HTTPException:
+    """Bedrock 대기열 포화 응답 (503)"""
+    logger.warning(f"ChatBot request rejected: {bedrock_executor.stats()}")
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail={
+            "error": "요청이 많아 잠시 후 다시 시도해주세요",
+            "error_code": "CHATBOT_BUSY",
+        },
+        headers={"Retry-After": "5"},
+    )
+
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    """Server-Sent Events 메시지 한 건"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def select_context(request: ChatBotRequest) -> Optional[ScenarioContext]:
+    """지시와 관련된 cue/단어만 추린 시나리오 컨텍스트 (시나리오가 없으면 None)"""
+    if not request.scenario_data:
+        return None
+    return await asyncio.to_thread(
+        select_scenario_context, request.scenario_data, request.prompt
+    )
+
+
+def build_xml_request(
+    request: ChatBotRequest, context: Optional[ScenarioContext] = None
+) -> str:
     """
     ChatBot 요청을 통일된 XML 구조로 변환
 
     Args:
         request: ChatBot 요청 객체
+        context: 관련 노드만 추린 시나리오 (있으면 전체 시나리오 대신 사용)
 
     Returns:
         str: XML 구조의 Claude 요청
     """
-    import json
-
     # 사용자 지시사항 구성
     user_instruction = request.prompt
 
@@ -102,16 +152,16 @@ def build_xml_request(request: ChatBotRequest) -> str:
         )
 
     # 현재 JSON 데이터 (시나리오가 있는 경우)
-    current_json = ""
-    if request.scenario_data:
-        current_json = json.dumps(request.scenario_data, indent=2, ensure_ascii=False)
-    else:
-        current_json = "{}"
+    summary = ""
+    current_json = "{}"
+    if context:
+        summary = f"{context.summary}\n\n"
+        current_json = context.to_json()
 
     # XML 구조로 변환
     xml_request = f"""<user_instruction>{user_instruction}</user_instruction>
 
-<current_json>
+{summary}<current_json>
 {current_json}
 </current_json>"""
 
@@ -129,19 +179,24 @@ def build_xml_request(request: ChatBotRequest) -> str:
     summary="ChatBot 메시지 전송",
     description="HOIT ChatBot과 대화를 나누는 API 엔드포인트입니다. 자막 편집 관련 질문에 답변합니다.",
 )
-async def send_chatbot_message(request: ChatBotRequest) -> ChatBotResponse:
+async def send_chatbot_message(
+    request: ChatBotRequest, http_request: Request, db: Session = Depends(get_db)
+) -> ChatBotResponse:
     """
     ChatBot에게 메시지를 전송하고 응답을 받습니다.
 
     - **prompt**: 사용자 입력 메시지 (필수)
     - **conversation_history**: 이전 대화 내역 (선택사항)
     - **scenario_data**: 시나리오 데이터 (선택사항)
+    - **job_id**: scenario_data 대신 서버에서 만든 작업 시나리오 사용 (선택사항)
     - **use_langchain**: LangChain 사용 여부 (기본값: True)
 
     참고: max_tokens(2000)와 temperature(0.7)는 백엔드에서 고정값으로 설정됩니다.
     """
     start_time = time.time()
 
+    await resolve_job_scenario(request, db)
+
     try:
         logger.info(
             f"ChatBot request received: prompt length={len(request.prompt)}, use_langchain={request.use_langchain}, has_scenario={request.scenario_data is not None}"
@@ -151,16 +206,20 @@ async def send_chatbot_message(request: ChatBotRequest) -> ChatBotResponse:
         max_tokens = 2000  # 프론트엔드 값 무시하고 고정값 사용
         temperature = 0.7  # 프론트엔드 값 무시하고 고정값 사용
 
-        # XML 구조로 변환된 요청 생성
-        xml_request = build_xml_request(request)
+        # XML 구조로 변환된 요청 생성 (관련 cue/단어만 포함)
+        context = await select_context(request)
+        xml_request = build_xml_request(request, context)
 
         logger.info(
             f"Using LangChain service with XML request structure: max_tokens={max_tokens}, temperature={temperature}"
         )
-        result = langchain_bedrock_service.invoke_claude_with_xml_request(
+        # Bedrock 호출은 전용 풀에서 실행 (이벤트 루프를 막지 않음)
+        result = await bedrock_executor.run(
+            langchain_bedrock_service.invoke_claude_with_xml_request,
             xml_request=xml_request,
             max_tokens=max_tokens,
             temperature=temperature,
+            request=http_request,
         )
 
         # 처리 시간 계산
@@ -181,15 +240,28 @@ async def send_chatbot_message(request: ChatBotRequest) -> ChatBotResponse:
             "processing_time_ms": processing_time_ms,
         }
 
-        # 시나리오 편집 정보 추가
+        # 시나리오 편집 정보 추가 (패치 경로는 원본 시나리오 인덱스로 변환)
         if "json_patches" in result:
-            response_data["json_patches"] = result["json_patches"]
-            response_data["has_scenario_edits"] = bool(result["json_patches"])
+            patches = result["json_patches"]
+            if context:
+                patches = context.remap_patches(patches)
+            response_data["json_patches"] = patches
+            response_data["has_scenario_edits"] = bool(patches)
         else:
             response_data["has_scenario_edits"] = False
+        if context:
+            response_data["context_stats"] = context.stats
 
         return ChatBotResponse(**response_data)
 
+    except BedrockBusy:
+        raise chatbot_busy()
+
+    except ClientDisconnected:
+        # 응답을 받을 클라이언트가 없으므로 본문 없이 종료
+        logger.info("ChatBot request cancelled: client disconnected")
+        return Response(status_code=499)
+
     except ValueError as e:
         logger.error(f"Validation error: {e}")
         raise HTTPException(
@@ -223,6 +295,101 @@ async def send_chatbot_message(request: ChatBotRequest) -> ChatBotResponse:
         )
 
 
+@router.post(
+    "/stream",
+    responses={
+        200: {"content": {"text/event-stream": {}}, "description": "SSE 이벤트 스트림"},
+        503: {"model": ChatBotErrorResponse, "description": "외부 서비스 이용 불가"},
+    },
+    summary="ChatBot 메시지 스트리밍 전송",
+    description="응답을 Server-Sent Events로 스트리밍합니다. 패치 청크가 완성되는 즉시 전달합니다.",
+)
+async def stream_chatbot_message(
+    request: ChatBotRequest, http_request: Request, db: Session = Depends(get_db)
+):
+    """
+    POST /chatbot/과 같은 요청을 받아 응답을 SSE로 스트리밍합니다.
+
+    이벤트:
+    - **summary**: {"summary"} - <summary> 태그가 닫히는 즉시
+    - **patches**: {"index", "total", "patches", "rejected"} - <json_patch_chunk>마다
+      RFC6902 형식을 검사한 패치 묶음 (형식이 틀린 연산은 rejected 수에만 포함)
+    - **apply_order**: {"apply_order"}
+    - **done**: {"completion", "json_patches", "has_scenario_edits",
+      "processing_time_ms", "first_patch_ms", "context_stats"} - 전체 결과
+    - **error**: {"error", "error_code"} - 스트리밍 도중 실패
+    """
+    start_time = time.time()
+
+    await resolve_job_scenario(request, db)
+    context = await select_context(request)
+    xml_request = build_xml_request(request, context)
+
+    try:
+        # 동시 호출 슬롯을 얻은 뒤에 응답을 시작 (대기열 포화는 503으로 응답)
+        tokens = await bedrock_executor.open_stream(
+            langchain_bedrock_service.stream_claude_with_xml_request,
+            xml_request=xml_request,
+            max_tokens=2000,
+            temperature=0.7,
+            request=http_request,
+        )
+    except BedrockBusy:
+        raise chatbot_busy()
+    except ClientDisconnected:
+        return Response(status_code=499)
+
+    async def events():
+        parser = langchain_bedrock_service.create_patch_stream_parser(
+            remap=context.patch_remapper().remap if context else None
+        )
+        completion = []
+        first_patch_ms = None
+
+        try:
+            async for text in tokens:
+                completion.append(text)
+                for event in parser.feed(text):
+                    if (
+                        event["event"] == "patches"
+                        and event["data"]["patches"]
+                        and first_patch_ms is None
+                    ):
+                        first_patch_ms = int((time.time() - start_time) * 1000)
+                    yield format_sse(event["event"], event["data"])
+        except Exception as e:
+            logger.error(f"ChatBot stream error: {e}")
+            yield format_sse(
+                "error", {"error": str(e), "error_code": "BEDROCK_API_ERROR"}
+            )
+            return
+
+        processing_time_ms = int((time.time() - start_time) * 1000)
+        logger.info(
+            f"ChatBot stream completed in {processing_time_ms}ms "
+            f"({parser.chunks} chunks, first patch {first_patch_ms}ms)"
+        )
+        yield format_sse(
+            "done",
+            {
+                "completion": parser.summary
+                or extract_summary_from_xml("".join(completion)),
+                "json_patches": parser.patches,
+                "has_scenario_edits": bool(parser.patches),
+                "processing_time_ms": processing_time_ms,
+                "first_patch_ms": first_patch_ms,
+                "context_stats": context.stats if context else None,
+            },
+        )
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # 프록시(nginx 등)가 이벤트를 모아서 보내지 않도록
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get(
     "/health",
     summary="ChatBot 서비스 상태 확인",
@@ -234,10 +401,12 @@ async def chatbot_health_check() -> Dict[str, Any]:
     """
     try:
         # 기존 Bedrock 연결 테스트
-        is_bedrock_healthy = bedrock_service.test_connection()
+        is_bedrock_healthy = await bedrock_executor.run(bedrock_service.test_connection)
 
         # LangChain Bedrock 연결 테스트
-        is_langchain_healthy = langchain_bedrock_service.test_connection()
+        is_langchain_healthy = await bedrock_executor.run(
+            langchain_bedrock_service.test_connection
+        )
 
         return {
             "status": (
@@ -247,6 +416,8 @@ async def chatbot_health_check() -> Dict[str, Any]:
             ),
             "bedrock_connection": is_bedrock_healthy,
             "langchain_connection": is_langchain_healthy,
+            "executor": bedrock_executor.stats(),
+            "intent_classifier": intent_classifier.stats(),
             "timestamp": time.time(),
             "service": "HOIT ChatBot API",
         }
@@ -257,6 +428,8 @@ async def chatbot_health_check() -> Dict[str, Any]:
             "status": "unhealthy",
             "bedrock_connection": False,
             "langchain_connection": False,
+            "executor": bedrock_executor.stats(),
+            "intent_classifier": intent_classifier.stats(),
             "error": str(e),
             "timestamp": time.time(),
             "service": "HOIT ChatBot API",
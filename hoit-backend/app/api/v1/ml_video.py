@@ -4,9 +4,16 @@ ML 서버와의 통신을 위한 비디오 처리 API
 EC2 ML 서버로부터 분석 결과를 받고, 비디오 처리 요청을 관리합니다.
 """
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends, Request
-from slowapi import Limiter
-from slowapi.util import get_remote_address
+from fastapi import (
+    APIRouter,
+    HTTPException,
+    BackgroundTasks,
+    Depends,
+    Header,
+    Query,
+    Request,
+    Response,
+)
 from pydantic import BaseModel, ValidationError
 from typing import Dict, Any, Optional, Union
 from enum import Enum
@@ -16,8 +23,11 @@ import aiohttp
 import hashlib
 import hmac
 from sqlalchemy.orm import Session
-from app.db.database import get_db
+from app.db.database import SessionLocal, get_db
 from app.services.job_service import JobService
+from app.services.subtitle_segmentation import subtitle_segmenter
+from app.services.scenario_builder import get_job_scenario, scenario_etag
+from app.services.rate_limiter import rate_limiter
 from app.core.config import settings
 from app.api.v1.auth import get_current_user
 from app.schemas.user import UserResponse
@@ -26,7 +36,6 @@ from app.schemas.user import UserResponse
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/upload-video", tags=["ml-video"])
-limiter = Limiter(key_func=get_remote_address)
 
 
 def verify_hmac_signature(request_body: bytes, signature: str, secret_key: str) -> bool:
@@ -170,8 +179,11 @@ FASTAPI_BASE_URL = settings.FASTAPI_BASE_URL
 ML_API_TIMEOUT = settings.ML_API_TIMEOUT
 
 
-@router.post("/request-process", response_model=ClientProcessResponse)
-@limiter.limit("5/minute")
+@router.post(
+    "/request-process",
+    response_model=ClientProcessResponse,
+    dependencies=[Depends(rate_limiter.limit("5/minute"))],  # 사용자별 분당 5회 제한
+)
 async def request_process(
     request: Request,
     data: ClientProcessRequest,
@@ -516,10 +528,68 @@ async def get_job_status(job_id: str, db: Session = Depends(get_db)):
         # 결과 데이터가 있으면 포함
         if job.result:
             response["result"] = job.result
+            response["clips_ready"] = job.segmentation is not None
 
         return response
 
 
+@router.get("/clips/{job_id}")
+async def get_job_clips(job_id: str, db: Session = Depends(get_db)):
+    """
+    완료된 작업의 에디터 자막 클립 조회
+
+    작업 완료 시 백엔드에서 분할해 둔 클립(프로젝트 clips 형식)을 반환합니다.
+    아직 분할되지 않았거나 분할 규칙/설정이 바뀐 경우 이 자리에서 다시 계산해 저장합니다.
+    """
+    try:
+        import uuid
+
+        uuid.UUID(job_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Job ID는 유효한 UUID 형식이어야 합니다")
+
+    job_service = JobService(db)
+    job = job_service.get_job(job_id)
+
+    if not job:
+        raise HTTPException(status_code=404, detail="해당 작업을 찾을 수 없습니다")
+    if job.status != "completed" or not job.result:
+        raise HTTPException(status_code=409, detail="아직 완료되지 않은 작업입니다")
+
+    segmentation = await asyncio.to_thread(job_service.get_current_segmentation, job)
+
+    return {"job_id": str(job.job_id), **segmentation}
+
+
+@router.get("/scenario/{job_id}")
+async def get_job_scenario_file(
+    job_id: str,
+    preset: str = Query("default", description="스타일 프리셋 (default, plain, shorts)"),
+    db: Session = Depends(get_db),
+    if_none_match: Optional[str] = Header(None),
+):
+    """
+    완료된 작업의 MotionText v2.0 시나리오 조회
+
+    자막 클립과 단어 음량/피치로 만든 초기 시나리오를 반환합니다.
+    (작업, 빌더 버전, 프리셋, 자막 분할 설정) 기준으로 캐시하며 If-None-Match가 일치하면 304를 반환합니다.
+    """
+    try:
+        import uuid
+
+        uuid.UUID(job_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Job ID는 유효한 UUID 형식이어야 합니다")
+
+    etag = scenario_etag(job_id, preset)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+
+    content = await asyncio.to_thread(get_job_scenario, db, job_id, preset)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
 @router.get("/ml-server/health")
 async def check_ml_server_health():
     """
@@ -626,11 +696,21 @@ async def process_completed_results(job_id: str, results: Dict[str, Any]):
     try:
         logger.info(f"결과 후처리 시작 - Job ID: {job_id}")
 
-        # TODO: 실제 후처리 로직 구현
-        # 1. 데이터베이스에 결과 저장
-        # 2. S3에 결과 파일 저장
-        # 3. 사용자에게 완료 알림 전송
-        # 4. 웹훅 전송 (필요한 경우)
+        # 에디터 자막 클립 분할 (CPU 작업이므로 스레드에서 실행)
+        segmentation = await asyncio.to_thread(
+            subtitle_segmenter.segment_result, results
+        )
+        db = SessionLocal()
+        try:
+            JobService(db).save_segmentation(job_id, segmentation)
+        finally:
+            db.close()
+        logger.info(f"자막 클립 분할 완료 - Job ID: {job_id}, Stats: {segmentation['stats']}")
+
+        # TODO: 나머지 후처리 로직 구현
+        # 1. S3에 결과 파일 저장
+        # 2. 사용자에게 완료 알림 전송
+        # 3. 웹훅 전송 (필요한 경우)
 
         logger.info(f"결과 후처리 완료 - Job ID: {job_id}")
 
@@ -1,19 +1,51 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Header, Response, Query
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    status,
+    Header,
+    Response,
+    Query,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Union
 
 from app.db.database import get_db
 from app.api.v1.auth import get_current_user
 from app.models.user import User
 from app.services.project_service import ProjectService
+from app.services.subtitle_export import EXPORT_MEDIA_TYPES, export_cache, export_etag
+from app.services.transcript_search import TranscriptSearchService
 from app.schemas.project import (
+    ProjectBulkEditRequest,
+    ProjectClipsDelta,
     ProjectCreate,
+    ProjectDeltaResponse,
+    ProjectDuplicateRequest,
     ProjectResponse,
+    ProjectRestoreRequest,
+    ProjectVersionContent,
+    TranscriptSearchResponse,
 )
 
 router = APIRouter(prefix="/api/projects", tags=["projects"])
 
 
+def _parse_if_match(if_match: Optional[str]) -> Optional[int]:
+    """If-Match 헤더에서 프로젝트 버전 추출 (따옴표/W/ 접두사 허용)"""
+    if not if_match:
+        return None
+    try:
+        return int(if_match.strip().removeprefix("W/").strip('"'))
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid If-Match header format",
+        )
+
+
 @router.put("/{project_id}")
 async def create_or_update_project(
     project_id: str,
@@ -26,18 +58,12 @@ async def create_or_update_project(
     프로젝트 생성 또는 업데이트
 
     - 새 프로젝트를 생성하거나 기존 프로젝트를 업데이트합니다.
-    - If-Match 헤더로 버전 충돌을 감지합니다.
+    - If-Match 버전이 현재 버전과 다르면 그 버전을 기준으로 서버 변경분과 3-way 병합합니다.
+      병합되면 응답에 merged/server_changes가 포함되고, 같은 클립/단어/필드를 양쪽에서
+      다르게 바꾼 경우에만 409와 함께 conflicts 목록을 반환합니다.
     """
     # If-Match 헤더에서 버전 추출
-    version = None
-    if if_match:
-        try:
-            version = int(if_match)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid If-Match header format",
-            )
+    version = _parse_if_match(if_match)
 
     # 프로젝트 ID 일치 확인
     if project_id != project_data.id:
@@ -60,9 +86,33 @@ async def create_or_update_project(
     return result
 
 
-@router.get("/{project_id}", response_model=ProjectResponse)
+@router.get("/search", response_model=TranscriptSearchResponse)
+async def search_transcripts(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(20, ge=1, le=50),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    자막 전문 검색
+
+    사용자의 모든 프로젝트에서 검색어의 모든 단어를 포함하는 클립을 찾습니다.
+    각 결과는 프로젝트, 클립, 검색어가 처음 등장하는 단어의 시간을 포함합니다.
+
+    - q: 검색어 (공백으로 구분된 단어는 AND 조건, 한국어는 어절 일부로도 매칭)
+    - limit: 최대 결과 수 (기본값: 20, 최대: 50)
+    """
+    return TranscriptSearchService.search(
+        db=db, user_id=current_user.id, query=q, limit=limit
+    )
+
+
+@router.get(
+    "/{project_id}", response_model=Union[ProjectDeltaResponse, ProjectResponse]
+)
 async def get_project(
     project_id: str,
+    since: Optional[int] = Query(None, ge=0),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -70,7 +120,15 @@ async def get_project(
     프로젝트 조회
 
     특정 프로젝트의 전체 데이터를 가져옵니다.
+
+    - since: 클라이언트가 가진 버전. 지정 시 이후 변경된 클립만 반환하며
+      (since_version 필드 포함), 변경 로그가 잘린 경우 전체 스냅샷을 반환합니다.
     """
+    if since is not None:
+        return await ProjectService.get_project_changes(
+            db=db, user_id=current_user.id, project_id=project_id, since=since
+        )
+
     return await ProjectService.get_project(
         db=db, user_id=current_user.id, project_id=project_id
     )
@@ -83,6 +141,7 @@ async def list_projects(
     sort: str = Query(
         "updated_at:desc", regex="^(updated_at|created_at|name):(asc|desc)$"
     ),
+    cursor: Optional[str] = Query(None),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> Dict[str, Any]:
@@ -94,9 +153,15 @@ async def list_projects(
     - page: 페이지 번호 (기본값: 1)
     - limit: 페이지당 항목 수 (기본값: 20, 최대: 100)
     - sort: 정렬 기준 (updated_at:desc, created_at:asc, name:asc)
+    - cursor: 이전 응답의 next_cursor (지정 시 page 대신 keyset 페이지네이션)
     """
     return await ProjectService.list_projects(
-        db=db, user_id=current_user.id, page=page, limit=limit, sort=sort
+        db=db,
+        user_id=current_user.id,
+        page=page,
+        limit=limit,
+        sort=sort,
+        cursor=cursor,
     )
 
 
@@ -122,58 +187,246 @@ async def export_project(
     format: str = Query("srt", regex="^(srt|vtt|ass)$"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    if_none_match: Optional[str] = Header(None),
 ) -> Response:
     """
     프로젝트 내보내기
 
     프로젝트를 자막 파일 형식으로 내보냅니다.
+    같은 버전/형식은 캐시에서 제공하며, If-None-Match가 일치하면 304를 반환합니다.
 
     - format: 출력 형식 (srt, vtt, ass)
     """
-    content = await ProjectService.export_project(
+    version = await ProjectService.get_project_version(
+        db=db, user_id=current_user.id, project_id=project_id
+    )
+
+    etag = export_etag(project_id, version, format)
+    headers = {
+        "Content-Disposition": f"attachment; filename={project_id}.{format}",
+        "ETag": etag,
+        "Cache-Control": "private, no-cache",
+    }
+
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in [tag.strip() for tag in if_none_match.split(",")]
+    ):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    media_type = EXPORT_MEDIA_TYPES[format]
+    cached = export_cache.get((project_id, version, format))
+    if cached is not None:
+        return Response(content=cached, media_type=media_type, headers=headers)
+
+    version, chunks = await ProjectService.export_project(
         db=db, user_id=current_user.id, project_id=project_id, format=format
     )
+    headers["ETag"] = export_etag(project_id, version, format)
 
-    # 파일 확장자와 MIME 타입 설정
-    if format == "srt":
-        media_type = "text/srt"
-        filename = f"{project_id}.srt"
-    elif format == "vtt":
-        media_type = "text/vtt"
-        filename = f"{project_id}.vtt"
-    elif format == "ass":
-        media_type = "text/x-ssa"
-        filename = f"{project_id}.ass"
-    else:
-        media_type = "text/plain"
-        filename = f"{project_id}.txt"
-
-    return Response(
-        content=content,
+    return StreamingResponse(
+        export_cache.capture((project_id, version, format), chunks),
         media_type=media_type,
-        headers={"Content-Disposition": f"attachment; filename={filename}"},
+        headers=headers,
     )
 
 
 @router.patch("/{project_id}/clips")
 async def update_project_clips(
     project_id: str,
-    clips_update: Dict[str, Any],
+    clips_update: Union[ProjectClipsDelta, List[Dict[str, Any]]] = Body(...),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    if_match: Optional[str] = Header(None),
 ) -> Dict[str, Any]:
     """
     프로젝트 클립 증분 업데이트
 
-    변경된 클립만 전송하여 네트워크 최적화
+    변경된 클립만 전송하여 네트워크 최적화. If-Match 헤더에 델타의 기준 버전이 필요하며,
+    성공 시 버전이 1 증가합니다. 기준 버전이 오래됐으면 서버 변경분과 3-way 병합하고
+    겹치는 변경이 있을 때만 409와 conflicts 목록을 반환합니다.
 
     Request Body:
     {
         "added": [...],     # 추가된 클립
-        "modified": [...],  # 수정된 클립
-        "deleted": [...]    # 삭제된 클립 ID
+        "modified": [...],  # 수정된 클립 (id 기준 교체)
+        "deleted": [...],   # 삭제된 클립 ID
+        "order": [...]      # (선택) 변경 후 클립 ID 순서
+    }
+
+    또는 clips 배열 기준 RFC 6902 JSON Patch 배열
+    (예: [{"op": "replace", "path": "/3/words/0/text", "value": "..."}])
+    """
+    version = _parse_if_match(if_match)
+    if version is None:
+        raise HTTPException(
+            status_code=status.HTTP_428_PRECONDITION_REQUIRED,
+            detail="If-Match header with the base project version is required",
+        )
+
+    result = await ProjectService.apply_clip_delta(
+        db=db,
+        user_id=current_user.id,
+        project_id=project_id,
+        delta=clips_update,
+        version=version,
+    )
+
+    # 충돌 발생 시 409 반환
+    if "error" in result and result["error"] == "CONFLICT":
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=result)
+
+    return result
+
+
+@router.post("/{project_id}/bulk")
+async def bulk_edit_project(
+    project_id: str,
+    bulk_request: ProjectBulkEditRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    if_match: Optional[str] = Header(None),
+) -> Dict[str, Any]:
+    """
+    프로젝트 일괄 편집
+
+    전체 프로젝트를 다시 업로드하지 않고 서버에서 일괄 연산을 적용합니다.
+    바뀐 클립만 저장되며, 응답의 changes로 바뀐 클립 ID를 확인할 수 있습니다.
+    If-Match 헤더 처리는 PATCH /clips와 같습니다.
+
+    Request Body:
+    {
+        "operations": [
+            {"op": "shift", "offset": 1.5, "start_after": 30.0},
+            {"op": "scale", "factor": 1.001},               # 29.97 → 30fps 등
+            {"op": "find_replace", "find": "안녕", "replace": "안녕하세요"},
+            {"op": "merge_gaps", "max_gap": 0.3},
+            {"op": "split_gaps", "min_gap": 1.5}
+        ]
     }
     """
-    # TODO: 증분 업데이트 로직 구현
-    # Phase 2에서 구현 예정
-    return {"message": "Incremental update will be implemented in Phase 2"}
+    version = _parse_if_match(if_match)
+    if version is None:
+        raise HTTPException(
+            status_code=status.HTTP_428_PRECONDITION_REQUIRED,
+            detail="If-Match header with the base project version is required",
+        )
+
+    result = await ProjectService.apply_clip_delta(
+        db=db,
+        user_id=current_user.id,
+        project_id=project_id,
+        delta=bulk_request,
+        version=version,
+    )
+
+    # 충돌 발생 시 409 반환
+    if "error" in result and result["error"] == "CONFLICT":
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=result)
+
+    return result
+
+
+@router.get("/{project_id}/versions")
+async def list_project_versions(
+    project_id: str,
+    limit: int = Query(50, ge=1, le=200),
+    before: Optional[int] = Query(None, ge=1),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> Dict[str, Any]:
+    """
+    프로젝트 버전 히스토리 목록
+
+    - limit: 최대 항목 수 (기본값: 50, 최대: 200)
+    - before: 이전 응답의 next_before (이 버전 미만만 조회)
+    """
+    return await ProjectService.list_project_versions(
+        db=db,
+        user_id=current_user.id,
+        project_id=project_id,
+        limit=limit,
+        before=before,
+    )
+
+
+@router.get("/{project_id}/versions/{version}", response_model=ProjectVersionContent)
+async def get_project_version_content(
+    project_id: str,
+    version: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    히스토리 버전 내용 조회
+
+    복원하기 전에 과거 버전의 클립과 설정을 확인할 때 사용합니다.
+    """
+    return await ProjectService.get_project_at_version(
+        db=db, user_id=current_user.id, project_id=project_id, version=version
+    )
+
+
+@router.post("/{project_id}/restore")
+async def restore_project(
+    project_id: str,
+    restore_request: ProjectRestoreRequest,
+    if_match: Optional[str] = Header(None, alias="If-Match"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> Dict[str, Any]:
+    """
+    프로젝트를 과거 버전으로 복원
+
+    복원 내용은 새 버전으로 저장됩니다. If-Match 헤더가 있으면 현재 버전과 일치해야 합니다.
+
+    Request Body:
+    {
+        "version": 12,                      # 복원할 버전
+        "at": "2026-10-19T09:00:00Z"        # 또는 해당 시각 직전에 저장된 버전
+    }
+    """
+    if restore_request.version is None and restore_request.at is None:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Either version or at is required",
+        )
+
+    result = await ProjectService.restore_project_version(
+        db=db,
+        user_id=current_user.id,
+        project_id=project_id,
+        target_version=restore_request.version,
+        at=restore_request.at,
+        version=_parse_if_match(if_match),
+    )
+
+    # 충돌 발생 시 409 반환
+    if "error" in result and result["error"] == "CONFLICT":
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=result)
+
+    return result
+
+
+@router.post("/{project_id}/duplicate", status_code=status.HTTP_201_CREATED)
+async def duplicate_project(
+    project_id: str,
+    duplicate_request: ProjectDuplicateRequest = Body(
+        default_factory=ProjectDuplicateRequest
+    ),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> Dict[str, Any]:
+    """
+    프로젝트 복제
+
+    - id: 새 프로젝트 ID (생략 시 서버에서 생성)
+    - name: 새 프로젝트 이름 (생략 시 "원본 이름 (사본)")
+    """
+    return await ProjectService.duplicate_project(
+        db=db,
+        user_id=current_user.id,
+        project_id=project_id,
+        new_project_id=duplicate_request.id,
+        name=duplicate_request.name,
+    )
@@ -2,15 +2,19 @@
 GPU 서버 렌더링 API 엔드포인트
 """
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends, Request
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends
 from pydantic import BaseModel
 from typing import Dict, Any, Optional, List
 from sqlalchemy.orm import Session
+import asyncio
+import json
 import logging
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 from app.db.database import get_db
 from app.services.render_service import RenderService
+from app.services.plugin_registry import plugin_registry
+from app.services.scenario_compiler import scenario_compiler, resolve_fps
+from app.services.scenario_builder import get_job_scenario
+from app.services.rate_limiter import rate_limiter
 from app.core.config import settings
 from app.api.v1.auth import get_current_user
 from app.schemas.user import UserResponse
@@ -24,11 +28,6 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/render", tags=["render"])
 
-# Rate Limiter 설정
-limiter = Limiter(key_func=get_remote_address)
-
-# Rate limit 에러는 slowapi middleware에서 자동 처리됨
-
 
 # Pydantic 모델들
 class RenderOptions(BaseModel):
@@ -45,7 +44,9 @@ class CreateRenderRequest(BaseModel):
     """렌더링 작업 생성 요청"""
 
     videoUrl: str
-    scenario: Dict[str, Any]  # MotionText scenario
+    scenario: Optional[Dict[str, Any]] = None  # MotionText scenario
+    jobId: Optional[str] = None  # scenario가 없으면 이 ML 작업 결과로 시나리오 생성
+    stylePreset: str = "default"
     options: Optional[RenderOptions] = None
 
 
@@ -98,6 +99,8 @@ class GPURenderRequest(BaseModel):
     scenario: Dict[str, Any]
     options: Dict[str, Any]
     callback_url: str
+    plugins: List[Dict[str, Any]] = []  # 워커 프리페치용 resolved plugin manifest
+    timeline: Optional[Dict[str, Any]] = None  # 사전 컴파일된 바이너리 타임라인
 
 
 class GPURenderCallback(BaseModel):
@@ -124,10 +127,12 @@ RENDER_CALLBACK_URL = getattr(
 )
 
 
-@router.post("/create", response_model=CreateRenderResponse)
-@limiter.limit("20/minute")  # 분당 20회 제한
+@router.post(
+    "/create",
+    response_model=CreateRenderResponse,
+    dependencies=[Depends(rate_limiter.limit("20/minute"))],  # 사용자별 분당 20회 제한
+)
 async def create_render_job(
-    request_obj: Request,
     request: CreateRenderRequest,
     background_tasks: BackgroundTasks,
     current_user: UserResponse = Depends(get_current_user),
@@ -137,6 +142,17 @@ async def create_render_job(
     GPU 서버에서 비디오 렌더링 작업을 생성합니다.
     """
     try:
+        # 시나리오 대신 ML 작업 ID가 오면 서버에서 만든 시나리오 사용
+        if request.scenario is None:
+            if not request.jobId:
+                raise RenderError.validation_error(
+                    "scenario 또는 jobId가 필요합니다", {"field": "scenario"}
+                )
+            content = await asyncio.to_thread(
+                get_job_scenario, db, request.jobId, request.stylePreset
+            )
+            request.scenario = json.loads(content)
+
         # 옵션 변환
         options_dict = request.options.model_dump() if request.options else {}
 
@@ -150,6 +166,16 @@ async def create_render_job(
                 validation_result["reason"], validation_result["details"]
             )
 
+        # 플러그인/폰트/에셋 렌더링 가능 여부 사전 검사 (GPU 슬롯 사용 전 거부)
+        # 레지스트리 첫 로드는 S3/DB 동기 I/O이므로 이벤트 루프 밖에서 실행
+        feasibility = await asyncio.to_thread(
+            plugin_registry.check_scenario, request.scenario, db
+        )
+        if not feasibility["feasible"]:
+            raise RenderError.render_infeasible(
+                feasibility["reason"], feasibility["details"]
+            )
+
         # 렌더링 서비스로 작업 생성
         render_service = RenderService(db)
 
@@ -176,6 +202,17 @@ async def create_render_job(
 
         logger.info(f"렌더링 작업 생성 - Job ID: {render_job.job_id}")
 
+        # 프레임 구간 테이블로 사전 컴파일 (실패 시 JSON 시나리오만 전송)
+        # 타임라인은 스타일/텍스트가 없는 색인이라 시나리오를 대신할 수 없으므로, GPU 서버가
+        # 읽을 수 있을 때만 첨부. 컴파일은 CPU 작업이므로 이벤트 루프 밖에서 실행
+        timeline = None
+        if settings.RENDER_SEND_COMPILED_TIMELINE:
+            timeline = await asyncio.to_thread(
+                scenario_compiler.compile_for_gpu,
+                request.scenario,
+                resolve_fps(request.scenario, options_dict.get("fps", 30)),
+            )
+
         # GPU 서버로 보낼 요청 준비
         gpu_request = GPURenderRequest(
             job_id=str(render_job.job_id),
@@ -183,6 +220,8 @@ async def create_render_job(
             scenario=request.scenario,
             options=options_dict,
             callback_url=f"{RENDER_CALLBACK_URL}/api/render/callback",
+            plugins=feasibility["plugins"],
+            timeline=timeline,
         )
 
         # 백그라운드에서 GPU 서버에 요청 전송
@@ -2,8 +2,10 @@
 Results API 라우터 - 프론트엔드가 기대하는 /api/results 경로 제공
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Header, Response
 from sqlalchemy.orm import Session
+from typing import Optional
+import asyncio
 import logging
 
 from app.db.database import get_db
@@ -12,6 +14,12 @@ from app.schemas.ml_response import (
     create_error_response,
     simplify_ml_result,
 )
+from app.services.transcript_columnar import (
+    ARROW_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    encode_result,
+    negotiate_format,
+)
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -20,11 +28,18 @@ router = APIRouter(prefix="/api", tags=["results"])
 
 
 @router.get("/results/{job_id}")
-async def get_results(job_id: str, db: Session = Depends(get_db)):
+async def get_results(
+    job_id: str,
+    db: Session = Depends(get_db),
+    accept: Optional[str] = Header(None),
+):
     """
     처리 완료된 결과 조회 - 프론트엔드 요구 경로
 
     프론트엔드 기대 경로: GET /api/results/{jobId}
+
+    Accept가 application/msgpack 또는 application/vnd.apache.arrow.stream이면
+    같은 내용을 열 배열 바이너리로 반환합니다 (app/services/transcript_columnar.py).
     """
     try:
         job_service = JobService(db)
@@ -56,6 +71,20 @@ async def get_results(job_id: str, db: Session = Depends(get_db)):
 
         # 결과 간소화
         try:
+            format = negotiate_format(accept)
+            if format:
+                content = await asyncio.to_thread(
+                    encode_result, job.result, job_id, format
+                )
+                logger.info(f"결과 조회 성공 ({format}) - Job ID: {job_id}")
+                return Response(
+                    content=content,
+                    media_type=MSGPACK_MEDIA_TYPE
+                    if format == "msgpack"
+                    else ARROW_MEDIA_TYPE,
+                    headers={"Vary": "Accept"},
+                )
+
             simplified_result = simplify_ml_result(job.result, job_id)
             logger.info(f"결과 조회 성공 - Job ID: {job_id}")
             return simplified_result
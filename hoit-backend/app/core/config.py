@@ -75,6 +75,85 @@ class Settings(BaseSettings):
         default="http://localhost:8000",
         description="Callback URL for GPU render results",
     )
+    PLUGIN_REGISTRY_TTL: int = Field(
+        default=300, description="Plugin registry refresh interval in seconds"
+    )
+    RENDER_AVAILABLE_FONTS: str = Field(
+        default="Arial,Helvetica,Times New Roman,Courier New,Verdana,Georgia,Noto Sans KR,Noto Sans,Pretendard",
+        description="Comma-separated font families installed on the GPU render server",
+    )
+    GPU_REQUEST_CONTENT_ENCODING: str = Field(
+        default="identity",
+        description="Content-Encoding for GPU render requests (identity, gzip, zstd); "
+        "enable compression only once the GPU server decodes it",
+    )
+    RENDER_SEND_COMPILED_TIMELINE: bool = Field(
+        default=False,
+        description="Attach the precompiled binary timeline to GPU render requests "
+        "(enable once the GPU server reads it)",
+    )
+    SCENARIO_TIMELINE_CACHE_SIZE: int = Field(
+        default=128, description="Max compiled render timelines kept in memory"
+    )
+    SCENARIO_CACHE_MAX_BYTES: int = Field(
+        default=64 * 1024 * 1024,
+        description="Max bytes of job scenarios built from ML results kept in memory",
+    )
+
+    # Project Sync Settings
+    PROJECT_CHANGE_LOG_LIMIT: int = Field(
+        default=200,
+        description="Number of clip-level change log entries kept per project",
+    )
+    EXPORT_CACHE_MAX_BYTES: int = Field(
+        default=64 * 1024 * 1024,
+        description="Max bytes of subtitle exports cached in memory",
+    )
+    CLIP_TABLE_DUAL_WRITE: bool = Field(
+        default=True,
+        description="Mirror project clips into the normalized clips/words tables",
+    )
+    PROJECT_HISTORY_SNAPSHOT_INTERVAL: int = Field(
+        default=25,
+        description="Versions between full snapshots in project history",
+    )
+    PROJECT_HISTORY_LIMIT: int = Field(
+        default=500, description="Number of history versions kept per project"
+    )
+    PROJECT_HISTORY_ZSTD_LEVEL: int = Field(
+        default=9, description="zstd compression level for project history blobs"
+    )
+
+    # Subtitle Segmentation Settings
+    SUBTITLE_MAX_LINE_CHARS: int = Field(
+        default=42, description="Max characters per subtitle clip"
+    )
+    SUBTITLE_MAX_LINE_CHARS_CJK: int = Field(
+        default=20,
+        description="Max characters per subtitle clip for ko/ja/zh transcripts",
+    )
+    SUBTITLE_MAX_CPS: float = Field(
+        default=17.0, description="Max reading speed in characters per second"
+    )
+    SUBTITLE_MAX_CPS_CJK: float = Field(
+        default=12.0,
+        description="Max reading speed in characters per second for ko/ja/zh",
+    )
+    SUBTITLE_MAX_DURATION: float = Field(
+        default=4.0, description="Max subtitle clip duration in seconds"
+    )
+    SUBTITLE_MIN_DURATION: float = Field(
+        default=1.2, description="Min subtitle clip duration when the gap allows"
+    )
+    SUBTITLE_MAX_WORDS: int = Field(
+        default=7, description="Max words per subtitle clip"
+    )
+    SUBTITLE_MIN_GAP: float = Field(
+        default=0.083, description="Min gap in seconds between consecutive clips"
+    )
+    SUBTITLE_PAUSE_SPLIT: float = Field(
+        default=0.7, description="Pause in seconds that always starts a new clip"
+    )
 
     # Frontend Editor Settings
     FRONTEND_EDITOR_URL: str = Field(
@@ -118,10 +197,93 @@ class Settings(BaseSettings):
         default=1440, description="JWT token expiration time in minutes"
     )
 
+    # Rate Limit Settings
+    RATE_LIMIT_ENABLED: bool = Field(
+        default=True, description="Enable Redis-backed rate limiting"
+    )
+    RATE_LIMIT_TRUSTED_PROXY_HOPS: int = Field(
+        default=1,
+        description="Proxies appending to X-Forwarded-For (0 = use socket address)",
+    )
+    RATE_LIMIT_REDIS_POOL_SIZE: int = Field(
+        default=50, description="Async Redis connections per worker for rate limiting"
+    )
+    RATE_LIMIT_LOCAL_BLOCK_MAX_KEYS: int = Field(
+        default=10000,
+        description="Max over-limit keys remembered in memory to skip Redis",
+    )
+
+    # Password Hashing Settings
+    PASSWORD_HASH_WORKERS: int = Field(
+        default=4, description="Threads dedicated to bcrypt hashing/verification"
+    )
+    PASSWORD_HASH_MAX_PENDING: int = Field(
+        default=32,
+        description="Max queued + running password hash jobs before returning 503",
+    )
+
+    # ChatBot (Bedrock) Concurrency Settings
+    CHATBOT_MAX_CONCURRENCY: int = Field(
+        default=4, description="Concurrent Bedrock calls per worker"
+    )
+    CHATBOT_MAX_QUEUE: int = Field(
+        default=16,
+        description="Max chatbot requests waiting for a Bedrock slot before 503",
+    )
+    CHATBOT_QUEUE_TIMEOUT: float = Field(
+        default=30.0,
+        description="Seconds a chatbot request may wait for a Bedrock slot",
+    )
+    INTENT_CLASSIFIER_MIN_CONFIDENCE: float = Field(
+        default=0.5,
+        description="Local intent classifier confidence below which Claude classifies",
+    )
+    CHATBOT_PLUGIN_CANDIDATES: int = Field(
+        default=3,
+        description="Plugins (with parameter schemas) retrieved into animation prompts",
+    )
+    CHATBOT_PARALLEL_MAX_CONCURRENCY: int = Field(
+        default=4, description="Concurrent Bedrock calls within one parallel chain"
+    )
+    CHATBOT_PARALLEL_TASK_TIMEOUT: float = Field(
+        default=60.0, description="Seconds before a parallel chain task times out"
+    )
+    CHATBOT_CHAIN_CONTEXT_CHARS: int = Field(
+        default=2000,
+        description="Max characters of summarised earlier results per multi-step prompt",
+    )
+
+    # Authenticated User Cache Settings
+    USER_CACHE_TTL: float = Field(
+        default=30.0,
+        description="Seconds a resolved user stays in the in-process cache",
+    )
+    USER_CACHE_MAX_ENTRIES: int = Field(
+        default=10000, description="Max (user_id, jti) entries in the in-process cache"
+    )
+    USER_CACHE_REDIS_TTL: int = Field(
+        default=300, description="Seconds a resolved user stays in the Redis cache"
+    )
+    USER_CACHE_REDIS_TIMEOUT: float = Field(
+        default=0.5,
+        description="Seconds to wait for the user cache Redis before falling back to DB",
+    )
+    USER_CACHE_REDIS_POOL_SIZE: int = Field(
+        default=20, description="Async Redis connections per worker for the user cache"
+    )
+
     # Google OAuth Settings
     google_client_id: str = Field(..., description="Google OAuth client ID")
     google_client_secret: str = Field(..., description="Google OAuth client secret")
     google_redirect_uri: str = Field(..., description="Google OAuth redirect URI")
+    GOOGLE_JWKS_URL: str = Field(
+        default="https://www.googleapis.com/oauth2/v3/certs",
+        description="Google public keys (JWKS) used to verify ID tokens locally",
+    )
+    GOOGLE_JWKS_REFRESH_INTERVAL: int = Field(
+        default=3600,
+        description="Max seconds Google JWKS keys are cached before refreshing",
+    )
 
     # Frontend URL Settings
     frontend_url: str = Field(
@@ -5,6 +5,7 @@ SQLAlchemy 모델 기반으로 테이블 생성 + 시드 데이터 추가
 
 from app.db.database import engine, Base
 from app.db.seed_data import create_seed_data
+from app.services.transcript_search import ensure_search_indexes
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,7 +15,8 @@ def init_database():
     """
     데이터베이스 초기화
     1. SQLAlchemy 모델 기반으로 테이블 생성
-    2. 시드 데이터 추가
+    2. 검색 인덱스 보장 (PostgreSQL)
+    3. 시드 데이터 추가
     """
     try:
         logger.info("Initializing database...")
@@ -24,7 +26,10 @@ def init_database():
         Base.metadata.create_all(bind=engine)
         logger.info("Tables created successfully")
 
-        # 2. 시드 데이터 생성
+        # 2. 자막 검색 인덱스 (pg_trgm)
+        ensure_search_indexes(engine)
+
+        # 3. 시드 데이터 생성
         logger.info("Creating seed data...")
         create_seed_data()
 
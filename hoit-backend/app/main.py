@@ -2,9 +2,6 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
-from slowapi import Limiter, _rate_limit_exceeded_handler
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
 from app.api.v1.routers import api_router
 from app.api.v1.auth import router as auth_router
 from app.api.v1.render import router as render_router
@@ -13,17 +10,13 @@ from app.api.v1.projects import router as projects_router
 from app.api.v1.ml_video import router as ml_video_router
 from app.api.v1.video import router as video_router
 from app.core.config import settings
+from app.services.password_hasher import password_hasher
 import os
 import logging
 import time
 
 app = FastAPI(title="HOIT Backend API", version="1.0.0")
 
-# Rate limiting 설정
-limiter = Limiter(key_func=get_remote_address)
-app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -126,6 +119,39 @@ async def startup_event():
         if "db" in locals():
             db.close()
 
+    # 플러그인 레지스트리 워밍업 (렌더링 사전 검사용)
+    try:
+        from app.db.database import SessionLocal
+        from app.services.plugin_registry import plugin_registry
+
+        registry_db = SessionLocal()
+        try:
+            plugin_registry.refresh(registry_db)
+        finally:
+            registry_db.close()
+    except Exception as e:
+        logger.error(f"Plugin registry warm-up failed: {str(e)}")
+
+    # 챗봇 요청 유형 분류기 학습 (첫 요청 지연 방지)
+    try:
+        from app.services.intent_classifier import intent_classifier
+
+        intent_classifier.warm_up()
+    except Exception as e:
+        logger.error(f"Intent classifier warm-up failed: {str(e)}")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """애플리케이션 종료 시 공유 HTTP/Redis 클라이언트 정리"""
+    from app.services.google_id_token import google_id_token_verifier
+    from app.services.rate_limiter import rate_limiter
+    from app.services.user_cache import user_cache
+
+    await google_id_token_verifier.close()
+    await rate_limiter.close()
+    await user_cache.close()
+
 
 # 요청 로깅 미들웨어 추가 (가장 먼저)
 app.add_middleware(RequestLoggingMiddleware)
@@ -256,7 +282,11 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "service": "HOIT Backend"}
+    return {
+        "status": "healthy",
+        "service": "HOIT Backend",
+        "password_hashing": password_hasher.stats(),
+    }
 
 
 if __name__ == "__main__":
@@ -3,6 +3,8 @@ from .job import Job
 from .render_job import RenderJob
 from .render_usage_stats import RenderUsageStats, RenderMonthlyStats
 from .project import Project
+from .project_change import ProjectChange
+from .project_version import ProjectVersion, ProjectBlob
 from .clip import Clip
 from .word import Word
 from .plugin_asset import PluginAsset
@@ -14,6 +16,9 @@ __all__ = [
     "RenderUsageStats",
     "RenderMonthlyStats",
     "Project",
+    "ProjectChange",
+    "ProjectVersion",
+    "ProjectBlob",
     "Clip",
     "Word",
     "PluginAsset",
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Float, Text, ForeignKey, DateTime
+from sqlalchemy import Column, String, Integer, Float, Text, ForeignKey, DateTime
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.database import Base
@@ -9,7 +9,7 @@ class Clip(Base):
 
     __tablename__ = "clips"
 
-    # 기본 정보
+    # 기본 정보 (id는 "{project_id}:{클라이언트 clip id}" 형식)
     id = Column(String(255), primary_key=True, index=True)
     project_id = Column(
         String(255),
@@ -18,6 +18,9 @@ class Clip(Base):
         index=True,
     )
 
+    # 프로젝트 내 순서
+    position = Column(Integer, nullable=False, default=0, server_default="0")
+
     # 클립 정보
     timeline = Column(String(50), nullable=True)  # "0:00:15" 형식
     speaker = Column(String(100), nullable=True)
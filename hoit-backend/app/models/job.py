@@ -28,6 +28,8 @@ class Job(Base):
     video_url = Column(Text, nullable=True)
     file_key = Column(Text, nullable=True)
     result = Column(JSONB, nullable=True)
+    # 완료 시 생성한 에디터 자막 클립 {"version", "options", "clips", "speakers", "stats"}
+    segmentation = Column(JSONB, nullable=True)
     error_message = Column(Text, nullable=True)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
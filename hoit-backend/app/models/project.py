@@ -1,4 +1,14 @@
-from sqlalchemy import Column, String, Integer, Float, DateTime, Text, ForeignKey, JSON
+from sqlalchemy import (
+    Column,
+    String,
+    Integer,
+    Float,
+    DateTime,
+    Text,
+    ForeignKey,
+    JSON,
+    Index,
+)
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.database import Base
@@ -18,6 +28,13 @@ class Project(Base):
     clips = Column(JSON, default=list)  # ClipItem[] 저장
     settings = Column(JSON, default=dict)  # ProjectSettings 저장
 
+    # 목록 조회용 요약 정보 (clips 쓰기 시 함께 갱신)
+    clip_count = Column(Integer, default=0, nullable=False, server_default="0")
+    size_bytes = Column(Integer, default=0, nullable=False, server_default="0")
+
+    # clips/words 테이블이 반영하고 있는 프로젝트 버전 (NULL이면 미동기화)
+    clip_rows_version = Column(Integer, nullable=True)
+
     # 미디어 정보
     media_id = Column(String(255), nullable=True)
     video_url = Column(Text, nullable=True)
@@ -45,3 +62,21 @@ class Project(Base):
     clips_relation = relationship(
         "Clip", back_populates="project", cascade="all, delete-orphan"
     )
+    changes = relationship(
+        "ProjectChange",
+        back_populates="project",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+    versions = relationship(
+        "ProjectVersion",
+        back_populates="project",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    __table_args__ = (
+        # 목록 keyset 페이지네이션용
+        Index("idx_projects_user_updated", "user_id", "updated_at", "id"),
+        Index("idx_projects_user_created", "user_id", "created_at", "id"),
+    )
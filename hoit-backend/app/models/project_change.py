@@ -0,0 +1,48 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    JSON,
+    Index,
+)
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+from app.db.database import Base
+
+
+class ProjectChange(Base):
+    """프로젝트 변경 로그 - 버전별 클립 단위 변경 내역 (since-version 조회용)"""
+
+    __tablename__ = "project_changes"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    project_id = Column(
+        String(255),
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    version = Column(Integer, nullable=False)  # 이 변경으로 만들어진 프로젝트 버전
+
+    # 변경된 클립 ID 목록 (내용은 projects.clips에서 조회)
+    added = Column(JSON, default=list)
+    modified = Column(JSON, default=list)
+    deleted = Column(JSON, default=list)
+    reordered = Column(Boolean, default=False)
+    meta_changed = Column(Boolean, default=False)  # 이름/설정/비디오 정보 변경 여부
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # 관계
+    project = relationship("Project", back_populates="changes")
+
+    __table_args__ = (
+        Index(
+            "idx_project_changes_project_version",
+            "project_id",
+            "version",
+            unique=True,
+        ),
+    )
@@ -0,0 +1,65 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    DateTime,
+    ForeignKey,
+    JSON,
+    LargeBinary,
+    Index,
+)
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+from app.db.database import Base
+
+
+class ProjectBlob(Base):
+    """버전 히스토리 블롭 - 내용 해시로 중복 제거된 zstd 압축 JSON (클립/메타/스냅샷 목록)"""
+
+    __tablename__ = "project_blobs"
+
+    hash = Column(String(64), primary_key=True)  # 원본 JSON의 sha256
+    data = Column(LargeBinary, nullable=False)  # zstd 압축 데이터
+    raw_size = Column(Integer, nullable=False)
+    stored_size = Column(Integer, nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class ProjectVersion(Base):
+    """프로젝트 버전 히스토리 - 주기적 전체 스냅샷 + 그 사이의 클립 단위 델타"""
+
+    __tablename__ = "project_versions"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    project_id = Column(
+        String(255),
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    version = Column(Integer, nullable=False)
+    kind = Column(String(20), nullable=False)  # snapshot, delta
+    base_version = Column(Integer, nullable=False)  # 복원 시작점이 되는 스냅샷 버전
+
+    # snapshot: 전체 목록 블롭 해시 / delta: 클립 ID → 블롭 해시 변경분
+    manifest_hash = Column(String(64), nullable=True)
+    delta = Column(JSON, nullable=True)  # {"upserted", "deleted", "order", "meta"}
+
+    # 목록 표시용 요약
+    name = Column(String(255), nullable=True)
+    clip_count = Column(Integer, nullable=False, default=0)
+    size_bytes = Column(Integer, nullable=False, default=0)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # 관계
+    project = relationship("Project", back_populates="versions")
+
+    __table_args__ = (
+        Index(
+            "idx_project_versions_project_version",
+            "project_id",
+            "version",
+            unique=True,
+        ),
+    )
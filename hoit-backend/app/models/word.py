@@ -1,4 +1,13 @@
-from sqlalchemy import Column, String, Float, Boolean, ForeignKey, JSON, DateTime
+from sqlalchemy import (
+    Column,
+    String,
+    Integer,
+    Float,
+    Boolean,
+    ForeignKey,
+    JSON,
+    DateTime,
+)
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.db.database import Base
@@ -9,7 +18,7 @@ class Word(Base):
 
     __tablename__ = "words"
 
-    # 기본 정보
+    # 기본 정보 (id는 "{clip row id}:{클라이언트 word id}" 형식)
     id = Column(String(255), primary_key=True, index=True)
     clip_id = Column(
         String(255),
@@ -18,6 +27,9 @@ class Word(Base):
         index=True,
     )
 
+    # 클립 내 순서
+    position = Column(Integer, nullable=False, default=0, server_default="0")
+
     # 단어 정보
     text = Column(String(255), nullable=False)
 
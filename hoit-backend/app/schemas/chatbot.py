@@ -22,6 +22,13 @@ class ChatBotRequest(BaseModel):
     scenario_data: Optional[Dict[str, Any]] = Field(
         default=None, description="현재 시나리오 파일 (자막 및 스타일링 데이터)"
     )
+    job_id: Optional[str] = Field(
+        default=None,
+        description="scenario_data가 없을 때 서버에서 만든 시나리오를 사용할 ML 작업 ID",
+    )
+    style_preset: str = Field(
+        default="default", description="job_id로 시나리오를 만들 때 사용할 스타일 프리셋"
+    )
     max_tokens: Optional[int] = Field(
         default=2000, description="최대 토큰 수 (백엔드에서 2000으로 고정 설정됨)", ge=1, le=4000
     )
@@ -90,6 +97,10 @@ class ChatBotResponse(BaseModel):
         default=None, description="파싱된 RFC6902 JSON Patch 배열 (시나리오 편집용)"
     )
     has_scenario_edits: Optional[bool] = Field(default=False, description="시나리오 편집 여부")
+    context_stats: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="프롬프트에 넣은 시나리오 범위와 추정 토큰 절감량 (sent_cues, saved_ratio 등)",
+    )
 
     class Config:
         json_schema_extra = {
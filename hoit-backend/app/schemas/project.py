@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -97,6 +97,65 @@ class ProjectResponse(ProjectBase):
         from_attributes = True
 
 
+class ProjectDeltaResponse(ProjectBase):
+    """since-version 조회 응답 스키마 (변경된 클립만 포함)"""
+
+    id: str
+    since_version: int
+    version: int
+    upserted: List[ClipItemSchema] = []  # 추가/수정된 클립의 현재 내용
+    deleted: List[str] = []  # 삭제된 클립 ID 목록
+    order: Optional[List[str]] = None  # 구조 변경 시 현재 클립 ID 순서
+    updated_at: datetime
+    server_synced_at: Optional[datetime] = None
+    sync_status: str = "pending"
+    change_count: int = 0
+
+
+class ProjectClipsDelta(BaseModel):
+    """클립 증분 업데이트 스키마 (PATCH /clips)"""
+
+    added: List[ClipItemSchema] = []
+    modified: List[ClipItemSchema] = []  # id 기준으로 클립 전체 교체
+    deleted: List[str] = []  # 삭제할 클립 ID 목록
+    order: Optional[List[str]] = None  # 변경 후 전체 클립 ID 순서 (생략 시 추가 클립은 끝에 붙임)
+
+
+class ProjectBulkOperation(BaseModel):
+    """일괄 편집 연산"""
+
+    op: str = Field(..., pattern="^(shift|scale|find_replace|merge_gaps|split_gaps)$")
+    clip_ids: Optional[List[str]] = None  # 적용 범위 (생략 시 전체 클립)
+
+    # shift: offset초 이동 (start_after 이후 단어만 선택 가능)
+    offset: Optional[float] = None
+    start_after: Optional[float] = None
+
+    # scale: origin 기준 배율 (예: 원본 fps / 대상 fps)
+    factor: Optional[float] = None
+    origin: float = 0.0
+
+    # find_replace: 단어 텍스트 찾아 바꾸기
+    find: Optional[str] = None
+    replace: str = ""
+    match_case: bool = True
+    whole_word: bool = False
+    regex: bool = False
+
+    # merge_gaps: 클립 간 간격이 max_gap초 이하이면 병합
+    max_gap: Optional[float] = Field(None, ge=0)
+    same_speaker: bool = True
+
+    # split_gaps: 단어 간 간격이 min_gap초를 넘으면 분할
+    min_gap: Optional[float] = Field(None, ge=0)
+
+
+class ProjectBulkEditRequest(BaseModel):
+    """일괄 편집 요청 (연산은 순서대로 적용)"""
+
+    operations: List[ProjectBulkOperation] = Field(..., min_length=1, max_length=20)
+
+
 class ProjectListResponse(BaseModel):
     """프로젝트 목록 응답 스키마"""
 
@@ -112,6 +171,63 @@ class ProjectListResponse(BaseModel):
         from_attributes = True
 
 
+class ProjectVersionInfo(BaseModel):
+    """히스토리 버전 요약"""
+
+    version: int
+    kind: str  # snapshot, delta
+    name: Optional[str] = None
+    clip_count: int = 0
+    size_bytes: int = 0
+    created_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class ProjectVersionContent(ProjectBase):
+    """히스토리 버전 내용 (복원 전 미리보기)"""
+
+    id: str
+    version: int
+    clips: List[ClipItemSchema]
+
+
+class ProjectRestoreRequest(BaseModel):
+    """버전 복원 요청 (version 또는 at 중 하나)"""
+
+    version: Optional[int] = None
+    at: Optional[datetime] = None  # 해당 시각 직전에 저장된 버전
+
+
+class ProjectDuplicateRequest(BaseModel):
+    """프로젝트 복제 요청"""
+
+    id: Optional[str] = None  # 생략 시 서버에서 생성
+    name: Optional[str] = None
+
+
+class TranscriptSearchHit(BaseModel):
+    """자막 검색 결과 항목"""
+
+    project_id: str
+    project_name: str
+    clip_id: str
+    word_id: Optional[str] = None  # 검색어가 처음 등장하는 단어
+    speaker: Optional[str] = None
+    snippet: str
+    start: float  # 초 단위 (매칭 단어 없으면 클립 시작)
+    end: float
+
+
+class TranscriptSearchResponse(BaseModel):
+    """자막 검색 응답"""
+
+    query: str
+    hits: List[TranscriptSearchHit] = []
+    has_more: bool = False
+
+
 class ProjectSyncResponse(BaseModel):
     """프로젝트 동기화 응답"""
 
@@ -128,3 +244,5 @@ class ConflictResponse(BaseModel):
     your_version: int
     server_data: Optional[Dict[str, Any]] = None
     conflict_resolution: str = "merge"  # merge, overwrite, manual
+    # 3-way 병합 후에도 겹친 항목 (clip_id, word_id, field, base/server/client 값)
+    conflicts: Optional[List[Dict[str, Any]]] = None
@@ -1,13 +1,16 @@
+import uuid
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional
 from passlib.context import CryptContext
 from jose import JWTError, jwt
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Session
 from authlib.integrations.starlette_client import OAuth
-import httpx
 from app.models.user import User, AuthProvider
 from app.schemas.user import UserCreate
 from app.core.config import settings
+from app.services.password_hasher import password_hasher
+from app.services.user_cache import user_cache
 
 # 비밀번호 암호화 설정
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -43,7 +46,8 @@ class AuthService:
                 minutes=settings.jwt_access_token_expire_minutes
             )
 
-        to_encode.update({"exp": expire, "type": "access"})
+        # jti: 토큰별 식별자 (사용자 조회 캐시 키, 로그아웃 시 폐기 대상)
+        to_encode.update({"exp": expire, "type": "access", "jti": uuid.uuid4().hex})
         encoded_jwt = jwt.encode(
             to_encode, settings.jwt_secret_key, algorithm=ALGORITHM
         )
@@ -84,20 +88,32 @@ class AuthService:
             return None
 
     @staticmethod
-    def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
-        """사용자 인증"""
+    async def hash_password(password: str) -> str:
+        """비밀번호 해시화 (해시 풀에서 실행, 이벤트 루프를 막지 않음)"""
+        return await password_hasher.run(AuthService.get_password_hash, password)
+
+    @staticmethod
+    async def authenticate_user(
+        db: Session, email: str, password: str
+    ) -> Optional[User]:
+        """사용자 인증 (비밀번호 검증은 해시 풀에서 실행)"""
         user = db.query(User).filter(User.email == email).first()
-        if not user:
+        if not user or not user.password_hash:
             return None
-        if not AuthService.verify_password(password, user.password_hash):
+        if not await password_hasher.run(
+            AuthService.verify_password, password, user.password_hash
+        ):
             return None
         return user
 
     @staticmethod
-    def create_user(db: Session, user_data: UserCreate) -> User:
-        """새 사용자 생성"""
+    def create_user(
+        db: Session, user_data: UserCreate, hashed_password: Optional[str] = None
+    ) -> User:
+        """새 사용자 생성 (hashed_password가 없으면 여기서 해시화)"""
         # 비밀번호 해시화
-        hashed_password = AuthService.get_password_hash(user_data.password)
+        if hashed_password is None:
+            hashed_password = AuthService.get_password_hash(user_data.password)
 
         # 사용자 생성
         db_user = User(
@@ -134,35 +150,40 @@ class AuthService:
         )
 
     @staticmethod
-    async def get_google_user_info(access_token: str) -> Dict[str, Any]:
-        """Google OAuth 토큰으로 사용자 정보 가져오기"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://www.googleapis.com/oauth2/v2/userinfo",
-                headers={"Authorization": f"Bearer {access_token}"},
-            )
-            response.raise_for_status()
-            return response.json()
-
-    @staticmethod
-    def create_oauth_user(
+    def upsert_oauth_user(
         db: Session, email: str, username: str, oauth_id: str, provider: AuthProvider
-    ) -> User:
-        """OAuth 사용자 생성"""
-        db_user = User(
-            username=username,
-            email=email,
-            password_hash=None,  # OAuth 사용자는 비밀번호 없음
-            auth_provider=provider,
-            oauth_id=oauth_id,
-            is_verified=True,  # OAuth 사용자는 이미 인증됨
+    ) -> Optional[User]:
+        """
+        OAuth 사용자 조회/생성을 한 번의 INSERT ... ON CONFLICT로 처리
+
+        같은 이메일의 같은 제공자 계정이 있으면 그 계정을 돌려주고(oauth_id만 갱신),
+        다른 제공자(로컬 가입 등) 계정이 있으면 None을 돌려줍니다.
+        Core INSERT라 User ORM 업데이트 이벤트가 발생하지 않으므로 캐시를 직접 무효화합니다.
+        """
+        statement = (
+            postgresql.insert(User)
+            .values(
+                username=username,
+                email=email,
+                password_hash=None,  # OAuth 사용자는 비밀번호 없음
+                auth_provider=provider,
+                oauth_id=oauth_id,
+                is_verified=True,  # OAuth 사용자는 이미 인증됨
+            )
+            .on_conflict_do_update(
+                index_elements=[User.email],
+                set_={"oauth_id": oauth_id},
+                where=User.auth_provider == provider,
+            )
+            .returning(User)
         )
-
-        db.add(db_user)
+        user = db.scalars(
+            statement, execution_options={"populate_existing": True}
+        ).first()
         db.commit()
-        db.refresh(db_user)
-
-        return db_user
+        if user is not None:
+            user_cache.invalidate_user(user.id)
+        return user
 
 
 # OAuth 클라이언트 설정
@@ -0,0 +1,241 @@
+"""
+Bedrock 호출 전용 실행기
+
+ChatBedrock/boto3 호출은 동기식이라 async 핸들러에서 바로 부르면 수 초 동안 워커 전체가
+멈춥니다. 호출을 전용 스레드 풀에서 실행하고 워커당 동시 호출 수를 제한합니다.
+
+- 동시 호출: CHATBOT_MAX_CONCURRENCY (세마포어, 스레드 풀 크기와 동일)
+- 대기열: CHATBOT_MAX_QUEUE를 넘거나 CHATBOT_QUEUE_TIMEOUT 안에 차례가 오지 않으면
+  BedrockBusy (→ 503)
+- 클라이언트 연결 끊김: 대기 중이면 Bedrock을 호출하지 않고 취소하며, 이미 호출 중이면
+  결과를 기다리지 않고 바로 반환합니다 (스레드의 호출은 끝날 때까지 자리를 차지).
+- 스트리밍(open_stream): 같은 슬롯 제한 아래에서 토큰을 받는 대로 이벤트 루프로 넘깁니다.
+
+stats()는 대기/실행 수, 취소/거절 수, 대기 시간과 호출 시간 p50/p99를 돌려줍니다.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional, Tuple
+
+from fastapi import Request
+
+from app.core.config import settings
+from app.utils.latency_stats import LatencyWindow
+
+# 클라이언트 연결 확인 간격 (초)
+DISCONNECT_POLL_INTERVAL = 0.5
+
+
+class BedrockBusy(Exception):
+    """대기열이 가득 찼거나 대기 시간이 초과됨"""
+
+
+class ClientDisconnected(Exception):
+    """응답을 기다리던 클라이언트가 연결을 끊음"""
+
+
+class BedrockExecutor:
+    """Bedrock 동기 호출을 제한된 스레드 풀에서 실행"""
+
+    def __init__(self, max_concurrency: int, max_queue: int, queue_timeout: float):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="bedrock"
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._waiting = 0
+        self._running = 0
+        self.completed = 0
+        self.cancelled = 0
+        self.rejected = 0
+        self._queue_waits = LatencyWindow()
+        self._durations = LatencyWindow()
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # 이벤트 루프가 생긴 뒤 만들어야 하므로 첫 호출 시 생성
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def _until_done(
+        self,
+        task: "asyncio.Future[Any]",
+        request: Optional[Request],
+        deadline: Optional[float] = None,
+    ) -> Any:
+        """task 완료까지 대기하면서 연결 끊김/대기 시간 초과 시 취소"""
+        while True:
+            timeout = DISCONNECT_POLL_INTERVAL
+            if deadline is not None:
+                timeout = min(timeout, max(deadline - time.monotonic(), 0))
+            done, _ = await asyncio.wait({task}, timeout=timeout)
+            if done:
+                return task.result()
+            if request is not None and await request.is_disconnected():
+                task.cancel()
+                self.cancelled += 1
+                raise ClientDisconnected()
+            if deadline is not None and time.monotonic() >= deadline:
+                task.cancel()
+                self.rejected += 1
+                raise BedrockBusy()
+
+    async def _acquire(self, request: Optional[Request]) -> None:
+        semaphore = self._get_semaphore()
+        acquire = asyncio.ensure_future(semaphore.acquire())
+        try:
+            await self._until_done(
+                acquire, request, time.monotonic() + self.queue_timeout
+            )
+        except BaseException:
+            # 취소 직전에 획득했다면 반납
+            if acquire.done() and not acquire.cancelled() and not acquire.exception():
+                semaphore.release()
+            else:
+                acquire.cancel()
+            raise
+
+    def _release(self) -> None:
+        self._running -= 1
+        self._get_semaphore().release()
+
+    async def _admit(self, request: Optional[Request]) -> None:
+        """대기열 확인 후 동시 호출 슬롯 획득"""
+        if self._waiting >= self.max_queue:
+            self.rejected += 1
+            raise BedrockBusy()
+
+        self._waiting += 1
+        enqueued = time.perf_counter()
+        try:
+            await self._acquire(request)
+        finally:
+            self._waiting -= 1
+        self._queue_waits.add(time.perf_counter() - enqueued)
+        self._running += 1
+
+    def _submit(self, call: Callable[[], Any]) -> "Future[Any]":
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+
+        def timed() -> Any:
+            try:
+                return call()
+            finally:
+                self._durations.add(time.perf_counter() - started)
+
+        future = self._executor.submit(timed)
+        # 스레드의 호출이 실제로 끝났을 때 세마포어 반납
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release))
+        return future
+
+    async def run(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        request: Optional[Request] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        fn(*args, **kwargs)를 Bedrock 풀에서 실행
+
+        Raises:
+            BedrockBusy: 대기열 포화 또는 대기 시간 초과
+            ClientDisconnected: request가 주어졌고 클라이언트가 연결을 끊음
+        """
+        await self._admit(request)
+        future = self._submit(lambda: fn(*args, **kwargs))
+        result = await self._until_done(asyncio.wrap_future(future), request)
+        self.completed += 1
+        return result
+
+    async def open_stream(
+        self,
+        fn: Callable[..., Iterator[Any]],
+        *args: Any,
+        request: Optional[Request] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """
+        이터레이터를 반환하는 fn을 Bedrock 풀에서 실행하고 항목을 비동기로 전달
+
+        슬롯 획득까지 기다린 뒤 반환하므로 BedrockBusy/ClientDisconnected는 응답을 시작하기
+        전에 발생합니다. 반환된 이터레이터를 끝까지 읽지 않고 닫으면(클라이언트 연결 끊김)
+        스레드의 스트림도 다음 항목에서 중단됩니다.
+        """
+        await self._admit(request)
+        loop = asyncio.get_running_loop()
+        queue: "asyncio.Queue[Tuple[bool, Any]]" = asyncio.Queue()
+        stopped = threading.Event()
+
+        def put(done: bool, item: Any) -> None:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, (done, item))
+            except RuntimeError:
+                # 이벤트 루프가 이미 종료됨
+                stopped.set()
+
+        def pump() -> None:
+            iterator = None
+            try:
+                iterator = iter(fn(*args, **kwargs))
+                for item in iterator:
+                    if stopped.is_set():
+                        break
+                    put(False, item)
+            except Exception as e:
+                put(True, e)
+                return
+            finally:
+                close = getattr(iterator, "close", None)
+                if close:
+                    close()
+            put(True, None)
+
+        self._submit(pump)
+        return self._drain(queue, stopped)
+
+    async def _drain(
+        self, queue: "asyncio.Queue[Tuple[bool, Any]]", stopped: threading.Event
+    ) -> AsyncIterator[Any]:
+        finished = False
+        try:
+            while True:
+                done, item = await queue.get()
+                if done:
+                    finished = True
+                    if item is not None:
+                        raise item
+                    self.completed += 1
+                    return
+                yield item
+        finally:
+            if not finished:
+                stopped.set()
+                self.cancelled += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "waiting": self._waiting,
+            "running": self._running,
+            "completed": self.completed,
+            "cancelled": self.cancelled,
+            "rejected": self.rejected,
+            **self._queue_waits.summary("queue_wait"),
+            **self._durations.summary("invoke"),
+        }
+
+
+# 싱글톤 인스턴스
+bedrock_executor = BedrockExecutor(
+    max_concurrency=settings.CHATBOT_MAX_CONCURRENCY,
+    max_queue=settings.CHATBOT_MAX_QUEUE,
+    queue_timeout=settings.CHATBOT_QUEUE_TIMEOUT,
+)
@@ -0,0 +1,385 @@
+"""
+프로젝트 일괄 편집 (시간 이동 / 배율 / 찾아 바꾸기 / 간격 기준 병합·분할)
+
+클립 JSON의 단어를 한 번 펼쳐 NumPy 열 배열(start, end, text, 소속 클립 인덱스)로 만들고
+연산을 배열 단위로 적용합니다. JSON으로 되돌릴 때는 값이 바뀐 클립만 새로 만들고,
+나머지 클립은 원래 객체를 그대로 재사용합니다.
+"""
+
+import re
+from typing import Dict, Any, List, Optional, Sequence
+
+import numpy as np
+
+from app.services.clip_merge import clip_text, format_clip_duration
+
+# 시간 연산 후 부동소수 오차 정리 (ms 단위)
+TIME_DECIMALS = 3
+
+
+class BulkEditError(ValueError):
+    """일괄 편집 요청이 현재 클립에 적용될 수 없음"""
+
+
+class ClipColumns:
+    """클립 목록의 단어 단위 열 배열"""
+
+    def __init__(self, clips: List[Dict[str, Any]]):
+        self.clips = clips
+        words_per_clip = [clip.get("words") or [] for clip in clips]
+        counts = np.fromiter(
+            (len(words) for words in words_per_clip), dtype=np.int64, count=len(clips)
+        )
+        self.offsets = np.concatenate(([0], np.cumsum(counts)))
+        self.words = [word for words in words_per_clip for word in words]
+
+        total = len(self.words)
+        self.starts = np.fromiter(
+            (word.get("start", 0.0) for word in self.words),
+            dtype=np.float64,
+            count=total,
+        )
+        self.ends = np.fromiter(
+            (word.get("end", 0.0) for word in self.words), dtype=np.float64, count=total
+        )
+        self.texts = np.array(
+            [word.get("text", "") for word in self.words], dtype=object
+        )
+        self.clip_index = np.repeat(np.arange(len(clips)), counts)
+        self.dirty = np.zeros(len(clips), dtype=bool)
+        self.text_dirty = np.zeros(len(clips), dtype=bool)
+
+    def word_mask(self, clip_ids: Optional[Sequence[str]]) -> np.ndarray:
+        """적용 범위 클립에 속한 단어 마스크"""
+        if clip_ids is None:
+            return np.ones(len(self.words), dtype=bool)
+        return self.clip_mask(clip_ids)[self.clip_index]
+
+    def clip_mask(self, clip_ids: Optional[Sequence[str]]) -> np.ndarray:
+        if clip_ids is None:
+            return np.ones(len(self.clips), dtype=bool)
+        selected = set(clip_ids)
+        return np.fromiter(
+            (clip.get("id") in selected for clip in self.clips),
+            dtype=bool,
+            count=len(self.clips),
+        )
+
+    def mark(self, word_mask: np.ndarray, text: bool = False) -> int:
+        """바뀐 단어가 속한 클립 표시 후 바뀐 단어 수 반환"""
+        changed_clips = np.unique(self.clip_index[word_mask])
+        self.dirty[changed_clips] = True
+        if text:
+            self.text_dirty[changed_clips] = True
+        return int(word_mask.sum())
+
+    def to_clips(self) -> List[Dict[str, Any]]:
+        """바뀐 클립만 새 dict로 만들어 클립 목록 재구성"""
+        # numpy 스칼라 변환을 단어마다 하지 않도록 한 번에 파이썬 값으로 변환
+        starts = self.starts.tolist()
+        ends = self.ends.tolist()
+        texts = self.texts.tolist()
+        offsets = self.offsets.tolist()
+
+        result = []
+        for index, clip in enumerate(self.clips):
+            if not self.dirty[index]:
+                result.append(clip)
+                continue
+
+            words = [
+                {
+                    **self.words[position],
+                    "start": starts[position],
+                    "end": ends[position],
+                    "text": texts[position],
+                }
+                for position in range(offsets[index], offsets[index + 1])
+            ]
+            if self.text_dirty[index]:
+                result.append(_with_words(clip, words))
+            else:
+                result.append(
+                    {**clip, "words": words, "duration": format_clip_duration(words)}
+                )
+        return result
+
+
+def _with_words(clip: Dict[str, Any], words: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """단어를 바꾼 클립 사본 (파생 필드 재계산)"""
+    text = clip_text(words)
+    return {
+        **clip,
+        "words": words,
+        "full_text": text,
+        "subtitle": text,
+        "duration": format_clip_duration(words),
+    }
+
+
+def shift_times(
+    columns: ClipColumns,
+    offset: float,
+    clip_ids: Optional[Sequence[str]] = None,
+    start_after: Optional[float] = None,
+) -> int:
+    """단어 시간을 offset초만큼 이동 (start_after 이후 단어만 선택 가능)"""
+    mask = columns.word_mask(clip_ids)
+    if start_after is not None:
+        mask &= columns.starts >= start_after
+    if not mask.any() or offset == 0:
+        return 0
+
+    starts = np.round(columns.starts[mask] + offset, TIME_DECIMALS)
+    if starts.min() < 0:
+        raise BulkEditError("Shift would move words before 0 seconds")
+    columns.starts[mask] = starts
+    columns.ends[mask] = np.round(columns.ends[mask] + offset, TIME_DECIMALS)
+    return columns.mark(mask)
+
+
+def scale_times(
+    columns: ClipColumns,
+    factor: float,
+    origin: float = 0.0,
+    clip_ids: Optional[Sequence[str]] = None,
+) -> int:
+    """origin 기준으로 단어 시간 배율 조정 (프레임레이트 변환 등)"""
+    if factor <= 0:
+        raise BulkEditError("Scale factor must be positive")
+    mask = columns.word_mask(clip_ids)
+    if not mask.any() or factor == 1:
+        return 0
+
+    starts = np.round(origin + (columns.starts[mask] - origin) * factor, TIME_DECIMALS)
+    if starts.min() < 0:
+        raise BulkEditError("Scale would move words before 0 seconds")
+    columns.starts[mask] = starts
+    columns.ends[mask] = np.round(
+        origin + (columns.ends[mask] - origin) * factor, TIME_DECIMALS
+    )
+    return columns.mark(mask)
+
+
+def find_replace(
+    columns: ClipColumns,
+    find: str,
+    replace: str = "",
+    match_case: bool = True,
+    whole_word: bool = False,
+    regex: bool = False,
+    clip_ids: Optional[Sequence[str]] = None,
+) -> int:
+    """
+    단어 텍스트 찾아 바꾸기
+
+    일반 검색은 포함 여부로 후보 단어를 먼저 추린 뒤 후보에만 정규식 치환을 적용합니다.
+    """
+    if not find:
+        raise BulkEditError("Find text is required")
+
+    try:
+        pattern = find if regex else re.escape(find)
+        if whole_word:
+            pattern = rf"(?<!\w)(?:{pattern})(?!\w)"
+        compiled = re.compile(pattern, 0 if match_case else re.IGNORECASE)
+    except re.error as e:
+        raise BulkEditError(f"Invalid pattern: {str(e)}")
+
+    mask = columns.word_mask(clip_ids)
+    if not regex:
+        # 부분 문자열 포함 여부로 후보만 추림 (np.char 연산보다 빠름)
+        needle = find if match_case else find.lower()
+        texts = columns.texts if match_case else (t.lower() for t in columns.texts)
+        mask &= np.fromiter(
+            (needle in text for text in texts), dtype=bool, count=len(columns.words)
+        )
+
+    candidates = np.flatnonzero(mask)
+    if not len(candidates):
+        return 0
+
+    # 일반 검색의 바꿀 텍스트는 그대로 삽입 (역슬래시를 그룹 참조로 해석하지 않음)
+    replacement = replace if regex else (lambda _: replace)
+    try:
+        replaced = np.array(
+            [compiled.sub(replacement, columns.texts[i]) for i in candidates],
+            dtype=object,
+        )
+    except re.error as e:
+        raise BulkEditError(f"Invalid replacement: {str(e)}")
+    changed = replaced != columns.texts[candidates]
+    columns.texts[candidates[changed]] = replaced[changed]
+
+    changed_mask = np.zeros(len(columns.words), dtype=bool)
+    changed_mask[candidates[changed]] = True
+    return columns.mark(changed_mask, text=True)
+
+
+def _clip_bounds(columns: ClipColumns) -> np.ndarray:
+    """클립별 (첫 단어 start, 마지막 단어 end), 단어 없는 클립은 NaN"""
+    counts = np.diff(columns.offsets)
+    has_words = counts > 0
+    bounds = np.full((len(columns.clips), 2), np.nan)
+    bounds[has_words, 0] = columns.starts[columns.offsets[:-1][has_words]]
+    bounds[has_words, 1] = columns.ends[columns.offsets[1:][has_words] - 1]
+    return bounds
+
+
+def merge_at_gaps(
+    columns: ClipColumns,
+    max_gap: float,
+    same_speaker: bool = True,
+    clip_ids: Optional[Sequence[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    이웃 클립 사이 간격이 max_gap초 이하이면 하나로 병합
+
+    병합된 클립은 첫 클립 ID를 유지하고 나머지 클립은 삭제됩니다.
+    """
+    clips = columns.to_clips()
+    if len(clips) < 2:
+        return clips
+
+    bounds = _clip_bounds(columns)
+    gaps = bounds[1:, 0] - bounds[:-1, 1]
+    in_scope = columns.clip_mask(clip_ids)
+    join = (gaps <= max_gap) & in_scope[1:] & in_scope[:-1]  # NaN 비교는 False
+    if same_speaker:
+        speakers = np.array([clip.get("speaker") for clip in clips], dtype=object)
+        join &= speakers[1:] == speakers[:-1]
+    if not join.any():
+        return clips
+
+    group_ids = np.concatenate(([0], np.cumsum(~join)))
+    group_starts = np.flatnonzero(np.diff(group_ids, prepend=-1))
+
+    result = []
+    for position, begin in enumerate(group_starts):
+        end = (
+            group_starts[position + 1]
+            if position + 1 < len(group_starts)
+            else len(clips)
+        )
+        if end - begin == 1:
+            result.append(clips[begin])
+            continue
+
+        words: List[Dict[str, Any]] = []
+        seen = set()
+        for member in clips[begin:end]:
+            for word in member.get("words") or []:
+                word_id = word.get("id")
+                if word_id in seen:
+                    # 병합 후에도 클립 내 단어 ID가 유일하도록
+                    word = {**word, "id": f"{member.get('id')}_{word_id}"}
+                seen.add(word["id"])
+                words.append(word)
+        result.append(_with_words(clips[begin], words))
+    return result
+
+
+def split_at_gaps(
+    columns: ClipColumns,
+    min_gap: float,
+    clip_ids: Optional[Sequence[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    클립 안에서 단어 사이 간격이 min_gap초를 넘는 지점마다 분할
+
+    첫 조각은 원래 클립 ID를, 나머지 조각은 "{clip_id}_split_{n}" ID를 사용합니다.
+    """
+    clips = columns.to_clips()
+    if len(columns.words) < 2:
+        return clips
+
+    gaps = columns.starts[1:] - columns.ends[:-1]
+    same_clip = columns.clip_index[1:] == columns.clip_index[:-1]
+    in_scope = columns.word_mask(clip_ids)[1:]
+    cut_after = np.flatnonzero((gaps > min_gap) & same_clip & in_scope)
+    if not len(cut_after):
+        return clips
+
+    cuts_by_clip: Dict[int, List[int]] = {}
+    for position in cut_after:
+        clip_position = int(columns.clip_index[position])
+        local = int(position - columns.offsets[clip_position]) + 1
+        cuts_by_clip.setdefault(clip_position, []).append(local)
+
+    used_ids = {clip.get("id") for clip in clips}
+    result = []
+    for index, clip in enumerate(clips):
+        cuts = cuts_by_clip.get(index)
+        if not cuts:
+            result.append(clip)
+            continue
+
+        words = clip.get("words") or []
+        bounds = [0] + cuts + [len(words)]
+        for part, (begin, end) in enumerate(zip(bounds[:-1], bounds[1:])):
+            piece = _with_words(clip, words[begin:end])
+            if part:
+                piece_id = f"{clip.get('id')}_split_{part}"
+                suffix = 1
+                while piece_id in used_ids:
+                    suffix += 1
+                    piece_id = f"{clip.get('id')}_split_{part}_{suffix}"
+                used_ids.add(piece_id)
+                piece["id"] = piece_id
+            result.append(piece)
+    return result
+
+
+def apply_bulk_operations(
+    clips: List[Dict[str, Any]], operations: Sequence[Any]
+) -> List[Dict[str, Any]]:
+    """
+    일괄 편집 연산을 순서대로 적용한 클립 목록 반환
+
+    시간/텍스트 연산은 열 배열에 누적하고, 병합/분할처럼 클립 구성이 바뀌는 연산 뒤에만
+    열 배열을 다시 만듭니다.
+    """
+    columns = ClipColumns(clips)
+    for operation in operations:
+        op = operation.op
+        if op == "shift":
+            if operation.offset is None:
+                raise BulkEditError("shift requires offset")
+            shift_times(
+                columns, operation.offset, operation.clip_ids, operation.start_after
+            )
+        elif op == "scale":
+            if operation.factor is None:
+                raise BulkEditError("scale requires factor")
+            scale_times(columns, operation.factor, operation.origin, operation.clip_ids)
+        elif op == "find_replace":
+            find_replace(
+                columns,
+                operation.find or "",
+                operation.replace,
+                operation.match_case,
+                operation.whole_word,
+                operation.regex,
+                operation.clip_ids,
+            )
+        elif op == "merge_gaps":
+            if operation.max_gap is None:
+                raise BulkEditError("merge_gaps requires max_gap")
+            columns = ClipColumns(
+                merge_at_gaps(
+                    columns,
+                    operation.max_gap,
+                    operation.same_speaker,
+                    operation.clip_ids,
+                )
+            )
+        elif op == "split_gaps":
+            if operation.min_gap is None:
+                raise BulkEditError("split_gaps requires min_gap")
+            columns = ClipColumns(
+                split_at_gaps(columns, operation.min_gap, operation.clip_ids)
+            )
+        else:
+            raise BulkEditError(f"Unsupported operation: {op}")
+
+    return columns.to_clips()
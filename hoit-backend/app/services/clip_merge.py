@@ -0,0 +1,288 @@
+"""
+프로젝트 클립 3-way 병합
+
+기준 버전(base), 서버 현재 버전(server), 클라이언트 제출본(client)을 클립 → 필드 → 단어
+단위로 비교합니다. 한쪽만 바꾼 부분은 그대로 반영하고, 양쪽이 같은 대상을 서로 다르게
+바꾼 경우만 충돌로 돌려줍니다.
+
+full_text / subtitle / duration은 단어에서 파생되는 값이라, 단어가 충돌 없이 병합되었고
+양쪽 값이 각자의 단어와 일치하면 병합된 단어로 다시 계산합니다.
+"""
+
+from typing import Dict, Any, List, Optional, Tuple
+
+
+class _Missing:
+    """값 없음 표시 (None 값과 구분하기 위한 센티널)"""
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+MISSING = _Missing()
+
+DERIVED_FIELDS = ("full_text", "subtitle", "duration")
+
+
+def clip_text(words: List[Dict[str, Any]]) -> str:
+    """단어 텍스트를 공백으로 이어 붙인 자막 텍스트 (프론트엔드와 동일 규칙)"""
+    return " ".join(word.get("text", "") for word in words)
+
+
+def format_clip_duration(words: List[Dict[str, Any]]) -> str:
+    """단어 타이밍 기준 클립 길이 ("1.283초" 형식)"""
+    if not words:
+        return f"{0:.3f}초"
+    return f"{max(0.0, float(words[-1]['end']) - float(words[0]['start'])):.3f}초"
+
+
+def _derive(field: str, words: List[Dict[str, Any]]) -> str:
+    if field == "duration":
+        return format_clip_duration(words)
+    return clip_text(words)
+
+
+def _plain(value: Any) -> Any:
+    return None if value is MISSING else value
+
+
+def _merge_value(base: Any, server: Any, client: Any) -> Tuple[Any, bool]:
+    """단일 값 3-way 병합 → (결과, 충돌 여부). 충돌 시 서버 값 유지"""
+    if server == client or client == base:
+        return server, False
+    if server == base:
+        return client, False
+    return server, True
+
+
+def _by_id(items: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    return {item.get("id"): item for item in items}
+
+
+def _merge_order(
+    base_ids: List[str],
+    server_ids: List[str],
+    client_ids: List[str],
+    merged_ids: set,
+) -> List[str]:
+    """
+    병합 결과 순서 결정
+
+    클라이언트가 기존 항목 순서를 바꿨으면 클라이언트 순서를, 아니면 서버 순서를 기준으로
+    하고, 다른 쪽에만 있는 항목은 그쪽에서의 바로 앞 항목 뒤에 끼워 넣습니다.
+    """
+    base_set = set(base_ids)
+    client_set = set(client_ids)
+    client_reordered = [i for i in client_ids if i in base_set] != [
+        i for i in base_ids if i in client_set
+    ]
+    primary, secondary = (
+        (client_ids, server_ids) if client_reordered else (server_ids, client_ids)
+    )
+
+    result = [item_id for item_id in primary if item_id in merged_ids]
+    placed = set(result)
+    anchor: Optional[str] = None
+    for item_id in secondary:
+        if item_id in merged_ids and item_id not in placed:
+            index = result.index(anchor) + 1 if anchor is not None else 0
+            result.insert(index, item_id)
+            placed.add(item_id)
+        if item_id in placed:
+            anchor = item_id
+
+    result.extend(item_id for item_id in merged_ids if item_id not in placed)
+    return result
+
+
+def _merge_words(
+    clip_id: str,
+    base: List[Dict[str, Any]],
+    server: List[Dict[str, Any]],
+    client: List[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """단어 ID 기준 병합 (같은 단어의 다른 필드를 바꾼 경우도 자동 병합)"""
+    base_by_id, server_by_id, client_by_id = (
+        _by_id(base),
+        _by_id(server),
+        _by_id(client),
+    )
+    merged: Dict[str, Dict[str, Any]] = {}
+    conflicts: List[Dict[str, Any]] = []
+
+    for word_id in list(server_by_id) + [
+        w for w in client_by_id if w not in server_by_id
+    ]:
+        b = base_by_id.get(word_id, MISSING)
+        s = server_by_id.get(word_id, MISSING)
+        c = client_by_id.get(word_id, MISSING)
+        value, conflicted = _merge_value(b, s, c)
+        if conflicted and MISSING not in (s, c):
+            value = {}
+            for key in list(s) + [k for k in c if k not in s]:
+                field_value, field_conflict = _merge_value(
+                    MISSING if b is MISSING else b.get(key, MISSING),
+                    s.get(key, MISSING),
+                    c.get(key, MISSING),
+                )
+                if field_conflict:
+                    conflicts.append(
+                        {
+                            "clip_id": clip_id,
+                            "word_id": word_id,
+                            "field": key,
+                            "base": _plain(b if b is MISSING else b.get(key, MISSING)),
+                            "server": _plain(s.get(key, MISSING)),
+                            "client": _plain(c.get(key, MISSING)),
+                        }
+                    )
+                if field_value is not MISSING:
+                    value[key] = field_value
+        elif conflicted:
+            conflicts.append(
+                {
+                    "clip_id": clip_id,
+                    "word_id": word_id,
+                    "field": None,
+                    "base": _plain(b),
+                    "server": _plain(s),
+                    "client": _plain(c),
+                }
+            )
+        if value is not MISSING:
+            merged[word_id] = value
+
+    order = _merge_order(
+        [w.get("id") for w in base],
+        [w.get("id") for w in server],
+        [w.get("id") for w in client],
+        set(merged),
+    )
+    words = [merged[word_id] for word_id in order]
+    # 단어는 타임라인 순서 유지 (정렬은 안정적이므로 같은 시작 시간은 병합 순서 유지)
+    words.sort(key=lambda word: float(word.get("start", 0.0)))
+    return words, conflicts
+
+
+def _merge_clip(
+    clip_id: str, base: Dict[str, Any], server: Dict[str, Any], client: Dict[str, Any]
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """양쪽에서 수정된 클립을 필드/단어 단위로 병합"""
+    words, conflicts = _merge_words(
+        clip_id,
+        base.get("words") or [],
+        server.get("words") or [],
+        client.get("words") or [],
+    )
+
+    merged: Dict[str, Any] = {}
+    for key in list(server) + [k for k in client if k not in server]:
+        if key == "words":
+            continue
+        b = base.get(key, MISSING)
+        s = server.get(key, MISSING)
+        c = client.get(key, MISSING)
+        value, conflicted = _merge_value(b, s, c)
+
+        if (
+            conflicted
+            and key in DERIVED_FIELDS
+            and s == _derive(key, server.get("words") or [])
+            and c == _derive(key, client.get("words") or [])
+        ):
+            # 단어 충돌이 있으면 단어 쪽 충돌로만 보고 (해결되면 다시 계산됨)
+            conflicted = False
+            if not conflicts:
+                value = _derive(key, words)
+
+        if conflicted:
+            conflicts.append(
+                {
+                    "clip_id": clip_id,
+                    "field": key,
+                    "base": _plain(b),
+                    "server": _plain(s),
+                    "client": _plain(c),
+                }
+            )
+        if value is not MISSING:
+            merged[key] = value
+
+    merged["words"] = words
+    return merged, conflicts
+
+
+def merge_clips(
+    base: List[Dict[str, Any]],
+    server: List[Dict[str, Any]],
+    client: List[Dict[str, Any]],
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    클립 목록 3-way 병합
+
+    Returns:
+        (병합된 클립 목록, 충돌 목록). 충돌 항목은 clip_id와 field/word_id,
+        base/server/client 값을 담으며, 충돌이 있으면 병합 결과는 사용하지 않아야 합니다.
+    """
+    base_by_id, server_by_id, client_by_id = (
+        _by_id(base),
+        _by_id(server),
+        _by_id(client),
+    )
+    merged: Dict[str, Dict[str, Any]] = {}
+    conflicts: List[Dict[str, Any]] = []
+
+    for clip_id in list(server_by_id) + [
+        c for c in client_by_id if c not in server_by_id
+    ]:
+        b = base_by_id.get(clip_id, MISSING)
+        s = server_by_id.get(clip_id, MISSING)
+        c = client_by_id.get(clip_id, MISSING)
+        value, conflicted = _merge_value(b, s, c)
+
+        if conflicted and MISSING in (s, c):
+            # 한쪽은 삭제, 다른 쪽은 수정
+            conflicts.append(
+                {
+                    "clip_id": clip_id,
+                    "field": None,
+                    "base": _plain(b),
+                    "server": _plain(s),
+                    "client": _plain(c),
+                }
+            )
+        elif conflicted:
+            value, clip_conflicts = _merge_clip(
+                clip_id, {} if b is MISSING else b, s, c
+            )
+            conflicts.extend(clip_conflicts)
+
+        if value is not MISSING:
+            merged[clip_id] = value
+
+    order = _merge_order(
+        [clip.get("id") for clip in base],
+        [clip.get("id") for clip in server],
+        [clip.get("id") for clip in client],
+        set(merged),
+    )
+    return [merged[clip_id] for clip_id in order], conflicts
+
+
+def merge_fields(
+    base: Dict[str, Any], server: Dict[str, Any], client: Dict[str, Any]
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """프로젝트 메타(이름/설정/비디오 정보) 필드 단위 3-way 병합"""
+    merged: Dict[str, Any] = {}
+    conflicts: List[Dict[str, Any]] = []
+    for key in list(server) + [k for k in client if k not in server]:
+        b = base.get(key)
+        s = server.get(key)
+        c = client.get(key, b)
+        value, conflicted = _merge_value(b, s, c)
+        if conflicted:
+            conflicts.append(
+                {"clip_id": None, "field": key, "base": b, "server": s, "client": c}
+            )
+        merged[key] = value
+    return merged, conflicts
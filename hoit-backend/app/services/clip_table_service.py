@@ -0,0 +1,288 @@
+"""
+정규화 clips/words 테이블 쓰기 서비스
+
+projects.clips JSON을 원본으로 유지하면서 clips/words 테이블에 같은 트랜잭션으로 반영합니다.
+PostgreSQL에서는 COPY, 그 외 DB에서는 multi-row INSERT를 사용합니다.
+
+클라이언트 clip/word ID는 프로젝트 간에 겹칠 수 있으므로 행 ID에 상위 ID를 접두사로 붙입니다.
+    clips.id = "{project_id}:{clip_id}"
+    words.id = "{clips.id}:{word_id}"
+"""
+
+import io
+import json
+import logging
+from typing import Dict, Any, List, Optional, Tuple
+
+from sqlalchemy import bindparam, delete, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.clip import Clip
+from app.models.project import Project
+from app.models.word import Word
+
+logger = logging.getLogger(__name__)
+
+ROW_ID_SEPARATOR = ":"
+
+CLIP_COLUMNS = (
+    "id",
+    "project_id",
+    "position",
+    "timeline",
+    "speaker",
+    "subtitle",
+    "full_text",
+    "start_time",
+    "end_time",
+    "duration",
+    "thumbnail_url",
+)
+WORD_COLUMNS = (
+    "id",
+    "clip_id",
+    "position",
+    "text",
+    "start",
+    "end",
+    "confidence",
+    "is_editable",
+    "applied_assets",
+)
+
+
+def clip_row_id(project_id: str, clip_id: str) -> str:
+    return f"{project_id}{ROW_ID_SEPARATOR}{clip_id}"
+
+
+def word_row_id(clip_row: str, word_id: str) -> str:
+    return f"{clip_row}{ROW_ID_SEPARATOR}{word_id}"
+
+
+def _truncate(value: Optional[str], length: int) -> Optional[str]:
+    return value[:length] if isinstance(value, str) else value
+
+
+class ClipTableService:
+    """projects.clips JSON → clips/words 테이블 벌크 반영"""
+
+    @staticmethod
+    def build_rows(
+        project_id: str,
+        clips: List[Dict[str, Any]],
+        positions: Optional[Dict[str, int]] = None,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        클립 JSON을 clips/words 행으로 변환
+
+        Args:
+            positions: 클립 ID → 프로젝트 내 순서 (생략 시 목록 순서)
+        """
+        clip_rows: List[Dict[str, Any]] = []
+        word_rows: List[Dict[str, Any]] = []
+
+        for index, clip in enumerate(clips):
+            clip_id = clip.get("id")
+            row_id = clip_row_id(project_id, clip_id)
+            words = clip.get("words") or []
+
+            start_time = float(words[0]["start"]) if words else 0.0
+            end_time = float(words[-1]["end"]) if words else 0.0
+
+            clip_rows.append(
+                {
+                    "id": row_id,
+                    "project_id": project_id,
+                    "position": positions[clip_id] if positions else index,
+                    "timeline": _truncate(clip.get("timeline"), 50),
+                    "speaker": _truncate(clip.get("speaker"), 100),
+                    "subtitle": clip.get("subtitle"),
+                    "full_text": clip.get("full_text"),
+                    "start_time": start_time,
+                    "end_time": end_time,
+                    "duration": max(0.0, end_time - start_time),
+                    "thumbnail_url": clip.get("thumbnail"),
+                }
+            )
+
+            for word_index, word in enumerate(words):
+                word_rows.append(
+                    {
+                        "id": word_row_id(row_id, word.get("id")),
+                        "clip_id": row_id,
+                        "position": word_index,
+                        "text": _truncate(word.get("text") or "", 255),
+                        "start": float(word.get("start", 0.0)),
+                        "end": float(word.get("end", 0.0)),
+                        "confidence": word.get("confidence"),
+                        "is_editable": word.get("is_editable", True),
+                        "applied_assets": word.get("applied_assets"),
+                    }
+                )
+
+        return clip_rows, word_rows
+
+    @staticmethod
+    def sync_project(
+        db: Session,
+        project: Project,
+        previous_version: Optional[int] = None,
+        changes: Optional[Dict[str, List[str]]] = None,
+        reordered: bool = False,
+    ) -> None:
+        """
+        프로젝트 저장과 같은 트랜잭션에서 clips/words 테이블 반영 (commit은 호출자)
+
+        테이블이 직전 버전과 동기화되어 있으면 변경된 클립만, 아니면 전체를 다시 씁니다.
+        반영은 SAVEPOINT 안에서 실행하므로 실패해도 프로젝트 저장은 그대로 진행되고,
+        clip_rows_version이 뒤처진 채로 남아 다음 저장 때 전체를 다시 씁니다.
+        """
+        if not settings.CLIP_TABLE_DUAL_WRITE:
+            return
+
+        clips = project.clips or []
+        savepoint = db.begin_nested()
+        try:
+            with savepoint:
+                if (
+                    changes is not None
+                    and previous_version is not None
+                    and project.clip_rows_version == previous_version
+                ):
+                    ClipTableService.apply_changes(
+                        db, project.id, clips, changes, reordered
+                    )
+                else:
+                    ClipTableService.replace_project_clips(db, project.id, clips)
+        except Exception as e:
+            logger.error(
+                f"Clip table sync failed for project {project.id} "
+                f"(version {project.version}): {str(e)}"
+            )
+            return
+
+        project.clip_rows_version = project.version
+
+    @staticmethod
+    def replace_project_clips(
+        db: Session, project_id: str, clips: List[Dict[str, Any]]
+    ) -> Dict[str, int]:
+        """프로젝트의 clips/words 행을 모두 지우고 다시 적재"""
+        ClipTableService._delete_project_rows(db, project_id)
+        clip_rows, word_rows = ClipTableService.build_rows(project_id, clips)
+        ClipTableService._bulk_insert(db, clip_rows, word_rows)
+        return {"clips": len(clip_rows), "words": len(word_rows)}
+
+    @staticmethod
+    def apply_changes(
+        db: Session,
+        project_id: str,
+        clips: List[Dict[str, Any]],
+        changes: Dict[str, List[str]],
+        reordered: bool = False,
+    ) -> Dict[str, int]:
+        """변경된 클립의 행만 교체하고 필요 시 순서 갱신"""
+        affected = changes["added"] + changes["modified"] + changes["deleted"]
+        if affected:
+            ClipTableService._delete_clip_rows(
+                db, [clip_row_id(project_id, clip_id) for clip_id in affected]
+            )
+
+        positions = {clip.get("id"): index for index, clip in enumerate(clips)}
+        upserted = set(changes["added"]) | set(changes["modified"])
+        clip_rows, word_rows = ClipTableService.build_rows(
+            project_id,
+            [clip for clip in clips if clip.get("id") in upserted],
+            positions,
+        )
+        ClipTableService._bulk_insert(db, clip_rows, word_rows)
+
+        # 추가/삭제/재정렬로 밀린 기존 클립 순서만 갱신
+        if changes["added"] or changes["deleted"] or reordered:
+            stored = db.execute(
+                select(Clip.id, Clip.position).where(Clip.project_id == project_id)
+            ).all()
+            prefix = f"{project_id}{ROW_ID_SEPARATOR}"
+            moved = [
+                {"row_id": row_id, "new_position": positions[row_id[len(prefix) :]]}
+                for row_id, position in stored
+                if positions.get(row_id[len(prefix) :], position) != position
+            ]
+            if moved:
+                db.execute(
+                    update(Clip.__table__)
+                    .where(Clip.__table__.c.id == bindparam("row_id"))
+                    .values(position=bindparam("new_position")),
+                    moved,
+                )
+
+        return {"clips": len(clip_rows), "words": len(word_rows)}
+
+    @staticmethod
+    def _delete_project_rows(db: Session, project_id: str) -> None:
+        clip_ids = select(Clip.id).where(Clip.project_id == project_id)
+        db.execute(delete(Word).where(Word.clip_id.in_(clip_ids)))
+        db.execute(delete(Clip).where(Clip.project_id == project_id))
+
+    @staticmethod
+    def _delete_clip_rows(db: Session, row_ids: List[str]) -> None:
+        db.execute(delete(Word).where(Word.clip_id.in_(row_ids)))
+        db.execute(delete(Clip).where(Clip.id.in_(row_ids)))
+
+    @staticmethod
+    def _bulk_insert(
+        db: Session,
+        clip_rows: List[Dict[str, Any]],
+        word_rows: List[Dict[str, Any]],
+    ) -> None:
+        if not clip_rows:
+            return
+
+        if db.get_bind().dialect.name == "postgresql":
+            ClipTableService._copy_rows(db, "clips", CLIP_COLUMNS, clip_rows)
+            ClipTableService._copy_rows(db, "words", WORD_COLUMNS, word_rows)
+        else:
+            db.execute(Clip.__table__.insert(), clip_rows)
+            if word_rows:
+                db.execute(Word.__table__.insert(), word_rows)
+
+    @staticmethod
+    def _copy_rows(
+        db: Session, table: str, columns: Tuple[str, ...], rows: List[Dict[str, Any]]
+    ) -> None:
+        """psycopg2 COPY FROM STDIN (text 포맷)으로 행 적재"""
+        if not rows:
+            return
+
+        buffer = io.StringIO()
+        for row in rows:
+            buffer.write("\t".join(_copy_value(row[column]) for column in columns))
+            buffer.write("\n")
+        buffer.seek(0)
+
+        # "end" 등 예약어 컬럼이 있어 컬럼명을 인용
+        column_list = ", ".join(f'"{column}"' for column in columns)
+        cursor = db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(f"COPY {table} ({column_list}) FROM STDIN", buffer)
+        finally:
+            cursor.close()
+
+
+def _copy_value(value: Any) -> str:
+    """COPY text 포맷 값 인코딩 (NULL은 \\N)"""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (list, dict)):
+        value = json.dumps(value, ensure_ascii=False)
+    elif not isinstance(value, str):
+        return str(value)
+    return (
+        value.replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
@@ -0,0 +1,165 @@
+"""
+Google ID 토큰 로컬 검증
+
+OAuth 콜백에서 받은 id_token(JWT)을 Google 공개키(JWKS)로 직접 검증해 사용자 정보를
+얻습니다. 로그인마다 userinfo API를 호출하지 않으므로 로그인 지연과 가용성이 Google
+API 왕복에 묶이지 않습니다.
+
+키 캐시
+- JWKS 응답의 Cache-Control max-age(최대 GOOGLE_JWKS_REFRESH_INTERVAL) 동안 사용합니다.
+- 유효 기간의 80%가 지나면 현재 키로 검증하면서 백그라운드에서 미리 갱신합니다.
+- 모르는 kid가 오면(키 교체 직후) 즉시 다시 받아오되, 최소 간격을 둬 반복 요청을 막습니다.
+- 갱신에 실패해도 이전 키가 있으면 계속 사용합니다.
+- 갱신 요청은 공유 httpx.AsyncClient 하나로 보냅니다.
+
+로컬 키 세트(load_keys)를 넣으면 네트워크 없이 검증할 수 있습니다.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from typing import Dict, Any, Optional
+
+import httpx
+from jose import jwt, JWTError
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_ISSUERS = ("https://accounts.google.com", "accounts.google.com")
+
+# 모르는 kid로 인한 강제 갱신 최소 간격 (초)
+MIN_FORCED_REFRESH_INTERVAL = 60.0
+
+# 유효 기간 중 이 비율이 지나면 백그라운드 갱신
+REFRESH_AHEAD_RATIO = 0.8
+
+MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+class GoogleIdTokenError(Exception):
+    """ID 토큰 검증 실패"""
+
+
+class GoogleIdTokenVerifier:
+    """JWKS 캐시 기반 Google ID 토큰 검증기"""
+
+    def __init__(self, client_id: str, jwks_url: str, refresh_interval: int):
+        self.client_id = client_id
+        self.jwks_url = jwks_url
+        self.refresh_interval = refresh_interval
+        self._keys: Dict[str, Dict[str, Any]] = {}
+        self._fetched_at = 0.0
+        self._ttl = 0.0
+        self._last_forced_refresh = 0.0
+        self._lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _http_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=httpx.Timeout(5.0))
+        return self._client
+
+    async def close(self) -> None:
+        """공유 HTTP 클라이언트 종료 (애플리케이션 종료 시)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def load_keys(self, jwks: Dict[str, Any], ttl: Optional[float] = None) -> None:
+        """JWKS 키 세트 적용 (ttl 생략 시 GOOGLE_JWKS_REFRESH_INTERVAL)"""
+        self._keys = {key["kid"]: key for key in jwks.get("keys", []) if "kid" in key}
+        self._fetched_at = time.monotonic()
+        self._ttl = self.refresh_interval if ttl is None else ttl
+
+    def _age(self) -> float:
+        return time.monotonic() - self._fetched_at
+
+    async def refresh(self) -> None:
+        """Google JWKS를 다시 받아 키 캐시 갱신"""
+        fetched_at = self._fetched_at
+        async with self._lock:
+            if self._fetched_at != fetched_at:
+                # 기다리는 동안 다른 요청이 이미 갱신함
+                return
+            response = await self._http_client().get(self.jwks_url)
+            response.raise_for_status()
+            ttl = float(self.refresh_interval)
+            match = MAX_AGE_PATTERN.search(response.headers.get("cache-control", ""))
+            if match:
+                ttl = min(ttl, float(match.group(1)))
+            self.load_keys(response.json(), ttl)
+            logger.info(
+                f"Google JWKS refreshed: {len(self._keys)} keys, ttl {ttl:.0f}s"
+            )
+
+    async def _refresh_or_keep(self) -> None:
+        """갱신 실패 시 기존 키가 있으면 경고만 남기고 계속 사용"""
+        try:
+            await self.refresh()
+        except Exception as e:
+            if not self._keys:
+                raise GoogleIdTokenError(f"Google JWKS를 가져오지 못했습니다: {e}")
+            logger.warning(f"Google JWKS refresh failed, keeping cached keys: {e}")
+
+    async def _key_for(self, kid: Optional[str]) -> Dict[str, Any]:
+        if not self._keys or self._age() >= self._ttl:
+            await self._refresh_or_keep()
+        elif self._age() >= self._ttl * REFRESH_AHEAD_RATIO and (
+            self._refresh_task is None or self._refresh_task.done()
+        ):
+            self._refresh_task = asyncio.create_task(self._refresh_or_keep())
+
+        key = self._keys.get(kid)
+        if key is None and (
+            time.monotonic() - self._last_forced_refresh >= MIN_FORCED_REFRESH_INTERVAL
+        ):
+            # 키 교체 직후일 수 있으므로 한 번 다시 받아봄
+            self._last_forced_refresh = time.monotonic()
+            await self._refresh_or_keep()
+            key = self._keys.get(kid)
+        if key is None:
+            raise GoogleIdTokenError(f"알 수 없는 서명 키입니다: {kid}")
+        return key
+
+    async def verify(
+        self, id_token: str, access_token: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        ID 토큰 서명/aud/iss/exp 검증 후 클레임 반환
+
+        Returns:
+            sub, email, name 등 Google 사용자 클레임. 이메일이 확인되지 않은 계정은 거부합니다.
+        """
+        try:
+            header = jwt.get_unverified_header(id_token)
+        except JWTError as e:
+            raise GoogleIdTokenError(f"ID 토큰 형식이 올바르지 않습니다: {e}")
+
+        key = await self._key_for(header.get("kid"))
+        try:
+            claims = jwt.decode(
+                id_token,
+                key,
+                algorithms=["RS256"],
+                audience=self.client_id,
+                issuer=GOOGLE_ISSUERS,
+                access_token=access_token,
+            )
+        except JWTError as e:
+            raise GoogleIdTokenError(f"ID 토큰 검증에 실패했습니다: {e}")
+
+        if not claims.get("email") or not claims.get("email_verified"):
+            raise GoogleIdTokenError("이메일이 확인되지 않은 Google 계정입니다.")
+        return claims
+
+
+# 싱글톤 인스턴스
+google_id_token_verifier = GoogleIdTokenVerifier(
+    client_id=settings.google_client_id,
+    jwks_url=settings.GOOGLE_JWKS_URL,
+    refresh_interval=settings.GOOGLE_JWKS_REFRESH_INTERVAL,
+)
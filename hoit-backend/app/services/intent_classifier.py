@@ -0,0 +1,279 @@
+"""
+챗봇 메시지 의도 분류기 (프로세스 내)
+
+편집 체인마다 Claude를 한 번 더 불러 메시지 유형만 분류하던 단계를 대신합니다.
+
+- 규칙: 플러그인 이름, 오타/맞춤법, hex 색상·px 크기, 인사말처럼 정밀도가 높은 신호
+- 모델: 한국어/영어 문자 1~3-gram과 단어를 해시한 특징 위의 다중 로지스틱 회귀
+  (app/data/intent_examples.jsonl로 첫 분류 때 결정적으로 학습, numpy만 사용)
+
+classify()는 1ms 안에 {"classification", "confidence", "source"}를 돌려주며, 신뢰도가
+INTENT_CLASSIFIER_MIN_CONFIDENCE보다 낮을 때만 호출 측에서 LLM 분류로 넘깁니다.
+정확도는 scripts/evaluate_intent_classifier.py로 별도 레이블 세트에서 확인합니다.
+"""
+
+import json
+import logging
+import re
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+LABELS = ("text_edit", "style_edit", "animation_request", "info_request")
+
+# create_subtitle_animation_chain의 분류 체계로 변환
+ANIMATION_CHAIN_LABELS = {
+    "text_edit": "simple_edit",
+    "style_edit": "simple_edit",
+    "animation_request": "animation_request",
+    "info_request": "simple_info",
+}
+
+EXAMPLES_PATH = (
+    Path(__file__).resolve().parent.parent / "data" / "intent_examples.jsonl"
+)
+
+# 해시 특징 차원 (학습 예문 수 대비 충돌이 드물 만큼)
+N_FEATURES = 2**14
+NGRAM_RANGE = (1, 3)
+
+# 학습 하이퍼파라미터 (전체 배치 경사 하강, 시드 불필요)
+EPOCHS = 300
+LEARNING_RATE = 2.0
+L2 = 1e-3
+
+# 규칙 ----------------------------------------------------------------------
+
+QUESTION_PATTERN = re.compile(
+    r"\?|어떻게|뭐야|뭐예요|뭔가요|무엇|있어요?$|있나요|되나요|돼요\?*$|알려\s*줘"
+    r"|\b(how|what|which|where|why|can i|can you explain|is there|do you)\b"
+)
+ANIMATION_PATTERN = re.compile(
+    r"fade\s?in|glow|typewriter|rotation|scalepop|slide\s?up|elastic|glitch|flames"
+    r"|pulse|bounce|애니메이션|animation|페이드|글로우|글리치|타자기|타이핑"
+)
+TEXT_EDIT_PATTERN = re.compile(r"오타|오탈자|맞춤법|철자|띄어쓰기|typo|misspel|spelling")
+STYLE_PATTERN = re.compile(
+    r"#[0-9a-f]{6}\b|#[0-9a-f]{3}\b|\d+\s?(px|pt)\b|폰트|글꼴|글씨체|font"
+    r"|(빨간|파란|노란|초록|검정|검은|흰|하얀|보라|주황|분홍|회)색"
+    r"|\b(red|blue|green|yellow|purple|black|white|pink|orange|gr[ae]y)\b"
+)
+SMALL_TALK = {
+    "안녕",
+    "안녕하세요",
+    "반가워",
+    "반가워요",
+    "고마워",
+    "고마워요",
+    "감사합니다",
+    "hi",
+    "hello",
+    "hey",
+    "thanks",
+    "thank you",
+    "ok",
+}
+
+DIGIT_PATTERN = re.compile(r"\d")
+SPACE_PATTERN = re.compile(r"\s+")
+WORD_PATTERN = re.compile(r"[0-9a-z#]+|[가-힣]+")
+
+
+def normalize(message: str) -> str:
+    """소문자화, 숫자 통일, 공백 정리"""
+    text = DIGIT_PATTERN.sub("0", message.lower())
+    return SPACE_PATTERN.sub(" ", text).strip()
+
+
+def _hash(token: str) -> int:
+    # 내장 hash()는 프로세스마다 달라지므로 crc32 사용
+    return zlib.crc32(token.encode("utf-8")) % N_FEATURES
+
+
+def extract_features(text: str) -> List[int]:
+    """정규화된 문장의 해시 특징 인덱스 (문자 n-gram + 단어)"""
+    padded = f" {text} "
+    features = []
+    low, high = NGRAM_RANGE
+    for n in range(low, high + 1):
+        for i in range(len(padded) - n + 1):
+            gram = padded[i : i + n]
+            if gram.strip():
+                features.append(_hash(gram))
+    features.extend(_hash(f"w:{word}") for word in WORD_PATTERN.findall(text))
+    return features
+
+
+def match_rule(text: str) -> Optional[str]:
+    """정밀도가 높은 규칙 하나에만 걸릴 때 레이블 반환"""
+    if text.rstrip("!.~ ") in SMALL_TALK:
+        return "info_request"
+    if QUESTION_PATTERN.search(text):
+        # 기능 질문은 편집 키워드를 포함하기 쉬우므로 모델에 맡김
+        return None
+
+    matched = []
+    if ANIMATION_PATTERN.search(text):
+        matched.append("animation_request")
+    if TEXT_EDIT_PATTERN.search(text):
+        matched.append("text_edit")
+    if STYLE_PATTERN.search(text):
+        matched.append("style_edit")
+    return matched[0] if len(matched) == 1 else None
+
+
+def load_examples(path: Path) -> List[Tuple[str, str]]:
+    """JSONL ({"text", "label"}) 레이블 예문 로드"""
+    examples = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                item = json.loads(line)
+                examples.append((item["text"], item["label"]))
+    return examples
+
+
+class IntentClassifier:
+    """규칙 + 해시 n-gram 로지스틱 회귀 의도 분류기"""
+
+    def __init__(self, examples_path: Path = EXAMPLES_PATH):
+        self.examples_path = examples_path
+        self._weights: Optional[np.ndarray] = None
+        self._bias: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+        self.train_accuracy: Optional[float] = None
+        self.counts = {"rule": 0, "model": 0, "escalated": 0}
+
+    def fit(self, examples: Iterable[Tuple[str, str]]) -> None:
+        """레이블 예문으로 가중치 학습 (0 초기화 + 전체 배치라 항상 같은 결과)"""
+        examples = list(examples)
+        rows = [extract_features(normalize(text)) for text, _ in examples]
+        # 예문에 나온 특징 열만 학습 (나머지 열은 기울기가 0이라 가중치도 0)
+        columns = np.unique(
+            np.concatenate([np.array(row, dtype=np.int64) for row in rows])
+        )
+        x = np.zeros((len(examples), len(columns)), dtype=np.float32)
+        for i, row in enumerate(rows):
+            np.add.at(x[i], np.searchsorted(columns, row), 1.0)
+            # 문장 길이와 무관하도록 L2 정규화
+            x[i] /= max(np.linalg.norm(x[i]), 1e-6)
+        y = np.array([LABELS.index(label) for _, label in examples])
+        targets = np.eye(len(LABELS), dtype=np.float32)[y]
+
+        weights = np.zeros((len(columns), len(LABELS)), dtype=np.float32)
+        bias = np.zeros(len(LABELS), dtype=np.float32)
+        for _ in range(EPOCHS):
+            probs = self._softmax(x @ weights + bias)
+            error = (probs - targets) / len(examples)
+            weights -= LEARNING_RATE * (x.T @ error + L2 * weights)
+            bias -= LEARNING_RATE * error.sum(axis=0)
+
+        self._weights = np.zeros((N_FEATURES, len(LABELS)), dtype=np.float32)
+        self._weights[columns] = weights
+        self._bias = bias
+        predicted = (x @ weights + bias).argmax(axis=1)
+        self.train_accuracy = float((predicted == y).mean())
+
+    def warm_up(self) -> None:
+        """첫 요청 지연을 피하도록 미리 학습"""
+        if self._weights is not None:
+            return
+        with self._lock:
+            if self._weights is not None:
+                return
+            started = time.perf_counter()
+            examples = load_examples(self.examples_path)
+            self.fit(examples)
+            logger.info(
+                f"Intent classifier trained on {len(examples)} examples in "
+                f"{(time.perf_counter() - started) * 1000:.0f}ms "
+                f"(train accuracy {self.train_accuracy:.1%})"
+            )
+
+    @staticmethod
+    def _softmax(logits: np.ndarray) -> np.ndarray:
+        shifted = np.exp(logits - logits.max(axis=-1, keepdims=True))
+        return shifted / shifted.sum(axis=-1, keepdims=True)
+
+    def predict_proba(self, message: str) -> Dict[str, float]:
+        """모델만 사용한 레이블별 확률"""
+        self.warm_up()
+        features = extract_features(normalize(message))
+        if not features:
+            return {label: 1 / len(LABELS) for label in LABELS}
+        unique, counts = np.unique(features, return_counts=True)
+        values = counts / np.sqrt((counts**2).sum())
+        logits = values @ self._weights[unique] + self._bias
+        return dict(zip(LABELS, self._softmax(logits).tolist()))
+
+    def classify(self, message: str) -> Dict[str, Any]:
+        """
+        메시지 의도 분류
+
+        Returns:
+            {"classification": LABELS 중 하나, "confidence": 0~1, "source": "rule"|"model"}
+        """
+        started = time.perf_counter()
+        label = match_rule(normalize(message))
+        if label:
+            source, confidence = "rule", 1.0
+        else:
+            probs = self.predict_proba(message)
+            label = max(probs, key=probs.get)
+            source, confidence = "model", probs[label]
+        self.counts[source] += 1
+        return {
+            "classification": label,
+            "confidence": round(confidence, 3),
+            "source": source,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
+        }
+
+    def record_escalation(self) -> None:
+        self.counts["escalated"] += 1
+
+    def evaluate(
+        self, examples: Iterable[Tuple[str, str]], min_confidence: float = 0.0
+    ) -> Dict[str, Any]:
+        """
+        레이블 세트 정확도
+
+        min_confidence 미만(LLM으로 넘길 대상)은 local_accuracy 계산에서 제외하고
+        escalation_rate로 따로 집계합니다.
+        """
+        confusion = {label: {other: 0 for other in LABELS} for label in LABELS}
+        correct = local = local_correct = 0
+        total = 0
+        for text, expected in examples:
+            result = self.classify(text)
+            predicted = result["classification"]
+            confusion[expected][predicted] += 1
+            total += 1
+            correct += predicted == expected
+            if result["confidence"] >= min_confidence:
+                local += 1
+                local_correct += predicted == expected
+        return {
+            "total": total,
+            "accuracy": correct / total if total else 0.0,
+            "local_accuracy": local_correct / local if local else 0.0,
+            "escalation_rate": 1 - local / total if total else 0.0,
+            "confusion": confusion,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "trained": self._weights is not None,
+            "train_accuracy": self.train_accuracy,
+            **self.counts,
+        }
+
+
+# 싱글톤 인스턴스
+intent_classifier = IntentClassifier()
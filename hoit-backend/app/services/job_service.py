@@ -6,6 +6,7 @@ from typing import Dict, Any, Optional, List
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from app.models.job import Job, JobStatus
+from app.services.subtitle_segmentation import subtitle_segmenter
 import logging
 import uuid
 from datetime import datetime
@@ -97,6 +98,31 @@ class JobService:
             logger.error(f"작업 상태 업데이트 실패: {str(e)}")
             return False
 
+    def save_segmentation(self, job_id: str, segmentation: Dict[str, Any]) -> bool:
+        """완료된 작업의 자막 분할 결과 저장"""
+        try:
+            updated = (
+                self.db.query(Job)
+                .filter(Job.job_id == job_id)
+                .update({Job.segmentation: segmentation}, synchronize_session=False)
+            )
+            self.db.commit()
+            return bool(updated)
+
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            logger.error(f"자막 분할 결과 저장 실패: {str(e)}")
+            return False
+
+    def get_current_segmentation(self, job: Job) -> Dict[str, Any]:
+        """완료된 작업의 자막 분할 결과 (없거나 분할 규칙/설정이 바뀌었으면 다시 계산해 저장)"""
+        if subtitle_segmenter.is_current(job.segmentation, job.result):
+            return job.segmentation
+
+        segmentation = subtitle_segmenter.segment_result(job.result)
+        self.save_segmentation(str(job.job_id), segmentation)
+        return segmentation
+
     def list_all_jobs(self, limit: int = 100) -> List[Job]:
         """모든 작업 목록 조회 (최신 순)"""
         try:
@@ -1,5 +1,9 @@
+import asyncio
+import json
 import logging
-from typing import Dict, Any, List, Optional
+import re
+import time
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
 
 from langchain_aws import ChatBedrock
 from langchain_core.messages import HumanMessage, AIMessage
@@ -13,9 +17,55 @@ from langchain_core.output_parsers import StrOutputParser
 
 from app.core.config import settings
 from app.schemas.chatbot import ChatMessage
+from app.services.intent_classifier import ANIMATION_CHAIN_LABELS, intent_classifier
+from app.services.patch_stream_parser import PatchStreamParser
+from app.services.plugin_search import plugin_search_index
+from app.services.scenario_context import select_scenario_context
 
 logger = logging.getLogger(__name__)
 
+# 다단계 체인: 직전 단계를 제외한 이전 단계 결과 하나당 요약 길이 상한
+STEP_SUMMARY_CHARS = 300
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?。])\s+|\n+")
+
+
+def summarize_text(text: str, limit: int) -> str:
+    """앞 문장부터 limit 글자 안에서 잘라 요약 (LLM 호출 없음)"""
+    text = text.strip()
+    if len(text) <= limit:
+        return text
+
+    summary = ""
+    for sentence in SENTENCE_BOUNDARY.split(text):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        candidate = f"{summary} {sentence}".strip()
+        if len(candidate) > limit:
+            break
+        summary = candidate
+    return (summary or text[:limit]).rstrip() + " …"
+
+
+def build_step_context(step_outputs: List[Tuple[str, str]], max_chars: int) -> str:
+    """
+    다단계 체인의 이전 단계 결과를 max_chars 안으로 요약
+
+    직전 단계는 예산의 절반까지, 그 이전 단계는 STEP_SUMMARY_CHARS까지 요약해 최신 순으로
+    채우고, 예산을 넘는 오래된 단계는 생략 표시만 남깁니다.
+    """
+    lines: List[str] = []
+    used = 0
+    for position, (name, output) in enumerate(reversed(step_outputs)):
+        limit = max_chars // 2 if position == 0 else STEP_SUMMARY_CHARS
+        line = f"[{name}] {summarize_text(output, limit)}"
+        if used + len(line) > max_chars:
+            lines.append(f"(이전 {len(step_outputs) - position}단계 생략)")
+            break
+        lines.append(line)
+        used += len(line) + 1
+    return "\n".join(reversed(lines))
+
 
 class LangChainBedrockService:
     """LangChain을 사용한 AWS Bedrock 서비스 클래스"""
@@ -121,9 +171,6 @@ class LangChainBedrockService:
                 ]
             )
 
-            # 체인 구성 (프롬프트 → LLM → 파서)
-            self.chain = self.prompt_template | self.llm | self.output_parser
-
             logger.info(
                 f"LangChain ChatBedrock initialized for region: {settings.aws_bedrock_region}"
             )
@@ -189,13 +236,8 @@ class LangChainBedrockService:
                 )
                 return self._generate_demo_response(scenario_data, prompt)
 
-            # 모델 파라미터 업데이트
-            self.llm.model_kwargs.update(
-                {
-                    "temperature": temperature,
-                    "max_tokens": max_tokens,
-                }
-            )
+            # 호출별 파라미터 바인딩 (공유 llm의 model_kwargs를 바꾸면 동시 요청끼리 섞임)
+            llm = self.llm.bind(temperature=temperature, max_tokens=max_tokens)
 
             logger.info(
                 f"Invoking Claude via LangChain: max_tokens={max_tokens}, temp={temperature}"
@@ -312,13 +354,14 @@ class LangChainBedrockService:
                 )
 
                 # 히스토리 포함 체인
-                history_chain = history_prompt | self.llm | self.output_parser
+                history_chain = history_prompt | llm | self.output_parser
                 completion = history_chain.invoke(
                     {"input": prompt, "scenario_data": scenario_json}
                 )
             else:
                 # 시나리오 데이터와 함께 단순 체인 사용
-                completion = self.chain.invoke(
+                chain = self.prompt_template | llm | self.output_parser
+                completion = chain.invoke(
                     {"input": prompt, "scenario_data": scenario_json}
                 )
 
@@ -397,6 +440,7 @@ class LangChainBedrockService:
         """
         try:
             results = {}
+            step_outputs: List[Tuple[str, str]] = []
             accumulated_context = ""
 
             logger.info(f"Starting multi-step chain with {len(steps)} steps")
@@ -405,11 +449,12 @@ class LangChainBedrockService:
                 step_name = step_info.get("step", f"step_{i}")
                 step_prompt = step_info.get("prompt", "")
 
-                # 이전 단계 결과를 컨텍스트로 포함
-                if accumulated_context:
-                    full_prompt = (
-                        f"이전 단계 결과:\n{accumulated_context}\n\n현재 단계: {step_prompt}"
-                    )
+                # 이전 단계 결과는 요약해 길이 제한 안에서만 포함
+                step_context = build_step_context(
+                    step_outputs, settings.CHATBOT_CHAIN_CONTEXT_CHARS
+                )
+                if step_context:
+                    full_prompt = f"이전 단계 결과:\n{step_context}\n\n현재 단계: {step_prompt}"
                 else:
                     full_prompt = step_prompt
 
@@ -426,10 +471,12 @@ class LangChainBedrockService:
                     "prompt": step_prompt,
                     "response": step_result["completion"],
                     "step_number": i,
+                    "context_chars": len(step_context),
                     "usage": step_result.get("usage", {}),
                 }
 
-                # 다음 단계를 위해 결과 누적
+                # 전체 결과는 응답용으로만 누적
+                step_outputs.append((step_name, step_result["completion"]))
                 accumulated_context += f"\n[{step_name}] {step_result['completion']}"
 
             # 최종 결과 구성
@@ -455,59 +502,122 @@ class LangChainBedrockService:
         parallel_prompts: List[Dict[str, str]],
         max_tokens: int = 1000,
         temperature: float = 0.7,
+        max_concurrency: Optional[int] = None,
+        task_timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
         """
-        여러 프롬프트를 병렬로 실행하는 체인
+        여러 프롬프트를 병렬로 실행하는 체인 (동기 호출용, bedrock_executor 스레드 등)
+
+        이벤트 루프 안에서는 acreate_parallel_chain을 사용하세요.
+        """
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(
+                self.acreate_parallel_chain(
+                    parallel_prompts,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    max_concurrency=max_concurrency,
+                    task_timeout=task_timeout,
+                )
+            )
+        finally:
+            # asyncio.run과 달리 제한 시간을 넘겨 남은 호출 스레드를 기다리지 않음
+            loop.close()
+
+    async def acreate_parallel_chain(
+        self,
+        parallel_prompts: List[Dict[str, str]],
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+        max_concurrency: Optional[int] = None,
+        task_timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        여러 프롬프트를 동시에 실행하는 체인
+
+        동시 호출 수는 max_concurrency(기본 CHATBOT_PARALLEL_MAX_CONCURRENCY)로 제한하고,
+        task_timeout(기본 CHATBOT_PARALLEL_TASK_TIMEOUT)초를 넘긴 작업은 기다리지 않고
+        timeout으로 기록합니다. 한 작업의 실패가 다른 작업 결과를 버리지 않습니다.
 
         Args:
             parallel_prompts: 병렬 실행할 프롬프트들 [{"name": "task1", "prompt": "..."}, ...]
             max_tokens: 최대 토큰 수
             temperature: 창의성 조절
+            max_concurrency: 동시 호출 수
+            task_timeout: 작업별 제한 시간 (초)
 
         Returns:
-            Dict: 각 병렬 작업별 결과
+            Dict: 각 병렬 작업별 결과 (status: ok | timeout | error)
         """
-        try:
-            results = {}
-
-            logger.info(f"Starting parallel chain with {len(parallel_prompts)} tasks")
-
-            for task_info in parallel_prompts:
-                task_name = task_info.get("name", f"task_{len(results) + 1}")
-                task_prompt = task_info.get("prompt", "")
-
-                logger.info(f"Executing parallel task: {task_name}")
-
-                # 각 작업별 독립적인 체인 실행
-                task_result = self.invoke_claude_with_chain(
-                    prompt=task_prompt,
-                    max_tokens=max_tokens,
-                    temperature=temperature,
-                )
-
-                results[task_name] = {
-                    "prompt": task_prompt,
-                    "response": task_result["completion"],
-                    "usage": task_result.get("usage", {}),
-                    "model_id": task_result.get("model_id"),
-                }
+        max_concurrency = max_concurrency or settings.CHATBOT_PARALLEL_MAX_CONCURRENCY
+        task_timeout = task_timeout or settings.CHATBOT_PARALLEL_TASK_TIMEOUT
+        semaphore = asyncio.Semaphore(max_concurrency)
+        llm = self.llm.bind(temperature=temperature, max_tokens=max_tokens)
+        chain = self.prompt_template | llm | self.output_parser
+
+        logger.info(
+            f"Starting parallel chain with {len(parallel_prompts)} tasks "
+            f"(max_concurrency={max_concurrency}, timeout={task_timeout}s)"
+        )
+
+        async def run_task(task_prompt: str) -> Dict[str, Any]:
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    completion = await asyncio.wait_for(
+                        chain.ainvoke(
+                            {"input": task_prompt, "scenario_data": "시나리오 데이터 없음"}
+                        ),
+                        timeout=task_timeout,
+                    )
+                    status, error = "ok", None
+                except asyncio.TimeoutError:
+                    completion, status = "", "timeout"
+                    error = f"{task_timeout}초 안에 응답이 없습니다"
+                except Exception as e:
+                    completion, status, error = "", "error", str(e)
 
-            # 최종 결과 구성
-            final_result = {
-                "parallel_results": results,
-                "total_tasks": len(parallel_prompts),
-                "langchain_used": True,
-                "chain_type": "parallel",
+            result = {
+                "prompt": task_prompt,
+                "response": completion,
+                "status": status,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                "usage": {
+                    "input_tokens": len(task_prompt.split()),  # 근사치
+                    "output_tokens": len(completion.split()),  # 근사치
+                },
+                "model_id": self.llm.model_id,
             }
+            if error:
+                result["error"] = error
+            return result
 
-            logger.info(
-                f"Parallel chain completed successfully with {len(parallel_prompts)} tasks"
-            )
-            return final_result
-
-        except Exception as e:
-            logger.error(f"Parallel chain failed: {e}")
-            raise Exception(f"병렬 체인 실행 실패: {str(e)}")
+        started = time.perf_counter()
+        names = [
+            task_info.get("name", f"task_{i}")
+            for i, task_info in enumerate(parallel_prompts, 1)
+        ]
+        task_results = await asyncio.gather(
+            *(run_task(task_info.get("prompt", "")) for task_info in parallel_prompts)
+        )
+        results = dict(zip(names, task_results))
+        failed = [name for name, result in results.items() if result["status"] != "ok"]
+
+        if failed:
+            logger.warning(f"Parallel chain tasks failed: {failed}")
+        logger.info(
+            f"Parallel chain completed with {len(parallel_prompts)} tasks "
+            f"in {(time.perf_counter() - started) * 1000:.0f}ms"
+        )
+        return {
+            "parallel_results": results,
+            "total_tasks": len(parallel_prompts),
+            "failed_tasks": failed,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+            "langchain_used": True,
+            "chain_type": "parallel",
+        }
 
     def create_conditional_chain(
         self,
@@ -666,6 +776,109 @@ class LangChainBedrockService:
             logger.error(f"XML request processing failed: {e}")
             raise Exception(f"XML 요청 처리 실패: {str(e)}")
 
+    def create_patch_stream_parser(
+        self,
+        remap: Optional[Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]] = None,
+    ) -> PatchStreamParser:
+        """
+        스트리밍 응답용 파서 (완성된 패치 청크에 plugin 형식 변환 적용)
+
+        Args:
+            remap: 추린 시나리오 기준 패치 경로를 원본 경로로 바꾸는 함수
+        """
+
+        def transform(patches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            patches = self._transform_json_patches(patches)
+            return remap(patches) if remap else patches
+
+        return PatchStreamParser(transform=transform)
+
+    def stream_claude_with_xml_request(
+        self,
+        xml_request: str,
+        max_tokens: int = 2000,
+        temperature: float = 0.7,
+    ) -> Iterator[str]:
+        """
+        invoke_claude_with_xml_request와 같은 프롬프트로 Claude 응답을 토큰 단위로 스트리밍
+
+        Args:
+            xml_request: XML 형식의 요청 (<user_instruction> + <current_json>)
+            max_tokens: 최대 토큰 수
+            temperature: 창의성 조절
+
+        Yields:
+            str: 응답 텍스트 조각 (태그 파싱은 호출 측 PatchStreamParser에서 처리)
+        """
+        logger.info(
+            f"🚀 Streaming unified XML request: max_tokens={max_tokens}, temp={temperature}"
+        )
+        llm = self.llm.bind(temperature=temperature, max_tokens=max_tokens)
+        chain = self.prompt_template | llm | self.output_parser
+        try:
+            yield from chain.stream(
+                {"input": xml_request, "scenario_data": "시나리오 데이터 없음"}
+            )
+        except Exception as e:
+            logger.error(f"XML request streaming failed: {e}")
+            raise Exception(f"XML 요청 스트리밍 실패: {str(e)}")
+
+    def _classify_message(self, user_message: str) -> Dict[str, Any]:
+        """
+        편집 요청 유형 분류 (text_edit/style_edit/animation_request/info_request)
+
+        로컬 분류기 신뢰도가 INTENT_CLASSIFIER_MIN_CONFIDENCE 미만일 때만 Claude에 묻고,
+        Claude 응답을 해석할 수 없으면 로컬 분류 결과를 그대로 사용합니다.
+        """
+        local_result = intent_classifier.classify(user_message)
+        logger.info(
+            f"🔍 Local classification: {local_result['classification']} "
+            f"(confidence {local_result['confidence']}, {local_result['source']}, "
+            f"{local_result['elapsed_ms']}ms)"
+        )
+        if local_result["confidence"] >= settings.INTENT_CLASSIFIER_MIN_CONFIDENCE:
+            return local_result
+
+        intent_classifier.record_escalation()
+        classification_prompt = f"""사용자의 자막 편집 요청을 분석해주세요:
+
+사용자 요청: "{user_message}"
+
+분류 기준:
+- "text_edit": 자막 텍스트 수정 (오탈자, 단어 변경)
+- "style_edit": 자막 스타일 수정 (색상, 크기, 위치)
+- "animation_request": 애니메이션 효과 추가/수정
+- "info_request": 단순 정보 질문
+
+JSON 형태로 응답:
+{{"classification": "분류결과", "confidence": 0.95}}"""
+
+        llm_result = self.invoke_claude_with_chain(
+            prompt=classification_prompt,
+            max_tokens=200,
+            temperature=0.1,
+        )
+        logger.info(f"🔍 Raw AI classification response: {llm_result['completion']}")
+
+        try:
+            classification_data = json.loads(llm_result["completion"])
+            classification = classification_data.get("classification")
+        except (json.JSONDecodeError, AttributeError) as e:
+            logger.warning(
+                f"❌ JSON parsing failed ({type(e).__name__}: {e}), using local classification"
+            )
+            classification = None
+
+        if classification not in ANIMATION_CHAIN_LABELS:
+            return {**local_result, "llm_response": llm_result}
+        return {
+            "classification": classification,
+            "confidence": classification_data.get("confidence", "unknown"),
+            "source": "llm",
+            "local": local_result,
+            "llm_response": llm_result,
+        }
+
     def create_subtitle_animation_chain(
         self,
         user_message: str,
@@ -689,73 +902,9 @@ class LangChainBedrockService:
         try:
             logger.info("Starting HOIT subtitle animation chain")
 
-            # 단계 1: 메시지 유형 분류
-            classification_prompt = f"""다음 사용자 메시지를 분석하여 유형을 분류해주세요:
-
-사용자 메시지: "{user_message}"
-
-분류 기준:
-1. "simple_info" - 단순한 정보 요청
-2. "simple_edit" - 간단한 자막 수정 (오탈자, 단어 변경 등)
-3. "animation_request" - 자막 애니메이션 수정/추가 요청
-
-응답 형식:
-{{
-    "classification": "분류결과",
-    "confidence": 0.95,
-    "reasoning": "분류 근거"
-}}"""
-
-            step1_result = self.invoke_claude_with_chain(
-                prompt=classification_prompt,
-                max_tokens=200,
-                temperature=0.1,
-            )
-
-            logger.info("Step 1 completed: Message classification")
-
-            # 분류 결과 파싱 시도
-            logger.info(
-                f"🔍 Raw AI classification response: {step1_result['completion']}"
-            )
-
-            try:
-                import json
-
-                classification_data = json.loads(step1_result["completion"])
-                classification = classification_data.get(
-                    "classification", "animation_request"
-                )
-                confidence = classification_data.get("confidence", "unknown")
-                reasoning = classification_data.get(
-                    "reasoning", "No reasoning provided"
-                )
-
-                logger.info(
-                    f"✅ JSON parsing successful - Classification: {classification}, Confidence: {confidence}"
-                )
-                logger.info(f"📝 AI reasoning: {reasoning}")
-
-            except (json.JSONDecodeError, KeyError, TypeError) as e:
-                logger.warning(
-                    f"❌ JSON parsing failed ({type(e).__name__}: {e}), falling back to keyword-based classification"
-                )
-
-                # JSON 파싱 실패시 키워드 기반 분류
-                response_lower = step1_result["completion"].lower()
-                logger.info(
-                    f"🔤 Analyzing keywords in lowercase response: '{response_lower[:200]}...'"
-                )
-
-                if "simple_info" in response_lower or "정보" in response_lower:
-                    classification = "simple_info"
-                    logger.info("🎯 Keyword match: 'simple_info' or '정보' found")
-                elif "simple_edit" in response_lower or "간단" in response_lower:
-                    classification = "simple_edit"
-                    logger.info("🎯 Keyword match: 'simple_edit' or '간단' found")
-                else:
-                    classification = "animation_request"
-                    logger.info("🎯 Default fallback: classified as 'animation_request'")
+            # 단계 1: 메시지 유형 분류 (프로세스 내 분류기, 신뢰도 낮을 때만 LLM)
+            step1_result = self._classify_message(user_message)
+            classification = ANIMATION_CHAIN_LABELS[step1_result["classification"]]
 
             logger.info(
                 f"🏷️  FINAL CLASSIFICATION: '{classification}' for user message: '{user_message}')"
@@ -850,84 +999,22 @@ JSON patch 형태로 수정사항을 제공해주세요. 기존 구조를 유지
 
             else:  # animation_request
                 logger.info(
-                    "🎬 Processing as ANIMATION_REQUEST - extracting animation category and generating effects"
+                    "🎬 Processing as ANIMATION_REQUEST - retrieving plugin candidates and generating effects"
                 )
-                # 단계 3: 애니메이션 카테고리 추출 (실제 manifest 기반)
-                category_prompt = f"""사용자가 원하는 애니메이션 효과의 카테고리를 추출해주세요:
-
-사용자 메시지: "{user_message}"
-
-사용 가능한 애니메이션 카테고리 (실제 manifest 기반):
-
-1. **rotation@2.0.0** - 3D 회전 효과
-   - 파라미터: rotationDegrees(90-720°), animationDuration(0.5-3s), axisX/Y/Z(boolean), perspective(200-1500px), staggerDelay(0-0.3s)
-
-2. **fadein@2.0.0** - 페이드 인 효과
-   - 파라미터: staggerDelay(0.02-0.5s), animationDuration(0.2-2s), startOpacity(0-0.5), scaleStart(0.5-1), ease(power1-3.out/back.out/elastic.out)
-
-3. **typewriter@2.0.0** - 타이핑 효과
-   - 파라미터: typingSpeed(0.02-0.2s), cursorBlink(boolean), cursorChar(string), showCursor(boolean), soundEffect(boolean)
-
-4. **glow@2.0.0** - 글로우 효과
-   - 파라미터: color(#hex), intensity(0-1), pulse(boolean), cycles(1-120)
-
-5. **scalepop@2.0.0** - 스케일 팝 효과
-   - 파라미터: popScale(1.1-3), animationDuration(0.5-2.5s), staggerDelay(0-0.3s), bounceStrength(0.1-2), colorPop(boolean)
-
-6. **slideup@2.0.0** - 슬라이드 업 효과
-   - 파라미터: slideDistance(10-100px), animationDuration(0.3-2s), staggerDelay(0-0.5s), easeType(power2.out/back.out/elastic.out/bounce.out), blurEffect(boolean)
-
-7. **elastic@2.0.0** - 탄성 효과
-   - 파라미터: bounceStrength(0.1-2), animationDuration(0.5-4s), staggerDelay(0-0.5s), startScale(0-1), overshoot(1-2)
-
-8. **glitch@2.0.0** - 글리치 효과
-   - 파라미터: glitchIntensity(1-20px), animationDuration(0.5-5s), glitchFrequency(0.1-1s), colorSeparation(boolean), noiseEffect(boolean)
-
-9. **flames@2.0.0** - 불꽃 효과 (GIF 기반)
-   - 파라미터: baseOpacity(0-1), flicker(0-1), cycles(1-120)
-
-10. **pulse@2.0.0** - 펄스 효과
-    - 파라미터: maxScale(1-2.5), cycles(0-10)
-
-만약 카테고리가 명확하지 않다면 사용자에게 구체적인 예시를 제공하세요.
-
-응답 형식:
-{{
-    "category": "추출된 카테고리명",
-    "confidence": 0.85,
-    "suggested_parameters": {{
-        "animationDuration": 1.5,
-        "staggerDelay": 0.1
-    }},
-    "clarification_needed": false,
-    "user_intent": "사용자 의도 분석"
-}}"""
-
-                step3_result = self.invoke_claude_with_chain(
-                    prompt=category_prompt,
-                    max_tokens=300,
-                    temperature=0.2,
+                # 단계 3: 후보 플러그인 검색 (레지스트리 manifest + plugin_assets, 프로세스 내)
+                step3_result = plugin_search_index.build_catalog(user_message)
+                logger.info(
+                    f"🔌 Plugin candidates ({step3_result['source']}): "
+                    f"{step3_result['candidates']}"
                 )
 
                 # 단계 4: 애니메이션 JSON 생성 (manifest 스키마 기반)
-                animation_prompt = f"""추출된 카테고리를 바탕으로 실제 manifest 스키마에 맞는 애니메이션 JSON을 생성해주세요:
+                animation_prompt = f"""사용자 요청에 맞는 플러그인을 아래 후보 중에서 골라 실제 manifest 스키마에 맞는 애니메이션 JSON을 생성해주세요:
 
-카테고리 분석 결과: {step3_result["completion"]}
 사용자 원본 요청: {user_message}
 
-실제 manifest 스키마에 따라 JSON patch를 생성하세요:
-
-예시 구조:
-- **rotation@2.0.0**: {{"rotationDegrees": 360, "animationDuration": 1.5, "axisY": true, "perspective": 800, "staggerDelay": 0.1}}
-- **fadein@2.0.0**: {{"staggerDelay": 0.1, "animationDuration": 0.8, "startOpacity": 0, "scaleStart": 0.9, "ease": "power2.out"}}
-- **typewriter@2.0.0**: {{"typingSpeed": 0.05, "cursorBlink": true, "cursorChar": "|", "showCursor": true}}
-- **glow@2.0.0**: {{"color": "#00ffff", "intensity": 0.4, "pulse": true, "cycles": 8}}
-- **scalepop@2.0.0**: {{"popScale": 1.5, "animationDuration": 1.2, "staggerDelay": 0.08, "bounceStrength": 0.6, "colorPop": true}}
-- **slideup@2.0.0**: {{"slideDistance": 30, "animationDuration": 1, "staggerDelay": 0.12, "easeType": "power2.out", "blurEffect": true}}
-- **elastic@2.0.0**: {{"bounceStrength": 0.7, "animationDuration": 1.5, "staggerDelay": 0.1, "startScale": 0, "overshoot": 1.3}}
-- **glitch@2.0.0**: {{"glitchIntensity": 5, "animationDuration": 2, "glitchFrequency": 0.3, "colorSeparation": true, "noiseEffect": true}}
-- **flames@2.0.0**: {{"baseOpacity": 0.8, "flicker": 0.3, "cycles": 12}}
-- **pulse@2.0.0**: {{"maxScale": 1.2, "cycles": 1}}
+후보 플러그인 (파라미터: 타입, 범위, 기본값):
+{step3_result["catalog"]}
 
 응답 형식 (JSON patch):
 {{
@@ -966,7 +1053,11 @@ JSON patch 형태로 수정사항을 제공해주세요. 기존 구조를 유지
                     "classification": "animation_request",
                     "steps": {
                         "classification": step1_result,
-                        "category_extraction": step3_result,
+                        "plugin_retrieval": {
+                            key: value
+                            for key, value in step3_result.items()
+                            if key != "catalog"
+                        },
                         "animation_generation": final_result,
                     },
                     "final_response": final_result["completion"],
@@ -1000,47 +1091,8 @@ JSON patch 형태로 수정사항을 제공해주세요. 기존 구조를 유지
         try:
             logger.info("Starting direct subtitle edit chain")
 
-            # 1단계: 요청 유형 분류
-            classification_prompt = f"""사용자의 자막 편집 요청을 분석해주세요:
-
-사용자 요청: "{user_message}"
-
-분류 기준:
-- "text_edit": 자막 텍스트 수정 (오탈자, 단어 변경)
-- "style_edit": 자막 스타일 수정 (색상, 크기, 위치)
-- "animation_request": 애니메이션 효과 추가/수정
-- "info_request": 단순 정보 질문
-
-JSON 형태로 응답:
-{{"classification": "분류결과", "confidence": 0.95}}"""
-
-            classification_result = self.invoke_claude_with_chain(
-                prompt=classification_prompt,
-                max_tokens=200,
-                temperature=0.1,
-            )
-
-            logger.info(
-                f"🔍 [DIRECT EDIT] Raw AI classification response: {classification_result['completion']}"
-            )
-
-            # 분류 결과 파싱
-            try:
-                import json
-
-                classification_data = json.loads(classification_result["completion"])
-                classification = classification_data.get("classification", "text_edit")
-                confidence = classification_data.get("confidence", "unknown")
-
-                logger.info(
-                    f"✅ [DIRECT EDIT] JSON parsing successful - Classification: {classification}, Confidence: {confidence}"
-                )
-
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning(
-                    f"❌ [DIRECT EDIT] JSON parsing failed ({type(e).__name__}: {e}), using fallback classification"
-                )
-                classification = "text_edit"  # 기본값
+            # 1단계: 요청 유형 분류 (프로세스 내 분류기, 신뢰도 낮을 때만 LLM)
+            classification = self._classify_message(user_message)["classification"]
 
             logger.info(
                 f"🏷️ [DIRECT EDIT] FINAL CLASSIFICATION: '{classification}' for user message: '{user_message}'"
@@ -1088,12 +1140,15 @@ JSON 형태로 응답:
         try:
             import json
 
-            scenario_json = json.dumps(scenario_data, indent=2, ensure_ascii=False)
+            # 지시와 관련된 cue/단어만 포함 (패치 경로는 아래에서 원본 기준으로 변환)
+            context = select_scenario_context(scenario_data, user_message)
 
             edit_prompt = f"""<user_instruction>{user_message}</user_instruction>
 
+{context.summary}
+
 <current_json>
-{scenario_json}
+{context.to_json()}
 </current_json>
 
 위의 MotionText v2.0 JSON에서 텍스트를 수정하세요. RFC6902 JSON Patch 표준을 준수하여 출력하세요."""
@@ -1109,6 +1164,10 @@ JSON 형태로 응답:
                 result["completion"]
             )
             if motion_result["success"]:
+                motion_result["patches"] = context.remap_patches(
+                    motion_result["patches"]
+                )
+                motion_result["context_stats"] = context.stats
                 return motion_result
 
             # 파싱 실패시 기존 JSON 형식으로 fallback
@@ -1146,12 +1205,15 @@ JSON 형태로 응답:
         try:
             import json
 
-            scenario_json = json.dumps(scenario_data, indent=2, ensure_ascii=False)
+            # 지시와 관련된 cue/단어만 포함 (패치 경로는 아래에서 원본 기준으로 변환)
+            context = select_scenario_context(scenario_data, user_message)
 
             style_prompt = f"""<user_instruction>{user_message}</user_instruction>
 
+{context.summary}
+
 <current_json>
-{scenario_json}
+{context.to_json()}
 </current_json>
 
 위의 MotionText v2.0 JSON에서 스타일을 수정하세요. RFC6902 JSON Patch 표준을 준수하여 출력하세요."""
@@ -1167,6 +1229,10 @@ JSON 형태로 응답:
                 result["completion"]
             )
             if motion_result["success"]:
+                motion_result["patches"] = context.remap_patches(
+                    motion_result["patches"]
+                )
+                motion_result["context_stats"] = context.stats
                 return motion_result
 
             # 파싱 실패시 기존 JSON 형식으로 fallback
@@ -1204,35 +1270,23 @@ JSON 형태로 응답:
         try:
             import json
 
-            scenario_json = json.dumps(scenario_data, indent=2, ensure_ascii=False)
+            # 지시와 관련된 cue/단어만 포함 (패치 경로는 아래에서 원본 기준으로 변환)
+            context = select_scenario_context(scenario_data, user_message)
+            # 요청과 관련된 플러그인과 파라미터 스키마만 포함
+            plugins = plugin_search_index.build_catalog(user_message)
 
             animation_prompt = f"""<user_instruction>{user_message}</user_instruction>
 
+{context.summary}
+
 <current_json>
-{scenario_json}
+{context.to_json()}
 </current_json>
 
 위의 MotionText v2.0 JSON에 애니메이션 효과를 추가하세요. RFC6902 JSON Patch 표준을 준수하여 출력하세요.
 
-사용 가능한 애니메이션:
-- **bobY@2.0.0**: 수직 바운싱 움직임 (amplitudePx, cycles)
-- **cwi-bouncing@2.0.0**: 바운싱 웨이브 (speaker, palette, color, waveHeight)
-- **cwi-color@2.0.0**: 색상 전환 효과 (speaker, palette, color, bulk)
-- **cwi-loud@2.0.0**: 화난 느낌/큰 소리 애니메이션 - 강렬한 감정 표현에 최적 (speaker, palette, color, pulse.scale, pulse.lift, tremble.ampPx, tremble.freq, timeOffset: [0,0])
-- **cwi-whisper@2.0.0**: 속삭임 애니메이션 (speaker, palette, color, shrink.scale, shrink.drop, flutter.amp, flutter.freq)
-- **elastic@2.0.0**: 탄성 바운스 효과 (bounceStrength, animationDuration, staggerDelay, startScale, overshoot)
-- **fadein@2.0.0**: 페이드인 애니메이션 (staggerDelay, animationDuration, startOpacity, scaleStart, ease)
-- **flames@2.0.0**: 불꽃 효과 (baseOpacity, flicker, cycles)
-- **fliptype@2.0.0**: 플립 타이핑 애니메이션 (typingSpeed, flipDuration, flipAngle, flipDirection, typingDelay)
-- **glitch@2.0.0**: 글리치 효과 (glitchIntensity, animationDuration, glitchFrequency, colorSeparation, noiseEffect)
-- **glow@2.0.0**: 글로우 효과 (color, intensity, pulse, cycles)
-- **magnetic@2.0.0**: 자기 끌림 효과 (magnetStrength, animationDuration, attractionDelay, elasticity)
-- **pulse@2.0.0**: 펄스 애니메이션 (maxScale, cycles)
-- **rotation@2.0.0**: 3D 회전 효과 (rotationDegrees, animationDuration, staggerDelay, perspective, axisX, axisY, axisZ)
-- **scalepop@2.0.0**: 스케일 팝 효과 (popScale, animationDuration, staggerDelay, bounceStrength, colorPop)
-- **slideup@2.0.0**: 슬라이드업 애니메이션 (slideDistance, animationDuration, staggerDelay, easeType, blurEffect)
-- **spin@2.0.0**: 스핀 애니메이션 (fullTurns)
-- **typewriter@2.0.0**: 타이프라이터 효과 (typingSpeed, cursorBlink, cursorChar, showCursor, soundEffect)"""
+사용 가능한 애니메이션 (파라미터: 타입, 범위, 기본값):
+{plugins["catalog"]}"""
 
             result = self.invoke_claude_with_chain(
                 prompt=animation_prompt,
@@ -1245,6 +1299,10 @@ JSON 형태로 응답:
                 result["completion"]
             )
             if motion_result["success"]:
+                motion_result["patches"] = context.remap_patches(
+                    motion_result["patches"]
+                )
+                motion_result["context_stats"] = context.stats
                 return motion_result
 
             # 파싱 실패시 기존 JSON 형식으로 fallback
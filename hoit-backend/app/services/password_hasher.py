@@ -0,0 +1,96 @@
+"""
+비밀번호 해시/검증 전용 스레드 풀
+
+bcrypt 한 번에 100~300ms가 걸려 async 핸들러에서 바로 호출하면 그동안 같은 워커의
+다른 요청이 모두 멈춥니다. 해시 작업을 전용 스레드 풀에서 실행하고(bcrypt는 계산 중
+GIL을 놓음), 대기 + 실행 중인 작업 수가 PASSWORD_HASH_MAX_PENDING에 도달하면 새 요청을
+바로 거절해(PasswordHasherBusy → 503) 로그인 폭주 시에도 대기열이 무한정 늘지 않게 합니다.
+
+stats()는 대기열 깊이, 거절 수, 최근 작업의 대기/실행 시간 p50/p99를 돌려주며
+/health 응답에 포함됩니다.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from app.core.config import settings
+from app.utils.latency_stats import LatencyWindow
+
+
+class PasswordHasherBusy(Exception):
+    """해시 대기열이 가득 차서 요청을 받을 수 없음"""
+
+
+class PasswordHasher:
+    """bcrypt 작업을 제한된 스레드 풀에서 실행"""
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hash"
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self.completed = 0
+        self.rejected = 0
+        self._queue_waits = LatencyWindow()
+        self._durations = LatencyWindow()
+
+    def _done(self, _future) -> None:
+        with self._lock:
+            self._pending -= 1
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """fn(*args)를 해시 풀에서 실행 (대기열이 가득 차면 PasswordHasherBusy)"""
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise PasswordHasherBusy()
+            self._pending += 1
+        submitted = time.perf_counter()
+
+        def task():
+            started = time.perf_counter()
+            with self._lock:
+                self._running += 1
+            try:
+                return fn(*args)
+            finally:
+                finished = time.perf_counter()
+                with self._lock:
+                    self._running -= 1
+                    self.completed += 1
+                self._queue_waits.add(started - submitted)
+                self._durations.add(finished - started)
+
+        # 대기 중에 요청이 취소되면 풀 작업도 취소되고, 이미 실행 중이면 끝날 때
+        # 대기열 수가 줄어듦 (_done은 실제 작업 종료 시점에 호출)
+        future = self._executor.submit(task)
+        future.add_done_callback(self._done)
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            pending, running = self._pending, self._running
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "queue_depth": pending - running,
+            "running": running,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            **self._queue_waits.summary("queue_wait"),
+            **self._durations.summary("hash"),
+        }
+
+
+# 싱글톤 인스턴스
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
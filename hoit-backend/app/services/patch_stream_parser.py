@@ -0,0 +1,147 @@
+"""
+MotionTextEditor 스트리밍 응답 파서
+
+Claude 응답을 토큰 단위로 받으면서 <summary>, <json_patch_chunk>, <apply_order> 태그가
+닫히는 즉시 이벤트로 돌려줍니다. 전체 응답을 기다렸다가 정규식으로 파싱하던 방식과 달리
+첫 번째 패치 청크가 완성되는 시점에 바로 편집을 적용할 수 있습니다.
+
+이벤트 형식:
+    {"event": "summary", "data": {"summary": "..."}}
+    {"event": "patches", "data": {"index": 1, "total": 2, "patches": [...], "rejected": 0}}
+    {"event": "apply_order", "data": {"apply_order": "1,2"}}
+"""
+
+import json
+import logging
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 인식하는 태그 (여는 태그 접두사, 닫는 태그)
+TAGS = {
+    "summary": ("<summary>", "</summary>"),
+    "json_patch_chunk": ("<json_patch_chunk", "</json_patch_chunk>"),
+    "apply_order": ("<apply_order>", "</apply_order>"),
+}
+
+MAX_OPEN_TAG_LENGTH = max(len(open_tag) for open_tag, _ in TAGS.values())
+
+RFC6902_OPS = {"add", "remove", "replace", "move", "copy", "test"}
+
+ATTR_PATTERN = re.compile(r'(\w+)="([^"]*)"')
+CDATA_PATTERN = re.compile(r"<!\[CDATA\[(.*?)\]\]>", re.DOTALL)
+
+
+def is_valid_patch(patch: Any) -> bool:
+    """RFC6902 연산 형식 검사 (op/path 필수, 연산별 value/from 필수)"""
+    if not isinstance(patch, dict) or patch.get("op") not in RFC6902_OPS:
+        return False
+    path = patch.get("path")
+    if not isinstance(path, str) or (path and not path.startswith("/")):
+        return False
+    if patch["op"] in ("add", "replace", "test") and "value" not in patch:
+        return False
+    if patch["op"] in ("move", "copy") and not isinstance(patch.get("from"), str):
+        return False
+    return True
+
+
+class PatchStreamParser:
+    """태그 단위 증분 파서"""
+
+    def __init__(
+        self,
+        transform: Optional[
+            Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]
+        ] = None,
+    ):
+        self._transform = transform
+        self._buffer = ""
+        # 닫는 태그를 찾기 시작할 위치 (매번 버퍼 처음부터 다시 찾지 않도록)
+        self._scan_from = 0
+        self.summary = ""
+        self.patches: List[Dict[str, Any]] = []
+        self.chunks = 0
+
+    def feed(self, text: str) -> List[Dict[str, Any]]:
+        """토큰을 추가하고 새로 완성된 태그의 이벤트 반환"""
+        self._buffer += text
+        events = []
+        while True:
+            event = self._next_event()
+            if event is None:
+                return events
+            if event is not False:
+                events.append(event)
+
+    def _next_event(self):
+        # 가장 먼저 나오는 여는 태그
+        start, name = -1, None
+        for tag_name, (open_tag, _) in TAGS.items():
+            index = self._buffer.find(open_tag)
+            if index != -1 and (start == -1 or index < start):
+                start, name = index, tag_name
+
+        if name is None:
+            # 태그 밖 텍스트는 버리되, 잘린 여는 태그일 수 있는 끝부분은 남김
+            self._buffer = self._buffer[-(MAX_OPEN_TAG_LENGTH - 1) :]
+            self._scan_from = 0
+            return None
+
+        if start > 0:
+            self._scan_from = max(self._scan_from - start, 0)
+            self._buffer = self._buffer[start:]
+
+        close_tag = TAGS[name][1]
+        end = self._buffer.find(close_tag, self._scan_from)
+        if end == -1:
+            self._scan_from = max(len(self._buffer) - len(close_tag), 0)
+            return None
+
+        element = self._buffer[:end]
+        self._buffer = self._buffer[end + len(close_tag) :]
+        self._scan_from = 0
+
+        head_end = element.find(">")
+        if head_end == -1:
+            return False
+        head, body = element[:head_end], element[head_end + 1 :]
+
+        if name == "summary":
+            self.summary = body.strip()
+            return {"event": "summary", "data": {"summary": self.summary}}
+        if name == "apply_order":
+            return {"event": "apply_order", "data": {"apply_order": body.strip()}}
+        return self._chunk_event(head, body)
+
+    def _chunk_event(self, head: str, body: str):
+        attrs = dict(ATTR_PATTERN.findall(head))
+        cdata = CDATA_PATTERN.search(body)
+        patch_json = (cdata.group(1) if cdata else body).strip()
+        self.chunks += 1
+        index = int(attrs["index"]) if attrs.get("index", "").isdigit() else self.chunks
+
+        try:
+            parsed = json.loads(patch_json) if patch_json else []
+        except json.JSONDecodeError as e:
+            logger.warning(f"Streamed patch chunk {index} is not valid JSON: {e}")
+            return {
+                "event": "patches",
+                "data": {"index": index, "patches": [], "error": "JSON 파싱 실패"},
+            }
+
+        candidates = parsed if isinstance(parsed, list) else [parsed]
+        valid = [patch for patch in candidates if is_valid_patch(patch)]
+        if self._transform:
+            valid = self._transform(valid)
+        self.patches.extend(valid)
+
+        data = {
+            "index": index,
+            "patches": valid,
+            "rejected": len(candidates) - len(valid),
+        }
+        if attrs.get("total", "").isdigit():
+            data["total"] = int(attrs["total"])
+        return {"event": "patches", "data": data}
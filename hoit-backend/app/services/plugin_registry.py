@@ -0,0 +1,333 @@
+"""
+플러그인 레지스트리 서비스
+
+S3 plugins/ prefix와 plugin_assets 테이블을 기반으로 인메모리 플러그인 목록을 유지하고,
+렌더링 요청 시 시나리오가 참조하는 플러그인/폰트/에셋을 GPU 서버로 보내기 전에 검증합니다.
+
+갱신은 S3/DB 동기 I/O이므로 TTL이 지난 뒤에는 백그라운드 스레드에서 다시 읽고, 그동안
+요청은 기존 스냅샷을 사용합니다. 한 번도 로드하지 못한 경우에만 호출한 쪽에서 기다립니다.
+"""
+
+import json
+import logging
+import threading
+import time
+from typing import Dict, Any, List, Optional, Set
+
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.config import settings
+from app.models.plugin_asset import PluginAsset
+
+logger = logging.getLogger(__name__)
+
+PLUGIN_PREFIX = "plugins/"
+DEFAULT_PLUGIN_VERSION = "2.0.0"
+
+# 항상 렌더링 가능한 CSS generic font family
+GENERIC_FONT_FAMILIES = {
+    "serif",
+    "sans-serif",
+    "monospace",
+    "cursive",
+    "fantasy",
+    "system-ui",
+}
+
+
+def resolve_plugin_key(name: str) -> str:
+    """플러그인 이름을 name@version 키로 변환 (프론트엔드 pluginLoader와 동일 규칙)"""
+    return name if "@" in name else f"{name}@{DEFAULT_PLUGIN_VERSION}"
+
+
+class PluginRegistry:
+    """S3 + plugin_assets 기반 인메모리 플러그인 레지스트리"""
+
+    def __init__(self, ttl_seconds: int = 300):
+        self.ttl_seconds = ttl_seconds
+        self._plugins: Dict[str, Dict[str, Any]] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    @property
+    def loaded_at(self) -> Optional[float]:
+        """마지막 스냅샷 교체 시각 (monotonic, 파생 인덱스 갱신 판단용)"""
+        return self._loaded_at
+
+    def is_stale(self) -> bool:
+        return (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at > self.ttl_seconds
+        )
+
+    def refresh(self, db: Optional[Session] = None) -> bool:
+        """S3 목록과 plugin_assets 테이블을 읽어 레지스트리 스냅샷 교체"""
+        if not self._lock.acquire(blocking=False):
+            # 다른 요청이 이미 갱신 중이면 기존 스냅샷 사용
+            return self.is_loaded
+
+        try:
+            from app.services.s3_service import s3_service
+
+            bucket = s3_service.plugin_bucket_name
+            files: Dict[str, Set[str]] = {}
+
+            paginator = s3_service.s3_client.get_paginator("list_objects_v2")
+            for page in paginator.paginate(Bucket=bucket, Prefix=PLUGIN_PREFIX):
+                for obj in page.get("Contents", []):
+                    relative = obj["Key"][len(PLUGIN_PREFIX) :]
+                    if "/" not in relative:
+                        continue
+                    plugin_key, file_path = relative.split("/", 1)
+                    files.setdefault(plugin_key, set()).add(file_path)
+
+            plugins: Dict[str, Dict[str, Any]] = {}
+            for plugin_key, plugin_files in files.items():
+                if "manifest.json" not in plugin_files:
+                    continue
+
+                manifest_key = f"{PLUGIN_PREFIX}{plugin_key}/manifest.json"
+                try:
+                    body = s3_service.s3_client.get_object(
+                        Bucket=bucket, Key=manifest_key
+                    )["Body"].read()
+                    manifest = json.loads(body)
+                except Exception as e:
+                    logger.warning(f"플러그인 manifest 로드 실패 - {plugin_key}: {str(e)}")
+                    continue
+
+                plugins[plugin_key] = {
+                    "plugin_key": plugin_key,
+                    "bucket": bucket,
+                    "manifest": manifest,
+                    "files": plugin_files,
+                    "is_pro": False,
+                }
+
+            if db is not None:
+                try:
+                    for asset in db.query(PluginAsset).all():
+                        entry = plugins.get(asset.plugin_key)
+                        if entry:
+                            entry["is_pro"] = bool(asset.is_pro)
+                            entry["title"] = asset.title
+                            entry["category"] = asset.category
+                            entry["description"] = asset.description
+                            entry["tags"] = list(asset.tags or [])
+                        else:
+                            logger.warning(
+                                f"plugin_assets에 등록되었지만 S3에 없는 플러그인: {asset.plugin_key}"
+                            )
+                except SQLAlchemyError as e:
+                    logger.warning(f"plugin_assets 조회 실패: {str(e)}")
+
+            self._plugins = plugins
+            self._loaded_at = time.monotonic()
+            logger.info(f"플러그인 레지스트리 갱신 완료 - {len(plugins)}개 플러그인")
+            return True
+
+        except Exception as e:
+            logger.error(f"플러그인 레지스트리 갱신 실패: {str(e)}")
+            return self.is_loaded
+        finally:
+            self._lock.release()
+
+    def refresh_with_new_session(self) -> bool:
+        """요청 세션과 별개의 DB 세션으로 갱신"""
+        try:
+            from app.db.database import SessionLocal
+
+            db = SessionLocal()
+        except Exception as e:
+            logger.warning(f"plugin_assets 세션 생성 실패: {str(e)}")
+            return self.refresh()
+
+        try:
+            return self.refresh(db)
+        finally:
+            db.close()
+
+    def refresh_in_background(self) -> None:
+        """백그라운드 스레드에서 갱신 (이미 갱신 중이면 무시)"""
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            return
+        self._refresh_thread = threading.Thread(
+            target=self.refresh_with_new_session,
+            name="plugin-registry-refresh",
+            daemon=True,
+        )
+        self._refresh_thread.start()
+
+    def ensure_fresh(self, db: Optional[Session] = None) -> bool:
+        """
+        로드 여부 반환
+
+        처음 한 번은 동기로 로드하고, 이후 TTL이 지나면 기존 스냅샷을 쓰면서 백그라운드에서
+        갱신합니다. 동기 로드는 S3/DB I/O이므로 이벤트 루프에서는 스레드로 호출해야 합니다.
+        """
+        if not self.is_loaded:
+            if db is None:
+                self.refresh_with_new_session()
+            else:
+                self.refresh(db)
+        elif self.is_stale():
+            self.refresh_in_background()
+        return self.is_loaded
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """플러그인 이름 또는 키로 레지스트리 항목 조회"""
+        return self._plugins.get(resolve_plugin_key(name))
+
+    def list_plugins(self) -> List[Dict[str, Any]]:
+        """레지스트리에 등록된 모든 플러그인 항목"""
+        return list(self._plugins.values())
+
+    def build_manifest_entry(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """GPU 워커 프리페치용 manifest 정보 구성"""
+        plugin_key = entry["plugin_key"]
+        manifest = entry["manifest"]
+        base = f"{PLUGIN_PREFIX}{plugin_key}"
+
+        return {
+            "pluginKey": plugin_key,
+            "name": manifest.get("name", plugin_key.split("@")[0]),
+            "version": manifest.get("version"),
+            "bucket": entry["bucket"],
+            "manifestKey": f"{base}/manifest.json",
+            "entryKey": f"{base}/{manifest.get('entry', 'index.mjs')}",
+            "preloadKeys": [f"{base}/{path}" for path in manifest.get("preload", [])],
+        }
+
+    def check_scenario(
+        self, scenario: Dict[str, Any], db: Optional[Session] = None
+    ) -> Dict[str, Any]:
+        """
+        시나리오 렌더링 가능 여부 검사
+
+        Args:
+            scenario: MotionText 시나리오
+            db: plugin_assets 조회용 DB 세션 (레지스트리 갱신 시 사용)
+
+        Returns:
+            dict: {"feasible": bool, "reason": str, "details": List[str],
+                   "plugins": List[dict]}
+        """
+        refs = collect_scenario_references(scenario)
+        errors: List[str] = []
+        manifests: List[Dict[str, Any]] = []
+
+        if not self.ensure_fresh(db):
+            # 레지스트리를 한 번도 로드하지 못한 경우 (S3 장애 등) 플러그인 검사는 건너뜀
+            logger.warning("플러그인 레지스트리 미로드 - 플러그인 검사 생략")
+        else:
+            for plugin_key in sorted(refs["plugins"]):
+                entry = self._plugins.get(plugin_key)
+                if not entry:
+                    errors.append(f"Unknown plugin: {plugin_key}")
+                    continue
+
+                manifest = entry["manifest"]
+                missing = [
+                    path
+                    for path in [manifest.get("entry", "index.mjs")]
+                    + list(manifest.get("preload", []))
+                    if path not in entry["files"]
+                ]
+                if missing:
+                    errors.append(
+                        f"Plugin {plugin_key} is missing assets: {', '.join(missing)}"
+                    )
+                    continue
+
+                manifests.append(self.build_manifest_entry(entry))
+
+        available_fonts = get_available_fonts()
+        for font_stack in sorted(refs["fonts"]):
+            families = [
+                family.strip().strip("'\"").lower()
+                for family in font_stack.split(",")
+                if family.strip()
+            ]
+            if not any(
+                family in GENERIC_FONT_FAMILIES or family in available_fonts
+                for family in families
+            ):
+                errors.append(f"Unavailable font: {font_stack}")
+
+        if errors:
+            return {
+                "feasible": False,
+                "reason": "Scenario cannot be rendered",
+                "details": errors,
+                "plugins": manifests,
+            }
+
+        return {
+            "feasible": True,
+            "reason": "Scenario is renderable",
+            "details": [],
+            "plugins": manifests,
+        }
+
+
+def get_available_fonts() -> Set[str]:
+    """설정에 등록된 렌더 서버 사용 가능 폰트 (소문자)"""
+    return {
+        font.strip().lower()
+        for font in settings.RENDER_AVAILABLE_FONTS.split(",")
+        if font.strip()
+    }
+
+
+def collect_scenario_references(scenario: Dict[str, Any]) -> Dict[str, Set[str]]:
+    """시나리오에서 참조하는 플러그인 키와 폰트 스택 수집"""
+    plugins: Set[str] = set()
+    fonts: Set[str] = set()
+
+    def visit_style(style: Any):
+        if isinstance(style, dict):
+            font_family = style.get("fontFamily")
+            if isinstance(font_family, str) and font_family.strip():
+                fonts.add(font_family)
+
+    def visit_node(node: Any):
+        if not isinstance(node, dict):
+            return
+
+        # v1 시나리오: node.plugin = {"name": ...}
+        legacy = node.get("plugin")
+        if isinstance(legacy, dict):
+            name = legacy.get("name")
+            if isinstance(name, str) and name:
+                plugins.add(resolve_plugin_key(name))
+
+        for plugin in node.get("pluginChain") or []:
+            if isinstance(plugin, dict):
+                name = plugin.get("pluginId") or plugin.get("name")
+                if isinstance(name, str) and name:
+                    plugins.add(resolve_plugin_key(name))
+
+        visit_style(node.get("style"))
+
+        for child in node.get("children") or []:
+            visit_node(child)
+
+    for track in scenario.get("tracks") or []:
+        if isinstance(track, dict):
+            visit_style(track.get("defaultStyle"))
+
+    for cue in scenario.get("cues") or []:
+        if isinstance(cue, dict):
+            visit_node(cue.get("root"))
+
+    return {"plugins": plugins, "fonts": fonts}
+
+
+# 싱글톤 인스턴스
+plugin_registry = PluginRegistry(ttl_seconds=settings.PLUGIN_REGISTRY_TTL)
@@ -0,0 +1,281 @@
+"""
+플러그인 검색 인덱스
+
+플러그인 레지스트리(S3 manifest + plugin_assets)를 BM25로 색인해 챗봇 애니메이션 요청에
+맞는 후보 플러그인과 파라미터 스키마만 골라 프롬프트에 넣습니다. 프롬프트에 붙여 두던
+고정 플러그인 목록과 카테고리 추출용 Claude 호출을 대신합니다.
+
+- 문서: 플러그인 이름, plugin_assets 제목/카테고리/설명/태그, manifest 스키마 이름/라벨/설명
+- 토큰: 영어는 단어(camelCase 분리), 한국어는 음절 bigram
+- 질의 확장: "빙글빙글", "반짝" 같은 구어 표현을 색인 어휘(rotation, glow 등)로 보강
+- 레지스트리 스냅샷이 바뀌면(loaded_at) 다음 검색 때 다시 색인
+"""
+
+import json
+import logging
+import math
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.plugin_registry import PluginRegistry, plugin_registry
+
+logger = logging.getLogger(__name__)
+
+# BM25 파라미터
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# 필드별 가중치 (토큰 반복 횟수)
+FIELD_WEIGHTS = {
+    "name": 3,
+    "title": 2,
+    "tags": 2,
+    "category": 1,
+    "description": 1,
+    "schema": 1,
+}
+
+# 후보 최소 점수 ("text", "animation"처럼 모든 플러그인에 있는 단어만 겹치면 제외)
+MIN_SCORE = 1.5
+# 1위 점수 대비 이 비율 미만인 후보는 제외
+MIN_RELATIVE_SCORE = 0.35
+
+WORD_PATTERN = re.compile(r"[A-Za-z]+|\d+|[가-힣]+")
+CAMEL_PATTERN = re.compile(r"(?<=[a-z])(?=[A-Z])")
+HANGUL_PATTERN = re.compile(r"[가-힣]")
+
+# 구어 표현 → 색인 어휘
+QUERY_EXPANSIONS = [
+    (re.compile(r"빙글|돌아|돌게|돌려|회전"), "rotation spin rotate"),
+    (re.compile(r"타자|타이핑|타닥|한 글자씩"), "typing typewriter"),
+    (re.compile(r"서서히|스르르|은은"), "fade"),
+    (re.compile(r"반짝|빛나|빛이|네온"), "glow neon light"),
+    (re.compile(r"튀|통통|튕|바운"), "bounce elastic spring"),
+    (re.compile(r"흔들|떨리|떨게|진동|화난|외치"), "tremble loud emphasis"),
+    (re.compile(r"지지직|깨지|노이즈"), "glitch digital"),
+    (re.compile(r"불꽃|불타|타오르|불이"), "flame fire"),
+    (re.compile(r"커지|커졌|확대|팝|뿅"), "scale pop"),
+    (re.compile(r"올라|위로|슬라이드"), "slide up"),
+    (re.compile(r"속삭|조용"), "whisper soft"),
+    (re.compile(r"두근|심장|박동"), "pulse beat heart"),
+    (re.compile(r"물결|출렁|둥실|위아래"), "wave bob"),
+    (re.compile(r"뒤집|플립"), "flip card"),
+    (re.compile(r"자석|끌려|모이"), "magnetic pull"),
+]
+
+# 레지스트리를 한 번도 로드하지 못했을 때(S3 장애 등) 사용하는 목록
+FALLBACK_PLUGIN_CATALOG = """- **bobY@2.0.0**: 수직 바운싱 움직임 (amplitudePx, cycles)
+- **cwi-bouncing@2.0.0**: 바운싱 웨이브 (speaker, palette, color, waveHeight)
+- **cwi-color@2.0.0**: 색상 전환 효과 (speaker, palette, color, bulk)
+- **cwi-loud@2.0.0**: 화난 느낌/큰 소리 애니메이션 - 강렬한 감정 표현에 최적 (speaker, palette, color, pulse.scale, pulse.lift, tremble.ampPx, tremble.freq, timeOffset: [0,0])
+- **cwi-whisper@2.0.0**: 속삭임 애니메이션 (speaker, palette, color, shrink.scale, shrink.drop, flutter.amp, flutter.freq)
+- **elastic@2.0.0**: 탄성 바운스 효과 (bounceStrength, animationDuration, staggerDelay, startScale, overshoot)
+- **fadein@2.0.0**: 페이드인 애니메이션 (staggerDelay, animationDuration, startOpacity, scaleStart, ease)
+- **flames@2.0.0**: 불꽃 효과 (baseOpacity, flicker, cycles)
+- **fliptype@2.0.0**: 플립 타이핑 애니메이션 (typingSpeed, flipDuration, flipAngle, flipDirection, typingDelay)
+- **glitch@2.0.0**: 글리치 효과 (glitchIntensity, animationDuration, glitchFrequency, colorSeparation, noiseEffect)
+- **glow@2.0.0**: 글로우 효과 (color, intensity, pulse, cycles)
+- **magnetic@2.0.0**: 자기 끌림 효과 (magnetStrength, animationDuration, attractionDelay, elasticity)
+- **pulse@2.0.0**: 펄스 애니메이션 (maxScale, cycles)
+- **rotation@2.0.0**: 3D 회전 효과 (rotationDegrees, animationDuration, staggerDelay, perspective, axisX, axisY, axisZ)
+- **scalepop@2.0.0**: 스케일 팝 효과 (popScale, animationDuration, staggerDelay, bounceStrength, colorPop)
+- **slideup@2.0.0**: 슬라이드업 애니메이션 (slideDistance, animationDuration, staggerDelay, easeType, blurEffect)
+- **spin@2.0.0**: 스핀 애니메이션 (fullTurns)
+- **typewriter@2.0.0**: 타이프라이터 효과 (typingSpeed, cursorBlink, cursorChar, showCursor, soundEffect)"""
+
+
+def tokenize(text: str) -> List[str]:
+    """영어 단어(camelCase 분리, 소문자) + 한국어 음절 bigram"""
+    tokens = []
+    for word in WORD_PATTERN.findall(text):
+        if HANGUL_PATTERN.match(word):
+            if len(word) == 1:
+                tokens.append(word)
+            else:
+                tokens.extend(word[i : i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.extend(part.lower() for part in CAMEL_PATTERN.split(word))
+    return tokens
+
+
+def expand_query(query: str) -> str:
+    """구어 표현에 대응하는 색인 어휘를 질의 뒤에 추가"""
+    extra = [terms for pattern, terms in QUERY_EXPANSIONS if pattern.search(query)]
+    return " ".join([query, *extra])
+
+
+def _schema_text(schema: Dict[str, Any], prefix: str = "") -> List[str]:
+    parts = []
+    for name, spec in (schema or {}).items():
+        parts.append(f"{prefix}{name}")
+        if isinstance(spec, dict):
+            parts.extend(
+                str(spec[key]) for key in ("label", "description") if spec.get(key)
+            )
+            parts.extend(_schema_text(spec.get("properties"), f"{prefix}{name} "))
+    return parts
+
+
+def _format_param(name: str, spec: Any) -> List[str]:
+    """파라미터 하나를 'name(type 범위, 기본값)' 형태로 (object는 하위 속성으로 펼침)"""
+    if not isinstance(spec, dict):
+        return [name]
+    if spec.get("properties"):
+        return [
+            formatted
+            for child, child_spec in spec["properties"].items()
+            for formatted in _format_param(f"{name}.{child}", child_spec)
+        ]
+
+    details = [str(spec.get("type", "any"))]
+    if "min" in spec or "max" in spec:
+        details.append(f"{spec.get('min', '')}~{spec.get('max', '')}")
+    if spec.get("enum"):
+        details.append("/".join(str(option) for option in spec["enum"]))
+    if "default" in spec:
+        details.append(f"기본 {json.dumps(spec['default'], ensure_ascii=False)}")
+    return [f"{name}({', '.join(details)})"]
+
+
+def format_plugin(entry: Dict[str, Any]) -> str:
+    """프롬프트용 플러그인 한 줄 설명 (이름, 설명, 파라미터 스키마)"""
+    manifest = entry["manifest"]
+    summary = entry.get("description") or entry.get("title") or ""
+    params = [
+        formatted
+        for name, spec in (manifest.get("schema") or {}).items()
+        for formatted in _format_param(name, spec)
+    ]
+    return f"- **{entry['plugin_key']}**: {summary} ({', '.join(params)})"
+
+
+class PluginSearchIndex:
+    """플러그인 레지스트리 BM25 인덱스"""
+
+    def __init__(self, registry: PluginRegistry):
+        self.registry = registry
+        self._built_for: Optional[float] = None
+        self._entries: List[Dict[str, Any]] = []
+        self._doc_terms: List[Counter] = []
+        self._doc_lengths: List[int] = []
+        self._idf: Dict[str, float] = {}
+        self._avg_length = 0.0
+        self._lock = threading.Lock()
+
+    def build(self, entries: List[Dict[str, Any]]) -> None:
+        """레지스트리 항목으로 색인 재구성"""
+        doc_terms = []
+        for entry in entries:
+            manifest = entry["manifest"]
+            fields = {
+                "name": manifest.get("name", entry["plugin_key"].split("@")[0]),
+                "title": entry.get("title") or "",
+                "tags": " ".join(entry.get("tags") or []),
+                "category": entry.get("category") or "",
+                "description": entry.get("description") or "",
+                "schema": " ".join(_schema_text(manifest.get("schema"))),
+            }
+            terms: Counter = Counter()
+            for field, text in fields.items():
+                for token in tokenize(text):
+                    terms[token] += FIELD_WEIGHTS[field]
+            doc_terms.append(terms)
+
+        document_frequency: Counter = Counter()
+        for terms in doc_terms:
+            document_frequency.update(terms.keys())
+        total = len(doc_terms)
+
+        self._entries = entries
+        self._doc_terms = doc_terms
+        self._doc_lengths = [sum(terms.values()) for terms in doc_terms]
+        self._avg_length = sum(self._doc_lengths) / total if total else 0.0
+        self._idf = {
+            term: math.log(1 + (total - count + 0.5) / (count + 0.5))
+            for term, count in document_frequency.items()
+        }
+
+    def _ensure_current(self) -> None:
+        """레지스트리 로드/갱신을 요청하고, 스냅샷이 바뀌었으면 다시 색인"""
+        self.registry.ensure_fresh()
+
+        if self.registry.loaded_at == self._built_for:
+            return
+        with self._lock:
+            loaded_at = self.registry.loaded_at
+            if loaded_at != self._built_for:
+                self.build(self.registry.list_plugins())
+                self._built_for = loaded_at
+
+    def search(
+        self, query: str, limit: Optional[int] = None
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        """질의와 관련 있는 (레지스트리 항목, BM25 점수) 목록 (점수 내림차순)"""
+        self._ensure_current()
+        limit = limit or settings.CHATBOT_PLUGIN_CANDIDATES
+        query_terms = set(tokenize(expand_query(query)))
+
+        scored = []
+        for entry, terms, length in zip(
+            self._entries, self._doc_terms, self._doc_lengths
+        ):
+            score = 0.0
+            for term in query_terms:
+                frequency = terms.get(term)
+                if not frequency:
+                    continue
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * length / self._avg_length)
+                score += (
+                    self._idf[term] * frequency * (BM25_K1 + 1) / (frequency + norm)
+                )
+            if score >= MIN_SCORE:
+                scored.append((entry, score))
+
+        scored.sort(key=lambda item: (-item[1], item[0]["plugin_key"]))
+        if not scored:
+            return []
+        threshold = scored[0][1] * MIN_RELATIVE_SCORE
+        return [item for item in scored[:limit] if item[1] >= threshold]
+
+    def build_catalog(self, query: str) -> Dict[str, Any]:
+        """
+        생성 프롬프트에 넣을 플러그인 목록
+
+        Returns:
+            {"catalog": 프롬프트 텍스트, "candidates": [plugin_key...],
+             "source": "search" | "all" | "fallback"}
+        """
+        results = self.search(query)
+        if results:
+            return {
+                "catalog": "\n".join(format_plugin(entry) for entry, _ in results),
+                "candidates": [entry["plugin_key"] for entry, _ in results],
+                "scores": [round(score, 2) for _, score in results],
+                "source": "search",
+            }
+
+        if self._entries:
+            # 특정 효과를 가리키지 않는 요청 ("애니메이션 넣어줘")은 이름/설명만 전부 제공
+            lines = [
+                f"- **{entry['plugin_key']}**: "
+                f"{entry.get('description') or entry.get('title') or ''}"
+                for entry in sorted(self._entries, key=lambda e: e["plugin_key"])
+            ]
+            return {
+                "catalog": "\n".join(lines),
+                "candidates": [],
+                "source": "all",
+            }
+
+        return {
+            "catalog": FALLBACK_PLUGIN_CATALOG,
+            "candidates": [],
+            "source": "fallback",
+        }
+
+
+# 싱글톤 인스턴스
+plugin_search_index = PluginSearchIndex(plugin_registry)
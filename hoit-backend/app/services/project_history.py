@@ -0,0 +1,375 @@
+"""
+프로젝트 버전 히스토리 저장소
+
+저장할 때마다 버전 한 개를 기록합니다. 전체 사본 대신 아래 두 종류의 행을 씁니다.
+
+    snapshot: 일정 간격마다 전체 목록 {"meta": 해시, "clips": [[clip_id, 해시], ...]}
+    delta:    직전 버전 대비 {"upserted": {clip_id: 해시}, "deleted", "order", "meta"}
+
+클립/메타/스냅샷 목록은 정규화 JSON의 sha256을 키로 project_blobs에 zstd 압축해 저장하므로,
+바뀌지 않은 클립과 복제된 프로젝트는 같은 블롭을 공유합니다.
+특정 버전은 가장 가까운 이전 스냅샷에서 델타를 순서대로 적용해 복원합니다.
+"""
+
+import hashlib
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
+
+import zstandard
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.project import Project
+from app.models.project_version import ProjectBlob, ProjectVersion
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT = "snapshot"
+DELTA = "delta"
+
+# 버전과 함께 보관하는 프로젝트 메타 필드
+META_FIELDS = (
+    "name",
+    "settings",
+    "video_url",
+    "video_name",
+    "video_type",
+    "video_duration",
+    "video_metadata",
+)
+
+# GC가 아직 커밋되지 않은 저장과 경합하지 않도록 최근 블롭은 유지
+BLOB_GC_GRACE = timedelta(hours=1)
+
+
+def _canonical(value: Any) -> bytes:
+    return json.dumps(
+        value, ensure_ascii=False, sort_keys=True, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _add_blob(blobs: Dict[str, bytes], value: Any) -> str:
+    raw = _canonical(value)
+    digest = hashlib.sha256(raw).hexdigest()
+    blobs[digest] = raw
+    return digest
+
+
+def project_meta(project: Project) -> Dict[str, Any]:
+    return {field: getattr(project, field) for field in META_FIELDS}
+
+
+class ProjectHistoryService:
+    """스냅샷 + 클립 단위 델타 버전 히스토리"""
+
+    @staticmethod
+    def record(
+        db: Session,
+        project: Project,
+        changes: Optional[Dict[str, List[str]]] = None,
+        reordered: bool = False,
+        meta_changed: bool = False,
+    ) -> None:
+        """
+        프로젝트 현재 버전을 히스토리에 기록 (commit은 호출자)
+
+        직전 버전이 기록되어 있고 스냅샷 간격 안이면 델타, 아니면 스냅샷으로 기록합니다.
+        """
+        latest = (
+            db.query(ProjectVersion.version, ProjectVersion.base_version)
+            .filter(ProjectVersion.project_id == project.id)
+            .order_by(ProjectVersion.version.desc())
+            .first()
+        )
+
+        clips = project.clips or []
+        blobs: Dict[str, bytes] = {}
+        chained = (
+            changes is not None
+            and latest is not None
+            and latest.version == project.version - 1
+            and project.version - latest.base_version
+            < settings.PROJECT_HISTORY_SNAPSHOT_INTERVAL
+        )
+
+        if chained:
+            upserted_ids = set(changes["added"]) | set(changes["modified"])
+            delta = {
+                "upserted": {
+                    clip.get("id"): _add_blob(blobs, clip)
+                    for clip in clips
+                    if clip.get("id") in upserted_ids
+                },
+                "deleted": list(changes["deleted"]),
+                "order": [clip.get("id") for clip in clips]
+                if changes["added"] or reordered
+                else None,
+                "meta": _add_blob(blobs, project_meta(project))
+                if meta_changed
+                else None,
+            }
+            row = ProjectVersion(
+                project_id=project.id,
+                version=project.version,
+                kind=DELTA,
+                base_version=latest.base_version,
+                delta=delta,
+            )
+        else:
+            manifest = {
+                "meta": _add_blob(blobs, project_meta(project)),
+                "clips": [[clip.get("id"), _add_blob(blobs, clip)] for clip in clips],
+            }
+            row = ProjectVersion(
+                project_id=project.id,
+                version=project.version,
+                kind=SNAPSHOT,
+                base_version=project.version,
+                manifest_hash=_add_blob(blobs, manifest),
+            )
+
+        row.name = project.name
+        row.clip_count = len(clips)
+        row.size_bytes = project.size_bytes or 0
+
+        ProjectHistoryService._store_blobs(db, blobs)
+        db.add(row)
+
+        if row.kind == SNAPSHOT:
+            ProjectHistoryService._trim(db, project.id, project.version)
+
+    @staticmethod
+    def _trim(db: Session, project_id: str, version: int) -> None:
+        """보관 개수를 넘은 버전 정리 (복원 체인이 끊기지 않도록 스냅샷 경계에서 자름)"""
+        cutoff = version - settings.PROJECT_HISTORY_LIMIT
+        if cutoff <= 0:
+            return
+
+        boundary = (
+            db.query(ProjectVersion.version)
+            .filter(
+                ProjectVersion.project_id == project_id,
+                ProjectVersion.kind == SNAPSHOT,
+                ProjectVersion.version <= cutoff,
+            )
+            .order_by(ProjectVersion.version.desc())
+            .limit(1)
+            .scalar()
+        )
+        if boundary is not None:
+            db.query(ProjectVersion).filter(
+                ProjectVersion.project_id == project_id,
+                ProjectVersion.version < boundary,
+            ).delete(synchronize_session=False)
+
+    @staticmethod
+    def _store_blobs(db: Session, blobs: Dict[str, bytes]) -> None:
+        """
+        없는 블롭만 압축해서 저장 (동시 저장은 ON CONFLICT로 무시)
+
+        이미 있는 블롭은 created_at을 갱신해 GC 유예 기간을 다시 시작합니다. 갱신한 행은
+        커밋까지 잠기므로 동시에 실행 중인 GC가 재사용된 블롭을 지우지 못하고, 갱신 전에
+        GC가 지운 블롭은 아래 조회에서 빠져 새로 저장됩니다.
+        """
+        if not blobs:
+            return
+
+        db.execute(
+            update(ProjectBlob)
+            .where(ProjectBlob.hash.in_(list(blobs)))
+            .values(created_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        existing = set(
+            db.execute(
+                select(ProjectBlob.hash).where(ProjectBlob.hash.in_(list(blobs)))
+            ).scalars()
+        )
+        compressor = zstandard.ZstdCompressor(level=settings.PROJECT_HISTORY_ZSTD_LEVEL)
+        rows = []
+        for digest, raw in blobs.items():
+            if digest in existing:
+                continue
+            data = compressor.compress(raw)
+            rows.append(
+                {
+                    "hash": digest,
+                    "data": data,
+                    "raw_size": len(raw),
+                    "stored_size": len(data),
+                }
+            )
+        if not rows:
+            return
+
+        dialect = db.get_bind().dialect.name
+        if dialect == "postgresql":
+            statement = postgresql.insert(ProjectBlob.__table__).on_conflict_do_nothing(
+                index_elements=["hash"]
+            )
+        elif dialect == "sqlite":
+            statement = sqlite.insert(ProjectBlob.__table__).on_conflict_do_nothing(
+                index_elements=["hash"]
+            )
+        else:
+            statement = ProjectBlob.__table__.insert()
+        db.execute(statement, rows)
+
+    @staticmethod
+    def _load_blobs(db: Session, hashes: Iterable[str]) -> Dict[str, Any]:
+        hashes = list(set(hashes))
+        if not hashes:
+            return {}
+        decompressor = zstandard.ZstdDecompressor()
+        return {
+            digest: json.loads(decompressor.decompress(data))
+            for digest, data in db.execute(
+                select(ProjectBlob.hash, ProjectBlob.data).where(
+                    ProjectBlob.hash.in_(hashes)
+                )
+            ).all()
+        }
+
+    @staticmethod
+    def load_version(
+        db: Session, project_id: str, version: int
+    ) -> Optional[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        특정 버전의 (메타, 클립 목록) 복원
+
+        Returns:
+            버전이 없거나 체인이 끊긴 경우 None
+        """
+        target = (
+            db.query(ProjectVersion.base_version)
+            .filter(
+                ProjectVersion.project_id == project_id,
+                ProjectVersion.version == version,
+            )
+            .first()
+        )
+        if target is None:
+            return None
+
+        rows = (
+            db.query(ProjectVersion)
+            .filter(
+                ProjectVersion.project_id == project_id,
+                ProjectVersion.version >= target.base_version,
+                ProjectVersion.version <= version,
+            )
+            .order_by(ProjectVersion.version)
+            .all()
+        )
+        if (
+            not rows
+            or rows[0].kind != SNAPSHOT
+            or [row.version for row in rows]
+            != list(range(target.base_version, version + 1))
+        ):
+            logger.warning(f"Broken version chain: {project_id}@{version}")
+            return None
+
+        manifest = ProjectHistoryService._load_blobs(db, [rows[0].manifest_hash]).get(
+            rows[0].manifest_hash
+        )
+        if manifest is None:
+            return None
+
+        meta_hash = manifest["meta"]
+        hashes = {clip_id: digest for clip_id, digest in manifest["clips"]}
+        order = [clip_id for clip_id, _ in manifest["clips"]]
+        for row in rows[1:]:
+            delta = row.delta or {}
+            for clip_id in delta.get("deleted") or []:
+                hashes.pop(clip_id, None)
+            hashes.update(delta.get("upserted") or {})
+            if delta.get("order") is not None:
+                order = delta["order"]
+            else:
+                order = [clip_id for clip_id in order if clip_id in hashes]
+            if delta.get("meta"):
+                meta_hash = delta["meta"]
+
+        blobs = ProjectHistoryService._load_blobs(
+            db, set(hashes.values()) | {meta_hash}
+        )
+        missing = (set(hashes.values()) | {meta_hash}) - set(blobs)
+        if missing:
+            logger.warning(f"Missing history blobs for {project_id}@{version}")
+            return None
+
+        return blobs[meta_hash], [blobs[hashes[clip_id]] for clip_id in order]
+
+    @staticmethod
+    def version_at(db: Session, project_id: str, at: datetime) -> Optional[int]:
+        """주어진 시각에 유효했던 (그 이전 마지막으로 저장된) 버전"""
+        return (
+            db.query(ProjectVersion.version)
+            .filter(
+                ProjectVersion.project_id == project_id,
+                ProjectVersion.created_at <= at,
+            )
+            .order_by(ProjectVersion.version.desc())
+            .limit(1)
+            .scalar()
+        )
+
+    @staticmethod
+    def list_versions(
+        db: Session, project_id: str, limit: int = 50, before: Optional[int] = None
+    ) -> List[ProjectVersion]:
+        """최신순 버전 목록 (before 버전 미만)"""
+        query = db.query(ProjectVersion).filter(ProjectVersion.project_id == project_id)
+        if before is not None:
+            query = query.filter(ProjectVersion.version < before)
+        return query.order_by(ProjectVersion.version.desc()).limit(limit).all()
+
+    @staticmethod
+    def collect_garbage(db: Session, batch_size: int = 500) -> int:
+        """어떤 버전에서도 참조하지 않는 블롭 삭제 (삭제된 프로젝트/잘린 버전 정리용)"""
+        referenced: Set[str] = set()
+        manifests: List[str] = []
+        for kind, manifest_hash, delta in db.execute(
+            select(
+                ProjectVersion.kind, ProjectVersion.manifest_hash, ProjectVersion.delta
+            ).execution_options(yield_per=batch_size)
+        ):
+            if kind == SNAPSHOT:
+                referenced.add(manifest_hash)
+                manifests.append(manifest_hash)
+            elif delta:
+                referenced.update((delta.get("upserted") or {}).values())
+                if delta.get("meta"):
+                    referenced.add(delta["meta"])
+
+        for start in range(0, len(manifests), batch_size):
+            loaded = ProjectHistoryService._load_blobs(
+                db, manifests[start : start + batch_size]
+            )
+            for manifest in loaded.values():
+                referenced.add(manifest["meta"])
+                referenced.update(digest for _, digest in manifest["clips"])
+
+        threshold = datetime.utcnow() - BLOB_GC_GRACE
+        orphaned = [
+            digest
+            for digest in db.execute(
+                select(ProjectBlob.hash).where(ProjectBlob.created_at < threshold)
+            ).scalars()
+            if digest not in referenced
+        ]
+        deleted = 0
+        for start in range(0, len(orphaned), batch_size):
+            # 조회 이후 저장에서 재사용되어 created_at이 갱신된 블롭은 제외
+            deleted += db.execute(
+                delete(ProjectBlob).where(
+                    ProjectBlob.hash.in_(orphaned[start : start + batch_size]),
+                    ProjectBlob.created_at < threshold,
+                )
+            ).rowcount
+        return deleted
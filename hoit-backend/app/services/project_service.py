@@ -1,16 +1,38 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Tuple, Union
 from datetime import datetime
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+import uuid
+from sqlalchemy.orm import Session, defer, load_only
+from sqlalchemy import and_, or_, func
 from fastapi import HTTPException, status
+from pydantic import ValidationError
 
+from app.core.config import settings
 from app.models.project import Project
+from app.models.project_change import ProjectChange
+from app.services.bulk_edit import BulkEditError, apply_bulk_operations
+from app.services.clip_table_service import ClipTableService
+from app.services.clip_merge import merge_clips, merge_fields
+from app.services.project_history import (
+    META_FIELDS,
+    ProjectHistoryService,
+    project_meta,
+)
+from app.services.subtitle_export import EXPORT_MEDIA_TYPES, iter_export
 from app.schemas.project import (
+    ClipItemSchema,
+    ProjectBulkEditRequest,
+    ProjectClipsDelta,
     ProjectCreate,
+    ProjectDeltaResponse,
     ProjectResponse,
     ProjectListResponse,
+    ProjectVersionContent,
+    ProjectVersionInfo,
 )
+import base64
 import json
+import jsonpatch
+import jsonpointer
 import logging
 
 logger = logging.getLogger(__name__)
@@ -27,24 +49,27 @@ class ProjectService:
         project_data: ProjectCreate,
         version: Optional[int] = None,
     ) -> Dict[str, Any]:
-        """프로젝트 생성 또는 업데이트"""
+        """
+        프로젝트 생성 또는 업데이트
+
+        기준 버전(If-Match)이 현재 버전과 다르면 히스토리의 기준 버전으로 3-way 병합하고,
+        실제로 겹치는 변경이 있을 때만 충돌 목록과 함께 CONFLICT를 반환합니다.
+        """
 
-        # 기존 프로젝트 조회
+        # 기존 프로젝트 조회 (병합/저장 사이 다른 저장이 끼어들지 않도록 행 잠금)
         existing_project = (
             db.query(Project)
             .filter(and_(Project.id == project_id, Project.user_id == user_id))
+            .with_for_update()
             .first()
         )
 
         if existing_project:
-            # 버전 충돌 체크
+            # 버전이 다르면 기준 버전 기준으로 병합
             if version is not None and existing_project.version != version:
-                return {
-                    "error": "CONFLICT",
-                    "current_version": existing_project.version,
-                    "your_version": version,
-                    "conflict_resolution": "merge",
-                }
+                return await ProjectService._merge_project(
+                    db, existing_project, project_data, version
+                )
 
             # 프로젝트 업데이트
             return await ProjectService._update_project(
@@ -62,11 +87,14 @@ class ProjectService:
 
         try:
             # 프로젝트 생성
+            clips = json.loads(project_data.model_dump_json())["clips"]
             new_project = Project(
                 id=project_data.id,
                 user_id=user_id,
                 name=project_data.name,
-                clips=json.loads(project_data.model_dump_json())["clips"],
+                clips=clips,
+                clip_count=len(clips),
+                size_bytes=ProjectService._clips_size(clips),
                 settings=project_data.settings.model_dump()
                 if project_data.settings
                 else {},
@@ -85,6 +113,10 @@ class ProjectService:
             )
 
             db.add(new_project)
+            db.flush()
+            ClipTableService.sync_project(db, new_project)
+            ProjectHistoryService.record(db, new_project)
+
             db.commit()
             db.refresh(new_project)
 
@@ -104,6 +136,96 @@ class ProjectService:
                 detail=f"Failed to create project: {str(e)}",
             )
 
+    @staticmethod
+    async def _merge_project(
+        db: Session, project: Project, project_data: ProjectCreate, version: int
+    ) -> Dict[str, Any]:
+        """오래된 버전 기준 전체 저장을 서버 변경분과 병합해서 저장"""
+        base = ProjectHistoryService.load_version(db, project.id, version)
+        if base is None:
+            return ProjectService._conflict(project, version)
+        base_meta, base_clips = base
+
+        client_clips = json.loads(project_data.model_dump_json())["clips"]
+        merged_clips, conflicts = merge_clips(
+            base_clips, project.clips or [], client_clips
+        )
+        merged_meta, meta_conflicts = merge_fields(
+            base_meta,
+            project_meta(project),
+            ProjectService._submitted_meta(project_data),
+        )
+        conflicts.extend(meta_conflicts)
+        if conflicts:
+            return ProjectService._conflict(project, version, conflicts)
+
+        merged_data = ProjectCreate(
+            id=project.id,
+            clips=merged_clips,
+            media_id=project_data.media_id,
+            **merged_meta,
+        )
+        result = await ProjectService._update_project(db, project, merged_data)
+        result.update(ProjectService._merge_result(version, client_clips, merged_clips))
+
+        logger.info(
+            f"Project merged: {project.id}, base version: {version}, "
+            f"version: {project.version}"
+        )
+        return result
+
+    @staticmethod
+    def _submitted_meta(project_data: ProjectCreate) -> Dict[str, Any]:
+        """전체 저장 요청의 메타 필드 (_update_project처럼 빈 값은 변경 없음으로 취급)"""
+        data = json.loads(project_data.model_dump_json(include=set(META_FIELDS)))
+        return {key: value for key, value in data.items() if key == "name" or value}
+
+    @staticmethod
+    def _conflict(
+        project: Project,
+        version: int,
+        conflicts: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """
+        CONFLICT 결과
+
+        conflicts가 있으면 병합이 시도된 것이므로 겹친 항목만 담아 수동 해결을 요청하고,
+        없으면 (기준 버전 히스토리 없음) 클라이언트 쪽 병합을 요청합니다.
+        """
+        result = {
+            "error": "CONFLICT",
+            "current_version": project.version,
+            "your_version": version,
+            "conflict_resolution": "manual" if conflicts else "merge",
+        }
+        if conflicts:
+            result["conflicts"] = conflicts
+        return result
+
+    @staticmethod
+    def _merge_result(
+        base_version: int,
+        client_clips: List[Dict[str, Any]],
+        merged_clips: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """병합 저장 응답에 붙일, 클라이언트 제출본 대비 서버 쪽 변경분"""
+        changes = ProjectService._diff_clips(client_clips, merged_clips)
+        merged_by_id = {clip.get("id"): clip for clip in merged_clips}
+        client_order = [clip.get("id") for clip in client_clips]
+        merged_order = [clip.get("id") for clip in merged_clips]
+        return {
+            "merged": True,
+            "base_version": base_version,
+            "server_changes": {
+                "upserted": [
+                    merged_by_id[clip_id]
+                    for clip_id in changes["added"] + changes["modified"]
+                ],
+                "deleted": changes["deleted"],
+                "order": merged_order if merged_order != client_order else None,
+            },
+        }
+
     @staticmethod
     async def _update_project(
         db: Session, project: Project, project_data: ProjectCreate
@@ -112,8 +234,14 @@ class ProjectService:
 
         try:
             # 프로젝트 정보 업데이트
+            old_clips = project.clips or []
+            new_clips = json.loads(project_data.model_dump_json())["clips"]
+            changes = ProjectService._diff_clips(old_clips, new_clips)
+
             project.name = project_data.name
-            project.clips = json.loads(project_data.model_dump_json())["clips"]
+            project.clips = new_clips
+            project.clip_count = len(new_clips)
+            project.size_bytes = ProjectService._clips_size(new_clips)
 
             if project_data.settings:
                 project.settings = project_data.settings.model_dump()
@@ -130,12 +258,26 @@ class ProjectService:
                 project.video_metadata = project_data.video_metadata.model_dump()
 
             # 버전 및 동기화 정보 업데이트
+            previous_version = project.version
             project.version += 1
             project.change_count = 0
             project.server_synced_at = datetime.utcnow()
             project.sync_status = "synced"
             project.updated_at = datetime.utcnow()
 
+            reordered = ProjectService._clip_order_changed(
+                old_clips, new_clips, changes
+            )
+            ProjectService._record_change(
+                db, project, changes, reordered=reordered, meta_changed=True
+            )
+            ClipTableService.sync_project(
+                db, project, previous_version, changes, reordered
+            )
+            ProjectHistoryService.record(
+                db, project, changes, reordered=reordered, meta_changed=True
+            )
+
             db.commit()
             db.refresh(project)
 
@@ -155,6 +297,389 @@ class ProjectService:
                 detail=f"Failed to update project: {str(e)}",
             )
 
+    @staticmethod
+    async def apply_clip_delta(
+        db: Session,
+        user_id: int,
+        project_id: str,
+        delta: Union[ProjectClipsDelta, ProjectBulkEditRequest, List[Dict[str, Any]]],
+        version: int,
+    ) -> Dict[str, Any]:
+        """
+        클립 증분 업데이트 적용
+
+        Args:
+            delta: added/modified/deleted 델타, 일괄 편집 연산 목록
+                또는 clips 배열 기준 RFC 6902 패치
+            version: 클라이언트가 가진 기준 버전 (If-Match)
+
+        Returns:
+            dict: 동기화 결과와 변경된 클립 ID 목록.
+            기준 버전이 오래됐으면 기준 버전에 델타를 적용한 결과를 서버 변경분과 병합하고,
+            겹치는 변경이 있을 때만 CONFLICT
+        """
+        # 동시 PATCH 간 버전 경합 방지를 위해 행 잠금
+        project = (
+            db.query(Project)
+            .filter(and_(Project.id == project_id, Project.user_id == user_id))
+            .with_for_update()
+            .first()
+        )
+
+        if not project:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
+            )
+
+        clips = list(project.clips or [])
+        merge_info: Dict[str, Any] = {}
+        if project.version != version:
+            base = ProjectHistoryService.load_version(db, project.id, version)
+            if base is None:
+                return ProjectService._conflict(project, version)
+            base_clips = base[1]
+
+            client_clips, _ = ProjectService._apply_delta(base_clips, delta)
+            new_clips, conflicts = merge_clips(base_clips, clips, client_clips)
+            if conflicts:
+                return ProjectService._conflict(project, version, conflicts)
+            changes = ProjectService._diff_clips(clips, new_clips)
+            merge_info = ProjectService._merge_result(version, client_clips, new_clips)
+        else:
+            new_clips, changes = ProjectService._apply_delta(clips, delta)
+
+        reordered = ProjectService._clip_order_changed(clips, new_clips, changes)
+        if not any(changes.values()) and not reordered:
+            return {
+                "success": True,
+                "synced_at": project.server_synced_at,
+                "version": project.version,
+                "changes": changes,
+                **merge_info,
+            }
+
+        # 크기는 영향받은 클립만 다시 직렬화해서 증분 계산
+        old_by_id = {clip.get("id"): clip for clip in clips}
+        new_by_id = {clip.get("id"): clip for clip in new_clips}
+        size_delta = sum(
+            ProjectService._clip_size(new_by_id[clip_id])
+            for clip_id in changes["added"] + changes["modified"]
+        ) - sum(
+            ProjectService._clip_size(old_by_id[clip_id])
+            for clip_id in changes["modified"] + changes["deleted"]
+        )
+
+        try:
+            previous_version = project.version
+            project.clips = new_clips
+            project.clip_count = len(new_clips)
+            project.size_bytes = max(0, (project.size_bytes or 0) + size_delta)
+            project.version += 1
+            project.change_count = 0
+            project.server_synced_at = datetime.utcnow()
+            project.sync_status = "synced"
+            project.updated_at = datetime.utcnow()
+
+            ProjectService._record_change(db, project, changes, reordered=reordered)
+            ClipTableService.sync_project(
+                db, project, previous_version, changes, reordered
+            )
+            ProjectHistoryService.record(db, project, changes, reordered=reordered)
+
+            db.commit()
+
+            logger.info(
+                f"Project clips patched: {project.id}, version: {project.version}, "
+                f"added: {len(changes['added'])}, modified: {len(changes['modified'])}, "
+                f"deleted: {len(changes['deleted'])}"
+            )
+
+            return {
+                "success": True,
+                "synced_at": project.server_synced_at,
+                "version": project.version,
+                "changes": changes,
+                **merge_info,
+            }
+
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to patch project clips: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to patch project clips: {str(e)}",
+            )
+
+    @staticmethod
+    def _apply_delta(
+        clips: List[Dict[str, Any]],
+        delta: Union[ProjectClipsDelta, ProjectBulkEditRequest, List[Dict[str, Any]]],
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, List[str]]]:
+        """델타 형식(JSON Patch / added·modified·deleted / 일괄 편집)에 맞춰 적용"""
+        if isinstance(delta, list):
+            return ProjectService._apply_json_patch(clips, delta)
+        if isinstance(delta, ProjectBulkEditRequest):
+            try:
+                new_clips = apply_bulk_operations(clips, delta.operations)
+            except BulkEditError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)
+                )
+            return new_clips, ProjectService._diff_clips(clips, new_clips)
+        return ProjectService._apply_clip_changes(clips, delta)
+
+    @staticmethod
+    def _apply_clip_changes(
+        clips: List[Dict[str, Any]], delta: ProjectClipsDelta
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, List[str]]]:
+        """added/modified/deleted 델타를 클립 목록에 적용"""
+        by_id = {clip.get("id"): clip for clip in clips}
+
+        unknown = [
+            clip_id
+            for clip_id in delta.deleted + [clip.id for clip in delta.modified]
+            if clip_id not in by_id
+        ]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Unknown clip ids: {', '.join(unknown)}",
+            )
+
+        duplicated = [clip.id for clip in delta.added if clip.id in by_id]
+        if duplicated:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Clip ids already exist: {', '.join(duplicated)}",
+            )
+
+        deleted = set(delta.deleted)
+        for clip in delta.modified:
+            by_id[clip.id] = json.loads(clip.model_dump_json())
+
+        new_clips = [
+            by_id[clip.get("id")] for clip in clips if clip.get("id") not in deleted
+        ]
+        for clip in delta.added:
+            clip_data = json.loads(clip.model_dump_json())
+            by_id[clip.id] = clip_data
+            new_clips.append(clip_data)
+
+        if delta.order is not None:
+            if sorted(delta.order) != sorted(clip.get("id") for clip in new_clips):
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail="Clip order does not match the resulting clip ids",
+                )
+            new_clips = [by_id[clip_id] for clip_id in delta.order]
+
+        return new_clips, {
+            "added": [clip.id for clip in delta.added],
+            "modified": [clip.id for clip in delta.modified],
+            "deleted": list(delta.deleted),
+        }
+
+    @staticmethod
+    def _apply_json_patch(
+        clips: List[Dict[str, Any]], operations: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, List[str]]]:
+        """clips 배열 기준 RFC 6902 패치 적용"""
+        try:
+            new_clips = jsonpatch.apply_patch(clips, operations)
+        except (jsonpatch.JsonPatchException, jsonpointer.JsonPointerException) as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Invalid JSON patch: {str(e)}",
+            )
+
+        if not isinstance(new_clips, list):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="JSON patch must keep clips as an array",
+            )
+
+        after_ids = set()
+        for clip in new_clips:
+            if not isinstance(clip, dict) or clip.get("id") in after_ids:
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                    detail="JSON patch produced invalid or duplicated clips",
+                )
+            after_ids.add(clip.get("id"))
+
+        # 연산은 순서대로 적용되어 앞선 add/remove가 뒤 연산의 인덱스를 밀어내므로,
+        # 경로 인덱스 대신 결과를 클립 ID 기준으로 비교해 변경/검증 대상을 구함
+        changes = ProjectService._diff_clips(clips, new_clips)
+        changed = set(changes["added"]) | set(changes["modified"])
+        try:
+            for clip in new_clips:
+                if clip.get("id") in changed:
+                    ClipItemSchema.model_validate(clip)
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"JSON patch produced an invalid clip: {str(e)}",
+            )
+
+        return new_clips, changes
+
+    @staticmethod
+    def _clip_size(clip: Dict[str, Any]) -> int:
+        """클립 하나의 직렬화 크기 (배열 구분자 포함)"""
+        return len(json.dumps(clip)) + 2
+
+    @staticmethod
+    def _clips_size(clips: List[Dict[str, Any]]) -> int:
+        """클립 목록의 대략적인 크기 (bytes), len(json.dumps(clips))와 동일"""
+        return sum(ProjectService._clip_size(clip) for clip in clips)
+
+    @staticmethod
+    def _diff_clips(
+        old_clips: List[Dict[str, Any]], new_clips: List[Dict[str, Any]]
+    ) -> Dict[str, List[str]]:
+        """클립 ID 기준으로 두 클립 목록의 추가/수정/삭제 계산"""
+        old_by_id = {clip.get("id"): clip for clip in old_clips}
+        new_ids = set()
+        added, modified = [], []
+
+        for clip in new_clips:
+            clip_id = clip.get("id")
+            new_ids.add(clip_id)
+            if clip_id not in old_by_id:
+                added.append(clip_id)
+            elif old_by_id[clip_id] != clip:
+                modified.append(clip_id)
+
+        deleted = [clip_id for clip_id in old_by_id if clip_id not in new_ids]
+        return {"added": added, "modified": modified, "deleted": deleted}
+
+    @staticmethod
+    def _clip_order_changed(
+        old_clips: List[Dict[str, Any]],
+        new_clips: List[Dict[str, Any]],
+        changes: Dict[str, List[str]],
+    ) -> bool:
+        """추가/삭제를 제외한 기존 클립들의 순서가 바뀌었는지 확인"""
+        added = set(changes["added"])
+        deleted = set(changes["deleted"])
+        old_order = [c.get("id") for c in old_clips if c.get("id") not in deleted]
+        new_order = [c.get("id") for c in new_clips if c.get("id") not in added]
+        return old_order != new_order
+
+    @staticmethod
+    def _record_change(
+        db: Session,
+        project: Project,
+        changes: Dict[str, List[str]],
+        reordered: bool = False,
+        meta_changed: bool = False,
+    ) -> None:
+        """현재 버전의 변경 로그 기록 후 보관 개수를 넘는 오래된 항목 정리"""
+        db.add(
+            ProjectChange(
+                project_id=project.id,
+                version=project.version,
+                added=changes["added"],
+                modified=changes["modified"],
+                deleted=changes["deleted"],
+                reordered=reordered,
+                meta_changed=meta_changed,
+            )
+        )
+
+        cutoff = project.version - settings.PROJECT_CHANGE_LOG_LIMIT
+        if cutoff > 0:
+            db.query(ProjectChange).filter(
+                ProjectChange.project_id == project.id,
+                ProjectChange.version <= cutoff,
+            ).delete(synchronize_session=False)
+
+    @staticmethod
+    async def get_project_changes(
+        db: Session, user_id: int, project_id: str, since: int
+    ) -> Union[ProjectDeltaResponse, ProjectResponse]:
+        """
+        since 버전 이후 변경분 조회
+
+        변경 로그가 잘려 since 버전까지 이어지지 않으면 전체 스냅샷을 반환합니다.
+        """
+        # clips는 변경분이 있을 때만 로드
+        project = (
+            db.query(Project)
+            .options(defer(Project.clips))
+            .filter(and_(Project.id == project_id, Project.user_id == user_id))
+            .first()
+        )
+
+        if not project:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
+            )
+
+        if since > project.version:
+            return await ProjectService.get_project(db, user_id, project_id)
+
+        entries = []
+        if since < project.version:
+            entries = (
+                db.query(ProjectChange)
+                .filter(
+                    ProjectChange.project_id == project.id,
+                    ProjectChange.version > since,
+                )
+                .order_by(ProjectChange.version)
+                .all()
+            )
+
+        # 로그가 연속되지 않으면 (잘렸거나 로그 도입 이전 버전) 전체 스냅샷
+        if [entry.version for entry in entries] != list(
+            range(since + 1, project.version + 1)
+        ):
+            return await ProjectService.get_project(db, user_id, project_id)
+
+        changed_ids = set()
+        structure_changed = False
+        for entry in entries:
+            changed_ids.update(entry.added or [])
+            changed_ids.update(entry.modified or [])
+            changed_ids.update(entry.deleted or [])
+            if entry.added or entry.deleted or entry.reordered:
+                structure_changed = True
+
+        upserted: List[Dict[str, Any]] = []
+        deleted: List[str] = []
+        order = None
+        if changed_ids or structure_changed:
+            clips = project.clips or []
+            current_ids = set()
+            for clip in clips:
+                current_ids.add(clip.get("id"))
+                if clip.get("id") in changed_ids:
+                    upserted.append(clip)
+            deleted = sorted(changed_ids - current_ids)
+            if structure_changed:
+                order = [clip.get("id") for clip in clips]
+
+        return ProjectDeltaResponse(
+            id=project.id,
+            name=project.name,
+            since_version=since,
+            version=project.version,
+            upserted=upserted,
+            deleted=deleted,
+            order=order,
+            settings=project.settings or {},
+            video_url=project.video_url,
+            video_name=project.video_name,
+            video_type=project.video_type,
+            video_duration=project.video_duration,
+            video_metadata=project.video_metadata,
+            updated_at=project.updated_at,
+            server_synced_at=project.server_synced_at,
+            sync_status=project.sync_status,
+            change_count=project.change_count,
+        )
+
     @staticmethod
     async def get_project(
         db: Session, user_id: int, project_id: str
@@ -198,60 +723,195 @@ class ProjectService:
         page: int = 1,
         limit: int = 20,
         sort: str = "updated_at:desc",
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """프로젝트 목록 조회"""
+        """
+        프로젝트 목록 조회
+
+        clips/settings는 읽지 않고 요약 컬럼만 조회합니다.
+        cursor가 주어지면 OFFSET 대신 keyset 페이지네이션을 사용합니다.
+        """
 
         # 정렬 파싱
         sort_field, sort_order = sort.split(":")
+        sort_column = getattr(Project, sort_field)
+        descending = sort_order == "desc"
+
+        # 쿼리 생성 (목록에 필요한 컬럼만 로드)
+        base_query = db.query(Project).filter(Project.user_id == user_id)
+        query = base_query.options(
+            load_only(
+                Project.id,
+                Project.name,
+                Project.created_at,
+                Project.updated_at,
+                Project.clip_count,
+                Project.size_bytes,
+                Project.video_duration,
+                Project.sync_status,
+            )
+        )
 
-        # 쿼리 생성
-        query = db.query(Project).filter(Project.user_id == user_id)
+        # keyset 조건 (정렬 컬럼 + id로 동률 해소)
+        if cursor:
+            cursor_value, cursor_id = ProjectService._decode_list_cursor(
+                cursor, sort_field
+            )
+            if descending:
+                query = query.filter(
+                    or_(
+                        sort_column < cursor_value,
+                        and_(sort_column == cursor_value, Project.id < cursor_id),
+                    )
+                )
+            else:
+                query = query.filter(
+                    or_(
+                        sort_column > cursor_value,
+                        and_(sort_column == cursor_value, Project.id > cursor_id),
+                    )
+                )
 
         # 정렬 적용
-        if sort_order == "desc":
-            query = query.order_by(getattr(Project, sort_field).desc())
+        if descending:
+            query = query.order_by(sort_column.desc(), Project.id.desc())
         else:
-            query = query.order_by(getattr(Project, sort_field))
-
-        # 전체 개수
-        total = query.count()
+            query = query.order_by(sort_column, Project.id)
 
-        # 페이지네이션
-        offset = (page - 1) * limit
-        projects = query.offset(offset).limit(limit).all()
+        # 페이지네이션 (전체 개수는 윈도우 함수로 같은 쿼리에서 계산)
+        if cursor:
+            rows = query.limit(limit).all()
+            total = base_query.with_entities(func.count(Project.id)).scalar()
+            projects = rows
+        else:
+            offset = (page - 1) * limit
+            rows = (
+                query.add_columns(func.count(Project.id).over().label("total"))
+                .offset(offset)
+                .limit(limit)
+                .all()
+            )
+            projects = [row[0] for row in rows]
+            if rows:
+                total = rows[0].total
+            else:
+                total = base_query.with_entities(func.count(Project.id)).scalar()
 
         # 응답 형식 변환
-        project_list = []
-        for project in projects:
-            # 클립 개수 계산
-            clip_count = len(project.clips) if project.clips else 0
-
-            # 프로젝트 크기 계산 (대략적)
-            project_size = len(json.dumps(project.clips or [])) if project.clips else 0
-
-            project_list.append(
-                ProjectListResponse(
-                    id=project.id,
-                    name=project.name,
-                    last_modified=project.updated_at,
-                    size=project_size,
-                    clip_count=clip_count,
-                    video_duration=project.video_duration,
-                    sync_status=project.sync_status,
-                )
+        project_list = [
+            ProjectListResponse(
+                id=project.id,
+                name=project.name,
+                last_modified=project.updated_at,
+                size=project.size_bytes,
+                clip_count=project.clip_count,
+                video_duration=project.video_duration,
+                sync_status=project.sync_status,
             )
+            for project in projects
+        ]
 
-        return {"projects": project_list, "total": total, "page": page, "limit": limit}
+        next_cursor = None
+        if len(projects) == limit:
+            last = projects[-1]
+            next_cursor = ProjectService._encode_list_cursor(
+                getattr(last, sort_field), last.id
+            )
+
+        return {
+            "projects": project_list,
+            "total": total,
+            "page": page,
+            "limit": limit,
+            "next_cursor": next_cursor,
+        }
 
     @staticmethod
-    async def delete_project(
-        db: Session, user_id: int, project_id: str
+    def _encode_list_cursor(value: Any, project_id: str) -> str:
+        """목록 keyset 커서 인코딩 (정렬 값, 프로젝트 ID)"""
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        raw = json.dumps([value, project_id], separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def _decode_list_cursor(cursor: str, sort_field: str) -> Tuple[Any, str]:
+        """목록 keyset 커서 디코딩"""
+        try:
+            value, project_id = json.loads(
+                base64.urlsafe_b64decode(cursor.encode("ascii"))
+            )
+            if sort_field in ("updated_at", "created_at"):
+                value = datetime.fromisoformat(value)
+            return value, str(project_id)
+        except (ValueError, TypeError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            )
+
+    @staticmethod
+    async def list_project_versions(
+        db: Session,
+        user_id: int,
+        project_id: str,
+        limit: int = 50,
+        before: Optional[int] = None,
     ) -> Dict[str, Any]:
-        """프로젝트 삭제"""
+        """프로젝트 히스토리 버전 목록 (최신순)"""
+        current_version = await ProjectService.get_project_version(
+            db, user_id, project_id
+        )
+
+        rows = ProjectHistoryService.list_versions(db, project_id, limit, before)
+        return {
+            "current_version": current_version,
+            "versions": [ProjectVersionInfo.model_validate(row) for row in rows],
+            "next_before": rows[-1].version if len(rows) == limit else None,
+        }
 
+    @staticmethod
+    async def get_project_at_version(
+        db: Session, user_id: int, project_id: str, version: int
+    ) -> ProjectVersionContent:
+        """히스토리 버전 내용 조회"""
+        await ProjectService.get_project_version(db, user_id, project_id)
+
+        state = ProjectHistoryService.load_version(db, project_id, version)
+        if state is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Version {version} is not available",
+            )
+
+        meta, clips = state
+        return ProjectVersionContent(
+            id=project_id, version=version, clips=clips, **meta
+        )
+
+    @staticmethod
+    async def restore_project_version(
+        db: Session,
+        user_id: int,
+        project_id: str,
+        target_version: Optional[int] = None,
+        at: Optional[datetime] = None,
+        version: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        히스토리 버전으로 복원
+
+        과거 버전 내용을 새 버전으로 저장하므로 버전 번호는 계속 증가하며,
+        변경 로그/clips 테이블/히스토리도 일반 저장과 같이 갱신됩니다.
+
+        Args:
+            target_version: 복원할 버전 (없으면 at 시각 기준으로 선택)
+            version: 클라이언트 기준 버전 (If-Match, 불일치 시 CONFLICT)
+        """
         project = (
             db.query(Project)
             .filter(and_(Project.id == project_id, Project.user_id == user_id))
+            .with_for_update()
             .first()
         )
 
@@ -260,96 +920,242 @@ class ProjectService:
                 status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
             )
 
+        if version is not None and project.version != version:
+            return ProjectService._conflict(project, version)
+
+        if target_version is None and at is not None:
+            target_version = ProjectHistoryService.version_at(db, project.id, at)
+        if target_version is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="No version recorded at the requested time",
+            )
+
+        state = ProjectHistoryService.load_version(db, project.id, target_version)
+        if state is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Version {target_version} is not available",
+            )
+        meta, restored_clips = state
+
         try:
-            db.delete(project)
+            old_clips = project.clips or []
+            changes = ProjectService._diff_clips(old_clips, restored_clips)
+            reordered = ProjectService._clip_order_changed(
+                old_clips, restored_clips, changes
+            )
+
+            for field in META_FIELDS:
+                setattr(project, field, meta.get(field))
+            project.clips = restored_clips
+            project.clip_count = len(restored_clips)
+            project.size_bytes = ProjectService._clips_size(restored_clips)
+
+            previous_version = project.version
+            project.version += 1
+            project.change_count = 0
+            project.server_synced_at = datetime.utcnow()
+            project.sync_status = "synced"
+            project.updated_at = datetime.utcnow()
+
+            ProjectService._record_change(
+                db, project, changes, reordered=reordered, meta_changed=True
+            )
+            ClipTableService.sync_project(
+                db, project, previous_version, changes, reordered
+            )
+            ProjectHistoryService.record(
+                db, project, changes, reordered=reordered, meta_changed=True
+            )
+
             db.commit()
 
-            logger.info(f"Project deleted: {project_id}")
+            logger.info(
+                f"Project restored: {project.id}, from version {target_version} "
+                f"to version {project.version}"
+            )
 
-            return {"success": True, "message": "Project deleted successfully"}
+            return {
+                "success": True,
+                "synced_at": project.server_synced_at,
+                "version": project.version,
+                "restored_from": target_version,
+                "changes": changes,
+            }
 
         except Exception as e:
             db.rollback()
-            logger.error(f"Failed to delete project: {str(e)}")
+            logger.error(f"Failed to restore project: {str(e)}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to delete project: {str(e)}",
+                detail=f"Failed to restore project: {str(e)}",
             )
 
     @staticmethod
-    async def export_project(
-        db: Session, user_id: int, project_id: str, format: str = "srt"
-    ) -> str:
-        """프로젝트를 자막 파일 형식으로 내보내기"""
+    async def duplicate_project(
+        db: Session,
+        user_id: int,
+        project_id: str,
+        new_project_id: Optional[str] = None,
+        name: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        프로젝트 복제
 
-        project = await ProjectService.get_project(db, user_id, project_id)
+        클립 내용이 같으므로 히스토리 블롭은 원본과 공유되고 새 스냅샷 행만 추가됩니다.
+        """
+        source = (
+            db.query(Project)
+            .filter(and_(Project.id == project_id, Project.user_id == user_id))
+            .first()
+        )
 
-        if not project.clips:
-            return ""
+        if not source:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
+            )
 
-        # SRT 형식으로 변환
-        if format == "srt":
-            return ProjectService._export_as_srt(project.clips)
-        elif format == "vtt":
-            return ProjectService._export_as_vtt(project.clips)
-        else:
+        new_project_id = new_project_id or f"project_{uuid.uuid4().hex}"
+        if db.query(Project.id).filter(Project.id == new_project_id).first():
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Unsupported export format: {format}",
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Project id already exists",
             )
 
-    @staticmethod
-    def _export_as_srt(clips: List[Dict]) -> str:
-        """SRT 형식으로 내보내기"""
-        srt_content = []
+        try:
+            new_project = Project(
+                id=new_project_id,
+                user_id=user_id,
+                name=name or f"{source.name} (사본)",
+                clips=source.clips or [],
+                clip_count=source.clip_count,
+                size_bytes=source.size_bytes,
+                settings=source.settings or {},
+                media_id=source.media_id,
+                video_url=source.video_url,
+                video_name=source.video_name,
+                video_type=source.video_type,
+                video_duration=source.video_duration,
+                video_metadata=source.video_metadata,
+                version=1,
+                change_count=0,
+                server_synced_at=datetime.utcnow(),
+                sync_status="synced",
+            )
+
+            db.add(new_project)
+            db.flush()
+            ClipTableService.sync_project(db, new_project)
+            ProjectHistoryService.record(db, new_project)
+
+            db.commit()
 
-        for idx, clip in enumerate(clips, 1):
-            # 시간 형식 변환
-            words = clip.get("words", [])
-            if words:
-                start_time = ProjectService._seconds_to_srt_time(words[0]["start"])
-                end_time = ProjectService._seconds_to_srt_time(words[-1]["end"])
-                text = clip.get("fullText", clip.get("subtitle", ""))
+            logger.info(f"Project duplicated: {project_id} -> {new_project_id}")
 
-                srt_content.append(f"{idx}")
-                srt_content.append(f"{start_time} --> {end_time}")
-                srt_content.append(text)
-                srt_content.append("")  # 빈 줄
+            return {
+                "success": True,
+                "id": new_project.id,
+                "name": new_project.name,
+                "synced_at": new_project.server_synced_at,
+                "version": new_project.version,
+            }
 
-        return "\n".join(srt_content)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to duplicate project: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to duplicate project: {str(e)}",
+            )
 
     @staticmethod
-    def _export_as_vtt(clips: List[Dict]) -> str:
-        """VTT 형식으로 내보내기"""
-        vtt_content = ["WEBVTT", ""]
+    async def delete_project(
+        db: Session, user_id: int, project_id: str
+    ) -> Dict[str, Any]:
+        """프로젝트 삭제"""
+
+        project = (
+            db.query(Project)
+            .filter(and_(Project.id == project_id, Project.user_id == user_id))
+            .first()
+        )
+
+        if not project:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
+            )
 
-        for clip in clips:
-            words = clip.get("words", [])
-            if words:
-                start_time = ProjectService._seconds_to_vtt_time(words[0]["start"])
-                end_time = ProjectService._seconds_to_vtt_time(words[-1]["end"])
-                text = clip.get("fullText", clip.get("subtitle", ""))
+        try:
+            db.delete(project)
+            db.commit()
 
-                vtt_content.append(f"{start_time} --> {end_time}")
-                vtt_content.append(text)
-                vtt_content.append("")  # 빈 줄
+            logger.info(f"Project deleted: {project_id}")
 
-        return "\n".join(vtt_content)
+            return {"success": True, "message": "Project deleted successfully"}
+
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Failed to delete project: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to delete project: {str(e)}",
+            )
 
     @staticmethod
-    def _seconds_to_srt_time(seconds: float) -> str:
-        """초를 SRT 시간 형식으로 변환 (00:00:00,000)"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds % 1) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+    async def get_project_version(db: Session, user_id: int, project_id: str) -> int:
+        """프로젝트 현재 버전만 조회 (내보내기 ETag 확인용)"""
+        version = (
+            db.query(Project.version)
+            .filter(and_(Project.id == project_id, Project.user_id == user_id))
+            .scalar()
+        )
+
+        if version is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
+            )
+
+        return version
 
     @staticmethod
-    def _seconds_to_vtt_time(seconds: float) -> str:
-        """초를 VTT 시간 형식으로 변환 (00:00:00.000)"""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds % 1) * 1000)
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+    async def export_project(
+        db: Session, user_id: int, project_id: str, format: str = "srt"
+    ) -> Tuple[int, Iterator[str]]:
+        """
+        프로젝트를 자막 파일 형식으로 내보내기
+
+        Returns:
+            tuple: (내보낸 프로젝트 버전, 자막 내용 제너레이터)
+        """
+        if format not in EXPORT_MEDIA_TYPES:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unsupported export format: {format}",
+            )
+
+        # pydantic 변환 없이 필요한 컬럼만 조회
+        project = (
+            db.query(Project)
+            .options(
+                load_only(
+                    Project.id,
+                    Project.name,
+                    Project.clips,
+                    Project.version,
+                    Project.video_metadata,
+                )
+            )
+            .filter(and_(Project.id == project_id, Project.user_id == user_id))
+            .first()
+        )
+
+        if not project:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Project not found"
+            )
+
+        chunks = iter_export(
+            format, project.clips or [], project.name, project.video_metadata
+        )
+        return project.version, chunks
@@ -0,0 +1,206 @@
+"""
+Redis 기반 분산 Rate Limiter
+
+모든 gunicorn 워커가 같은 Redis 카운터를 공유하므로 설정한 한도가 워커 수와 관계없이
+그대로 적용됩니다. 슬라이딩 윈도우 카운터(이전 윈도우 카운트를 경과 비율만큼 가중)를
+Lua 스크립트 한 번으로 원자적으로 확인/증가시키며, 시간은 Redis TIME을 써서 워커 간
+시계 차이의 영향을 받지 않습니다.
+
+키
+- 인증된 요청: user:{user_id} (JWT 서명만 확인, DB 조회 없음)
+- 그 외: ip:{클라이언트 IP}. CloudFront/ALB 뒤에서는 X-Forwarded-For의 오른쪽에서
+  RATE_LIMIT_TRUSTED_PROXY_HOPS번째 값(프록시가 붙인 실제 클라이언트 IP)을 씁니다.
+
+응답 헤더 (IETF RateLimit 헤더 초안)
+    RateLimit-Limit, RateLimit-Remaining, RateLimit-Reset(초), RateLimit-Policy
+    한도 초과 시 429 + Retry-After
+
+한도를 넘긴 키는 Retry-After 동안 워커 메모리에서 바로 거절해 Redis 왕복을 생략합니다.
+Redis에 연결할 수 없으면 요청을 막지 않고(fail-open) 잠시 Redis를 건너뜁니다.
+
+사용법:
+    @router.post("/create", dependencies=[Depends(rate_limiter.limit("20/minute"))])
+"""
+
+import logging
+import math
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+import redis.asyncio as aioredis
+from fastapi import HTTPException, Request, Response, status
+
+from app.core.config import settings
+from app.core.redis_client import REDIS_URL, REDIS_SOCKET_TIMEOUT
+from app.services.auth_service import auth_service
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "ratelimit"
+
+# Redis 오류 후 다시 시도하기까지 건너뛰는 시간 (초)
+REDIS_RETRY_INTERVAL = 5.0
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+# KEYS[1]: 키 접두사, ARGV[1]: 한도, ARGV[2]: 윈도우(ms)
+# 반환: {허용 여부(1/0), 남은 횟수, 재시도/리셋까지 ms}
+SLIDING_WINDOW_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local index = math.floor(now / window)
+local elapsed = now - index * window
+local current_key = KEYS[1] .. ':' .. index
+local previous = tonumber(redis.call('GET', KEYS[1] .. ':' .. (index - 1)) or '0')
+local current = tonumber(redis.call('GET', current_key) or '0')
+local weighted = previous * (window - elapsed) / window
+
+if weighted + current >= limit then
+    -- 가중 합이 한도 아래로 내려가는 시점까지 대기
+    local retry
+    if current < limit then
+        retry = math.ceil(window * (1 - (limit - current) / previous)) - elapsed
+    else
+        retry = window - elapsed + math.ceil(window * (1 - limit / current))
+    end
+    return {0, 0, math.max(retry, 1)}
+end
+
+current = redis.call('INCR', current_key)
+if current == 1 then
+    redis.call('PEXPIRE', current_key, window * 2)
+end
+return {1, math.max(limit - math.floor(weighted + current), 0), window - elapsed}
+"""
+
+
+def parse_rate(rate: str) -> Tuple[int, int]:
+    """ "20/minute", "5/10 seconds" 형식 → (한도, 윈도우 초)"""
+    count, _, period = rate.partition("/")
+    parts = period.strip().split()
+    multiplier = int(parts[0]) if len(parts) == 2 else 1
+    unit = parts[-1].rstrip("s")
+    if unit not in PERIODS:
+        raise ValueError(f"Unsupported rate limit period: {rate}")
+    return int(count), multiplier * PERIODS[unit]
+
+
+def client_ip(request: Request) -> str:
+    """프록시 뒤 실제 클라이언트 IP (신뢰하는 프록시 수만큼 X-Forwarded-For 오른쪽에서 선택)"""
+    forwarded = request.headers.get("x-forwarded-for")
+    hops = settings.RATE_LIMIT_TRUSTED_PROXY_HOPS
+    if forwarded and hops > 0:
+        addresses = [a.strip() for a in forwarded.split(",") if a.strip()]
+        if addresses:
+            return addresses[-min(hops, len(addresses))]
+    return request.client.host if request.client else "unknown"
+
+
+def rate_limit_identity(request: Request) -> str:
+    """인증된 요청은 사용자 ID, 아니면 클라이언트 IP 기준"""
+    token = None
+    auth_header = request.headers.get("Authorization")
+    if auth_header and auth_header.startswith("Bearer "):
+        token = auth_header[7:]
+    else:
+        token = request.cookies.get("access_token")
+    if token:
+        payload = auth_service.verify_token(token)
+        if payload and payload.get("user_id") is not None:
+            return f"user:{payload['user_id']}"
+    return f"ip:{client_ip(request)}"
+
+
+class RateLimiter:
+    """모든 워커가 공유하는 Redis 슬라이딩 윈도우 Rate Limiter"""
+
+    def __init__(self, redis_url: str):
+        self._client = aioredis.from_url(
+            redis_url,
+            max_connections=settings.RATE_LIMIT_REDIS_POOL_SIZE,
+            socket_timeout=REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+        )
+        self._script = self._client.register_script(SLIDING_WINDOW_SCRIPT)
+        # 한도를 넘긴 키 → 다시 허용될 수 있는 시각(monotonic)
+        self._blocked: Dict[str, float] = {}
+        self._redis_retry_at = 0.0
+
+    async def hit(self, key: str, limit: int, window: int) -> Tuple[bool, int, float]:
+        """
+        요청 1회 기록
+
+        Returns:
+            (허용 여부, 남은 횟수, 재시도/리셋까지 초)
+        """
+        now = time.monotonic()
+        blocked_until = self._blocked.get(key)
+        if blocked_until is not None:
+            if blocked_until > now:
+                return False, 0, blocked_until - now
+            del self._blocked[key]
+
+        if now < self._redis_retry_at:
+            return True, limit, float(window)
+        try:
+            allowed, remaining, reset_ms = await self._script(
+                keys=[key], args=[limit, window * 1000]
+            )
+        except Exception as e:
+            logger.warning(f"Rate limiter Redis unavailable, allowing request: {e}")
+            self._redis_retry_at = now + REDIS_RETRY_INTERVAL
+            return True, limit, float(window)
+
+        reset = reset_ms / 1000
+        if not allowed:
+            if len(self._blocked) > settings.RATE_LIMIT_LOCAL_BLOCK_MAX_KEYS:
+                self._blocked = {k: t for k, t in self._blocked.items() if t > now}
+            self._blocked[key] = now + reset
+        return bool(allowed), int(remaining), reset
+
+    async def close(self) -> None:
+        """Redis 연결 풀 종료 (애플리케이션 종료 시)"""
+        await self._client.aclose()
+
+    def limit(self, rate: str, scope: Optional[str] = None) -> Callable:
+        """
+        라우트에 붙일 FastAPI 의존성 생성
+
+        Args:
+            rate: "20/minute" 형식의 한도
+            scope: 카운터 구분 이름 (기본값: 메서드 + 라우트 경로)
+        """
+        count, window = parse_rate(rate)
+        policy = f"{count};w={window}"
+
+        async def dependency(request: Request, response: Response) -> None:
+            if not settings.RATE_LIMIT_ENABLED:
+                return
+            route = request.scope.get("route")
+            name = (
+                scope or f"{request.method}:{getattr(route, 'path', request.url.path)}"
+            )
+            key = f"{KEY_PREFIX}:{name}:{rate_limit_identity(request)}"
+
+            allowed, remaining, reset = await self.hit(key, count, window)
+            headers = {
+                "RateLimit-Limit": str(count),
+                "RateLimit-Remaining": str(remaining),
+                "RateLimit-Reset": str(math.ceil(reset)),
+                "RateLimit-Policy": policy,
+            }
+            if not allowed:
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail=f"요청 한도를 초과했습니다 ({rate}). 잠시 후 다시 시도해주세요.",
+                    headers={**headers, "Retry-After": str(math.ceil(reset))},
+                )
+            response.headers.update(headers)
+
+        return dependency
+
+
+# 싱글톤 인스턴스
+rate_limiter = RateLimiter(REDIS_URL)
@@ -0,0 +1,360 @@
+"""
+ML 결과 → MotionText v2.0 시나리오 빌더
+
+완료된 작업의 자막 클립(subtitle_segmentation)과 단어 음향 정보로 에디터 초기 시나리오와
+같은 구조의 시나리오를 만듭니다. 노드 ID는 프론트엔드 buildInitialScenarioFromClips와
+같은 규칙(cue-{clip_id} / clip-{clip_id} / word-...)을 따르므로 에디터·챗봇 패치와 호환됩니다.
+
+오디오 반응형 프리셋은 단어 volume_db/pitch_hz로 강도(0~1)를 미리 계산해
+큰 소리 단어에는 cwi-loud, 속삭임 단어에는 cwi-whisper 플러그인을 기본 적용합니다.
+
+결과는 (job_id, 빌더 버전, 스타일 프리셋) 기준으로 직렬화된 JSON 그대로 캐시합니다.
+"""
+
+import hashlib
+import json
+import logging
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.services.job_service import JobService
+from app.services.plugin_registry import resolve_plugin_key
+from app.services.subtitle_export import ExportCache
+from app.services.subtitle_segmentation import WordStream, subtitle_segmenter
+
+logger = logging.getLogger(__name__)
+
+# 시나리오 구조나 강도 계산이 바뀌면 올려서 캐시/ETag 무효화
+SCENARIO_BUILDER_VERSION = 1
+
+STYLE_PRESETS: Dict[str, Dict[str, Any]] = {
+    # 에디터 기본 자막 (하단 중앙 + 반투명 박스) + 음량 기반 애니메이션
+    "default": {
+        "base_aspect": "16:9",
+        "position": {"x": 0.5, "y": 0.925},
+        "anchor": "bc",
+        "font_size_rel": 0.05,
+        "box": True,
+        "audio_reactive": True,
+    },
+    # 애니메이션 없는 기본 자막
+    "plain": {
+        "base_aspect": "16:9",
+        "position": {"x": 0.5, "y": 0.925},
+        "anchor": "bc",
+        "font_size_rel": 0.05,
+        "box": True,
+        "audio_reactive": False,
+    },
+    # 세로 영상 (화면 중앙 큰 글씨, 박스 없음)
+    "shorts": {
+        "base_aspect": "9:16",
+        "position": {"x": 0.5, "y": 0.7},
+        "anchor": "cc",
+        "font_size_rel": 0.07,
+        "box": False,
+        "audio_reactive": True,
+    },
+}
+
+SPEAKER_COLOURS = ["#FFFFFF", "#FFD700", "#4FC3F7", "#81C784", "#F48FB1", "#FFB74D"]
+
+LOUD_PLUGIN = resolve_plugin_key("cwi-loud")
+WHISPER_PLUGIN = resolve_plugin_key("cwi-whisper")
+
+# ML 결과에 음량 통계가 없을 때 사용할 분위수 (속삭임 / 큰 소리 기준)
+FALLBACK_QUANTILES = (0.1, 0.9)
+
+
+def _volume_thresholds(
+    result: Dict[str, Any], volume: np.ndarray
+) -> Optional[Tuple[float, float]]:
+    """(속삭임 기준 dB, 큰 소리 기준 dB). ML 통계 우선, 없으면 단어 음량 분위수"""
+    stats = result.get("volume_statistics") or {}
+    whisper = stats.get("whisper_threshold_db")
+    loud = stats.get("loud_threshold_db")
+    if isinstance(whisper, (int, float)) and isinstance(loud, (int, float)):
+        if loud > whisper:
+            return float(whisper), float(loud)
+
+    known = volume[~np.isnan(volume)]
+    if known.size < 2:
+        return None
+    low, high = np.quantile(known, FALLBACK_QUANTILES)
+    return (float(low), float(high)) if high > low else None
+
+
+def _pitch_range(
+    result: Dict[str, Any], pitch: np.ndarray
+) -> Optional[Tuple[float, float]]:
+    """평상시 피치 범위 (ML baseline_range 우선, 없으면 사분위)"""
+    baseline = (result.get("pitch_statistics") or {}).get("baseline_range") or {}
+    low, high = baseline.get("min_hz"), baseline.get("max_hz")
+    if isinstance(low, (int, float)) and isinstance(high, (int, float)) and high > low:
+        return float(low), float(high)
+
+    known = pitch[~np.isnan(pitch)]
+    if known.size < 2:
+        return None
+    low, high = np.quantile(known, (0.25, 0.75))
+    return (float(low), float(high)) if high > low else None
+
+
+def word_intensities(
+    result: Dict[str, Any], volume: np.ndarray, pitch: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    단어별 애니메이션 강도 계산
+
+    Returns:
+        (강도 0~1, 큰 소리 여부, 속삭임 여부). 음향 정보가 없는 단어는 0.5 / False
+    """
+    count = len(volume)
+    volume_norm = np.full(count, 0.5)
+    pitch_norm = np.full(count, 0.5)
+    loud = np.zeros(count, dtype=bool)
+    whisper = np.zeros(count, dtype=bool)
+
+    thresholds = _volume_thresholds(result, volume)
+    if thresholds:
+        low, high = thresholds
+        known = ~np.isnan(volume)
+        volume_norm[known] = np.clip((volume[known] - low) / (high - low), 0.0, 1.0)
+        loud = known & (volume >= high)
+        whisper = known & (volume <= low)
+
+    pitch_bounds = _pitch_range(result, pitch)
+    if pitch_bounds:
+        low, high = pitch_bounds
+        known = ~np.isnan(pitch)
+        pitch_norm[known] = np.clip((pitch[known] - low) / (high - low), 0.0, 1.0)
+
+    return np.round(0.8 * volume_norm + 0.2 * pitch_norm, 3), loud, whisper
+
+
+class ScenarioBuilder:
+    """자막 클립 + 단어 음향 정보 → MotionText v2.0 시나리오"""
+
+    def build(
+        self,
+        result: Dict[str, Any],
+        segmentation: Dict[str, Any],
+        preset: str = "default",
+    ) -> Dict[str, Any]:
+        style = STYLE_PRESETS[preset]
+        clips = segmentation.get("clips") or []
+        speakers = segmentation.get("speakers") or []
+        palette = {
+            speaker: SPEAKER_COLOURS[index % len(SPEAKER_COLOURS)]
+            for index, speaker in enumerate(speakers)
+        }
+
+        plugins: List[Optional[Dict[str, Any]]] = []
+        if style["audio_reactive"]:
+            plugins = self._word_plugins(result, clips)
+
+        cues: List[Dict[str, Any]] = []
+        position = 0
+        for clip in clips:
+            words = clip.get("words") or []
+            children = []
+            for word in words:
+                node: Dict[str, Any] = {
+                    "id": word["id"],
+                    "eType": "text",
+                    "text": word["text"],
+                    "baseTime": [word["start"], word["end"]],
+                }
+                plugin = plugins[position] if plugins else None
+                if plugin:
+                    node["pluginChain"] = [
+                        {
+                            **plugin,
+                            "params": {**plugin["params"], "speaker": clip["speaker"]},
+                        }
+                    ]
+                children.append(node)
+                position += 1
+            if not children:
+                continue
+
+            start = min(word["start"] for word in words)
+            end = max(word["end"] for word in words)
+            cues.append(
+                {
+                    "id": f"cue-{clip['id']}",
+                    "track": "caption",
+                    "domLifetime": [start, end],
+                    "root": {
+                        "id": f"clip-{clip['id']}",
+                        "eType": "group",
+                        "displayTime": [words[0]["start"], words[-1]["end"]],
+                        "layout": {
+                            "anchor": "define.caption.layout.anchor",
+                            "position": "define.caption.position",
+                            "safeAreaClamp": "define.caption.layout.safeAreaClamp",
+                            "childrenLayout": "define.caption.childrenLayout",
+                        },
+                        "children": children,
+                    },
+                }
+            )
+
+        caption_track: Dict[str, Any] = {
+            "id": "caption",
+            "type": "subtitle",
+            "layer": 1,
+            "defaultStyle": {
+                "fontSizeRel": style["font_size_rel"],
+                "fontFamily": "Arial, sans-serif",
+                "color": "#ffffff",
+                "align": "center",
+            },
+            "defaultConstraints": {
+                "safeArea": {"top": 0.025, "bottom": 0.075, "left": 0.05, "right": 0.05}
+            },
+        }
+        if style["box"]:
+            caption_track["defaultBoxStyle"] = {
+                "backgroundColor": "rgba(0, 0, 0, 0.6)",
+                "padding": "4px 8px",
+                "borderRadius": "4px",
+                "opacity": 1,
+            }
+
+        define: Dict[str, Any] = {
+            "caption": {
+                "position": style["position"],
+                "layout": {"anchor": style["anchor"], "safeAreaClamp": True},
+                "childrenLayout": {
+                    "mode": "flow",
+                    "direction": "horizontal",
+                    "wrap": True,
+                    "maxWidth": "90%",
+                    "gap": 0.005,
+                    "align": "center",
+                    "justify": "center",
+                },
+            }
+        }
+        if palette:
+            define["speakerPalette"] = palette
+
+        return {
+            "version": "2.0",
+            "pluginApiVersion": "3.0",
+            "timebase": {"unit": "seconds"},
+            "stage": {"baseAspect": style["base_aspect"]},
+            "define": define,
+            "tracks": [
+                caption_track,
+                {
+                    "id": "overlay",
+                    "type": "free",
+                    "layer": 2,
+                    "defaultStyle": {
+                        "fontSizeRel": 0.06,
+                        "fontFamily": "Arial, sans-serif",
+                        "color": "#ffffff",
+                    },
+                },
+            ],
+            "cues": cues,
+        }
+
+    @staticmethod
+    def _word_plugins(
+        result: Dict[str, Any], clips: List[Dict[str, Any]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """클립 단어 순서대로 기본 애니메이션 플러그인 (없으면 None)"""
+        # 클립 단어는 단어 스트림을 순서대로 나눈 것이므로 스트림 인덱스와 1:1 대응
+        stream = WordStream(result.get("segments") or [])
+        word_count = sum(len(clip.get("words") or []) for clip in clips)
+        if len(stream) != word_count:
+            logger.warning(
+                "Word stream does not match segmented clips, skipping intensities"
+            )
+            return []
+
+        intensity, loud, whisper = word_intensities(result, stream.volume, stream.pitch)
+        plugins: List[Optional[Dict[str, Any]]] = [None] * word_count
+        for index in np.flatnonzero(loud).tolist():
+            level = float(intensity[index])
+            plugins[index] = {
+                "name": LOUD_PLUGIN,
+                "params": {
+                    "palette": "define.speakerPalette",
+                    "tremble": {
+                        "ampPx": round(1.0 + 3.0 * level, 2),
+                        "freq": int(round(8 + 10 * level)),
+                    },
+                },
+            }
+        for index in np.flatnonzero(whisper).tolist():
+            plugins[index] = {
+                "name": WHISPER_PLUGIN,
+                "params": {"palette": "define.speakerPalette"},
+            }
+        return plugins
+
+
+def scenario_etag(job_id: str, preset: str) -> str:
+    """
+    작업/프리셋/빌더 버전/자막 분할 설정 기준 ETag
+
+    완료된 작업의 결과는 바뀌지 않지만, 분할 설정(SUBTITLE_*)이 바뀌면 클립이 다시
+    계산되므로 함께 반영합니다.
+    """
+    digest = hashlib.sha256(
+        f"{job_id}:{SCENARIO_BUILDER_VERSION}:{preset}:"
+        f"{subtitle_segmenter.fingerprint()}".encode("utf-8")
+    ).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+def get_job_scenario(db: Session, job_id: str, preset: str = "default") -> bytes:
+    """
+    완료된 작업의 시나리오 JSON (직렬화된 바이트, 캐시 우선)
+
+    Raises:
+        HTTPException: 알 수 없는 프리셋(422), 작업 없음(404), 미완료 작업(409)
+    """
+    if preset not in STYLE_PRESETS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"지원하지 않는 스타일 프리셋입니다: {preset} " f"(가능: {', '.join(STYLE_PRESETS)})",
+        )
+
+    key = (
+        str(job_id),
+        SCENARIO_BUILDER_VERSION,
+        preset,
+        subtitle_segmenter.fingerprint(),
+    )
+    cached = scenario_cache.get(key)
+    if cached is not None:
+        return cached
+
+    job_service = JobService(db)
+    job = job_service.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="해당 작업을 찾을 수 없습니다")
+    if job.status != "completed" or not job.result:
+        raise HTTPException(status_code=409, detail="아직 완료되지 않은 작업입니다")
+
+    segmentation = job_service.get_current_segmentation(job)
+    scenario = scenario_builder.build(job.result, segmentation, preset)
+    content = json.dumps(scenario, ensure_ascii=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+    scenario_cache.put(key, content)
+    return content
+
+
+# 싱글톤 인스턴스
+scenario_builder = ScenarioBuilder()
+scenario_cache = ExportCache(max_bytes=settings.SCENARIO_CACHE_MAX_BYTES)
@@ -0,0 +1,343 @@
+"""
+시나리오 컴파일 서비스
+
+MotionText 시나리오를 GPU 렌더러용 압축 바이너리 타임라인으로 변환합니다.
+렌더러는 트리를 매 프레임 순회하는 대신 프레임 구간 테이블에서 바로 활성 노드를 찾습니다.
+
+바이너리 레이아웃 (little-endian):
+    header   : magic(4s) version(H) reserved(H) fps(f) bucket_size(I) total_frames(I)
+               n_strings(I) n_nodes(I) n_plugin_refs(I) n_buckets(I) n_bucket_items(I)
+    strings  : offsets(I * (n_strings + 1)) + UTF-8 blob
+    nodes    : id(i) parent(i) cue(i) start(i) end(i) plugin_start(i) plugin_count(i)
+               각각 n_nodes 길이 배열, 이어서 eType(B * n_nodes)
+    plugins  : key(i) start(i) end(i) 각각 n_plugin_refs 길이 배열
+    order    : start 프레임 기준 정렬된 노드 인덱스(i * n_nodes)
+    buckets  : offsets(I * (n_buckets + 1)) + 노드 인덱스(i * n_bucket_items)
+"""
+
+import base64
+import bisect
+import hashlib
+import json
+import logging
+import struct
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.plugin_registry import resolve_plugin_key
+
+logger = logging.getLogger(__name__)
+
+TIMELINE_MAGIC = b"MTTL"
+TIMELINE_VERSION = 1
+TIMELINE_FORMAT = f"mttl/{TIMELINE_VERSION}"
+
+HEADER_STRUCT = struct.Struct("<4sHHfIIIIIII")
+
+ETYPE_CODES = {"group": 0, "text": 1, "image": 2, "video": 3}
+ETYPE_NAMES = {code: name for name, code in ETYPE_CODES.items()}
+ETYPE_UNKNOWN = 255
+
+
+def _pack_ints(fmt: str, values: List[int]) -> bytes:
+    return struct.pack(f"<{len(values)}{fmt}", *values)
+
+
+def _unpack_ints(fmt: str, data: bytes, offset: int, count: int) -> Tuple[list, int]:
+    size = struct.calcsize(f"<{count}{fmt}")
+    return list(struct.unpack_from(f"<{count}{fmt}", data, offset)), offset + size
+
+
+def _time_range(node: Dict[str, Any], key: str) -> Optional[Tuple[float, float]]:
+    value = node.get(key)
+    if (
+        isinstance(value, (list, tuple))
+        and len(value) == 2
+        and all(isinstance(v, (int, float)) for v in value)
+    ):
+        return float(value[0]), float(value[1])
+    return None
+
+
+def scenario_hash(scenario: Dict[str, Any], fps: float) -> str:
+    """시나리오 + fps + 포맷 버전 기준 캐시 키"""
+    canonical = json.dumps(
+        scenario, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+    digest = hashlib.sha256()
+    digest.update(f"{TIMELINE_FORMAT}|{fps}|".encode("utf-8"))
+    digest.update(canonical.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ScenarioCompiler:
+    """MotionText 시나리오 → 바이너리 타임라인 컴파일러 (해시 기반 LRU 캐시)"""
+
+    def __init__(self, cache_size: int = 128):
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def compile(self, scenario: Dict[str, Any], fps: float) -> Tuple[str, bytes]:
+        """시나리오를 컴파일하고 (hash, artifact) 반환"""
+        key = scenario_hash(scenario, fps)
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return key, cached
+
+        artifact = compile_timeline(scenario, fps)
+
+        with self._lock:
+            self._cache[key] = artifact
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return key, artifact
+
+    def compile_for_gpu(
+        self, scenario: Dict[str, Any], fps: float
+    ) -> Optional[Dict[str, Any]]:
+        """GPU 요청에 첨부할 타임라인 정보 (실패 시 None, JSON 시나리오로 fallback)"""
+        try:
+            key, artifact = self.compile(scenario, fps)
+            return {
+                "format": TIMELINE_FORMAT,
+                "hash": key,
+                "encoding": "base64",
+                "size": len(artifact),
+                "data": base64.b64encode(artifact).decode("ascii"),
+            }
+        except Exception as e:
+            logger.warning(f"시나리오 타임라인 컴파일 실패: {str(e)}")
+            return None
+
+
+def resolve_fps(scenario: Dict[str, Any], default_fps: float) -> float:
+    """timebase.fps 우선, 없으면 렌더링 옵션 fps 사용"""
+    timebase = scenario.get("timebase") or {}
+    fps = timebase.get("fps") if isinstance(timebase, dict) else None
+    if isinstance(fps, (int, float)) and fps > 0:
+        return float(fps)
+    return float(default_fps)
+
+
+def compile_timeline(scenario: Dict[str, Any], fps: float) -> bytes:
+    """시나리오를 바이너리 타임라인으로 컴파일"""
+    if fps <= 0:
+        raise ValueError("fps must be positive")
+
+    strings: List[str] = []
+    string_index: Dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        idx = string_index.get(value)
+        if idx is None:
+            idx = len(strings)
+            strings.append(value)
+            string_index[value] = idx
+        return idx
+
+    def to_frame(seconds: float) -> int:
+        return max(0, int(round(seconds * fps)))
+
+    node_ids: List[int] = []
+    parents: List[int] = []
+    cue_indices: List[int] = []
+    starts: List[int] = []
+    ends: List[int] = []
+    plugin_starts: List[int] = []
+    plugin_counts: List[int] = []
+    etypes: List[int] = []
+
+    plugin_keys: List[int] = []
+    plugin_start_frames: List[int] = []
+    plugin_end_frames: List[int] = []
+
+    def add_node(
+        node: Dict[str, Any],
+        parent: int,
+        cue_index: int,
+        inherited: Tuple[int, int],
+    ):
+        node_range = _time_range(node, "displayTime") or _time_range(node, "baseTime")
+        if node_range:
+            start = to_frame(node_range[0])
+            end = max(start + 1, to_frame(node_range[1]))
+        else:
+            start, end = inherited
+
+        index = len(node_ids)
+        node_ids.append(intern(str(node.get("id", ""))))
+        parents.append(parent)
+        cue_indices.append(cue_index)
+        starts.append(start)
+        ends.append(end)
+        etypes.append(ETYPE_CODES.get(node.get("eType"), ETYPE_UNKNOWN))
+
+        plugin_starts.append(len(plugin_keys))
+        for plugin in node.get("pluginChain") or []:
+            if not isinstance(plugin, dict):
+                continue
+            name = plugin.get("pluginId") or plugin.get("name")
+            if not isinstance(name, str) or not name:
+                continue
+            base = _time_range(plugin, "baseTime")
+            plugin_keys.append(intern(resolve_plugin_key(name)))
+            plugin_start_frames.append(to_frame(base[0]) if base else start)
+            plugin_end_frames.append(to_frame(base[1]) if base else end)
+        plugin_counts.append(len(plugin_keys) - plugin_starts[index])
+
+        for child in node.get("children") or []:
+            if isinstance(child, dict):
+                add_node(child, index, cue_index, (start, end))
+
+    for cue_index, cue in enumerate(scenario.get("cues") or []):
+        if not isinstance(cue, dict) or not isinstance(cue.get("root"), dict):
+            continue
+        cue_range = _time_range(cue, "domLifetime") or _time_range(cue, "displayTime")
+        inherited = (
+            (to_frame(cue_range[0]), max(1, to_frame(cue_range[1])))
+            if cue_range
+            else (0, 0)
+        )
+        add_node(cue["root"], -1, cue_index, inherited)
+
+    node_count = len(node_ids)
+    order = sorted(range(node_count), key=lambda i: (starts[i], ends[i]))
+    total_frames = max(ends) if ends else 0
+
+    # 프레임 구간(bucket)별 활성 노드 목록 (CSR)
+    bucket_size = max(1, int(round(fps)))
+    bucket_count = (total_frames + bucket_size - 1) // bucket_size
+    buckets: List[List[int]] = [[] for _ in range(bucket_count)]
+    for i in order:
+        if ends[i] <= starts[i]:
+            continue
+        first = starts[i] // bucket_size
+        last = (ends[i] - 1) // bucket_size
+        for b in range(first, min(last, bucket_count - 1) + 1):
+            buckets[b].append(i)
+
+    bucket_offsets = [0]
+    bucket_items: List[int] = []
+    for items in buckets:
+        bucket_items.extend(items)
+        bucket_offsets.append(len(bucket_items))
+
+    encoded = [s.encode("utf-8") for s in strings]
+    string_offsets = [0]
+    for blob in encoded:
+        string_offsets.append(string_offsets[-1] + len(blob))
+
+    parts = [
+        HEADER_STRUCT.pack(
+            TIMELINE_MAGIC,
+            TIMELINE_VERSION,
+            0,
+            float(fps),
+            bucket_size,
+            total_frames,
+            len(strings),
+            node_count,
+            len(plugin_keys),
+            bucket_count,
+            len(bucket_items),
+        ),
+        _pack_ints("I", string_offsets),
+        b"".join(encoded),
+        _pack_ints("i", node_ids),
+        _pack_ints("i", parents),
+        _pack_ints("i", cue_indices),
+        _pack_ints("i", starts),
+        _pack_ints("i", ends),
+        _pack_ints("i", plugin_starts),
+        _pack_ints("i", plugin_counts),
+        bytes(etypes),
+        _pack_ints("i", plugin_keys),
+        _pack_ints("i", plugin_start_frames),
+        _pack_ints("i", plugin_end_frames),
+        _pack_ints("i", order),
+        _pack_ints("I", bucket_offsets),
+        _pack_ints("i", bucket_items),
+    ]
+    return b"".join(parts)
+
+
+class TimelineReader:
+    """바이너리 타임라인 디코더 (렌더러 구현 참조용)"""
+
+    def __init__(self, data: bytes):
+        (
+            magic,
+            version,
+            _,
+            self.fps,
+            self.bucket_size,
+            self.total_frames,
+            n_strings,
+            n_nodes,
+            n_plugins,
+            n_buckets,
+            n_items,
+        ) = HEADER_STRUCT.unpack_from(data, 0)
+        if magic != TIMELINE_MAGIC or version != TIMELINE_VERSION:
+            raise ValueError("Unsupported timeline format")
+
+        offset = HEADER_STRUCT.size
+        string_offsets, offset = _unpack_ints("I", data, offset, n_strings + 1)
+        blob = data[offset : offset + string_offsets[-1]]
+        offset += string_offsets[-1]
+        self.strings = [
+            blob[string_offsets[i] : string_offsets[i + 1]].decode("utf-8")
+            for i in range(n_strings)
+        ]
+
+        self.node_ids, offset = _unpack_ints("i", data, offset, n_nodes)
+        self.parents, offset = _unpack_ints("i", data, offset, n_nodes)
+        self.cues, offset = _unpack_ints("i", data, offset, n_nodes)
+        self.starts, offset = _unpack_ints("i", data, offset, n_nodes)
+        self.ends, offset = _unpack_ints("i", data, offset, n_nodes)
+        self.plugin_starts, offset = _unpack_ints("i", data, offset, n_nodes)
+        self.plugin_counts, offset = _unpack_ints("i", data, offset, n_nodes)
+        self.etypes = list(data[offset : offset + n_nodes])
+        offset += n_nodes
+        self.plugin_keys, offset = _unpack_ints("i", data, offset, n_plugins)
+        self.plugin_start_frames, offset = _unpack_ints("i", data, offset, n_plugins)
+        self.plugin_end_frames, offset = _unpack_ints("i", data, offset, n_plugins)
+        self.order, offset = _unpack_ints("i", data, offset, n_nodes)
+        self.bucket_offsets, offset = _unpack_ints("I", data, offset, n_buckets + 1)
+        self.bucket_items, offset = _unpack_ints("i", data, offset, n_items)
+        self._sorted_starts = [self.starts[i] for i in self.order]
+
+    def active_nodes(self, frame: int) -> List[int]:
+        """해당 프레임에 활성화된 노드 인덱스 목록"""
+        bucket = frame // self.bucket_size
+        if bucket < 0 or bucket >= len(self.bucket_offsets) - 1:
+            return []
+        items = self.bucket_items[
+            self.bucket_offsets[bucket] : self.bucket_offsets[bucket + 1]
+        ]
+        return [i for i in items if self.starts[i] <= frame < self.ends[i]]
+
+    def first_node_at_or_after(self, frame: int) -> Optional[int]:
+        """frame 이후 처음 시작하는 노드 (이진 탐색)"""
+        pos = bisect.bisect_left(self._sorted_starts, frame)
+        return self.order[pos] if pos < len(self.order) else None
+
+    def node_plugins(self, node: int) -> List[str]:
+        """노드에 적용된 resolved plugin 키 목록"""
+        start = self.plugin_starts[node]
+        return [
+            self.strings[self.plugin_keys[i]]
+            for i in range(start, start + self.plugin_counts[node])
+        ]
+
+
+# 싱글톤 인스턴스
+scenario_compiler = ScenarioCompiler(cache_size=settings.SCENARIO_TIMELINE_CACHE_SIZE)
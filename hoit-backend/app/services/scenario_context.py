@@ -0,0 +1,718 @@
+"""
+LLM 편집 프롬프트용 시나리오 컨텍스트 선택
+
+사용자 지시에서 대상 cue/단어를 찾아 그 노드만 프롬프트에 넣습니다. 프로젝트가 길어져도
+"첫 번째 자막"을 고치는 요청의 입력 토큰이 늘지 않도록 하기 위함입니다.
+
+대상 찾기 (여러 조건이 있으면 합집합)
+- 순서: "첫 번째 자막", "3번 자막", "마지막 문장", "second subtitle", "cue 3"
+- 시간: "1:23", "10초에", "10초부터 20초까지", "at 12s", "from 10s to 20s"
+- 인용한 텍스트: '안녕하세요', "hello" → 해당 텍스트가 들어 있는 cue/단어
+- 화자: define.speakerPalette의 화자 이름, "화자 2", "speaker 2"
+
+찾지 못하면 전체 시나리오를 보냅니다. 인용 텍스트/시간으로 단어까지 특정되고 cue의 단어가
+많으면 그 단어만 남기며, 단어 순서("두 번째 단어")를 언급한 요청은 인덱스가 어긋나지 않도록
+cue의 단어를 모두 유지합니다.
+
+선택된 시나리오는 cue/단어 인덱스가 0부터 다시 매겨지므로 LLM이 만든 패치 경로는
+remap_patches()로 원본 인덱스로 되돌립니다. JSON은 공백 없이 직렬화하고, 빠진 부분은
+짧은 스키마 요약(<scenario_summary>)으로 알려줍니다.
+"""
+
+import json
+import logging
+import re
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 이 단어 수 이하인 cue는 단어를 골라내지 않고 통째로 보냄
+MIN_WORDS_TO_PRUNE = 8
+
+KOREAN_ORDINALS = {
+    "첫": 1,
+    "두": 2,
+    "세": 3,
+    "네": 4,
+    "다섯": 5,
+    "여섯": 6,
+    "일곱": 7,
+    "여덟": 8,
+    "아홉": 9,
+    "열": 10,
+}
+ENGLISH_ORDINALS = {
+    "first": 1,
+    "second": 2,
+    "third": 3,
+    "fourth": 4,
+    "fifth": 5,
+    "sixth": 6,
+    "seventh": 7,
+    "eighth": 8,
+    "ninth": 9,
+    "tenth": 10,
+}
+
+CUE_NOUN = r"(?:자막|문장|클립|줄|대사|cue|subtitle|caption|clip|line|sentence)"
+WORD_NOUN = r"(?:단어|워드|글자|word)"
+NOUN_PATTERN = re.compile(rf"({CUE_NOUN}|{WORD_NOUN})", re.IGNORECASE)
+WORD_NOUN_PATTERN = re.compile(WORD_NOUN, re.IGNORECASE)
+
+ORDINAL_PATTERN = re.compile(
+    r"(?P<ko>" + "|".join(KOREAN_ORDINALS) + r")\s*번\s*째"
+    r"|(?P<num>\d+)\s*번\s*째?"
+    r"|(?P<last>마지막|맨\s*끝|\blast\b)"
+    r"|\b(?P<en>" + "|".join(ENGLISH_ORDINALS) + r")\b"
+    r"|\b(?P<nth>\d+)(?:st|nd|rd|th)\b"
+    rf"|\b{CUE_NOUN}\s*#?\s*(?P<after>\d+)\b",
+    re.IGNORECASE,
+)
+
+# 범위를 넓히는 표현: 제외/전체("첫 번째 자막만 빼고 모두")나 복수 수량("마지막 두 줄",
+# "first three lines"). 서수만 보고 cue를 좁히면 나머지 대상이 빠지므로 전체를 보냄
+SCOPE_WIDENING_PATTERN = re.compile(
+    r"빼고|제외|말고|나머지|이외|외에|전부|전체|모두|모든"
+    r"|(?:한|두|세|네|다섯|여섯|일곱|여덟|아홉|열|몇|\d+)\s*(?:개|줄|문장|자막|대사|클립|단어)"
+    r"|\b(?:except|excluding|besides|other\s+than|apart\s+from|rest|all|every|everything)\b"
+    r"|\b(?:first|last|top|bottom|next|previous|final)\s+"
+    r"(?:two|three|four|five|six|seven|eight|nine|ten|few|several|couple|\d+)\b"
+    r"|\b(?:two|three|four|five|six|seven|eight|nine|ten|\d+)\s+"
+    r"(?:lines|subtitles|captions|cues|clips|sentences|words)\b",
+    re.IGNORECASE,
+)
+
+CLOCK_PATTERN = re.compile(
+    r"(?<![\d:])(?:(\d+):)?(\d{1,2}):(\d{2})(?:\.(\d+))?(?![\d:])"
+)
+KOREAN_TIME_PATTERN = re.compile(
+    r"(?:(\d+)\s*분\s*)?(\d+(?:\.\d+)?)\s*초\s*(?=에|부터|까지|쯤|경|지점|의|~|-|–)"
+    r"|(\d+)\s*분\s*(?=에|부터|까지|쯤|경|지점|의|~|-|–)"
+)
+ENGLISH_TIME_PATTERN = re.compile(
+    r"\b(?:at|from|to|until|between|around|and)\s+(\d+(?:\.\d+)?)\s*"
+    r"(?:s|sec|secs|seconds)\b",
+    re.IGNORECASE,
+)
+RANGE_CONNECTOR = re.compile(r"~|-|–|부터|에서|\bto\b|\band\b|\buntil\b")
+
+QUOTE_PATTERN = re.compile(
+    r"\"([^\"]+)\"|“([^”]+)”|'([^']+)'|‘([^’]+)’|「([^」]+)」|『([^』]+)』"
+)
+SPEAKER_NUMBER_PATTERN = re.compile(r"(?:화자|speaker)\s*#?\s*(\d+)", re.IGNORECASE)
+
+
+def compact_json(data: Any) -> str:
+    """프롬프트용 JSON (공백 없음, 한글 그대로)"""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def estimate_tokens(text: str) -> int:
+    """대략적인 토큰 수 (UTF-8 4바이트당 1토큰, 한글은 글자당 약 0.75토큰)"""
+    return max(1, len(text.encode("utf-8")) // 4)
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r"\s+", "", text).lower()
+
+
+def _cue_words(cue: Dict[str, Any]) -> List[Dict[str, Any]]:
+    children = (cue.get("root") or {}).get("children")
+    return children if isinstance(children, list) else []
+
+
+def _cue_text(cue: Dict[str, Any]) -> str:
+    root = cue.get("root") or {}
+    words = [w.get("text", "") for w in _cue_words(cue) if isinstance(w, dict)]
+    return " ".join(words) if words else str(root.get("text", ""))
+
+
+def _cue_span(cue: Dict[str, Any]) -> Optional[Tuple[float, float]]:
+    root = cue.get("root") or {}
+    for span in (root.get("displayTime"), cue.get("domLifetime")):
+        if (
+            isinstance(span, list)
+            and len(span) == 2
+            and all(isinstance(v, (int, float)) for v in span)
+        ):
+            return float(span[0]), float(span[1])
+    times = [
+        w["baseTime"]
+        for w in _cue_words(cue)
+        if isinstance(w, dict) and isinstance(w.get("baseTime"), list)
+    ]
+    if times:
+        return float(times[0][0]), float(times[-1][1])
+    return None
+
+
+def _cue_speakers(node: Any, found: Set[str]) -> Set[str]:
+    """cue 안의 speaker 값 (노드 속성 또는 plugin params)"""
+    if isinstance(node, dict):
+        speaker = node.get("speaker")
+        if isinstance(speaker, str):
+            found.add(speaker)
+        for value in node.values():
+            if isinstance(value, (dict, list)):
+                _cue_speakers(value, found)
+    elif isinstance(node, list):
+        for item in node:
+            _cue_speakers(item, found)
+    return found
+
+
+def _plugin_names(cues: List[Dict[str, Any]]) -> List[str]:
+    names: Set[str] = set()
+
+    def collect(node: Any):
+        if isinstance(node, dict):
+            for plugin in node.get("pluginChain") or []:
+                if isinstance(plugin, dict):
+                    name = plugin.get("name") or plugin.get("pluginId") or ""
+                    if name:
+                        names.add(name.split("@")[0])
+            for child in node.get("children") or []:
+                collect(child)
+
+    for cue in cues:
+        collect(cue.get("root"))
+    return sorted(names)
+
+
+class ScenarioContext:
+    """프롬프트에 넣을 시나리오 일부와 원본 경로 매핑"""
+
+    def __init__(
+        self,
+        scenario: Dict[str, Any],
+        scenario_json: str,
+        cue_indices: List[int],
+        child_indices: Dict[int, List[int]],
+        summary: str,
+        stats: Dict[str, Any],
+    ):
+        self.scenario = scenario
+        self._json = scenario_json
+        # 선택된 cue 인덱스 → 원본 cue 인덱스
+        self.cue_indices = cue_indices
+        # 단어를 골라낸 cue만: 선택된 cue 인덱스 → (단어 인덱스 → 원본 단어 인덱스)
+        self.child_indices = child_indices
+        self.summary = summary
+        self.stats = stats
+
+    @property
+    def pruned(self) -> bool:
+        return self.stats["sent_cues"] < self.stats["total_cues"] or bool(
+            self.child_indices
+        )
+
+    def to_json(self) -> str:
+        return self._json
+
+    def patch_remapper(self) -> "PatchRemapper":
+        """패치를 순서대로 원본 경로로 바꾸는 변환기 (스트리밍처럼 나눠 받을 때 공유)"""
+        return PatchRemapper(self.cue_indices, self.child_indices)
+
+    def remap_path(self, path: str) -> str:
+        """선택된 시나리오 기준 경로 → 원본 시나리오 경로 (구조를 바꾸지 않는 경로용)"""
+        if not self.pruned:
+            return path
+        return self.patch_remapper().map_path(path)
+
+    def remap_patches(self, patches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if not self.pruned:
+            return patches
+        return self.patch_remapper().remap(patches)
+
+
+class UnmappablePath(Exception):
+    """선택된 시나리오 밖을 가리키는 경로"""
+
+
+class PatchRemapper:
+    """
+    선택된 시나리오 기준 패치를 원본 인덱스로 변환
+
+    RFC6902 연산은 순서대로 적용되므로 /cues 또는 children 배열에 대한 add/remove/move/copy가
+    뒤따르는 인덱스를 밀어냅니다. 선택된 cue/단어가 원본의 몇 번째인지를 연산마다 함께
+    갱신해서 이후 경로를 변환합니다. 선택 범위 밖을 가리켜 원본 위치를 알 수 없는 패치는
+    잘못된 노드를 고치지 않도록 버리고 dropped에 셉니다.
+    단어 일부만 보낸 cue를 통째로(cue, root, children) 교체/삭제/이동하는 패치도 보지 못한
+    단어를 지우게 되므로 같은 방식으로 버립니다.
+    """
+
+    def __init__(self, cue_indices: List[int], child_indices: Dict[int, List[int]]):
+        # 현재 선택 뷰의 cue: [원본 cue 인덱스, 원본 단어 인덱스 목록 (None = 단어 전부 포함)]
+        self._cues: List[List[Any]] = [
+            [
+                original,
+                list(child_indices[position]) if position in child_indices else None,
+            ]
+            for position, original in enumerate(cue_indices)
+        ]
+        self.dropped = 0
+
+    def remap(self, patches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        remapped = []
+        for patch in patches:
+            try:
+                remapped.append(self._apply(dict(patch)))
+            except UnmappablePath as e:
+                self.dropped += 1
+                logger.warning(f"Dropped patch outside selected scenario context: {e}")
+        return remapped
+
+    def map_path(self, path: str) -> str:
+        """구조 변경 없이 경로만 변환 (선택 범위 밖이면 UnmappablePath)"""
+        parts = self._split(path)
+        if parts is None:
+            return path
+        cue = self._cue_entry(parts[2], path)
+        parts[2] = str(cue[0])
+        if len(parts) > 5 and parts[3:5] == ["root", "children"]:
+            parts[5] = str(self._child_index(cue, parts[5], path))
+        return "/".join(parts)
+
+    @staticmethod
+    def _split(path: Any) -> Optional[List[str]]:
+        if not isinstance(path, str):
+            return None
+        parts = path.split("/")
+        if len(parts) < 3 or parts[1] != "cues":
+            return None
+        return parts
+
+    @staticmethod
+    def _level(parts: Optional[List[str]]) -> Optional[str]:
+        """배열 원소 자체를 가리키면 "cue" / "child", 그 밖은 None"""
+        if parts is None:
+            return None
+        if len(parts) == 3:
+            return "cue"
+        if len(parts) == 6 and parts[3:5] == ["root", "children"]:
+            return "child"
+        return None
+
+    def _cue_entry(self, token: str, path: str) -> List[Any]:
+        if not token.isdigit() or int(token) >= len(self._cues):
+            raise UnmappablePath(path)
+        return self._cues[int(token)]
+
+    @staticmethod
+    def _child_index(cue: List[Any], token: str, path: str) -> int:
+        children = cue[1]
+        if not token.isdigit():
+            raise UnmappablePath(path)
+        if children is None:
+            return int(token)
+        if int(token) >= len(children):
+            raise UnmappablePath(path)
+        return children[int(token)]
+
+    @staticmethod
+    def _insert_position(
+        originals: List[int], token: str, path: str
+    ) -> Tuple[int, int]:
+        """(뷰 위치, 원본 위치). 뷰 끝에 추가하면 선택된 마지막 항목 바로 뒤"""
+        if token == "-":
+            view = len(originals)
+        elif token.isdigit() and int(token) <= len(originals):
+            view = int(token)
+        else:
+            raise UnmappablePath(path)
+        if view < len(originals):
+            return view, originals[view]
+        return view, originals[-1] + 1 if originals else 0
+
+    def _insert(self, parts: List[str], path: str, moved: Optional[List[Any]] = None):
+        if self._level(parts) == "cue":
+            view, original = self._insert_position(
+                [cue[0] for cue in self._cues], parts[2], path
+            )
+            for cue in self._cues:
+                if cue[0] >= original:
+                    cue[0] += 1
+            # 새 cue는 LLM이 전부 작성했으므로 단어를 모두 포함한 것으로 취급
+            self._cues.insert(view, [original, moved[1] if moved else None])
+            parts[2] = str(original)
+            return
+
+        cue = self._cue_entry(parts[2], path)
+        parts[2] = str(cue[0])
+        if cue[1] is None:
+            if not (parts[5] == "-" or parts[5].isdigit()):
+                raise UnmappablePath(path)
+            return
+        view, original = self._insert_position(cue[1], parts[5], path)
+        cue[1] = [index + 1 if index >= original else index for index in cue[1]]
+        cue[1].insert(view, original)
+        parts[5] = str(original)
+
+    def _remove(self, parts: List[str], path: str) -> Optional[List[Any]]:
+        if self._level(parts) == "cue":
+            removed = self._cue_entry(parts[2], path)
+            self._cues.remove(removed)
+            for cue in self._cues:
+                if cue[0] > removed[0]:
+                    cue[0] -= 1
+            parts[2] = str(removed[0])
+            return removed
+
+        cue = self._cue_entry(parts[2], path)
+        original = self._child_index(cue, parts[5], path)
+        parts[2] = str(cue[0])
+        parts[5] = str(original)
+        if cue[1] is not None:
+            cue[1] = [
+                index - 1 if index > original else index
+                for index in cue[1]
+                if index != original
+            ]
+        return None
+
+    def _pruned_container(self, parts: Optional[List[str]]) -> bool:
+        """단어 일부만 보낸 cue 자체, 그 root, 그 children 배열을 가리키는지"""
+        if parts is None or not parts[2].isdigit() or int(parts[2]) >= len(self._cues):
+            return False
+        if self._cues[int(parts[2])][1] is None:
+            return False
+        return (
+            len(parts) == 3
+            or (len(parts) == 4 and parts[3] == "root")
+            or (len(parts) == 5 and parts[3:5] == ["root", "children"])
+        )
+
+    def _apply(self, patch: Dict[str, Any]) -> Dict[str, Any]:
+        op = patch.get("op")
+        path = patch.get("path")
+        parts = self._split(path)
+        level = self._level(parts)
+
+        # 단어 일부만 본 모델이 cue/children을 통째로 바꾸거나 지우면 보지 못한 단어가
+        # 사라지므로 버림 (cue 위치에 새 cue를 추가하는 것은 허용)
+        if (
+            op in ("replace", "remove") or (op == "add" and level != "cue")
+        ) and self._pruned_container(parts):
+            raise UnmappablePath(path)
+        if op == "move" and self._pruned_container(self._split(patch.get("from"))):
+            raise UnmappablePath(patch["from"])
+
+        moved = None
+        if "from" in patch:
+            source = self._split(patch["from"])
+            if op == "move" and self._level(source):
+                moved = self._remove(source, patch["from"])
+                patch["from"] = "/".join(source)
+            else:
+                patch["from"] = self.map_path(patch["from"])
+
+        if parts is None:
+            return patch
+        if level and op in ("add", "move", "copy"):
+            self._insert(parts, path, moved if op == "move" else None)
+            patch["path"] = "/".join(parts)
+        elif level and op == "remove":
+            self._remove(parts, path)
+            patch["path"] = "/".join(parts)
+        else:
+            patch["path"] = self.map_path(path)
+            if level == "cue" and op == "replace":
+                # 통째로 교체한 cue는 이후 단어 인덱스가 원본과 같음
+                self._cues[int(path.split("/")[2])][1] = None
+        return patch
+
+
+class _Selection:
+    """cue별 선택 결과 (None = cue 전체, set = 해당 단어만)"""
+
+    def __init__(self):
+        self.cues: Dict[int, Optional[Set[int]]] = {}
+
+    def add_cue(self, index: int):
+        self.cues[index] = None
+
+    def add_words(self, index: int, words: Set[int]):
+        if index in self.cues and self.cues[index] is None:
+            return
+        self.cues.setdefault(index, set()).update(words)
+
+
+def _resolve_ordinals(instruction: str, cues: List[Dict[str, Any]], selection):
+    """순서 표현으로 cue 선택. 단어 순서를 언급했으면 True 반환"""
+    matches = list(ORDINAL_PATTERN.finditer(instruction))
+    mentions_word_order = False
+
+    for i, match in enumerate(matches):
+        if match.group("ko"):
+            n = KOREAN_ORDINALS[match.group("ko")]
+        elif match.group("num"):
+            n = int(match.group("num"))
+        elif match.group("en"):
+            n = ENGLISH_ORDINALS[match.group("en").lower()]
+        elif match.group("nth"):
+            n = int(match.group("nth"))
+        elif match.group("after"):
+            index = int(match.group("after")) - 1
+            if 0 <= index < len(cues):
+                selection.add_cue(index)
+            continue
+        else:
+            n = -1  # 마지막
+
+        # 뒤따르는 명사로 cue/단어 구분 ("첫 번째와 세 번째 단어"처럼 나열된 경우 포함)
+        noun = None
+        for j in range(i, len(matches)):
+            end = matches[j + 1].start() if j + 1 < len(matches) else len(instruction)
+            window = instruction[matches[j].end() : min(end, matches[j].end() + 12)]
+            noun_match = NOUN_PATTERN.search(window)
+            if noun_match:
+                noun = noun_match.group(1)
+                break
+
+        if noun is None:
+            continue
+        if WORD_NOUN_PATTERN.fullmatch(noun):
+            mentions_word_order = True
+            continue
+        index = len(cues) - 1 if n == -1 else n - 1
+        if 0 <= index < len(cues):
+            selection.add_cue(index)
+
+    return mentions_word_order
+
+
+def _parse_times(instruction: str) -> List[Tuple[int, int, float]]:
+    """(시작 위치, 끝 위치, 초) 목록"""
+    times = []
+    for match in CLOCK_PATTERN.finditer(instruction):
+        hours, minutes, seconds, fraction = match.groups()
+        value = int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds)
+        if fraction:
+            value += float(f"0.{fraction}")
+        times.append((match.start(), match.end(), float(value)))
+    for match in KOREAN_TIME_PATTERN.finditer(instruction):
+        minutes, seconds, minutes_only = match.groups()
+        if minutes_only:
+            value = int(minutes_only) * 60.0
+        else:
+            value = int(minutes or 0) * 60 + float(seconds)
+        times.append((match.start(), match.end(), value))
+    for match in ENGLISH_TIME_PATTERN.finditer(instruction):
+        times.append((match.start(1), match.end(), float(match.group(1))))
+    return sorted(times)
+
+
+def _resolve_times(instruction: str, cues: List[Dict[str, Any]], selection):
+    times = _parse_times(instruction)
+    if not times:
+        return
+
+    ranges: List[Tuple[float, float]] = []
+    points: List[float] = []
+    i = 0
+    while i < len(times):
+        if i + 1 < len(times) and RANGE_CONNECTOR.search(
+            instruction[times[i][1] : times[i + 1][0] + 1]
+        ):
+            start, end = sorted((times[i][2], times[i + 1][2]))
+            ranges.append((start, end))
+            i += 2
+        else:
+            points.append(times[i][2])
+            i += 1
+
+    spans = [_cue_span(cue) for cue in cues]
+    for start, end in ranges:
+        for index, span in enumerate(spans):
+            if span and span[0] < end and span[1] > start:
+                selection.add_cue(index)
+
+    for point in points:
+        containing = [
+            index
+            for index, span in enumerate(spans)
+            if span and span[0] <= point <= span[1]
+        ]
+        if not containing:
+            # 자막 사이 빈 구간이면 가장 가까운 cue
+            candidates = [
+                (min(abs(span[0] - point), abs(span[1] - point)), index)
+                for index, span in enumerate(spans)
+                if span
+            ]
+            if candidates:
+                selection.add_cue(min(candidates)[1])
+            continue
+        for index in containing:
+            words = {
+                w_index
+                for w_index, word in enumerate(_cue_words(cues[index]))
+                if isinstance(word, dict)
+                and isinstance(word.get("baseTime"), list)
+                and word["baseTime"][0] <= point <= word["baseTime"][1]
+            }
+            if words:
+                selection.add_words(index, words)
+            else:
+                selection.add_cue(index)
+
+
+def _resolve_quotes(instruction: str, cues: List[Dict[str, Any]], selection):
+    quotes = [
+        _normalize(next(group for group in match.groups() if group))
+        for match in QUOTE_PATTERN.finditer(instruction)
+    ]
+    quotes = [quote for quote in quotes if quote]
+    if not quotes:
+        return
+
+    for index, cue in enumerate(cues):
+        cue_text = _normalize(_cue_text(cue))
+        for quote in quotes:
+            if quote not in cue_text:
+                continue
+            words = {
+                w_index
+                for w_index, word in enumerate(_cue_words(cue))
+                if isinstance(word, dict)
+                and _normalize(str(word.get("text", "")))
+                and (
+                    _normalize(str(word.get("text", ""))) in quote
+                    or quote in _normalize(str(word.get("text", "")))
+                )
+            }
+            if words:
+                selection.add_words(index, words)
+            else:
+                selection.add_cue(index)
+
+
+def _resolve_speakers(
+    instruction: str, scenario: Dict[str, Any], cues: List[Dict[str, Any]], selection
+):
+    palette = (scenario.get("define") or {}).get("speakerPalette") or {}
+    known = list(palette) if isinstance(palette, dict) else []
+    lowered = instruction.lower()
+    numbered = SPEAKER_NUMBER_PATTERN.findall(instruction)
+    if not numbered and not any(speaker.lower() in lowered for speaker in known):
+        # 화자를 언급하지 않았으면 cue 트리를 훑지 않음
+        return
+
+    cue_speakers = [_cue_speakers(cue, set()) for cue in cues]
+    for speakers in cue_speakers:
+        known.extend(s for s in sorted(speakers) if s not in known)
+
+    targets = {speaker for speaker in known if speaker.lower() in lowered}
+    if not targets:
+        for number in map(int, numbered):
+            if 1 <= number <= len(known):
+                targets.add(known[number - 1])
+    for index, speakers in enumerate(cue_speakers):
+        if speakers & targets:
+            selection.add_cue(index)
+
+
+def _summary(
+    scenario: Dict[str, Any],
+    cues: List[Dict[str, Any]],
+    cue_indices: List[int],
+    child_indices: Dict[int, List[int]],
+) -> str:
+    spans = [span for span in (_cue_span(cue) for cue in cues) if span]
+    palette = (scenario.get("define") or {}).get("speakerPalette") or {}
+    lines = [f"version {scenario.get('version', '?')}, 전체 cue {len(cues)}개"]
+    if spans:
+        lines[0] += f" ({spans[0][0]:.2f}s~{max(s[1] for s in spans):.2f}s)"
+    if palette:
+        lines.append(f"화자: {', '.join(palette)}")
+    plugins = _plugin_names(cues)
+    if plugins:
+        lines.append(f"사용 중인 플러그인: {', '.join(plugins)}")
+    if len(cue_indices) < len(cues) or child_indices:
+        included = ", ".join(str(index) for index in cue_indices)
+        lines.append(
+            f"아래 JSON에는 요청과 관련된 cue {len(cue_indices)}개만 포함 "
+            f"(원본 cue 인덱스 {included}). 패치 경로는 아래 JSON 기준 인덱스로 작성하세요."
+        )
+        for cue, children in child_indices.items():
+            lines.append(
+                f"cues[{cue}]에는 관련 단어 {len(children)}개만 포함 "
+                f"(원본 {len(_cue_words(cues[cue_indices[cue]]))}개)"
+            )
+    lines.append(
+        "노드: cues[].root(eType=group, displayTime=[start,end]).children[]"
+        "(eType=text, text, baseTime=[start,end], style, pluginChain[])"
+    )
+    return "<scenario_summary>\n" + "\n".join(lines) + "\n</scenario_summary>"
+
+
+def select_scenario_context(
+    scenario: Dict[str, Any], instruction: str
+) -> ScenarioContext:
+    """지시문과 관련된 cue/단어만 남긴 컨텍스트 생성"""
+    started = time.perf_counter()
+    cues = scenario.get("cues") if isinstance(scenario.get("cues"), list) else []
+
+    selection = _Selection()
+    mentions_word_order = False
+    if not SCOPE_WIDENING_PATTERN.search(instruction):
+        mentions_word_order = _resolve_ordinals(instruction, cues, selection)
+        _resolve_times(instruction, cues, selection)
+        _resolve_quotes(instruction, cues, selection)
+        _resolve_speakers(instruction, scenario, cues, selection)
+
+    cue_indices = sorted(i for i in selection.cues if 0 <= i < len(cues))
+    if not cue_indices:
+        # 아무것도 찾지 못했으면 전체 전송
+        cue_indices = list(range(len(cues)))
+
+    selected_cues = []
+    child_indices: Dict[int, List[int]] = {}
+    for position, index in enumerate(cue_indices):
+        cue = cues[index]
+        words = selection.cues.get(index)
+        if (
+            words
+            and not mentions_word_order
+            and len(_cue_words(cue)) > MIN_WORDS_TO_PRUNE
+        ):
+            kept = sorted(words)
+            children = _cue_words(cue)
+            cue = {
+                **cue,
+                "root": {**cue["root"], "children": [children[i] for i in kept]},
+            }
+            child_indices[position] = kept
+        selected_cues.append(cue)
+
+    context_scenario = {**scenario, "cues": selected_cues}
+    summary = _summary(scenario, cues, cue_indices, child_indices)
+    select_ms = (time.perf_counter() - started) * 1000
+
+    # 절감량은 같은 시나리오 전체를 공백 없이 보냈을 때와 비교 (기존 들여쓰기 JSON보다
+    # 작으므로 실제 절감량은 이보다 큼. 들여쓰기 직렬화는 느려 기준값으로 쓰지 않음)
+    context_json = compact_json(context_scenario)
+    pruned = len(cue_indices) < len(cues) or bool(child_indices)
+    full_json = compact_json(scenario) if pruned else context_json
+    sent = summary + context_json
+    full_tokens = estimate_tokens(full_json)
+    sent_tokens = estimate_tokens(sent)
+    stats = {
+        "total_cues": len(cues),
+        "sent_cues": len(selected_cues),
+        "full_chars": len(full_json),
+        "sent_chars": len(sent),
+        "full_tokens": full_tokens,
+        "sent_tokens": sent_tokens,
+        "saved_ratio": round(1 - sent_tokens / full_tokens, 3),
+        "select_ms": round(select_ms, 2),
+    }
+    logger.info(
+        f"Scenario context: {stats['sent_cues']}/{stats['total_cues']} cues, "
+        f"~{sent_tokens}/{full_tokens} tokens ({stats['saved_ratio']:.0%} saved), "
+        f"{stats['select_ms']}ms"
+    )
+    return ScenarioContext(
+        context_scenario, context_json, cue_indices, child_indices, summary, stats
+    )
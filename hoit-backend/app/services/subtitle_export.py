@@ -0,0 +1,271 @@
+"""
+자막 파일 내보내기 (SRT / VTT / ASS)
+
+클립 JSON을 한 번 순회하며 자막 파일을 조각 단위로 생성하는 제너레이터와,
+(project_id, version, format) 기준 내보내기 결과 캐시를 제공합니다.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+
+from app.core.config import settings
+
+# 출력 형식이 바뀌면 올려서 기존 캐시/ETag 무효화
+EXPORT_FORMAT_VERSION = 1
+
+EXPORT_MEDIA_TYPES = {
+    "srt": "text/srt",
+    "vtt": "text/vtt",
+    "ass": "text/x-ssa",
+}
+
+# 화자별 ASS 스타일 색상 (&HAABBGGRR)
+ASS_SPEAKER_COLOURS = [
+    "&H00FFFFFF",
+    "&H0000FFFF",
+    "&H00FFFF00",
+    "&H0000FF00",
+    "&H00FF80FF",
+    "&H000080FF",
+]
+ASS_UNSUNG_COLOUR = "&H00808080"
+
+
+def _timing(clip: Dict[str, Any]) -> Optional[Tuple[float, float]]:
+    words = clip.get("words") or []
+    if not words:
+        return None
+    return float(words[0]["start"]), float(words[-1]["end"])
+
+
+def _clip_text(clip: Dict[str, Any]) -> str:
+    text = clip.get("full_text") or clip.get("subtitle")
+    if not text:
+        text = " ".join(word.get("text", "") for word in clip.get("words") or [])
+    return text
+
+
+def _split_ms(seconds: float) -> Tuple[int, int, int, int]:
+    total_ms = max(0, int(round(seconds * 1000)))
+    hours, rest = divmod(total_ms, 3_600_000)
+    minutes, rest = divmod(rest, 60_000)
+    secs, millis = divmod(rest, 1000)
+    return hours, minutes, secs, millis
+
+
+def seconds_to_srt_time(seconds: float) -> str:
+    """초를 SRT 시간 형식으로 변환 (00:00:00,000)"""
+    hours, minutes, secs, millis = _split_ms(seconds)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+
+
+def seconds_to_vtt_time(seconds: float) -> str:
+    """초를 VTT 시간 형식으로 변환 (00:00:00.000)"""
+    hours, minutes, secs, millis = _split_ms(seconds)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+
+
+def seconds_to_ass_time(seconds: float) -> str:
+    """초를 ASS 시간 형식으로 변환 (0:00:00.00)"""
+    total_cs = max(0, int(round(seconds * 100)))
+    hours, rest = divmod(total_cs, 360_000)
+    minutes, rest = divmod(rest, 6000)
+    secs, centis = divmod(rest, 100)
+    return f"{hours:d}:{minutes:02d}:{secs:02d}.{centis:02d}"
+
+
+def iter_srt(clips: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """SRT 형식 제너레이터"""
+    index = 0
+    for clip in clips:
+        timing = _timing(clip)
+        if not timing:
+            continue
+        index += 1
+        yield (
+            f"{index}\n"
+            f"{seconds_to_srt_time(timing[0])} --> {seconds_to_srt_time(timing[1])}\n"
+            f"{_clip_text(clip)}\n\n"
+        )
+
+
+def iter_vtt(clips: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """VTT 형식 제너레이터"""
+    yield "WEBVTT\n\n"
+    for clip in clips:
+        timing = _timing(clip)
+        if not timing:
+            continue
+        yield (
+            f"{seconds_to_vtt_time(timing[0])} --> {seconds_to_vtt_time(timing[1])}\n"
+            f"{_clip_text(clip)}\n\n"
+        )
+
+
+def _ass_escape(text: str) -> str:
+    return (
+        text.replace("\\", "\\\\")
+        .replace("{", "(")
+        .replace("}", ")")
+        .replace("\r", "")
+        .replace("\n", "\\N")
+    )
+
+
+def _ass_style_name(speaker: str) -> str:
+    return speaker.replace(",", " ").strip() or "Default"
+
+
+def _ass_karaoke(clip: Dict[str, Any], line_start: float) -> str:
+    """단어 타이밍을 {\\k} 태그로 변환 (누적 반올림으로 오차 누적 방지)"""
+    parts: List[str] = []
+    previous_cs = 0
+    for word in clip.get("words") or []:
+        end_cs = max(previous_cs, int(round((float(word["end"]) - line_start) * 100)))
+        parts.append(
+            f"{{\\k{end_cs - previous_cs}}}{_ass_escape(word.get('text', ''))}"
+        )
+        previous_cs = end_cs
+    return " ".join(parts)
+
+
+def iter_ass(
+    clips: List[Dict[str, Any]],
+    title: str = "",
+    video_metadata: Optional[Dict[str, Any]] = None,
+) -> Iterator[str]:
+    """ASS 형식 제너레이터 (화자별 스타일 + 단어 단위 karaoke 타이밍)"""
+    metadata = video_metadata or {}
+    width = metadata.get("width") or 1920
+    height = metadata.get("height") or 1080
+    font_size = max(24, int(height * 0.05))
+    margin_v = int(height * 0.06)
+
+    yield (
+        "[Script Info]\n"
+        "; Script generated by HOIT\n"
+        f"Title: {_ass_escape(title)}\n"
+        "ScriptType: v4.00+\n"
+        "WrapStyle: 0\n"
+        "ScaledBorderAndShadow: yes\n"
+        f"PlayResX: {width}\n"
+        f"PlayResY: {height}\n\n"
+    )
+
+    speakers: List[str] = []
+    for clip in clips:
+        style = _ass_style_name(clip.get("speaker") or "")
+        if style not in speakers:
+            speakers.append(style)
+    if "Default" not in speakers:
+        speakers.insert(0, "Default")
+
+    styles = [
+        "[V4+ Styles]\n"
+        "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, "
+        "OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, "
+        "ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, "
+        "MarginL, MarginR, MarginV, Encoding\n"
+    ]
+    for index, style in enumerate(speakers):
+        colour = ASS_SPEAKER_COLOURS[index % len(ASS_SPEAKER_COLOURS)]
+        styles.append(
+            f"Style: {style},Noto Sans KR,{font_size},{colour},{ASS_UNSUNG_COLOUR},"
+            f"&H00000000,&H80000000,0,0,0,0,100,100,0,0,1,2,1,2,40,40,{margin_v},1\n"
+        )
+    styles.append("\n")
+    yield "".join(styles)
+
+    yield (
+        "[Events]\n"
+        "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, "
+        "Effect, Text\n"
+    )
+    for clip in clips:
+        timing = _timing(clip)
+        if not timing:
+            continue
+        speaker = clip.get("speaker") or ""
+        yield (
+            f"Dialogue: 0,{seconds_to_ass_time(timing[0])},"
+            f"{seconds_to_ass_time(timing[1])},{_ass_style_name(speaker)},"
+            f"{speaker.replace(',', ' ')},0,0,0,,{_ass_karaoke(clip, timing[0])}\n"
+        )
+
+
+def iter_export(
+    format: str,
+    clips: List[Dict[str, Any]],
+    title: str = "",
+    video_metadata: Optional[Dict[str, Any]] = None,
+) -> Iterator[str]:
+    """형식별 자막 제너레이터 선택"""
+    if format == "srt":
+        return iter_srt(clips)
+    if format == "vtt":
+        return iter_vtt(clips)
+    if format == "ass":
+        return iter_ass(clips, title, video_metadata)
+    raise ValueError(f"Unsupported export format: {format}")
+
+
+def export_etag(project_id: str, version: int, format: str) -> str:
+    """프로젝트 버전 기준 ETag (내용은 버전과 형식으로 결정됨)"""
+    digest = hashlib.sha256(
+        f"{project_id}:{version}:{format}:{EXPORT_FORMAT_VERSION}".encode("utf-8")
+    ).hexdigest()[:32]
+    return f'"{digest}"'
+
+
+class ExportCache:
+    """(project_id, version, format) 기준 내보내기 결과 LRU 캐시 (총 바이트 제한)"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, int, str], bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, int, str]) -> Optional[bytes]:
+        with self._lock:
+            content = self._entries.get(key)
+            if content is not None:
+                self._entries.move_to_end(key)
+            return content
+
+    def put(self, key: Tuple[str, int, str], content: bytes) -> None:
+        if len(content) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = content
+            self._size += len(content)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def capture(
+        self, key: Tuple[str, int, str], chunks: Iterable[str]
+    ) -> Iterator[bytes]:
+        """조각을 그대로 스트리밍하면서 끝까지 전송되면 캐시에 저장"""
+        buffer: Optional[List[bytes]] = []
+        size = 0
+        for chunk in chunks:
+            data = chunk.encode("utf-8")
+            if buffer is not None:
+                size += len(data)
+                if size > self.max_bytes:
+                    buffer = None
+                else:
+                    buffer.append(data)
+            yield data
+        if buffer is not None:
+            self.put(key, b"".join(buffer))
+
+
+# 싱글톤 인스턴스
+export_cache = ExportCache(max_bytes=settings.EXPORT_CACHE_MAX_BYTES)
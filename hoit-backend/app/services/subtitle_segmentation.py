@@ -0,0 +1,422 @@
+"""
+ML 결과 → 에디터 자막 클립 분할
+
+ML 서버 결과의 segments[].words[]를 하나의 단어 스트림으로 펼쳐 NumPy 배열로 만든 뒤,
+아래 제약을 지키는 자막 클립으로 나눕니다.
+
+    화자 변경 / 긴 쉼:  무조건 분할
+    줄 길이 / 길이 / 단어 수:  누적합 + searchsorted로 클립마다 한 번에 최대 범위 계산
+    분할 위치:  범위 안에서 문장 끝 → 쉼표 → 가장 긴 쉼 순으로 선호
+    읽기 속도(CPS) / 최소 길이:  다음 클립 전까지 끝 시간 연장
+    최소 간격:  다음 클립과 너무 붙은 끝 시간 단축
+
+반복은 단어가 아니라 클립 단위로만 일어나므로 1시간 분량(약 1만 단어)도 수십 ms 안에
+끝납니다. 결과 클립은 프로젝트 clips JSON 형식(ClipItemSchema)을 그대로 따릅니다.
+"""
+
+import logging
+import math
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.clip_merge import format_clip_duration
+
+logger = logging.getLogger(__name__)
+
+# 분할 규칙이나 출력 형식이 바뀌면 올려서 저장된 결과를 다시 계산
+SEGMENTER_VERSION = 1
+
+# 한 글자가 넓은 언어는 줄 길이/CPS 기준을 따로 적용
+CJK_LANGUAGES = {"ko", "ja", "zh"}
+
+SENTENCE_END = (".", "?", "!", "…", "。", "？", "！")
+CLAUSE_END = (",", ";", ":", "，", "、", "；")
+
+# 타이밍이 잘못된 단어에 보장하는 최소 길이 (프론트엔드 변환 규칙과 동일)
+MIN_WORD_DURATION = 0.001
+
+
+def _format_timeline(seconds: float) -> str:
+    """mm:ss.mmm 형식 (프론트엔드 업로드 변환과 동일)"""
+    total_ms = max(0, int(round(seconds * 1000)))
+    minutes, rest = divmod(total_ms, 60_000)
+    secs, millis = divmod(rest, 1000)
+    return f"{minutes:02d}:{secs:02d}.{millis:03d}"
+
+
+def _finite(value: Any) -> float:
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return value if math.isfinite(value) and value > 0 else 0.0
+
+
+def _optional_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _speaker_id(speaker: Any) -> str:
+    if isinstance(speaker, dict):
+        return speaker.get("speaker_id") or "Unknown"
+    if isinstance(speaker, str) and speaker:
+        return speaker
+    return "Unknown"
+
+
+def _result_language(result: Dict[str, Any]) -> Optional[str]:
+    metadata = result.get("metadata") or {}
+    language = metadata.get("language") or (metadata.get("config") or {}).get(
+        "language"
+    )
+    return language.lower()[:2] if isinstance(language, str) else None
+
+
+class WordStream:
+    """segments[].words[]를 시작 시간 순으로 펼친 열 배열"""
+
+    def __init__(self, segments: List[Dict[str, Any]]):
+        texts: List[str] = []
+        starts: List[float] = []
+        ends: List[float] = []
+        confidences: List[Optional[float]] = []
+        volumes: List[float] = []
+        pitches: List[float] = []
+        speakers: List[str] = []
+
+        for segment in segments:
+            speaker = _speaker_id(segment.get("speaker"))
+            words = segment.get("words") or []
+            if not words and segment.get("text"):
+                # 단어 정보가 없으면 세그먼트 전체를 한 단어로 취급
+                words = [
+                    {
+                        "word": segment["text"],
+                        "start": segment.get("start", segment.get("start_time")),
+                        "end": segment.get("end", segment.get("end_time")),
+                        "confidence": segment.get("confidence"),
+                    }
+                ]
+            for word in words:
+                text = str(word.get("word", word.get("text", ""))).strip()
+                if not text:
+                    continue
+                texts.append(text)
+                starts.append(_finite(word.get("start", word.get("start_time"))))
+                ends.append(_finite(word.get("end", word.get("end_time"))))
+                confidences.append(word.get("confidence"))
+                volumes.append(_optional_float(word.get("volume_db")))
+                pitches.append(_optional_float(word.get("pitch_hz")))
+                speakers.append(speaker)
+
+        start = np.asarray(starts, dtype=np.float64)
+        end = np.asarray(ends, dtype=np.float64)
+        end = np.where(end <= start, start + MIN_WORD_DURATION, end)
+
+        # 겹치는 화자 세그먼트가 있어 단어는 시작 시간 기준으로 안정 정렬
+        order = np.argsort(start, kind="stable")
+        self.start = start[order]
+        self.end = end[order]
+        order_list = order.tolist()
+        self.texts = [texts[i] for i in order_list]
+        self.confidences = [confidences[i] for i in order_list]
+        # 음량/피치가 없는 단어는 NaN
+        self.volume = np.asarray(volumes, dtype=np.float64)[order]
+        self.pitch = np.asarray(pitches, dtype=np.float64)[order]
+        speaker_names, speaker_codes = np.unique(
+            np.asarray(speakers, dtype=object)[order], return_inverse=True
+        )
+        self.speaker_names = [str(name) for name in speaker_names]
+        self.speaker = speaker_codes.reshape(-1).astype(np.int32)
+        self.chars = np.fromiter(
+            (len(text) for text in self.texts), dtype=np.int64, count=len(self.texts)
+        )
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+
+class SubtitleSegmenter:
+    """단어 스트림을 자막 제약에 맞는 클립으로 분할"""
+
+    def __init__(
+        self,
+        max_line_chars: int = settings.SUBTITLE_MAX_LINE_CHARS,
+        max_line_chars_cjk: int = settings.SUBTITLE_MAX_LINE_CHARS_CJK,
+        max_cps: float = settings.SUBTITLE_MAX_CPS,
+        max_cps_cjk: float = settings.SUBTITLE_MAX_CPS_CJK,
+        max_duration: float = settings.SUBTITLE_MAX_DURATION,
+        min_duration: float = settings.SUBTITLE_MIN_DURATION,
+        max_words: int = settings.SUBTITLE_MAX_WORDS,
+        min_gap: float = settings.SUBTITLE_MIN_GAP,
+        pause_split: float = settings.SUBTITLE_PAUSE_SPLIT,
+    ):
+        self.max_line_chars = max_line_chars
+        self.max_line_chars_cjk = max_line_chars_cjk
+        self.max_cps = max_cps
+        self.max_cps_cjk = max_cps_cjk
+        self.max_duration = max_duration
+        self.min_duration = min_duration
+        self.max_words = max_words
+        self.min_gap = min_gap
+        self.pause_split = pause_split
+
+    def options(self, language: Optional[str] = None) -> Dict[str, Any]:
+        """언어에 맞춰 적용되는 제약 값 (저장된 결과의 재계산 여부 판단에도 사용)"""
+        cjk = language in CJK_LANGUAGES
+        return {
+            "language": language,
+            "max_line_chars": self.max_line_chars_cjk if cjk else self.max_line_chars,
+            "max_cps": self.max_cps_cjk if cjk else self.max_cps,
+            "max_duration": self.max_duration,
+            "min_duration": self.min_duration,
+            "max_words": self.max_words,
+            "min_gap": self.min_gap,
+            "pause_split": self.pause_split,
+        }
+
+    def fingerprint(self) -> str:
+        """
+        분할 버전과 모든 제약 설정의 요약 (언어 무관)
+
+        분할 결과로 만든 산출물(시나리오 캐시/ETag)이 설정 변경 후에도 재사용되지 않도록
+        키에 포함합니다.
+        """
+        values = (
+            SEGMENTER_VERSION,
+            self.max_line_chars,
+            self.max_line_chars_cjk,
+            self.max_cps,
+            self.max_cps_cjk,
+            self.max_duration,
+            self.min_duration,
+            self.max_words,
+            self.min_gap,
+            self.pause_split,
+        )
+        return ":".join(str(value) for value in values)
+
+    def segment_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        ML 결과 전체를 에디터 클립으로 분할
+
+        Returns:
+            {"version", "options", "clips", "speakers", "stats"}
+        """
+        started = time.perf_counter()
+        options = self.options(_result_language(result))
+        stream = WordStream(result.get("segments") or [])
+        clips, stats = self._segment(stream, options)
+        stats["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return {
+            "version": SEGMENTER_VERSION,
+            "options": options,
+            "clips": clips,
+            "speakers": stream.speaker_names,
+            "stats": stats,
+        }
+
+    def _segment(
+        self, stream: WordStream, options: Dict[str, Any]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        count = len(stream)
+        if count == 0:
+            return [], {"clips": 0, "words": 0, "cps_violations": 0}
+
+        start, end = stream.start, stream.end
+        firsts = self._break_points(stream, options)
+        lasts = np.append(firsts[1:] - 1, count - 1)
+
+        clip_start = start[firsts]
+        clip_end = np.maximum.reduceat(end, firsts)
+        # 단어 사이 공백 포함 글자 수
+        clip_chars = np.add.reduceat(stream.chars, firsts) + (lasts - firsts)
+
+        clip_end = self._adjust_ends(
+            clip_start, clip_end, clip_chars, start[lasts], options
+        )
+        end = end.copy()
+        end[lasts] = clip_end
+
+        duration = np.maximum.reduceat(end, firsts) - clip_start
+        cps = clip_chars / np.maximum(duration, MIN_WORD_DURATION)
+        stats = {
+            "clips": int(len(firsts)),
+            "words": int(count),
+            "avg_duration": round(float(duration.mean()), 3),
+            "avg_cps": round(float(cps.mean()), 2),
+            "cps_violations": int(np.count_nonzero(cps > options["max_cps"] + 1e-6)),
+        }
+        return self._to_clips(stream, firsts, lasts, np.round(end, 3)), stats
+
+    def _break_points(self, stream: WordStream, options: Dict[str, Any]) -> np.ndarray:
+        """각 클립의 첫 단어 인덱스"""
+        start, end = stream.start, stream.end
+        count = len(stream)
+
+        gap = np.empty(count)
+        gap[0] = np.inf
+        gap[1:] = start[1:] - end[:-1]
+
+        # 화자 변경과 긴 쉼은 무조건 분할 (run 경계)
+        hard = np.zeros(count, dtype=bool)
+        hard[0] = True
+        hard[1:] = (stream.speaker[1:] != stream.speaker[:-1]) | (
+            gap[1:] >= options["pause_split"]
+        )
+        run_starts = np.flatnonzero(hard)
+        run_ends = np.append(run_starts[1:] - 1, count - 1)
+
+        # 단어 i..j의 공백 포함 글자 수 = cum[j] - cum[i - 1] - 1
+        cum = np.cumsum(stream.chars + 1)
+        cum_before = np.concatenate(([0], cum[:-1]))
+        # 단어 끝 시간은 겹칠 수 있으므로 누적 최댓값으로 단조 증가 보장
+        end_max = np.maximum.accumulate(end)
+
+        sentence_ends = np.flatnonzero(
+            np.fromiter(
+                (text.endswith(SENTENCE_END) for text in stream.texts),
+                dtype=bool,
+                count=count,
+            )
+        )
+        clause_ends = np.flatnonzero(
+            np.fromiter(
+                (text.endswith(CLAUSE_END) for text in stream.texts),
+                dtype=bool,
+                count=count,
+            )
+        )
+
+        max_chars = options["max_line_chars"]
+        max_duration = options["max_duration"]
+        max_words = options["max_words"]
+        # 너무 짧은 조각이 생기지 않도록 선호 분할 위치는 클립 절반 이후에서만 찾음
+        firsts: List[int] = []
+        for run_start, run_end in zip(run_starts.tolist(), run_ends.tolist()):
+            i = run_start
+            while i <= run_end:
+                firsts.append(i)
+                limit = min(
+                    run_end,
+                    i + max_words - 1,
+                    int(cum.searchsorted(cum_before[i] + max_chars + 1, "right")) - 1,
+                    int(end_max.searchsorted(start[i] + max_duration, "right")) - 1,
+                )
+                j = max(i, limit)
+                if j < run_end:
+                    j = self._preferred_break(
+                        i, j, run_end, gap, sentence_ends, clause_ends
+                    )
+                i = j + 1
+
+        return np.asarray(firsts, dtype=np.int64)
+
+    @staticmethod
+    def _preferred_break(
+        i: int,
+        j: int,
+        run_end: int,
+        gap: np.ndarray,
+        sentence_ends: np.ndarray,
+        clause_ends: np.ndarray,
+    ) -> int:
+        """i..j 범위에서 클립을 끝낼 단어 (문장 끝 → 쉼표 → 가장 긴 쉼)"""
+        lower = i + (j - i) // 2
+        for candidates in (sentence_ends, clause_ends):
+            position = int(candidates.searchsorted(j, "right")) - 1
+            if position >= 0 and candidates[position] >= lower:
+                return int(candidates[position])
+
+        # 남는 단어가 하나뿐이면 앞 클립과 반씩 나눔
+        if run_end - j == 1 and j > i:
+            return (i + run_end) // 2
+
+        # gap[k]는 k-1과 k 사이 쉼 → 가장 긴 쉼 앞에서 끝냄 (같으면 뒤쪽)
+        window = gap[lower + 1 : j + 2][::-1]
+        return j - int(np.argmax(window))
+
+    def _adjust_ends(
+        self,
+        clip_start: np.ndarray,
+        clip_end: np.ndarray,
+        clip_chars: np.ndarray,
+        last_word_start: np.ndarray,
+        options: Dict[str, Any],
+    ) -> np.ndarray:
+        """CPS/최소 길이를 위해 끝 시간을 연장하고, 다음 클립과 최소 간격을 유지"""
+        next_start = np.append(clip_start[1:], np.inf)
+        limit = next_start - options["min_gap"]
+
+        needed = np.maximum(options["min_duration"], clip_chars / options["max_cps"])
+        target = np.minimum(clip_start + needed, limit)
+        extended = np.maximum(clip_end, target)
+
+        # 다음 클립과 너무 붙으면 단축. 마지막 단어 시작 전까지 겹치는 경우는
+        # 다른 화자의 동시 발화이므로 원래 끝 시간 유지
+        shortened = np.minimum(extended, limit)
+        return np.where(
+            shortened >= last_word_start + MIN_WORD_DURATION, shortened, clip_end
+        )
+
+    @staticmethod
+    def _to_clips(
+        stream: WordStream, firsts: np.ndarray, lasts: np.ndarray, end: np.ndarray
+    ) -> List[Dict[str, Any]]:
+        starts = np.round(stream.start, 3).tolist()
+        ends = end.tolist()
+        speakers = stream.speaker.tolist()
+        texts = stream.texts
+        confidences = stream.confidences
+
+        clips: List[Dict[str, Any]] = []
+        for clip_index, (first, last) in enumerate(
+            zip(firsts.tolist(), lasts.tolist())
+        ):
+            words = [
+                {
+                    "id": f"word-{clip_index}-{offset}",
+                    "text": texts[k],
+                    "start": starts[k],
+                    "end": ends[k],
+                    "is_editable": True,
+                    "confidence": confidences[k],
+                    "applied_assets": None,
+                }
+                for offset, k in enumerate(range(first, last + 1))
+            ]
+            text = " ".join(texts[first : last + 1])
+            clips.append(
+                {
+                    "id": f"clip-{clip_index}",
+                    "timeline": f"{_format_timeline(starts[first])} - "
+                    f"{_format_timeline(max(ends[first : last + 1]))}",
+                    "speaker": stream.speaker_names[speakers[first]],
+                    "subtitle": text,
+                    "full_text": text,
+                    "duration": format_clip_duration(words),
+                    "thumbnail": "",
+                    "words": words,
+                }
+            )
+        return clips
+
+    def is_current(
+        self, stored: Optional[Dict[str, Any]], result: Dict[str, Any]
+    ) -> bool:
+        """저장된 분할 결과가 현재 버전/설정으로 만든 것인지"""
+        return bool(
+            stored
+            and stored.get("version") == SEGMENTER_VERSION
+            and stored.get("options") == self.options(_result_language(result))
+        )
+
+
+# 싱글톤 인스턴스
+subtitle_segmenter = SubtitleSegmenter()
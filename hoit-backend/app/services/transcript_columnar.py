@@ -0,0 +1,282 @@
+"""
+전사 결과 열(columnar) 바이너리 형식
+
+/api/results/{job_id}의 JSON은 단어마다 word/start/end/volume_db/pitch_hz 키를 반복하는
+중첩 객체라 크고 파싱이 느립니다. Accept 헤더로 아래 형식을 요청하면 같은 내용을
+열 배열로 보냅니다. 시간/음량/피치는 float32(little-endian)이며, 1시간 지점에서도
+시간 오차는 0.25ms 이내입니다.
+
+MessagePack (application/msgpack)
+    {"format", "jobId", "status", "metadata",
+     "strings": [단어/세그먼트 텍스트 문자열 테이블], "speakers": [화자 ID],
+     "segments": {"offsets": u32[n+1], "start_time": f32, "end_time": f32,
+                  "speaker": u16, "text": u32},
+     "words": {"text": u32, "start": f32, "end": f32, "volume_db": f32, "pitch_hz": f32}}
+    배열은 bin으로 담긴 raw 바이트입니다. 세그먼트 i의 단어는 offsets[i]:offsets[i+1],
+    text 값은 strings 인덱스, speaker 값은 speakers 인덱스입니다.
+
+Arrow IPC stream (application/vnd.apache.arrow.stream)
+    세그먼트 한 행에 start_time/end_time(float32), speaker_id/text(dictionary),
+    words(list<struct<word: dictionary, start, end, volume_db, pitch_hz>>)를 담습니다.
+    list 오프셋이 세그먼트 오프셋, dictionary가 문자열 테이블 역할을 합니다.
+    metadata/jobId/status는 스키마 메타데이터 "hoit"에 JSON으로 들어갑니다.
+"""
+
+import json
+from typing import Dict, Any, List, Optional
+
+import msgpack
+import numpy as np
+
+COLUMNAR_FORMAT = "hoit-transcript-columnar/1"
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# Accept 값 → 형식 (application/x-msgpack은 일부 클라이언트가 쓰는 비표준 이름)
+ACCEPT_FORMATS = {
+    MSGPACK_MEDIA_TYPE: "msgpack",
+    "application/x-msgpack": "msgpack",
+    ARROW_MEDIA_TYPE: "arrow",
+}
+
+# simplify_ml_result와 같은 기본값
+DEFAULT_VOLUME_DB = -30.0
+DEFAULT_PITCH_HZ = 300.0
+
+
+def _number(item: Dict[str, Any], default: float, *keys: str) -> float:
+    """첫 번째로 값이 있는 키 (없거나 null이면 기본값)"""
+    for key in keys:
+        value = item.get(key)
+        if value is not None:
+            return value
+    return default
+
+
+def negotiate_format(accept: Optional[str]) -> Optional[str]:
+    """
+    Accept 헤더에서 열 형식 선택
+
+    Returns:
+        "msgpack" / "arrow", JSON을 보내야 하면 None. q 값이 가장 높은 항목을 따르며
+        같으면 먼저 나온 항목을 고릅니다.
+    """
+    if not accept:
+        return None
+
+    best: Optional[str] = None
+    best_q = 0.0
+    for item in accept.split(","):
+        media_type, _, params = item.strip().partition(";")
+        media_type = media_type.strip().lower()
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if media_type in ("application/json", "*/*", "application/*"):
+            candidate = None
+        elif media_type in ACCEPT_FORMATS:
+            candidate = ACCEPT_FORMATS[media_type]
+        else:
+            continue
+        if q > best_q:
+            best, best_q = candidate, q
+    return best
+
+
+class TranscriptColumns:
+    """ML 결과 segments[].words[]를 열 배열 + 문자열 테이블로 변환"""
+
+    def __init__(self, raw_result: Dict[str, Any]):
+        metadata = raw_result.get("metadata") or {}
+        self.metadata = {
+            "filename": metadata.get("filename", "unknown.mp4"),
+            "duration": metadata.get("duration", 0.0),
+            "total_segments": metadata.get("total_segments", 0),
+            "unique_speakers": metadata.get("unique_speakers", 0),
+        }
+
+        strings: Dict[str, int] = {}
+        speakers: Dict[str, int] = {}
+        offsets = [0]
+        segment_start: List[float] = []
+        segment_end: List[float] = []
+        segment_speaker: List[int] = []
+        segment_text: List[int] = []
+        word_text: List[int] = []
+        word_start: List[float] = []
+        word_end: List[float] = []
+        word_volume: List[float] = []
+        word_pitch: List[float] = []
+
+        for segment in raw_result.get("segments") or []:
+            speaker = (segment.get("speaker") or {}).get("speaker_id", "UNKNOWN")
+            # 콜백 수신 시 start_time/end_time이 start/end로 정규화된 결과도 허용
+            segment_start.append(_number(segment, 0.0, "start_time", "start"))
+            segment_end.append(_number(segment, 0.0, "end_time", "end"))
+            segment_speaker.append(speakers.setdefault(speaker, len(speakers)))
+            text = segment.get("text") or ""
+            segment_text.append(strings.setdefault(text, len(strings)))
+
+            for word in segment.get("words") or []:
+                text = word.get("word") or ""
+                word_text.append(strings.setdefault(text, len(strings)))
+                word_start.append(_number(word, 0.0, "start", "start_time"))
+                word_end.append(_number(word, 0.0, "end", "end_time"))
+                word_volume.append(_number(word, DEFAULT_VOLUME_DB, "volume_db"))
+                word_pitch.append(_number(word, DEFAULT_PITCH_HZ, "pitch_hz"))
+            offsets.append(len(word_text))
+
+        self.strings = list(strings)
+        self.speakers = list(speakers)
+        self.offsets = np.asarray(offsets, dtype="<u4")
+        self.segment_start = np.asarray(segment_start, dtype="<f4")
+        self.segment_end = np.asarray(segment_end, dtype="<f4")
+        self.segment_speaker = np.asarray(segment_speaker, dtype="<u2")
+        self.segment_text = np.asarray(segment_text, dtype="<u4")
+        self.word_text = np.asarray(word_text, dtype="<u4")
+        self.word_start = np.asarray(word_start, dtype="<f4")
+        self.word_end = np.asarray(word_end, dtype="<f4")
+        self.word_volume = np.asarray(word_volume, dtype="<f4")
+        self.word_pitch = np.asarray(word_pitch, dtype="<f4")
+
+    def _header(self, job_id: str) -> Dict[str, Any]:
+        return {
+            "format": COLUMNAR_FORMAT,
+            "jobId": job_id,
+            "status": "success",
+            "metadata": self.metadata,
+        }
+
+    def to_msgpack(self, job_id: str) -> bytes:
+        return msgpack.packb(
+            {
+                **self._header(job_id),
+                "strings": self.strings,
+                "speakers": self.speakers,
+                "segments": {
+                    "offsets": self.offsets.tobytes(),
+                    "start_time": self.segment_start.tobytes(),
+                    "end_time": self.segment_end.tobytes(),
+                    "speaker": self.segment_speaker.tobytes(),
+                    "text": self.segment_text.tobytes(),
+                },
+                "words": {
+                    "text": self.word_text.tobytes(),
+                    "start": self.word_start.tobytes(),
+                    "end": self.word_end.tobytes(),
+                    "volume_db": self.word_volume.tobytes(),
+                    "pitch_hz": self.word_pitch.tobytes(),
+                },
+            },
+            use_bin_type=True,
+        )
+
+    def to_arrow(self, job_id: str) -> bytes:
+        # pyarrow는 무거워서 Arrow 형식 요청 시에만 로드
+        import pyarrow as pa
+
+        strings = pa.array(self.strings, type=pa.string())
+        words = pa.StructArray.from_arrays(
+            [
+                pa.DictionaryArray.from_arrays(pa.array(self.word_text), strings),
+                pa.array(self.word_start),
+                pa.array(self.word_end),
+                pa.array(self.word_volume),
+                pa.array(self.word_pitch),
+            ],
+            names=["word", "start", "end", "volume_db", "pitch_hz"],
+        )
+        batch = pa.record_batch(
+            [
+                pa.array(self.segment_start),
+                pa.array(self.segment_end),
+                pa.DictionaryArray.from_arrays(
+                    pa.array(self.segment_speaker),
+                    pa.array(self.speakers, type=pa.string()),
+                ),
+                pa.DictionaryArray.from_arrays(pa.array(self.segment_text), strings),
+                pa.ListArray.from_arrays(
+                    pa.array(self.offsets.astype(np.int32)), words
+                ),
+            ],
+            names=["start_time", "end_time", "speaker_id", "text", "words"],
+        )
+        schema = batch.schema.with_metadata(
+            {"hoit": json.dumps(self._header(job_id), ensure_ascii=False)}
+        )
+
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, schema) as writer:
+            writer.write_batch(batch)
+        return sink.getvalue().to_pybytes()
+
+
+def encode_result(raw_result: Dict[str, Any], job_id: str, format: str) -> bytes:
+    """ML 원본 결과를 열 형식 바이트로 인코딩"""
+    columns = TranscriptColumns(raw_result)
+    if format == "msgpack":
+        return columns.to_msgpack(job_id)
+    if format == "arrow":
+        return columns.to_arrow(job_id)
+    raise ValueError(f"Unsupported columnar format: {format}")
+
+
+def decode_msgpack(data: bytes) -> Dict[str, Any]:
+    """MessagePack 열 형식 → 열 배열 dict (벤치마크/검증용 참조 디코더)"""
+    payload = msgpack.unpackb(data, raw=False)
+    dtypes = {"offsets": "<u4", "speaker": "<u2", "text": "<u4"}
+    for group in ("segments", "words"):
+        payload[group] = {
+            key: np.frombuffer(value, dtype=dtypes.get(key, "<f4"))
+            for key, value in payload[group].items()
+        }
+    return payload
+
+
+def columns_to_segments(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """decode_msgpack 결과를 JSON 응답과 같은 segments 목록으로 복원"""
+    strings = payload["strings"]
+    speakers = payload["speakers"]
+    segments = payload["segments"]
+    words = payload["words"]
+    offsets = segments["offsets"].tolist()
+    word_text = words["text"].tolist()
+    word_start = words["start"].tolist()
+    word_end = words["end"].tolist()
+    word_volume = words["volume_db"].tolist()
+    word_pitch = words["pitch_hz"].tolist()
+
+    result = []
+    for index, (start_time, end_time, speaker, text) in enumerate(
+        zip(
+            segments["start_time"].tolist(),
+            segments["end_time"].tolist(),
+            segments["speaker"].tolist(),
+            segments["text"].tolist(),
+        )
+    ):
+        result.append(
+            {
+                "start_time": start_time,
+                "end_time": end_time,
+                "speaker_id": speakers[speaker],
+                "text": strings[text],
+                "words": [
+                    {
+                        "word": strings[word_text[k]],
+                        "start": word_start[k],
+                        "end": word_end[k],
+                        "volume_db": word_volume[k],
+                        "pitch_hz": word_pitch[k],
+                    }
+                    for k in range(offsets[index], offsets[index + 1])
+                ],
+            }
+        )
+    return result
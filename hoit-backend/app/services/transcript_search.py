@@ -0,0 +1,191 @@
+"""
+프로젝트 자막 전문 검색
+
+정규화 clips/words 테이블(ClipTableService가 프로젝트 저장 시 동기화)을 조회합니다.
+형태소 분석 없이 부분 문자열로 매칭하므로 한국어 조사/어미가 붙은 어절("학교에서")도
+어간("학교")으로 찾을 수 있습니다.
+
+    3자 이상 토큰: clips.full_text ILIKE '%토큰%'  (PostgreSQL pg_trgm GIN 인덱스)
+    2자 이하 토큰: words.text 접두사 매칭          (lower(text) text_pattern_ops 인덱스)
+
+pg_trgm은 3글자 미만 패턴에서 트라이그램을 뽑지 못해 인덱스를 쓰지 못하므로,
+짧은 토큰은 어절 접두사 인덱스로 우회합니다.
+"""
+
+import logging
+import unicodedata
+from typing import Dict, Any, List, Tuple
+
+from sqlalchemy import func, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.models.clip import Clip
+from app.models.project import Project
+from app.models.word import Word
+
+logger = logging.getLogger(__name__)
+
+MAX_QUERY_TOKENS = 8
+TRIGRAM_MIN_LENGTH = 3
+SNIPPET_CONTEXT = 40
+
+# create_all은 기존 테이블에 인덱스를 추가하지 않으므로 기동 시 함께 보장
+SEARCH_INDEX_DDL = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS idx_clips_full_text_trgm "
+    "ON clips USING gin (full_text gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS idx_words_text_prefix "
+    "ON words (lower(text) text_pattern_ops)",
+)
+
+
+def tokenize_query(query: str) -> List[str]:
+    """검색어 정규화 (NFKC + 소문자) 후 공백 기준 토큰 분리 (중복 제거)"""
+    normalized = unicodedata.normalize("NFKC", query).lower()
+    tokens: List[str] = []
+    for token in normalized.split():
+        if token not in tokens:
+            tokens.append(token)
+    return tokens[:MAX_QUERY_TOKENS]
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _snippet(full_text: str, tokens: List[str]) -> str:
+    """첫 번째로 매칭된 토큰 주변 텍스트"""
+    lowered = unicodedata.normalize("NFKC", full_text).lower()
+    positions = [lowered.find(token) for token in tokens]
+    positions = [position for position in positions if position >= 0]
+    if not positions or len(full_text) <= SNIPPET_CONTEXT * 2:
+        return full_text[: SNIPPET_CONTEXT * 2]
+
+    start = max(0, min(positions) - SNIPPET_CONTEXT)
+    end = min(len(full_text), min(positions) + SNIPPET_CONTEXT)
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if end < len(full_text) else ""
+    return f"{prefix}{full_text[start:end]}{suffix}"
+
+
+def ensure_search_indexes(engine: Engine) -> None:
+    """PostgreSQL 검색 인덱스 생성 (pg_trgm 확장 포함, 실패 시 경고만 남김)"""
+    if engine.dialect.name != "postgresql":
+        return
+    try:
+        with engine.begin() as connection:
+            for statement in SEARCH_INDEX_DDL:
+                connection.execute(text(statement))
+    except Exception as e:
+        logger.warning(f"Transcript search indexes not created: {str(e)}")
+
+
+class TranscriptSearchService:
+    """사용자 프로젝트 전체 자막 검색"""
+
+    @staticmethod
+    def search(
+        db: Session, user_id: int, query: str, limit: int = 20
+    ) -> Dict[str, Any]:
+        """
+        사용자 프로젝트의 클립 자막에서 모든 토큰을 포함하는 클립 검색
+
+        Returns:
+            {"query", "hits": [{project_id, project_name, clip_id, word_id,
+            speaker, snippet, start, end}], "has_more"}
+        """
+        tokens = tokenize_query(query)
+        if not tokens:
+            return {"query": query, "hits": [], "has_more": False}
+
+        conditions = []
+        for token in tokens:
+            if len(token) >= TRIGRAM_MIN_LENGTH:
+                conditions.append(
+                    Clip.full_text.ilike(f"%{_escape_like(token)}%", escape="\\")
+                )
+            else:
+                conditions.append(
+                    Clip.id.in_(
+                        select(Word.clip_id).where(
+                            func.lower(Word.text).like(
+                                f"{_escape_like(token)}%", escape="\\"
+                            )
+                        )
+                    )
+                )
+
+        rows = db.execute(
+            select(
+                Clip.id,
+                Clip.project_id,
+                Clip.speaker,
+                Clip.full_text,
+                Clip.start_time,
+                Clip.end_time,
+                Project.name,
+            )
+            .join(Project, Project.id == Clip.project_id)
+            .where(Project.user_id == user_id, *conditions)
+            .order_by(Project.updated_at.desc(), Project.id, Clip.position)
+            .limit(limit + 1)
+        ).all()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        matches = TranscriptSearchService._match_words(
+            db, [row.id for row in rows], tokens
+        )
+
+        hits = []
+        for row in rows:
+            prefix_length = len(row.project_id) + 1
+            word = matches.get(row.id)
+            hits.append(
+                {
+                    "project_id": row.project_id,
+                    "project_name": row.name,
+                    "clip_id": row.id[prefix_length:],
+                    "word_id": word[0][len(row.id) + 1 :] if word else None,
+                    "speaker": row.speaker,
+                    "snippet": _snippet(row.full_text or "", tokens),
+                    "start": word[1] if word else row.start_time,
+                    "end": word[2] if word else row.end_time,
+                }
+            )
+
+        return {"query": query, "hits": hits, "has_more": has_more}
+
+    @staticmethod
+    def _match_words(
+        db: Session, clip_row_ids: List[str], tokens: List[str]
+    ) -> Dict[str, Tuple[str, float, float]]:
+        """클립별로 검색 토큰을 처음 포함하는 단어 (타임스탬프용)"""
+        if not clip_row_ids:
+            return {}
+
+        words = db.execute(
+            select(Word.id, Word.clip_id, Word.text, Word.start, Word.end)
+            .where(Word.clip_id.in_(clip_row_ids))
+            .order_by(Word.clip_id, Word.position)
+        ).all()
+
+        matches: Dict[str, Tuple[str, float, float]] = {}
+        for word in words:
+            if word.clip_id in matches:
+                continue
+            normalized = unicodedata.normalize("NFKC", word.text or "").lower()
+            if _word_matches(normalized, tokens):
+                matches[word.clip_id] = (word.id, word.start, word.end)
+        return matches
+
+
+def _word_matches(normalized: str, tokens: List[str]) -> bool:
+    for token in tokens:
+        if len(token) >= TRIGRAM_MIN_LENGTH:
+            if token in normalized:
+                return True
+        elif normalized.startswith(token):
+            return True
+    return False
@@ -0,0 +1,311 @@
+"""
+인증 사용자 조회 캐시
+
+인증이 필요한 모든 요청은 get_current_user_dependency에서 JWT를 검증한 뒤 users 테이블을
+조회합니다. 조회 결과를 2단계로 캐시해 요청마다의 DB 왕복을 없앱니다.
+
+1. 프로세스 내 TTL LRU: (user_id, jti) → 사용자 필드. 히트 시 I/O 없음
+2. Redis: backend:auth:user:{user_id} → 사용자 필드(JSON). 워커 간 공유
+
+Redis 연결
+- app/core/redis_client.RedisClient는 GPU 서버가 쓰는 키를 읽기만 하는 클라이언트이므로
+  사용하지 않고, 같은 Redis에 전용 연결 풀과 backend:auth: 키 네임스페이스를 씁니다.
+- 인증 경로(resolve, revoke_token)는 이벤트 루프를 막지 않도록 redis.asyncio를 쓰고,
+  ORM 이벤트처럼 동기 코드에서 호출되는 invalidate_user만 동기 클라이언트를 씁니다.
+  둘 다 USER_CACHE_REDIS_TIMEOUT 안에 응답이 없으면 Redis를 건너뜁니다.
+
+무효화
+- 사용자 수정: invalidate_user(). User ORM 업데이트 시 자동 호출되며 Redis 키를 지우고
+  이 프로세스의 해당 사용자 항목을 모두 버립니다. 다른 워커의 로컬 항목은
+  USER_CACHE_TTL 이내에 만료됩니다.
+- 로그아웃: revoke_token(). 토큰 (user_id, jti)를 만료 시각까지 Redis에 기록해 이후 요청을
+  거부합니다. 로컬 히트는 Redis를 보지 않으므로 다른 워커에 이미 캐시된 토큰은
+  USER_CACHE_TTL 이내에 거부됩니다.
+
+캐시에는 응답에 필요한 필드만 담고 password_hash는 저장하지 않습니다. Redis에
+연결할 수 없으면 잠시 Redis를 건너뛰고 DB 조회로 동작합니다.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Any, Optional, Set, Tuple
+
+import redis
+import redis.asyncio as aioredis
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.redis_client import REDIS_URL
+from app.models.user import User, AuthProvider
+
+logger = logging.getLogger(__name__)
+
+# GPU 서버 키와 겹치지 않도록 백엔드 전용 네임스페이스 사용
+USER_KEY_PREFIX = "backend:auth:user:"
+REVOKED_KEY_PREFIX = "backend:auth:revoked:"
+
+# Redis 오류 후 다시 시도하기까지 건너뛰는 시간 (초)
+REDIS_RETRY_INTERVAL = 10.0
+
+CacheKey = Tuple[int, str]
+
+
+def _user_fields(user: User) -> Dict[str, Any]:
+    """캐시에 담을 사용자 필드 (UserResponse + 토큰 발급에 쓰는 값)"""
+    return {
+        "id": user.id,
+        "username": user.username,
+        "email": user.email,
+        "auth_provider": (
+            user.auth_provider.value
+            if isinstance(user.auth_provider, AuthProvider)
+            else user.auth_provider
+        ),
+        "oauth_id": user.oauth_id,
+        "is_active": user.is_active,
+        "is_verified": user.is_verified,
+        "created_at": user.created_at.isoformat() if user.created_at else None,
+        "updated_at": user.updated_at.isoformat() if user.updated_at else None,
+    }
+
+
+def _to_user(fields: Dict[str, Any]) -> User:
+    """캐시된 필드로 세션에 붙지 않은 User 인스턴스 생성"""
+    return User(
+        id=fields["id"],
+        username=fields["username"],
+        email=fields["email"],
+        auth_provider=(
+            AuthProvider(fields["auth_provider"])
+            if fields.get("auth_provider")
+            else None
+        ),
+        oauth_id=fields.get("oauth_id"),
+        is_active=fields["is_active"],
+        is_verified=fields["is_verified"],
+        created_at=(
+            datetime.fromisoformat(fields["created_at"])
+            if fields.get("created_at")
+            else None
+        ),
+        updated_at=(
+            datetime.fromisoformat(fields["updated_at"])
+            if fields.get("updated_at")
+            else None
+        ),
+    )
+
+
+class UserCache:
+    """(user_id, jti) 기준 사용자 조회 캐시 (프로세스 내 TTL LRU + Redis)"""
+
+    def __init__(
+        self,
+        ttl: float,
+        max_entries: int,
+        redis_ttl: int,
+        redis_url: str,
+        redis_timeout: float,
+        redis_pool_size: int,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.redis_ttl = redis_ttl
+        self._client = aioredis.from_url(
+            redis_url,
+            max_connections=redis_pool_size,
+            decode_responses=True,
+            socket_timeout=redis_timeout,
+            socket_connect_timeout=redis_timeout,
+        )
+        self._sync_client = redis.Redis.from_url(
+            redis_url,
+            decode_responses=True,
+            socket_timeout=redis_timeout,
+            socket_connect_timeout=redis_timeout,
+        )
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+        self._keys_by_user: Dict[int, Set[CacheKey]] = {}
+        # Redis에 기록하지 못한 경우에도 이 프로세스에서는 폐기되도록 보관 (키 → 만료 시각)
+        self._revoked: Dict[CacheKey, float] = {}
+        self._lock = threading.Lock()
+        self._redis_retry_at = 0.0
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    # ----- 프로세스 내 LRU -----
+
+    def _get_local(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, fields = entry
+            if expires_at <= time.monotonic():
+                self._remove_local(key)
+                return None
+            self._entries.move_to_end(key)
+            return fields
+
+    def _put_local(self, key: CacheKey, fields: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, fields)
+            self._entries.move_to_end(key)
+            self._keys_by_user.setdefault(key[0], set()).add(key)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = next(iter(self._entries.items()))
+                self._remove_local(evicted)
+
+    def _remove_local(self, key: CacheKey) -> None:
+        # self._lock을 잡은 상태에서 호출
+        self._entries.pop(key, None)
+        keys = self._keys_by_user.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[key[0]]
+
+    # ----- Redis -----
+
+    def _redis_available(self) -> bool:
+        return time.monotonic() >= self._redis_retry_at
+
+    def _redis_failed(self, error: Exception) -> None:
+        logger.warning(f"User cache Redis unavailable, falling back to DB: {error}")
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+
+    async def _get_redis(self, user_id: int, jti: str) -> Tuple[bool, Optional[str]]:
+        """(토큰 폐기 여부, 캐시된 사용자 JSON) 한 번의 왕복으로 조회"""
+        if not self._redis_available():
+            return False, None
+        try:
+            pipe = self._client.pipeline(transaction=False)
+            pipe.exists(f"{REVOKED_KEY_PREFIX}{user_id}:{jti}")
+            pipe.get(f"{USER_KEY_PREFIX}{user_id}")
+            revoked, cached = await pipe.execute()
+            return bool(revoked), cached
+        except Exception as e:
+            self._redis_failed(e)
+            return False, None
+
+    async def _put_redis(self, fields: Dict[str, Any]) -> None:
+        if not self._redis_available():
+            return
+        try:
+            await self._client.set(
+                f"{USER_KEY_PREFIX}{fields['id']}",
+                json.dumps(fields),
+                ex=self.redis_ttl,
+            )
+        except Exception as e:
+            self._redis_failed(e)
+
+    # ----- 공개 API -----
+
+    async def resolve(
+        self, db: Session, user_id: int, jti: str
+    ) -> Tuple[bool, Optional[User]]:
+        """
+        토큰의 user_id/jti로 사용자 조회
+
+        Returns:
+            (토큰 폐기 여부, 사용자). 사용자가 없으면 None
+        """
+        key = (user_id, jti)
+        fields = self._get_local(key)
+        if fields is not None:
+            self.hits += 1
+            return False, _to_user(fields)
+
+        revoked, cached = await self._get_redis(user_id, jti)
+        if revoked or self._revoked.get(key, 0.0) > time.time():
+            return True, None
+        if cached is not None:
+            self.redis_hits += 1
+            fields = json.loads(cached)
+            self._put_local(key, fields)
+            return False, _to_user(fields)
+
+        self.misses += 1
+        user = db.query(User).filter(User.id == user_id).first()
+        if user is None:
+            return False, None
+        fields = _user_fields(user)
+        await self._put_redis(fields)
+        self._put_local(key, fields)
+        return False, user
+
+    def invalidate_user(self, user_id: int) -> None:
+        """사용자 정보가 바뀌었을 때 캐시 항목 삭제 (동기 코드에서 호출, 사용자 수정 시에만)"""
+        with self._lock:
+            for key in list(self._keys_by_user.get(user_id, ())):
+                self._remove_local(key)
+        if not self._redis_available():
+            return
+        try:
+            self._sync_client.delete(f"{USER_KEY_PREFIX}{user_id}")
+        except Exception as e:
+            self._redis_failed(e)
+
+    async def revoke_token(self, user_id: int, jti: str, expires_at: float) -> None:
+        """
+        로그아웃한 토큰을 만료 시각까지 폐기 목록에 기록
+
+        이 프로세스에서는 즉시, 다른 워커에서는 로컬 캐시 항목이 만료되는 USER_CACHE_TTL
+        이내에 거부됩니다.
+        """
+        key = (user_id, jti)
+        now = time.time()
+        with self._lock:
+            self._remove_local(key)
+            self._revoked = {k: t for k, t in self._revoked.items() if t > now}
+            self._revoked[key] = expires_at
+        remaining = int(expires_at - now)
+        if remaining <= 0 or not self._redis_available():
+            return
+        try:
+            await self._client.set(
+                f"{REVOKED_KEY_PREFIX}{user_id}:{jti}", "1", ex=remaining
+            )
+        except Exception as e:
+            self._redis_failed(e)
+
+    async def close(self) -> None:
+        """Redis 연결 풀 종료 (애플리케이션 종료 시)"""
+        await self._client.aclose()
+        self._sync_client.close()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            size = len(self._entries)
+        return {
+            "size": size,
+            "hits": self.hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+        }
+
+
+# 싱글톤 인스턴스
+user_cache = UserCache(
+    ttl=settings.USER_CACHE_TTL,
+    max_entries=settings.USER_CACHE_MAX_ENTRIES,
+    redis_ttl=settings.USER_CACHE_REDIS_TTL,
+    redis_url=REDIS_URL,
+    redis_timeout=settings.USER_CACHE_REDIS_TIMEOUT,
+    redis_pool_size=settings.USER_CACHE_REDIS_POOL_SIZE,
+)
+
+
+@event.listens_for(User, "after_update")
+def _invalidate_on_update(mapper, connection, target: User) -> None:
+    """User ORM 업데이트 시 캐시 무효화"""
+    user_cache.invalidate_user(target.id)
@@ -4,10 +4,17 @@ GPU 렌더링 백그라운드 태스크
 
 import aiohttp
 import logging
+import time
 from typing import Dict, Any
 from sqlalchemy.orm import Session
 from app.core.config import settings
 from app.services.render_service import RenderService
+from app.utils.render_utils import (
+    encode_payload,
+    minify_json,
+    strip_payload_defaults,
+    summarize_scenario,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +26,7 @@ GPU_RENDER_TIMEOUT = getattr(settings, "GPU_RENDER_TIMEOUT", 1800)  # 30분
 RENDER_CALLBACK_URL = getattr(
     settings, "RENDER_CALLBACK_URL", settings.FASTAPI_BASE_URL
 )
+GPU_REQUEST_CONTENT_ENCODING = settings.GPU_REQUEST_CONTENT_ENCODING
 
 
 async def trigger_gpu_server(
@@ -55,25 +63,49 @@ async def _send_request_to_gpu_server(
         # GPU 서버 요청 데이터 구성
         gpu_request = {
             "jobId": job_id,
-            "videoUrl": payload.get("videoUrl"),
+            "videoUrl": payload.get("video_url") or payload.get("videoUrl"),
             "scenario": payload.get("scenario"),
             "options": payload.get("options", {}),
             "callbackUrl": f"{RENDER_CALLBACK_URL}/api/render/callback",
+            "plugins": payload.get("plugins", []),
+            "timeline": payload.get("timeline"),
         }
 
-        logger.info(f"GPU 서버 요청 데이터: {gpu_request}")
+        # 기본값 제거 + minify + 압축
+        encode_started = time.perf_counter()
+        raw_body = minify_json(strip_payload_defaults(gpu_request))
+        body, content_encoding = encode_payload(raw_body, GPU_REQUEST_CONTENT_ENCODING)
+        encode_ms = (time.perf_counter() - encode_started) * 1000
+
+        summary = summarize_scenario(gpu_request["scenario"], len(raw_body))
+        logger.info(
+            f"GPU 서버 요청 데이터 - Job ID: {job_id}, cues: {summary['cues']}, "
+            f"scenario: {summary['scenario_bytes']}B "
+            f"(sha256 {summary['scenario_sha256']}), "
+            f"body: {len(raw_body)}B -> {len(body)}B ({content_encoding}), "
+            f"encode: {encode_ms:.1f}ms"
+        )
+
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        if content_encoding != "identity":
+            headers["Content-Encoding"] = content_encoding
 
         # HTTP 요청 전송
         timeout = aiohttp.ClientTimeout(total=GPU_RENDER_TIMEOUT)
+        request_started = time.perf_counter()
         async with aiohttp.ClientSession(timeout=timeout) as session:
             async with session.post(
                 f"{GPU_RENDER_SERVER_URL}/render",
-                json=gpu_request,
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "application/json",
-                },
+                data=body,
+                headers=headers,
             ) as response:
+                logger.info(
+                    f"GPU 서버 응답 수신 - Job ID: {job_id}, Status: {response.status}, "
+                    f"latency: {(time.perf_counter() - request_started) * 1000:.1f}ms"
+                )
                 if response.status == 200:
                     result = await response.json()
                     logger.info(f"GPU 서버 응답 성공 - Job ID: {job_id}, Result: {result}")
@@ -24,6 +24,19 @@ class RenderError:
 
         return HTTPException(status_code=400, detail=error_detail)
 
+    @staticmethod
+    def render_infeasible(message: str, details: Optional[Any] = None) -> HTTPException:
+        """렌더링 불가능한 시나리오 (422)"""
+        error_detail = {
+            "error": "RENDER_INFEASIBLE",
+            "message": message,
+            "code": "RENDER_SCENARIO_INFEASIBLE",
+        }
+        if details:
+            error_detail["details"] = details
+
+        return HTTPException(status_code=422, detail=error_detail)
+
     @staticmethod
     def quota_exceeded(message: str, quota_type: str) -> HTTPException:
         """할당량 초과 에러 (403/429)"""
@@ -0,0 +1,36 @@
+"""
+최근 작업 지연 시간 통계 (p50/p99)
+"""
+
+import threading
+from collections import deque
+from typing import Deque, Dict
+
+# 통계에 쓰는 최근 작업 수
+LATENCY_WINDOW = 1000
+
+
+class LatencyWindow:
+    """최근 N개 측정값(초)을 보관하고 백분위수를 ms로 계산 (스레드 안전)"""
+
+    def __init__(self, size: int = LATENCY_WINDOW):
+        self._values: Deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float) -> None:
+        with self._lock:
+            self._values.append(seconds)
+
+    def percentile_ms(self, q: float) -> float:
+        with self._lock:
+            ordered = sorted(self._values)
+        if not ordered:
+            return 0.0
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000, 1)
+
+    def summary(self, name: str) -> Dict[str, float]:
+        """{name}_ms_p50 / {name}_ms_p99"""
+        return {
+            f"{name}_ms_p50": self.percentile_ms(0.5),
+            f"{name}_ms_p99": self.percentile_ms(0.99),
+        }
@@ -2,9 +2,16 @@
 GPU 렌더링 관련 유틸리티 함수들
 """
 
+import gzip
+import hashlib
+import json
 import re
+from typing import Any, Dict, Tuple
 from urllib.parse import urlparse
 
+# 렌더러가 비어 있으면 생략한 것과 동일하게 처리하는 시나리오 키
+OMITTABLE_EMPTY_KEYS = {"pluginChain", "params", "style", "layout", "effectScope"}
+
 
 def extract_video_name(video_url: str) -> str:
     """비디오 URL에서 파일명 추출"""
@@ -61,3 +68,53 @@ def calculate_estimated_time(scenario: dict) -> int:
 
     except Exception:
         return 30  # 계산 실패시 기본값 반환
+
+
+def strip_payload_defaults(value: Any) -> Any:
+    """None 값과 비어 있는 선택 필드를 재귀적으로 제거"""
+    if isinstance(value, dict):
+        stripped = {}
+        for key, item in value.items():
+            if item is None:
+                continue
+            item = strip_payload_defaults(item)
+            if key in OMITTABLE_EMPTY_KEYS and item in ({}, []):
+                continue
+            stripped[key] = item
+        return stripped
+    if isinstance(value, list):
+        return [strip_payload_defaults(item) for item in value]
+    return value
+
+
+def minify_json(value: Any) -> bytes:
+    """공백 없는 UTF-8 JSON 직렬화"""
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def encode_payload(body: bytes, encoding: str) -> Tuple[bytes, str]:
+    """
+    요청 본문 압축
+
+    Returns:
+        tuple: (압축된 본문, 실제 적용된 Content-Encoding)
+    """
+    if encoding == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor(level=3).compress(body), "zstd"
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6), "gzip"
+    return body, "identity"
+
+
+def summarize_scenario(scenario: Dict[str, Any], body_size: int) -> Dict[str, Any]:
+    """로그용 시나리오 요약 (본문 대신 크기와 해시만 기록)"""
+    scenario_bytes = minify_json(scenario or {})
+    cues = (scenario or {}).get("cues")
+    return {
+        "cues": len(cues) if isinstance(cues, list) else 0,
+        "scenario_bytes": len(scenario_bytes),
+        "scenario_sha256": hashlib.sha256(scenario_bytes).hexdigest()[:16],
+        "body_bytes": body_size,
+    }
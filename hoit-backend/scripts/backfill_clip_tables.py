@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+기존 프로젝트의 projects.clips JSON을 clips/words 테이블로 백필하는 스크립트
+
+clip_rows_version이 현재 버전과 다른 프로젝트만 처리하며, 프로젝트 단위로 커밋합니다.
+
+사용법:
+    python scripts/backfill_clip_tables.py
+    python scripts/backfill_clip_tables.py --project-id <id> --force
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add the backend root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import or_  # noqa: E402
+
+from app.db.database import SessionLocal  # noqa: E402
+from app.models.project import Project  # noqa: E402
+from app.services.clip_table_service import ClipTableService  # noqa: E402
+
+
+def backfill(project_id: str = None, force: bool = False, batch_size: int = 100):
+    db = SessionLocal()
+    total_clips = 0
+    total_words = 0
+    processed = 0
+    started = time.perf_counter()
+
+    try:
+        query = db.query(Project.id).order_by(Project.id)
+        if project_id:
+            query = query.filter(Project.id == project_id)
+        if not force:
+            query = query.filter(
+                or_(
+                    Project.clip_rows_version.is_(None),
+                    Project.clip_rows_version != Project.version,
+                )
+            )
+        project_ids = [row.id for row in query.all()]
+        print(f"📋 백필 대상 프로젝트: {len(project_ids)}개")
+
+        for index, pid in enumerate(project_ids, 1):
+            # 동시 저장과 겹치지 않도록 프로젝트 행 잠금
+            project = (
+                db.query(Project).filter(Project.id == pid).with_for_update().first()
+            )
+            if not project:
+                continue
+
+            counts = ClipTableService.replace_project_clips(
+                db, project.id, project.clips or []
+            )
+            project.clip_rows_version = project.version
+            db.commit()
+
+            processed += 1
+            total_clips += counts["clips"]
+            total_words += counts["words"]
+            if index % batch_size == 0:
+                print(f"  ... {index}/{len(project_ids)} 완료")
+
+        elapsed = time.perf_counter() - started
+        print(
+            f"✅ 백필 완료: 프로젝트 {processed}개, 클립 {total_clips}개, "
+            f"단어 {total_words}개 ({elapsed:.2f}s)"
+        )
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 백필 실패: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill clips/words tables")
+    parser.add_argument("--project-id", help="특정 프로젝트만 백필")
+    parser.add_argument("--force", action="store_true", help="이미 동기화된 프로젝트도 다시 적재")
+    parser.add_argument("--batch-size", type=int, default=100, help="진행 로그 간격")
+    args = parser.parse_args()
+
+    backfill(args.project_id, args.force, args.batch_size)
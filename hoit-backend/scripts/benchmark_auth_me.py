@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+/api/auth/me 처리량 벤치마크
+
+DB의 첫 번째 사용자로 access token을 발급하고, 앱을 ASGI로 직접 호출해
+사용자 조회 캐시를 끈 상태(매 요청 DB 조회)와 켠 상태의 requests/sec를 비교합니다.
+네트워크/서버 프로세스 비용은 포함되지 않습니다.
+
+사용법:
+    python scripts/benchmark_auth_me.py
+    python scripts/benchmark_auth_me.py --requests 5000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+import httpx
+
+# Add the backend root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.database import SessionLocal  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.services.auth_service import auth_service  # noqa: E402
+from app.services.user_cache import user_cache  # noqa: E402
+
+
+async def measure(token: str, requests: int, concurrency: int) -> float:
+    """requests번 /api/auth/me 호출 → requests/sec"""
+    transport = httpx.ASGITransport(app=app)
+    headers = {"Authorization": f"Bearer {token}"}
+    remaining = requests
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://benchmark"
+    ) as client:
+
+        async def worker():
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                response = await client.get("/api/auth/me", headers=headers)
+                response.raise_for_status()
+
+        # 워밍업 (첫 요청에서 캐시가 채워짐)
+        (await client.get("/api/auth/me", headers=headers)).raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return requests / (time.perf_counter() - started)
+
+
+def run_benchmark(requests: int, concurrency: int):
+    db = SessionLocal()
+    try:
+        user = db.query(User).first()
+        if not user:
+            print("❌ 벤치마크용 사용자가 없습니다. 시드 데이터를 먼저 생성하세요.")
+            return
+        token = auth_service.create_access_token(
+            data={"user_id": user.id, "email": user.email}
+        )
+    finally:
+        db.close()
+
+    print(f"📋 /api/auth/me {requests}회, 동시 {concurrency}")
+
+    # 캐시 끔: 로컬 항목 즉시 만료 + Redis 건너뜀 → 매 요청 DB 조회
+    ttl = user_cache.ttl
+    user_cache.ttl = 0
+    user_cache._redis_retry_at = float("inf")
+    uncached = asyncio.run(measure(token, requests, concurrency))
+    print(f"  cache off: {uncached:,.0f} req/s")
+
+    user_cache.ttl = ttl
+    user_cache._redis_retry_at = 0.0
+    cached = asyncio.run(measure(token, requests, concurrency))
+    print(f"  cache on:  {cached:,.0f} req/s ({cached / uncached:.1f}x)")
+    print(f"  {user_cache.stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark /api/auth/me throughput")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    run_benchmark(args.requests, args.concurrency)
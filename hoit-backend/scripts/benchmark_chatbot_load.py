@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+챗봇 동시 요청 지연 시간 벤치마크
+
+로컬 스텁 Bedrock 서버(응답마다 --delay초 대기)를 띄우고 boto3가 그 서버로 요청하도록
+한 뒤, /api/v1/chatbot/에 동시 요청을 보내면서 같은 이벤트 루프에서 /health를 주기적으로
+호출해 관련 없는 요청의 지연 시간을 측정합니다. AWS 자격증명이나 네트워크가 필요 없습니다.
+--inline은 Bedrock 호출을 이벤트 루프에서 직접 실행해 기존 동작과 비교합니다.
+
+사용법:
+    python scripts/benchmark_chatbot_load.py
+    python scripts/benchmark_chatbot_load.py --requests 16 --delay 1.0 --inline
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+# Add the backend root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+STUB_COMPLETION = """<summary>첫 번째 자막 색상을 변경했습니다</summary>
+<json_patch_chunk index="1" total="1" ops="1">
+<![CDATA[
+[{"op": "replace", "path": "/cues/0/root/style/color", "value": "#ff0000"}]
+]]>
+</json_patch_chunk>
+<apply_order>1</apply_order>"""
+
+
+class StubBedrockHandler(BaseHTTPRequestHandler):
+    """InvokeModel / Converse 응답을 delay초 뒤 돌려주는 스텁"""
+
+    delay = 1.0
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(self.delay)
+        usage = {"input_tokens": 100, "output_tokens": 50}
+        if self.path.endswith("/converse"):
+            body = {
+                "output": {
+                    "message": {
+                        "role": "assistant",
+                        "content": [{"text": STUB_COMPLETION}],
+                    }
+                },
+                "stopReason": "end_turn",
+                "usage": {"inputTokens": 100, "outputTokens": 50, "totalTokens": 150},
+                "metrics": {"latencyMs": int(self.delay * 1000)},
+            }
+        else:
+            body = {
+                "id": "msg_stub",
+                "type": "message",
+                "role": "assistant",
+                "content": [{"type": "text", "text": STUB_COMPLETION}],
+                "stop_reason": "end_turn",
+                "usage": usage,
+            }
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stub(delay: float) -> ThreadingHTTPServer:
+    StubBedrockHandler.delay = delay
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubBedrockHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    # 앱(boto3 클라이언트)을 import하기 전에 설정해야 함
+    os.environ[
+        "AWS_ENDPOINT_URL_BEDROCK_RUNTIME"
+    ] = f"http://127.0.0.1:{server.server_address[1]}"
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "benchmark")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "benchmark")
+    return server
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+
+async def measure(app, requests: int, health_interval: float):
+    transport = httpx.ASGITransport(app=app)
+    chat_latencies = []
+    health_latencies = []
+    statuses = {}
+    done = asyncio.Event()
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://benchmark", timeout=None
+    ) as client:
+
+        async def chat(i: int):
+            started = time.perf_counter()
+            response = await client.post(
+                "/api/v1/chatbot/",
+                json={
+                    "prompt": f"첫 번째 자막을 빨간색으로 바꿔줘 ({i})",
+                    "scenario_data": {"version": "2.0", "cues": []},
+                },
+            )
+            chat_latencies.append(time.perf_counter() - started)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        async def health():
+            while not done.is_set():
+                started = time.perf_counter()
+                (await client.get("/health")).raise_for_status()
+                health_latencies.append(time.perf_counter() - started)
+                await asyncio.sleep(health_interval)
+
+        probe = asyncio.create_task(health())
+        started = time.perf_counter()
+        await asyncio.gather(*(chat(i) for i in range(requests)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await probe
+
+    return elapsed, chat_latencies, health_latencies, statuses
+
+
+def run_benchmark(requests: int, delay: float, inline: bool, health_interval: float):
+    server = start_stub(delay)
+
+    from app.main import app
+    from app.services.bedrock_executor import bedrock_executor
+
+    if inline:
+        # 기존 동작: 이벤트 루프에서 Bedrock 직접 호출
+        async def run_inline(fn, *args, request=None, **kwargs):
+            return fn(*args, **kwargs)
+
+        bedrock_executor.run = run_inline
+
+    try:
+        mode = (
+            "inline"
+            if inline
+            else f"executor (concurrency {bedrock_executor.max_concurrency})"
+        )
+        print(f"📋 동시 챗봇 요청 {requests}회, 스텁 지연 {delay:.1f}s, {mode}")
+        elapsed, chat_latencies, health_latencies, statuses = asyncio.run(
+            measure(app, requests, health_interval)
+        )
+        print(f"  total:  {elapsed * 1000:.0f}ms, status {statuses}")
+        print(
+            f"  chat:   p50 {percentile(chat_latencies, 0.5):.0f}ms, "
+            f"p99 {percentile(chat_latencies, 0.99):.0f}ms"
+        )
+        print(
+            f"  health: p50 {percentile(health_latencies, 0.5):.1f}ms, "
+            f"p99 {percentile(health_latencies, 0.99):.1f}ms, "
+            f"max {max(health_latencies) * 1000:.1f}ms ({len(health_latencies)} probes)"
+        )
+        if not inline:
+            print(f"  {bedrock_executor.stats()}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark chatbot load latency")
+    parser.add_argument("--requests", type=int, default=8)
+    parser.add_argument("--delay", type=float, default=1.0)
+    parser.add_argument("--inline", action="store_true")
+    parser.add_argument("--health-interval", type=float, default=0.01)
+    args = parser.parse_args()
+
+    run_benchmark(args.requests, args.delay, args.inline, args.health_interval)
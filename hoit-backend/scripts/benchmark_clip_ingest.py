@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+clips/words 벌크 적재 벤치마크
+
+3시간 분량 전사 결과(기본 30,000 단어)를 가진 임시 프로젝트를 만들어
+ClipTableService.replace_project_clips 소요 시간을 측정합니다.
+측정이 끝나면 트랜잭션을 롤백하므로 DB에 데이터가 남지 않습니다.
+
+사용법:
+    python scripts/benchmark_clip_ingest.py
+    python scripts/benchmark_clip_ingest.py --words 30000 --words-per-clip 10 --runs 3
+"""
+
+import argparse
+import os
+import sys
+import time
+import uuid
+
+# Add the backend root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.database import SessionLocal  # noqa: E402
+from app.models.project import Project  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.services.clip_table_service import ClipTableService  # noqa: E402
+
+
+def build_transcript(word_count: int, words_per_clip: int, duration: float):
+    """word_count개 단어를 duration초에 고르게 배치한 클립 JSON 생성"""
+    step = duration / word_count
+    clips = []
+    for clip_index in range(0, word_count, words_per_clip):
+        words = []
+        for word_index in range(
+            clip_index, min(clip_index + words_per_clip, word_count)
+        ):
+            start = word_index * step
+            words.append(
+                {
+                    "id": f"word-{clip_index}-{word_index}",
+                    "text": f"단어{word_index}",
+                    "start": round(start, 3),
+                    "end": round(start + step * 0.9, 3),
+                    "is_editable": True,
+                    "confidence": 0.95,
+                    "applied_assets": None,
+                }
+            )
+        clips.append(
+            {
+                "id": f"clip-{clip_index}",
+                "timeline": "",
+                "speaker": f"Speaker {clip_index % 3 + 1}",
+                "subtitle": " ".join(word["text"] for word in words),
+                "full_text": " ".join(word["text"] for word in words),
+                "duration": "",
+                "thumbnail": None,
+                "words": words,
+            }
+        )
+    return clips
+
+
+def run_benchmark(word_count: int, words_per_clip: int, runs: int):
+    clips = build_transcript(word_count, words_per_clip, duration=3 * 60 * 60)
+    db = SessionLocal()
+
+    try:
+        user = db.query(User).first()
+        if not user:
+            print("❌ 벤치마크용 사용자가 없습니다. 시드 데이터를 먼저 생성하세요.")
+            return
+
+        project = Project(
+            id=f"benchmark-{uuid.uuid4()}",
+            user_id=user.id,
+            name="clip ingest benchmark",
+            clips=clips,
+            version=1,
+        )
+        db.add(project)
+        db.flush()
+
+        print(f"📋 {db.get_bind().dialect.name}: 클립 {len(clips)}개, 단어 {word_count}개")
+
+        for run in range(1, runs + 1):
+            started = time.perf_counter()
+            counts = ClipTableService.replace_project_clips(db, project.id, clips)
+            db.flush()
+            elapsed = time.perf_counter() - started
+            print(
+                f"  run {run}: {elapsed * 1000:.1f}ms "
+                f"(clips {counts['clips']}, words {counts['words']})"
+            )
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark clips/words ingestion")
+    parser.add_argument("--words", type=int, default=30000)
+    parser.add_argument("--words-per-clip", type=int, default=10)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    run_benchmark(args.words, args.words_per_clip, args.runs)
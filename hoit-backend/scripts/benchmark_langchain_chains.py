@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+LangChain 병렬/다단계 체인 벤치마크
+
+benchmark_chatbot_load.py의 스텁 Bedrock 서버(응답마다 --delay초 대기)를 띄우고
+
+- 병렬 체인: 작업을 하나씩 호출하던 기존 방식과 create_parallel_chain(동시 호출 제한)의
+  전체 소요 시간을 비교하고,
+- 다단계 체인: 단계마다 프롬프트에 들어가는 이전 단계 결과 글자 수를 기존 누적 방식과
+  요약 방식(CHATBOT_CHAIN_CONTEXT_CHARS)으로 비교합니다.
+
+AWS 자격증명이나 네트워크가 필요 없습니다.
+
+사용법:
+    python scripts/benchmark_langchain_chains.py
+    python scripts/benchmark_langchain_chains.py --tasks 16 --fanout 4 --steps 8 --delay 0.5
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add the backend root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import benchmark_chatbot_load  # noqa: E402
+
+# 단계 결과가 누적될 때 차이가 드러나도록 긴 응답 사용
+LONG_COMPLETION = " ".join(
+    f"{i}번째 분석 결과입니다. 자막 타이밍과 화자 구분을 검토했고 개선점을 정리했습니다." for i in range(1, 31)
+)
+
+
+def run_parallel(service, tasks: int, fanout: int, timeout: float):
+    prompts = [{"name": f"task_{i}", "prompt": f"작업 {i}"} for i in range(tasks)]
+
+    started = time.perf_counter()
+    for task in prompts:
+        service.invoke_claude_with_chain(prompt=task["prompt"])
+    sequential = time.perf_counter() - started
+
+    started = time.perf_counter()
+    result = service.create_parallel_chain(
+        prompts, max_concurrency=fanout, task_timeout=timeout
+    )
+    parallel = time.perf_counter() - started
+    print(f"🔀 병렬 체인 작업 {tasks}개 (동시 {fanout}, 제한 {timeout}s)")
+    print(f"  순차 호출 (기존)     {sequential * 1000:8.0f}ms")
+    print(
+        f"  create_parallel_chain {parallel * 1000:8.0f}ms  "
+        f"실패 {len(result['failed_tasks'])}개"
+    )
+
+
+def run_multi_step(service, steps: int, context_chars: int):
+    result = service.create_multi_step_chain(
+        [{"step": f"step_{i}", "prompt": f"{i}단계 작업"} for i in range(1, steps + 1)]
+    )
+    print(f"\n🪜 다단계 체인 {steps}단계 (요약 상한 {context_chars}자)")
+    print("  단계   기존 누적 컨텍스트   요약 컨텍스트")
+    unbounded = 0
+    for name, step in result["multi_step_results"].items():
+        print(f"  {name:<8} {unbounded:>12,}자 {step['context_chars']:>12,}자")
+        unbounded += len(f"\n[{name}] {step['response']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark LangChain chains")
+    parser.add_argument("--tasks", type=int, default=8)
+    parser.add_argument("--fanout", type=int, default=4)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--steps", type=int, default=6)
+    parser.add_argument("--delay", type=float, default=0.5)
+    args = parser.parse_args()
+
+    benchmark_chatbot_load.STUB_COMPLETION = LONG_COMPLETION
+    benchmark_chatbot_load.start_stub(args.delay)
+
+    from app.core.config import settings  # noqa: E402
+    from app.services.langchain_bedrock_service import (  # noqa: E402
+        langchain_bedrock_service,
+    )
+
+    run_parallel(langchain_bedrock_service, args.tasks, args.fanout, args.timeout)
+    run_multi_step(
+        langchain_bedrock_service, args.steps, settings.CHATBOT_CHAIN_CONTEXT_CHARS
+    )
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+동시 로그인 지연 시간 벤치마크
+
+임시 사용자를 만들어 /api/auth/login을 동시에 여러 번 호출하면서, 같은 이벤트 루프에서
+/health를 주기적으로 호출해 관련 없는 요청의 지연 시간도 함께 측정합니다.
+--inline은 비밀번호 검증을 이벤트 루프에서 직접 실행해 기존 동작과 비교합니다.
+측정이 끝나면 임시 사용자를 삭제합니다.
+
+사용법:
+    python scripts/benchmark_login_concurrency.py
+    python scripts/benchmark_login_concurrency.py --logins 64 --inline
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+
+import httpx
+
+# Add the backend root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.database import SessionLocal  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.services.auth_service import auth_service  # noqa: E402
+from app.services.password_hasher import password_hasher  # noqa: E402
+
+PASSWORD = "benchmark-password"  # nosec B105
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+
+async def measure(email: str, logins: int, health_interval: float):
+    transport = httpx.ASGITransport(app=app)
+    login_latencies = []
+    health_latencies = []
+    statuses = {}
+    done = asyncio.Event()
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://benchmark"
+    ) as client:
+
+        async def login():
+            started = time.perf_counter()
+            response = await client.post(
+                "/api/auth/login", json={"email": email, "password": PASSWORD}
+            )
+            login_latencies.append(time.perf_counter() - started)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        async def health():
+            while not done.is_set():
+                started = time.perf_counter()
+                (await client.get("/health")).raise_for_status()
+                health_latencies.append(time.perf_counter() - started)
+                await asyncio.sleep(health_interval)
+
+        probe = asyncio.create_task(health())
+        started = time.perf_counter()
+        await asyncio.gather(*(login() for _ in range(logins)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await probe
+
+    return elapsed, login_latencies, health_latencies, statuses
+
+
+def run_benchmark(logins: int, inline: bool, health_interval: float):
+    if inline:
+        # 기존 동작: 이벤트 루프에서 bcrypt 직접 실행
+        async def run_inline(fn, *args):
+            return fn(*args)
+
+        password_hasher.run = run_inline
+
+    db = SessionLocal()
+    email = f"benchmark-{uuid.uuid4().hex[:8]}@example.com"
+    user = User(
+        username="login benchmark",
+        email=email,
+        password_hash=auth_service.get_password_hash(PASSWORD),
+    )
+    db.add(user)
+    db.commit()
+
+    try:
+        mode = "inline" if inline else f"pool ({password_hasher.workers} workers)"
+        print(f"📋 동시 로그인 {logins}회, {mode}")
+        elapsed, login_latencies, health_latencies, statuses = asyncio.run(
+            measure(email, logins, health_interval)
+        )
+        print(f"  total:  {elapsed * 1000:.0f}ms, status {statuses}")
+        print(
+            f"  login:  p50 {percentile(login_latencies, 0.5):.0f}ms, "
+            f"p99 {percentile(login_latencies, 0.99):.0f}ms"
+        )
+        print(
+            f"  health: p50 {percentile(health_latencies, 0.5):.1f}ms, "
+            f"p99 {percentile(health_latencies, 0.99):.1f}ms, "
+            f"max {max(health_latencies) * 1000:.1f}ms ({len(health_latencies)} probes)"
+        )
+        if not inline:
+            print(f"  {password_hasher.stats()}")
+    finally:
+        db.query(User).filter(User.id == user.id).delete()
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark concurrent login latency")
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--inline", action="store_true")
+    parser.add_argument("--health-interval", type=float, default=0.01)
+    args = parser.parse_args()
+
+    run_benchmark(args.logins, args.inline, args.health_interval)
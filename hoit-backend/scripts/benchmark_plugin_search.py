@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+플러그인 검색 인덱스 벤치마크
+
+로컬 manifest 디렉터리와 에셋 스토어 JSON으로 레지스트리 항목을 만들어 BM25 인덱스를
+구성하고, 대표 애니메이션 요청마다 후보 플러그인, 1순위 적중 여부, 검색 시간, 프롬프트에
+들어가는 플러그인 목록의 추정 토큰(기존 고정 목록 대비)을 출력합니다. S3/DB 연결이
+필요 없습니다.
+
+사용법:
+    python scripts/benchmark_plugin_search.py
+    python scripts/benchmark_plugin_search.py --plugins ../hoit-frontend/public/plugin/legacy
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add the backend root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.plugin_search import (  # noqa: E402
+    FALLBACK_PLUGIN_CATALOG,
+    PluginSearchIndex,
+)
+from app.services.scenario_context import estimate_tokens  # noqa: E402
+
+FRONTEND_PUBLIC = Path(__file__).resolve().parents[2] / "hoit-frontend" / "public"
+
+# (요청, 기대하는 1순위 플러그인 이름)
+QUERIES = [
+    ("첫 번째 자막에 페이드인 효과 넣어줘", "fadein"),
+    ("자막이 빙글빙글 돌게 해줘", "spin"),
+    ("3D로 회전하면서 나타나게", "rotation"),
+    ("반짝반짝 빛나게 해줘", "glow"),
+    ("글자가 하나씩 타이핑되게", "typewriter"),
+    ("자막이 통통 튀게", "elastic"),
+    ("화난 느낌으로 흔들리게", "cwi-loud"),
+    ("속삭이듯이 작게", "cwi-whisper"),
+    ("불꽃 효과 넣어줘", "flames"),
+    ("아래에서 위로 올라오게", "slideup"),
+    ("글리치 효과 적용", "glitch"),
+    ("단어마다 커졌다 작아지는 효과", "scalepop"),
+    ("심장 뛰듯이 두근두근", "pulse"),
+    ("자석에 끌려오듯 모이게", "magnetic"),
+    ("make the text glow", "glow"),
+    ("add a typewriter animation", "typewriter"),
+]
+
+
+class LocalRegistry:
+    """PluginSearchIndex가 쓰는 레지스트리 인터페이스만 흉내 낸 로컬 스냅샷"""
+
+    def __init__(self, entries):
+        self._entries = entries
+        self.loaded_at = 0.0
+
+    def ensure_fresh(self, db=None) -> bool:
+        return True
+
+    def list_plugins(self):
+        return self._entries
+
+
+def load_entries(plugins_dir: Path, assets_path: Path):
+    assets = {}
+    if assets_path.exists():
+        data = json.loads(assets_path.read_text(encoding="utf-8"))
+        assets = {asset["pluginKey"]: asset for asset in data.get("assets", data)}
+
+    entries = []
+    for manifest_path in sorted(plugins_dir.glob("**/manifest.json")):
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        plugin_key = f"{manifest['name']}@2.0.0"
+        asset = assets.get(plugin_key, {})
+        entries.append(
+            {
+                "plugin_key": plugin_key,
+                "manifest": manifest,
+                "title": asset.get("title"),
+                "category": asset.get("category"),
+                "description": asset.get("description"),
+                "tags": asset.get("tags", []),
+            }
+        )
+    return entries
+
+
+def run_benchmark(plugins_dir: Path, assets_path: Path):
+    entries = load_entries(plugins_dir, assets_path)
+    index = PluginSearchIndex(LocalRegistry(entries))
+
+    started = time.perf_counter()
+    index.search("warm up")
+    print(
+        f"📋 플러그인 {len(entries)}개 색인 {(time.perf_counter() - started) * 1000:.1f}ms, "
+        f"기존 고정 목록 ~{estimate_tokens(FALLBACK_PLUGIN_CATALOG)} tokens"
+    )
+
+    hits = 0
+    for query, expected in QUERIES:
+        started = time.perf_counter()
+        catalog = index.build_catalog(query)
+        elapsed = (time.perf_counter() - started) * 1000
+        names = [key.split("@")[0] for key in catalog["candidates"]]
+        hit = bool(names) and names[0] == expected
+        hits += hit
+        print(
+            f"  {'✅' if hit else '❌'} {query:<28} {', '.join(names) or '-':<32} "
+            f"~{estimate_tokens(catalog['catalog']):>4} tokens  {elapsed:5.2f}ms"
+        )
+    print(f"\n1순위 적중 {hits}/{len(QUERIES)} ({hits / len(QUERIES):.0%})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark plugin retrieval")
+    parser.add_argument(
+        "--plugins", type=Path, default=FRONTEND_PUBLIC / "plugin" / "legacy"
+    )
+    parser.add_argument(
+        "--assets",
+        type=Path,
+        default=FRONTEND_PUBLIC / "asset-store" / "assets-database.json",
+    )
+    args = parser.parse_args()
+
+    run_benchmark(args.plugins, args.assets)
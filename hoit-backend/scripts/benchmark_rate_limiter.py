@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter 처리량 벤치마크
+
+설정된 Redis(REDIS_URL)에 대해 RateLimiter.hit를 동시에 호출해 워커 하나가 처리할 수 있는
+checks/sec를 측정합니다. 허용 경로(매번 Lua 스크립트 실행)와 한도 초과 경로(메모리에서
+거절)를 따로 측정하며, 측정용 키는 끝난 뒤 삭제합니다.
+
+사용법:
+    python scripts/benchmark_rate_limiter.py
+    python scripts/benchmark_rate_limiter.py --checks 50000 --concurrency 100 --keys 1000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import uuid
+
+# Add the backend root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.redis_client import REDIS_URL  # noqa: E402
+from app.services.rate_limiter import RateLimiter  # noqa: E402
+
+
+async def measure(
+    limiter: RateLimiter, prefix: str, checks: int, concurrency: int, keys: int, limit
+):
+    remaining = checks
+
+    async def worker(offset: int):
+        nonlocal remaining
+        index = offset
+        while remaining > 0:
+            remaining -= 1
+            await limiter.hit(f"{prefix}:{index % keys}", limit, 60)
+            index += concurrency
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    return checks / (time.perf_counter() - started)
+
+
+async def run_benchmark(checks: int, concurrency: int, keys: int):
+    limiter = RateLimiter(REDIS_URL)
+    prefix = f"ratelimit:benchmark:{uuid.uuid4().hex[:8]}"
+    try:
+        print(f"📋 {REDIS_URL}: {checks}회, 동시 {concurrency}, 키 {keys}개")
+        allowed = await measure(
+            limiter, f"{prefix}:allowed", checks, concurrency, keys, checks
+        )
+        print(f"  allowed (Lua): {allowed:,.0f} checks/s")
+        blocked = await measure(
+            limiter, f"{prefix}:blocked", checks, concurrency, keys, 1
+        )
+        print(f"  over limit:    {blocked:,.0f} checks/s")
+    finally:
+        async for key in limiter._client.scan_iter(match=f"{prefix}:*"):
+            await limiter._client.delete(key)
+        await limiter.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark Redis rate limiter")
+    parser.add_argument("--checks", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--keys", type=int, default=100)
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.checks, args.concurrency, args.keys))
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+GPU 렌더 요청 본문 벤치마크
+
+합성 프로젝트(--cues개 자막, 자막당 --words개 단어)로 MotionText 시나리오를 만들고
+gpu_tasks와 같은 방식으로 GPU 서버 요청을 구성해 다음을 비교합니다.
+
+- 기존 방식: aiohttp json= 직렬화(json.dumps 기본 구분자) 본문과 dict 그대로 남기던 로그
+- 기본값 제거 + minify 본문
+- GPU_REQUEST_CONTENT_ENCODING별(identity, gzip, zstd) 압축 크기와 인코딩 시간
+
+DB, AWS, GPU 서버 연결이 필요 없습니다.
+
+사용법:
+    python scripts/benchmark_render_payload.py
+    python scripts/benchmark_render_payload.py --cues 1000 --words 5 --runs 5
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+# Add the backend root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.scenario_builder import ScenarioBuilder  # noqa: E402
+from app.utils.render_utils import (  # noqa: E402
+    encode_payload,
+    minify_json,
+    strip_payload_defaults,
+    summarize_scenario,
+)
+
+VOCABULARY = "오늘은 날씨가 정말 좋네요 우리 함께 산책 갈까요 그리고 커피 한잔 hello world".split()
+
+ENCODINGS = ("identity", "gzip", "zstd")
+
+
+def build_request(cue_count: int, words_per_cue: int):
+    random.seed(42)
+    clips = []
+    t = 0.0
+    for c in range(cue_count):
+        words = []
+        for w in range(words_per_cue):
+            words.append(
+                {
+                    "id": f"word-{c}-{w}",
+                    "text": random.choice(VOCABULARY),
+                    "start": round(t, 2),
+                    "end": round(t + 0.4, 2),
+                }
+            )
+            t += 0.45
+        t += 0.5
+        clips.append({"id": str(c), "speaker": f"SPEAKER_0{c % 2}", "words": words})
+    scenario = ScenarioBuilder().build(
+        {}, {"clips": clips, "speakers": ["SPEAKER_00", "SPEAKER_01"]}
+    )
+    return {
+        "jobId": "benchmark-job",
+        "videoUrl": "https://example.com/video.mp4",
+        "scenario": scenario,
+        "options": {"width": 1920, "height": 1080, "fps": 30},
+        "callbackUrl": "http://localhost:8000/api/render/callback",
+        "plugins": [],
+        "timeline": None,
+    }
+
+
+def measure(fn, runs: int):
+    """(결과, 중앙값 ms)"""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return result, statistics.median(timings)
+
+
+def run_benchmark(cue_count: int, words_per_cue: int, runs: int):
+    request = build_request(cue_count, words_per_cue)
+    word_count = cue_count * words_per_cue
+    print(f"📦 cue {cue_count:,}개 / 단어 {word_count:,}개, 중앙값 {runs}회")
+
+    legacy_body = json.dumps(request).encode("utf-8")
+    legacy_log = f"GPU 서버 요청 데이터: {request}"
+    print(f"  기존 본문 (json=)        {len(legacy_body) / 1024:>9,.1f} KB")
+    print(f"  기존 로그 한 줄          {len(legacy_log.encode('utf-8')) / 1024:>9,.1f} KB")
+
+    raw_body, minify_ms = measure(
+        lambda: minify_json(strip_payload_defaults(request)), runs
+    )
+    print(
+        f"  기본값 제거 + minify     {len(raw_body) / 1024:>9,.1f} KB  "
+        f"{minify_ms:6.1f}ms"
+    )
+
+    for encoding in ENCODINGS:
+        (body, applied), encode_ms = measure(
+            lambda: encode_payload(raw_body, encoding), runs
+        )
+        print(
+            f"  Content-Encoding {applied:<8}{len(body) / 1024:>9,.1f} KB  "
+            f"{encode_ms:6.1f}ms (minify 제외)"
+        )
+
+    summary = summarize_scenario(request["scenario"], len(raw_body))
+    log_line = (
+        f"GPU 서버 요청 데이터 - Job ID: {request['jobId']}, cues: {summary['cues']}, "
+        f"scenario: {summary['scenario_bytes']}B "
+        f"(sha256 {summary['scenario_sha256']}), "
+        f"body: {len(raw_body)}B -> {len(raw_body)}B (identity), encode: 0.0ms"
+    )
+    print(f"  요약 로그 한 줄          {len(log_line.encode('utf-8')):>9,} B")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark GPU render request body")
+    parser.add_argument("--cues", type=int, default=1000)
+    parser.add_argument("--words", type=int, default=5)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    run_benchmark(args.cues, args.words, args.runs)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+시나리오 컨텍스트 선택 벤치마크
+
+합성 프로젝트(--cues개 자막)로 MotionText 시나리오를 만들고, 대표적인 편집 지시마다
+프롬프트에 들어가는 cue 수, 추정 입력 토큰(기존 들여쓰기 JSON 전체 대비), 선택 시간을
+출력합니다. DB나 AWS 연결이 필요 없습니다.
+
+사용법:
+    python scripts/benchmark_scenario_context.py
+    python scripts/benchmark_scenario_context.py --cues 2000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+# Add the backend root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.scenario_builder import ScenarioBuilder  # noqa: E402
+from app.services.scenario_context import (  # noqa: E402
+    estimate_tokens,
+    select_scenario_context,
+)
+
+VOCABULARY = "오늘은 날씨가 정말 좋네요 우리 함께 산책 갈까요 그리고 커피 한잔 hello world".split()
+
+PROMPTS = [
+    "첫 번째 자막을 빨간색으로 바꿔줘",
+    "마지막 문장에 fadein 효과 넣어줘",
+    "첫 번째 자막의 두 번째 단어에 glow",
+    "1:23에 나오는 자막 크게",
+    "10초부터 20초까지 자막에 bounce",
+    "'안녕하세요' 단어에 glow 추가",
+    "make the second subtitle bold",
+    "화자 2의 자막을 파란색으로",
+    "모든 자막에 fadein 추가",
+    # 범위를 넓히는 표현 (전체를 보내야 함)
+    "첫 번째 자막만 빼고 모두 크게",
+    "마지막 두 줄을 굵게",
+    "처음 세 개 자막에 glow",
+    "Change the last two lines to bold",
+    "make every subtitle except the first one red",
+]
+
+
+def build_scenario(cue_count: int):
+    random.seed(42)
+    clips = []
+    t = 0.0
+    for c in range(cue_count):
+        words = []
+        for w in range(random.randint(4, 14)):
+            text = "안녕하세요" if c == cue_count // 2 and w == 0 else None
+            words.append(
+                {
+                    "id": f"word-{c}-{w}",
+                    "text": text or random.choice(VOCABULARY),
+                    "start": round(t, 2),
+                    "end": round(t + 0.4, 2),
+                }
+            )
+            t += 0.45
+        t += 0.5
+        clips.append({"id": str(c), "speaker": f"SPEAKER_0{c % 2}", "words": words})
+    return ScenarioBuilder().build(
+        {}, {"clips": clips, "speakers": ["SPEAKER_00", "SPEAKER_01"]}
+    )
+
+
+def run_benchmark(cue_count: int):
+    scenario = build_scenario(cue_count)
+    pretty_tokens = estimate_tokens(json.dumps(scenario, indent=2, ensure_ascii=False))
+    print(f"📋 cue {cue_count}개, 기존 프롬프트(들여쓰기 JSON) ~{pretty_tokens:,} tokens")
+
+    for prompt in PROMPTS:
+        started = time.perf_counter()
+        context = select_scenario_context(scenario, prompt)
+        elapsed = (time.perf_counter() - started) * 1000
+        sent = context.stats["sent_tokens"]
+        print(
+            f"  {prompt:<32} cues {context.stats['sent_cues']:>5}  "
+            f"~{sent:>7,} tokens ({1 - sent / pretty_tokens:6.1%} saved)  "
+            f"{elapsed:5.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark scenario context selection")
+    parser.add_argument("--cues", type=int, default=300)
+    args = parser.parse_args()
+
+    run_benchmark(args.cues)
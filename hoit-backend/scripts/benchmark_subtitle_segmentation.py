@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+자막 클립 분할 벤치마크
+
+1시간 분량(기본 초당 2.5단어, 약 9,000 단어) ML 결과 형식의 가짜 전사를 만들어
+subtitle_segmenter.segment_result 소요 시간을 측정합니다. DB는 사용하지 않습니다.
+
+사용법:
+    python scripts/benchmark_subtitle_segmentation.py
+    python scripts/benchmark_subtitle_segmentation.py --hours 3 --words-per-second 3 --runs 5
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add the backend root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.subtitle_segmentation import subtitle_segmenter  # noqa: E402
+
+VOCABULARY = ["그래서", "오늘은", "학교에서", "정말?", "맞아.", "있잖아,", "the", "show."]
+
+
+def build_result(hours: float, words_per_second: float, speakers: int = 3):
+    """hours 시간 분량의 segments[].words[] 결과 생성 (세그먼트마다 화자가 바뀔 수 있음)"""
+    rng = random.Random(0)
+    word_count = int(hours * 3600 * words_per_second)
+    mean_duration = 1.0 / words_per_second
+    segments = []
+    cursor = 0.0
+    speaker = 0
+    produced = 0
+    while produced < word_count:
+        words = []
+        for _ in range(min(rng.randint(5, 40), word_count - produced)):
+            duration = mean_duration * rng.uniform(0.5, 1.0)
+            words.append(
+                {
+                    "word": rng.choice(VOCABULARY),
+                    "start": round(cursor, 3),
+                    "end": round(cursor + duration, 3),
+                    "confidence": 0.95,
+                    "volume_db": rng.uniform(-35, -10),
+                    "pitch_hz": rng.uniform(90, 300),
+                }
+            )
+            cursor += duration + rng.choice([0.0, 0.0, 0.05, 0.2, 0.9]) * mean_duration
+        produced += len(words)
+        segments.append(
+            {
+                "start": words[0]["start"],
+                "end": words[-1]["end"],
+                "speaker": {"speaker_id": f"SPEAKER_{speaker:02d}"},
+                "text": " ".join(word["word"] for word in words),
+                "words": words,
+            }
+        )
+        speaker = (speaker + rng.randint(0, 1)) % speakers
+    return {"metadata": {"duration": cursor, "language": "ko"}, "segments": segments}
+
+
+def run_benchmark(hours: float, words_per_second: float, runs: int):
+    result = build_result(hours, words_per_second)
+    word_count = sum(len(segment["words"]) for segment in result["segments"])
+    print(f"📋 {hours}시간, 세그먼트 {len(result['segments'])}개, 단어 {word_count}개")
+
+    for run in range(1, runs + 1):
+        started = time.perf_counter()
+        segmentation = subtitle_segmenter.segment_result(result)
+        elapsed = time.perf_counter() - started
+        stats = segmentation["stats"]
+        print(
+            f"  run {run}: {elapsed * 1000:.1f}ms "
+            f"(clips {stats['clips']}, avg {stats['avg_duration']}s, "
+            f"avg cps {stats['avg_cps']}, cps violations {stats['cps_violations']})"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark subtitle segmentation")
+    parser.add_argument("--hours", type=float, default=1.0)
+    parser.add_argument("--words-per-second", type=float, default=2.5)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    run_benchmark(args.hours, args.words_per_second, args.runs)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+전사 결과 전송 형식 벤치마크 (JSON vs MessagePack 열 형식 vs Arrow IPC)
+
+/api/results/{job_id}가 보내는 세 형식의 크기와 인코딩/디코딩 시간을 비교합니다.
+기본은 app/data/mock_result.json(143초)이며, --hours를 주면 해당 길이로 반복 확장합니다.
+
+사용법:
+    python scripts/benchmark_transcript_formats.py
+    python scripts/benchmark_transcript_formats.py --hours 1 --runs 5
+"""
+
+import argparse
+import copy
+import gzip
+import json
+import os
+import sys
+import time
+
+# Add the backend root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.schemas.ml_response import simplify_ml_result  # noqa: E402
+from app.services.transcript_columnar import (  # noqa: E402
+    columns_to_segments,
+    decode_msgpack,
+    encode_result,
+)
+
+MOCK_RESULT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "app",
+    "data",
+    "mock_result.json",
+)
+
+
+def load_result(hours: float):
+    """mock 결과를 hours 시간 분량이 되도록 시간을 밀어가며 반복"""
+    with open(MOCK_RESULT, encoding="utf-8") as f:
+        base = json.load(f)
+    # mock에는 텍스트/단어가 비어 있는 세그먼트가 있어 JSON 간소화가 실패하므로 제외
+    base["segments"] = [
+        segment
+        for segment in base["segments"]
+        if segment.get("text") and segment.get("words")
+    ]
+    if not hours:
+        return base
+
+    duration = base["metadata"]["duration"]
+    result = copy.deepcopy(base)
+    result["segments"] = []
+    offset = 0.0
+    while offset < hours * 3600:
+        for segment in base["segments"]:
+            segment = copy.deepcopy(segment)
+            segment["start_time"] += offset
+            segment["end_time"] += offset
+            for word in segment.get("words") or []:
+                word["start"] += offset
+                word["end"] += offset
+            result["segments"].append(segment)
+        offset += duration
+    return result
+
+
+def measure(label, encode, decode, runs):
+    encoded = encode()
+    started = time.perf_counter()
+    for _ in range(runs):
+        encode()
+    encode_ms = (time.perf_counter() - started) * 1000 / runs
+
+    started = time.perf_counter()
+    for _ in range(runs):
+        decode(encoded)
+    decode_ms = (time.perf_counter() - started) * 1000 / runs
+
+    print(
+        f"  {label:<10} {len(encoded) / 1024:>9.1f} KB "
+        f"(gzip {len(gzip.compress(encoded)) / 1024:>8.1f} KB)  "
+        f"encode {encode_ms:>7.1f}ms  decode {decode_ms:>7.1f}ms"
+    )
+
+
+def run_benchmark(hours: float, runs: int):
+    result = load_result(hours)
+    words = sum(len(segment.get("words") or []) for segment in result["segments"])
+    print(f"📋 세그먼트 {len(result['segments'])}개, 단어 {words}개")
+
+    job_id = "benchmark"
+    measure(
+        "json",
+        lambda: json.dumps(
+            simplify_ml_result(result, job_id).model_dump(), ensure_ascii=False
+        ).encode("utf-8"),
+        json.loads,
+        runs,
+    )
+    measure(
+        "msgpack",
+        lambda: encode_result(result, job_id, "msgpack"),
+        lambda data: columns_to_segments(decode_msgpack(data)),
+        runs,
+    )
+    try:
+        import pyarrow as pa
+    except ImportError:
+        print("  arrow      pyarrow 미설치 - 건너뜀")
+        return
+    measure(
+        "arrow",
+        lambda: encode_result(result, job_id, "arrow"),
+        lambda data: pa.ipc.open_stream(data).read_all(),
+        runs,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark transcript wire formats")
+    parser.add_argument("--hours", type=float, default=0.0)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    run_benchmark(args.hours, args.runs)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+챗봇 요청 유형 분류기 평가
+
+app/data/intent_examples.jsonl로 학습한 로컬 분류기를 학습에 쓰지 않은 레이블 세트
+(기본 scripts/intent_eval.jsonl)로 평가해 정확도, 혼동 행렬, 오분류, 분류 지연 시간
+p50/p99, 그리고 신뢰도 기준별 LLM 위임 비율을 출력합니다. AWS 연결이 필요 없습니다.
+
+사용법:
+    python scripts/evaluate_intent_classifier.py
+    python scripts/evaluate_intent_classifier.py --labelled my_set.jsonl --min-confidence 0.6
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add the backend root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.intent_classifier import (  # noqa: E402
+    LABELS,
+    IntentClassifier,
+    load_examples,
+)
+
+DEFAULT_LABELLED = Path(__file__).resolve().parent / "intent_eval.jsonl"
+
+
+def run_evaluation(labelled: Path, min_confidence: float, repeat: int):
+    classifier = IntentClassifier()
+    started = time.perf_counter()
+    classifier.warm_up()
+    print(
+        f"📚 학습 {(time.perf_counter() - started) * 1000:.0f}ms, "
+        f"학습 세트 정확도 {classifier.train_accuracy:.1%}"
+    )
+
+    examples = load_examples(labelled)
+    report = classifier.evaluate(examples, min_confidence)
+    print(f"📋 평가 세트 {labelled.name}: {report['total']}개")
+    print(f"  정확도 (전부 로컬)              {report['accuracy']:.1%}")
+    print(
+        f"  신뢰도 ≥ {min_confidence}: 로컬 정확도 {report['local_accuracy']:.1%}, "
+        f"LLM 위임 {report['escalation_rate']:.1%}"
+    )
+
+    print("\n혼동 행렬 (행: 정답, 열: 예측)")
+    print(" " * 20 + "".join(f"{label[:10]:>12}" for label in LABELS))
+    for label in LABELS:
+        row = report["confusion"][label]
+        print(f"  {label:<18}" + "".join(f"{row[other]:>12}" for other in LABELS))
+
+    print("\n오분류")
+    for text, expected in examples:
+        result = classifier.classify(text)
+        if result["classification"] != expected:
+            print(
+                f"  [{expected} → {result['classification']} "
+                f"{result['confidence']:.2f} {result['source']}] {text}"
+            )
+
+    timings = []
+    for _ in range(repeat):
+        for text, _ in examples:
+            started = time.perf_counter()
+            classifier.classify(text)
+            timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    print(
+        f"\n⏱️  분류 {len(timings)}회: p50 {timings[len(timings) // 2]:.3f}ms, "
+        f"p99 {timings[int(len(timings) * 0.99)]:.3f}ms"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Evaluate the local intent classifier")
+    parser.add_argument("--labelled", type=Path, default=DEFAULT_LABELLED)
+    parser.add_argument("--min-confidence", type=float, default=0.5)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    run_evaluation(args.labelled, args.min_confidence, args.repeat)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+프로젝트 버전 히스토리에서 더 이상 참조되지 않는 블롭을 삭제하는 스크립트
+
+프로젝트 삭제나 보관 개수 초과로 정리된 버전이 쓰던 블롭이 대상이며,
+진행 중인 저장과 겹치지 않도록 최근 1시간 내 생성된 블롭은 남겨둡니다.
+
+사용법:
+    python scripts/gc_project_blobs.py
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add the backend root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.database import SessionLocal  # noqa: E402
+from app.services.project_history import ProjectHistoryService  # noqa: E402
+
+
+def collect(batch_size: int = 500):
+    db = SessionLocal()
+    started = time.perf_counter()
+
+    try:
+        deleted = ProjectHistoryService.collect_garbage(db, batch_size)
+        db.commit()
+
+        elapsed = time.perf_counter() - started
+        print(f"✅ 블롭 정리 완료: {deleted}개 삭제 ({elapsed:.2f}s)")
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 블롭 정리 실패: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Delete unreferenced history blobs")
+    parser.add_argument("--batch-size", type=int, default=500, help="조회/삭제 배치 크기")
+    args = parser.parse_args()
+
+    collect(args.batch_size)
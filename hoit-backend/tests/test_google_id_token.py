@@ -0,0 +1,172 @@
+"""
+Google ID 토큰 로컬 검증 테스트
+
+테스트용 RSA 키로 JWKS를 만들어 load_keys로 넣고, 네트워크 없이 검증합니다.
+"""
+
+import time
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+from app.services.google_id_token import (
+    GoogleIdTokenError,
+    GoogleIdTokenVerifier,
+    MIN_FORCED_REFRESH_INTERVAL,
+)
+
+CLIENT_ID = "test-client.apps.googleusercontent.com"
+KID = "test-key"
+
+
+def _generate_key():
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    public_pem = (
+        key.public_key()
+        .public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        .decode()
+    )
+    return private_pem, public_pem
+
+
+PRIVATE_PEM, PUBLIC_PEM = _generate_key()
+
+
+def _jwks(kid: str = KID, public_pem: str = PUBLIC_PEM):
+    public_jwk = jwk.construct(public_pem, "RS256").to_dict()
+    return {"keys": [{**public_jwk, "kid": kid, "use": "sig", "alg": "RS256"}]}
+
+
+def _id_token(kid: str = KID, access_token=None, **overrides) -> str:
+    now = int(time.time())
+    claims = {
+        "iss": "https://accounts.google.com",
+        "aud": CLIENT_ID,
+        "sub": "1234567890",
+        "email": "user@example.com",
+        "email_verified": True,
+        "name": "Test User",
+        "iat": now,
+        "exp": now + 3600,
+        **overrides,
+    }
+    return jwt.encode(
+        claims,
+        PRIVATE_PEM,
+        algorithm="RS256",
+        headers={"kid": kid},
+        access_token=access_token,
+    )
+
+
+@pytest.fixture
+def verifier():
+    verifier = GoogleIdTokenVerifier(
+        client_id=CLIENT_ID,
+        jwks_url="https://example.invalid/oauth2/v3/certs",
+        refresh_interval=3600,
+    )
+    verifier.load_keys(_jwks())
+    return verifier
+
+
+@pytest.mark.asyncio
+async def test_accepts_valid_token(verifier):
+    claims = await verifier.verify(_id_token())
+    assert claims["sub"] == "1234567890"
+    assert claims["email"] == "user@example.com"
+
+
+@pytest.mark.asyncio
+async def test_accepts_short_issuer(verifier):
+    claims = await verifier.verify(_id_token(iss="accounts.google.com"))
+    assert claims["iss"] == "accounts.google.com"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"aud": "other-client.apps.googleusercontent.com"},
+        {"iss": "https://evil.example.com"},
+        {"exp": int(time.time()) - 3600, "iat": int(time.time()) - 7200},
+        {"email_verified": False},
+        {"email": None},
+    ],
+    ids=["aud", "iss", "exp", "email_verified", "email"],
+)
+async def test_rejects_invalid_claims(verifier, overrides):
+    with pytest.raises(GoogleIdTokenError):
+        await verifier.verify(_id_token(**overrides))
+
+
+@pytest.mark.asyncio
+async def test_rejects_foreign_signature(verifier):
+    other_private, other_public = _generate_key()
+    verifier.load_keys(_jwks(public_pem=other_public))
+    with pytest.raises(GoogleIdTokenError):
+        await verifier.verify(_id_token())
+
+
+@pytest.mark.asyncio
+async def test_at_hash(verifier):
+    token = _id_token(access_token="access-token")
+    claims = await verifier.verify(token, access_token="access-token")
+    assert "at_hash" in claims
+
+    with pytest.raises(GoogleIdTokenError):
+        await verifier.verify(token, access_token="other-access-token")
+
+
+@pytest.mark.asyncio
+async def test_rejects_malformed_token(verifier):
+    with pytest.raises(GoogleIdTokenError):
+        await verifier.verify("not-a-jwt")
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_forces_one_refresh(verifier, monkeypatch):
+    calls = []
+
+    async def refresh():
+        # 키 교체 직후처럼 새 kid가 담긴 키 세트를 받아옴
+        calls.append(time.monotonic())
+        verifier.load_keys(_jwks(kid="rotated-key"))
+
+    monkeypatch.setattr(verifier, "refresh", refresh)
+
+    claims = await verifier.verify(_id_token(kid="rotated-key"))
+    assert claims["sub"] == "1234567890"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_refresh_is_throttled(verifier, monkeypatch):
+    calls = []
+
+    async def refresh():
+        calls.append(time.monotonic())
+
+    monkeypatch.setattr(verifier, "refresh", refresh)
+
+    with pytest.raises(GoogleIdTokenError):
+        await verifier.verify(_id_token(kid="unknown-key"))
+    with pytest.raises(GoogleIdTokenError):
+        await verifier.verify(_id_token(kid="another-unknown-key"))
+    assert len(calls) == 1
+
+    # 최소 간격이 지나면 다시 받아봄
+    verifier._last_forced_refresh -= MIN_FORCED_REFRESH_INTERVAL
+    with pytest.raises(GoogleIdTokenError):
+        await verifier.verify(_id_token(kid="unknown-key"))
+    assert len(calls) == 2